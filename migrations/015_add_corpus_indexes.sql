@@ -0,0 +1,18 @@
+-- Migration 015: Indexes for SQL-side corpus filtering
+--
+-- The corpus endpoints select works whose heading and content chunking are
+-- completed and that have a sanitized file, directly in SQL. The partial index
+-- below covers exactly that predicate (it must stay textually identical to
+-- CORPUS_WORK_PREDICATE in psychrag/data/models/work.py), so corpus counts and
+-- listings never read the large toc/files/abstract columns of other works.
+-- The ->/->> operators work for both JSON and JSONB columns.
+
+CREATE INDEX IF NOT EXISTS ix_works_corpus
+ON works (id)
+WHERE processing_status ->> 'content_chunks' = 'completed'
+  AND processing_status ->> 'heading_chunks' = 'completed'
+  AND (files -> 'sanitized') IS NOT NULL;
+
+-- Per-status chunk counts over a set of works
+CREATE INDEX IF NOT EXISTS ix_chunks_work_id_vector_status
+ON chunks (work_id, vector_status);
@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useParams, useRouter } from "next/navigation";
 import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
@@ -44,6 +44,9 @@ interface AugmentPromptResponse {
   original_query: string;
   prompt: string;
   context_count: number;
+  prompt_tokens: number;
+  context_tokens: number;
+  token_budget: number;
 }
 
 export default function GeneratePage() {
@@ -82,12 +85,19 @@ export default function GeneratePage() {
   // Results state
   const [hasResults, setHasResults] = useState(false);
 
+  // Aborts a running augment stream; the server stops the LLM call on disconnect
+  const streamAbortRef = useRef<AbortController | null>(null);
+
   useEffect(() => {
     fetchAvailableSourceCount();
     fetchPrompt();
     fetchResultsCount();
   }, [queryId]);
 
+  useEffect(() => {
+    return () => streamAbortRef.current?.abort();
+  }, []);
+
   const fetchAvailableSourceCount = async () => {
     try {
       const response = await fetch(`${API_BASE_URL}/rag/queries/${queryId}`);
@@ -233,36 +243,73 @@ export default function GeneratePage() {
     setOperationError(null);
     setRunDialogOpen(false);
 
+    const controller = new AbortController();
+    streamAbortRef.current = controller;
+
     try {
       const response = await fetch(
-        `${API_BASE_URL}/rag/queries/${queryId}/augment/run`,
-        {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            force: false,
-          }),
-        }
+        `${API_BASE_URL}/rag/queries/${queryId}/augment/stream`,
+        { method: "POST", signal: controller.signal }
       );
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         const errorData = await response.json().catch(() => ({}));
         throw new Error(errorData.detail || "Failed to run prompt");
       }
 
-      const data = await response.json();
-      setOperationSuccess(data.message || "Response generated and saved successfully");
-      setGeneratedResponse(data.response_text);
+      // Show tokens as they arrive (Server-Sent Events: "token", then "done" or "error")
+      setGeneratedResponse("");
       setViewMode("response");
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let text = "";
+      let resultId: number | null = null;
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const events = buffer.split("\n\n");
+        buffer = events.pop() ?? "";
+        for (const rawEvent of events) {
+          const lines = rawEvent.split("\n");
+          const event = lines.find((line) => line.startsWith("event: "))?.slice(7);
+          const data = JSON.parse(
+            lines.find((line) => line.startsWith("data: "))?.slice(6) ?? "{}"
+          );
+          if (event === "token") {
+            text += data.text;
+            setGeneratedResponse(text);
+          } else if (event === "done") {
+            resultId = data.result_id;
+          } else if (event === "error") {
+            throw new Error(data.detail || "Failed to run prompt");
+          }
+        }
+      }
+
+      // Without a "done" event the stream was cut off and nothing was saved
+      if (resultId === null) {
+        throw new Error("Response stream ended before the result was saved");
+      }
+
+      setOperationSuccess("Response generated and saved successfully");
       // Refresh results count since we just created a new result
       await fetchResultsCount();
       // Redirect to the result detail page
-      if (data.result_id) {
-        router.push(`/rag/${queryId}/results/${data.result_id}`);
-      }
+      router.push(`/rag/${queryId}/results/${resultId}`);
     } catch (err) {
+      if (controller.signal.aborted) {
+        return;
+      }
       setOperationError(err instanceof Error ? err.message : "Failed to run prompt");
     } finally {
+      if (streamAbortRef.current === controller) {
+        streamAbortRef.current = null;
+      }
       setRunning(false);
     }
   };
@@ -453,7 +500,8 @@ export default function GeneratePage() {
           <div className="text-sm text-muted-foreground flex-1 mr-4">
             {viewMode === "prompt" ? (
               <p>
-                Context: {promptData?.context_count || 0} of {availableSourceCount} sources included.
+                Context: {promptData?.context_count || 0} of {availableSourceCount} sources included
+                (~{promptData?.prompt_tokens || 0} prompt tokens).
                 Run the prompt to generate a response.
               </p>
             ) : (
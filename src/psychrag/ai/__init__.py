@@ -21,6 +21,7 @@ __all__ = [
     "create_langchain_chat",
     "create_llm_stack",
     "create_embeddings",
+    "clear_client_cache",
 ]
 
 
@@ -34,6 +35,7 @@ def __getattr__(name: str):
         "create_langchain_chat",
         "create_llm_stack",
         "create_embeddings",
+        "clear_client_cache",
     ):
         from . import llm_factory
         return getattr(llm_factory, name)
@@ -33,6 +33,7 @@ _ENV_FILE_PATH = _find_env_file()
 class LLMProvider(str, Enum):
     OPENAI = "openai"
     GEMINI = "gemini"
+    LOCAL = "local"
 
 
 class ModelTier(str, Enum):
@@ -88,5 +89,11 @@ class LLMSettings(BaseSettings):
                 if tier == ModelTier.LIGHT
                 else app_config.llm.models.gemini.full
             )
+        elif self.provider == LLMProvider.LOCAL:
+            return (
+                app_config.llm.models.local.light
+                if tier == ModelTier.LIGHT
+                else app_config.llm.models.local.full
+            )
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
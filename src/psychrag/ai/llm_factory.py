@@ -1,21 +1,56 @@
 """Factory functions for creating PydanticAI and LangChain instances.
 
 Uses lazy imports to avoid loading heavy ML libraries until actually needed.
+
+Chat and embedding clients are cached per provider, model, temperature and
+API key, so query expansion, augmentation and heading suggestions reuse the
+same client and its open HTTP connections instead of building a new one per
+call. OpenAI clients share one httpx connection pool; Gemini clients each
+keep their own pool with the same limits. Timeouts, retries and keep-alive
+come from the ``llm.client`` section of psychrag.config.json; set
+``cache_clients`` to false to build a new client on every call.
+
+The "local" provider returns the offline stand-ins from
+psychrag.ai.local_models (deterministic chat with simulated latency, 768-d
+hashing embeddings), configured by the ``llm.local`` section, so the whole
+pipeline can be benchmarked without network access or API keys.
+
+Usage:
+    from psychrag.ai.llm_factory import clear_client_cache, create_langchain_chat
+
+    chat = create_langchain_chat(tier=ModelTier.FULL).chat  # cached
+    clear_client_cache()  # e.g. after rotating API keys in .env
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 # Lazy imports - only import heavy libraries when functions are called
 if TYPE_CHECKING:
+    import httpx
     from langchain_core.language_models import BaseChatModel
     from langchain_core.embeddings import Embeddings
     from pydantic_ai import Agent
 
+from psychrag.config import LLMClientConfig, load_config
+
 from .config import LLMProvider, LLMSettings, ModelTier
 
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+GEMINI_EMBEDDING_MODEL = "models/text-embedding-004"
+LOCAL_EMBEDDING_MODEL = "local-hash"
+
+# Guards the registries below; reentrant because building a client can
+# create the shared HTTP pool
+_registry_lock = threading.RLock()
+_clients: dict[tuple, Any] = {}
+_http_clients: dict[tuple, "httpx.Client"] = {}
+_default_settings: LLMSettings | None = None
+
 
 @dataclass
 class PydanticAIStack:
@@ -40,6 +75,88 @@ class LLMStack:
     langchain: LangChainStack
 
 
+def _client_config() -> LLMClientConfig:
+    return load_config().llm.client
+
+
+def _config_key(client_config: LLMClientConfig) -> tuple:
+    """Hashable form of the client settings, so config edits get new clients."""
+    return tuple(client_config.model_dump().values())
+
+
+def _local_key() -> tuple:
+    """Hashable form of the local model settings."""
+    return tuple(load_config().llm.local.model_dump().values())
+
+
+def _key_digest(api_key: str | None) -> str:
+    """Identify an API key in a cache key without keeping the key itself."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _get_settings(settings: LLMSettings | None) -> LLMSettings:
+    """Return settings, loading them from the environment once if not given."""
+    global _default_settings
+    if settings is not None:
+        return settings
+    with _registry_lock:
+        if _default_settings is None:
+            _default_settings = LLMSettings()
+        return _default_settings
+
+
+def _http_limits(client_config: LLMClientConfig) -> "httpx.Limits":
+    import httpx
+
+    return httpx.Limits(
+        max_connections=client_config.max_connections,
+        max_keepalive_connections=client_config.max_keepalive_connections,
+        keepalive_expiry=client_config.keepalive_expiry,
+    )
+
+
+def _shared_http_client(client_config: LLMClientConfig) -> "httpx.Client":
+    """Connection pool shared by all OpenAI clients with these settings."""
+    import httpx
+
+    key = _config_key(client_config)
+    with _registry_lock:
+        http_client = _http_clients.get(key)
+        if http_client is None:
+            http_client = httpx.Client(
+                limits=_http_limits(client_config),
+                timeout=client_config.timeout,
+            )
+            _http_clients[key] = http_client
+        return http_client
+
+
+def _cached_client(key: tuple, client_config: LLMClientConfig, build: Callable[[], Any]) -> Any:
+    """Return the client cached under key, building it on first use."""
+    if not client_config.cache_clients:
+        return build()
+    key = key + _config_key(client_config)
+    with _registry_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = build()
+            _clients[key] = client
+        return client
+
+
+def clear_client_cache() -> None:
+    """
+    Drop cached clients, HTTP pools and settings loaded from the environment.
+
+    Clients already handed out keep working; later calls build new ones.
+    """
+    global _default_settings
+    with _registry_lock:
+        _clients.clear()
+        _http_clients.clear()
+        _default_settings = None
+
+
 def create_pydantic_agent(
     settings: LLMSettings,
     tier: ModelTier = ModelTier.LIGHT,
@@ -56,14 +173,18 @@ def create_pydantic_agent(
     model_name = settings.get_model(tier)
 
     if settings.provider == LLMProvider.OPENAI:
-        model_str = f"openai:{model_name}"
+        model = f"openai:{model_name}"
     elif settings.provider == LLMProvider.GEMINI:
-        model_str = f"google-gla:{model_name}"
+        model = f"google-gla:{model_name}"
+    elif settings.provider == LLMProvider.LOCAL:
+        from pydantic_ai.models.test import TestModel
+
+        model = TestModel(model_name=model_name)
     else:
         raise ValueError(f"Unsupported provider: {settings.provider}")
 
     agent = Agent(
-        model_str,
+        model,
         instructions="You are a helpful assistant.",
     )
     return PydanticAIStack(agent=agent)
@@ -78,45 +199,70 @@ def create_langchain_chat(
     """Create a LangChain ChatModel based on the configured provider.
 
     Args:
-        settings: LLM settings with provider and API keys (default: load from .env)
+        settings: LLM settings with provider and API keys (default: load from .env once)
         tier: Model tier to use (LIGHT or FULL)
         search: Enable web search capability (default: False)
         temperature: Model temperature (default 0.2)
     """
-    if settings is None:
-        settings = LLMSettings()
-
+    settings = _get_settings(settings)
+    client_config = _client_config()
     model_name = settings.get_model(tier)
 
     if settings.provider == LLMProvider.OPENAI:
-        # Lazy import - only load langchain_openai when needed
-        from langchain_openai import ChatOpenAI
-
-        chat = ChatOpenAI(
-            model=model_name,
-            api_key=settings.openai_api_key,
-            temperature=temperature,
-        )
+        def build() -> "BaseChatModel":
+            # Lazy import - only load langchain_openai when needed
+            from langchain_openai import ChatOpenAI
+
+            return ChatOpenAI(
+                model=model_name,
+                api_key=settings.openai_api_key,
+                temperature=temperature,
+                timeout=client_config.timeout,
+                max_retries=client_config.max_retries,
+                http_client=_shared_http_client(client_config),
+            )
         # Note: OpenAI web search would require additional tools/plugins
         # This is a placeholder for future implementation
-        if search:
-            # Web search for OpenAI would be implemented via function calling
-            pass
+        api_key = settings.openai_api_key
     elif settings.provider == LLMProvider.GEMINI:
-        # Lazy import - only load langchain_google_genai when needed
-        from langchain_google_genai import ChatGoogleGenerativeAI
-
-        # Note: Google Search grounding requires specific API setup
-        # For now, search parameter is ignored for Gemini
-        # Future: implement via google.generativeai native API
-        chat = ChatGoogleGenerativeAI(
-            model=model_name,
-            google_api_key=settings.google_api_key,
-            temperature=temperature,
-        )
+        def build() -> "BaseChatModel":
+            # Lazy import - only load langchain_google_genai when needed
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            # Note: Google Search grounding requires specific API setup
+            # For now, search parameter is ignored for Gemini
+            # Future: implement via google.generativeai native API
+            return ChatGoogleGenerativeAI(
+                model=model_name,
+                google_api_key=settings.google_api_key,
+                temperature=temperature,
+                timeout=client_config.timeout,
+                max_retries=client_config.max_retries,
+                client_args={"limits": _http_limits(client_config)},
+            )
+        api_key = settings.google_api_key
+    elif settings.provider == LLMProvider.LOCAL:
+        local_config = load_config().llm.local
+
+        def build() -> "BaseChatModel":
+            from .local_models import LocalChatModel
+
+            return LocalChatModel(
+                model_name=model_name,
+                temperature=temperature,
+                latency_seconds=local_config.latency_seconds,
+                tokens_per_second=local_config.tokens_per_second,
+                response_tokens=local_config.response_tokens,
+                seed=local_config.seed,
+            )
+        api_key = None
     else:
         raise ValueError(f"Unsupported provider: {settings.provider}")
 
+    key = ("chat", settings.provider, model_name, temperature, search, _key_digest(api_key))
+    if settings.provider == LLMProvider.LOCAL:
+        key += _local_key()
+    chat = _cached_client(key, client_config, build)
     return LangChainStack(chat=chat)
 
 
@@ -126,33 +272,61 @@ def create_embeddings(
     """Create an Embeddings model based on the configured provider.
 
     Args:
-        settings: LLM settings with provider and API keys (default: load from .env)
+        settings: LLM settings with provider and API keys (default: load from .env once)
 
     Returns:
-        Embeddings model instance (GoogleGenerativeAIEmbeddings or OpenAIEmbeddings)
+        Embeddings model instance (GoogleGenerativeAIEmbeddings, OpenAIEmbeddings
+        or LocalHashEmbeddings)
     """
-    if settings is None:
-        settings = LLMSettings()
+    settings = _get_settings(settings)
+    client_config = _client_config()
 
     if settings.provider == LLMProvider.OPENAI:
-        # Lazy import - only load langchain_openai when needed
-        from langchain_openai import OpenAIEmbeddings
-
-        return OpenAIEmbeddings(
-            model="text-embedding-3-small",
-            api_key=settings.openai_api_key,
-        )
+        def build() -> "Embeddings":
+            # Lazy import - only load langchain_openai when needed
+            from langchain_openai import OpenAIEmbeddings
+
+            return OpenAIEmbeddings(
+                model=OPENAI_EMBEDDING_MODEL,
+                api_key=settings.openai_api_key,
+                timeout=client_config.timeout,
+                max_retries=client_config.max_retries,
+                http_client=_shared_http_client(client_config),
+            )
+        model_name, api_key = OPENAI_EMBEDDING_MODEL, settings.openai_api_key
     elif settings.provider == LLMProvider.GEMINI:
-        # Lazy import - only load langchain_google_genai when needed
-        from langchain_google_genai import GoogleGenerativeAIEmbeddings
-
-        return GoogleGenerativeAIEmbeddings(
-            model="models/text-embedding-004",
-            google_api_key=settings.google_api_key,
-        )
+        def build() -> "Embeddings":
+            # Lazy import - only load langchain_google_genai when needed
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+            return GoogleGenerativeAIEmbeddings(
+                model=GEMINI_EMBEDDING_MODEL,
+                google_api_key=settings.google_api_key,
+                client_args={
+                    "limits": _http_limits(client_config),
+                    "timeout": client_config.timeout,
+                },
+            )
+        model_name, api_key = GEMINI_EMBEDDING_MODEL, settings.google_api_key
+    elif settings.provider == LLMProvider.LOCAL:
+        local_config = load_config().llm.local
+
+        def build() -> "Embeddings":
+            from .local_models import LocalHashEmbeddings
+
+            return LocalHashEmbeddings(
+                dimensions=local_config.embedding_dimensions,
+                model=LOCAL_EMBEDDING_MODEL,
+            )
+        model_name, api_key = LOCAL_EMBEDDING_MODEL, None
     else:
         raise ValueError(f"Unsupported provider: {settings.provider}")
 
+    key = ("embeddings", settings.provider, model_name, _key_digest(api_key))
+    if settings.provider == LLMProvider.LOCAL:
+        key += _local_key()
+    return _cached_client(key, client_config, build)
+
 
 def create_llm_stack(
     tier: ModelTier = ModelTier.LIGHT,
@@ -176,7 +350,7 @@ def create_llm_stack(
         # Enable web search
         stack = create_llm_stack(tier=ModelTier.LIGHT, search=True)
     """
-    settings = LLMSettings()
+    settings = _get_settings(None)
     pydantic_stack = create_pydantic_agent(settings, tier=tier)
     langchain_stack = create_langchain_chat(settings, tier=tier, search=search, temperature=temperature)
     return LLMStack(
@@ -0,0 +1,221 @@
+"""Offline stand-in chat and embedding models for the "local" provider.
+
+Selecting ``"provider": "local"`` in psychrag.config.json makes llm_factory
+return these models instead of OpenAI or Gemini clients, so query expansion,
+vectorization and augmentation can be benchmarked on an isolated machine.
+Nothing is sent over the network and no API key is needed.
+
+- LocalChatModel answers deterministically: the same prompt (and seed) always
+  gives the same response. Free-text answers are ``response_tokens`` words
+  drawn from the prompt's own vocabulary; query expansion prompts get a valid
+  expansion JSON object; structured output returns a default instance of the
+  schema. ``latency_seconds`` and ``tokens_per_second`` simulate time to
+  first token and generation rate, for invoke and streaming alike.
+- LocalHashEmbeddings maps text to ``embedding_dimensions`` (768) floats by
+  signed feature hashing of words and word bigrams, L2-normalized, so texts
+  sharing words get similar vectors.
+
+Settings come from the ``llm.local`` section of psychrag.config.json.
+
+Usage:
+    from psychrag.ai.local_models import LocalChatModel, LocalHashEmbeddings
+
+    chat = LocalChatModel(model_name="local-light", tokens_per_second=50)
+    print(chat.invoke("What is working memory?").content)
+    vector = LocalHashEmbeddings().embed_query("working memory")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from typing import Any, Iterator, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, ValidationError
+
+from psychrag.utils.token_count import count_tokens
+
+EMBEDDING_DIMENSIONS = 768
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'-]{3,}")
+_FALLBACK_WORDS = ["memory", "attention", "learning", "perception", "emotion", "cognition"]
+_INTENTS = ["DEFINITION", "MECHANISM", "COMPARISON", "APPLICATION", "STUDY_DETAIL", "CRITIQUE"]
+
+
+def _prompt_text(messages: list[BaseMessage]) -> str:
+    parts = []
+    for message in messages:
+        content = message.content
+        if isinstance(content, list):
+            content = " ".join(
+                block.get("text", "") if isinstance(block, dict) else str(block) for block in content
+            )
+        parts.append(content)
+    return "\n".join(parts)
+
+
+def _rng(prompt: str, seed: int) -> random.Random:
+    digest = hashlib.sha256(f"{seed}\0{prompt}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _vocabulary(text: str) -> list[str]:
+    words = list(dict.fromkeys(word.lower() for word in _WORD_RE.findall(text)))
+    return words or _FALLBACK_WORDS
+
+
+def _words(rng: random.Random, vocabulary: list[str], count: int) -> list[str]:
+    return [rng.choice(vocabulary) for _ in range(count)]
+
+
+def _expansion_response(prompt: str, rng: random.Random) -> str:
+    """Query expansion JSON built from the words of the user query."""
+    query_match = re.search(r"User query:\s*\n(.+?)\n\s*\n", prompt, re.DOTALL)
+    query = query_match.group(1) if query_match else prompt
+    n_match = re.search(r"EXACTLY (\d+) alternative", prompt)
+    n = int(n_match.group(1)) if n_match else 3
+
+    vocabulary = _vocabulary(query)
+    sentences = [" ".join(_words(rng, vocabulary, 12)).capitalize() + "." for _ in range(3)]
+    return json.dumps({
+        "queries": [" ".join(_words(rng, vocabulary, rng.randint(5, 10))) for _ in range(n)],
+        "hyde_answer": " ".join(sentences),
+        "intent": rng.choice(_INTENTS),
+        "entities": sorted(vocabulary, key=len, reverse=True)[:3],
+    })
+
+
+def _default_instance(schema: type[BaseModel]) -> BaseModel:
+    try:
+        return schema.model_validate({})
+    except ValidationError:
+        return schema.model_construct()
+
+
+class LocalChatModel(BaseChatModel):
+    """Deterministic offline chat model with simulated latency."""
+
+    model_name: str = "local-light"
+    temperature: Optional[float] = None
+    latency_seconds: float = 0.0
+    tokens_per_second: float = 0.0
+    response_tokens: int = 200
+    seed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "local"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"model_name": self.model_name, "seed": self.seed}
+
+    def _response_tokens(self, prompt: str) -> list[str]:
+        """Response split into tokens (words with their leading space)."""
+        rng = _rng(prompt, self.seed)
+        if '"hyde_answer"' in prompt:
+            text = _expansion_response(prompt, rng)
+            return [text]
+        words = _words(rng, _vocabulary(prompt), self.response_tokens)
+        return [words[0].capitalize()] + [f" {word}" for word in words[1:]] + ["."]
+
+    def _token_delay(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _usage(self, prompt: str, tokens: list[str]) -> dict:
+        input_tokens = count_tokens(prompt)
+        output_tokens = count_tokens("".join(tokens))
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt = _prompt_text(messages)
+        tokens = self._response_tokens(prompt)
+        time.sleep(self.latency_seconds + self._token_delay() * len(tokens))
+        message = AIMessage(
+            content="".join(tokens),
+            usage_metadata=self._usage(prompt, tokens),
+            response_metadata={"model_name": self.model_name},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: Optional[list[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        prompt = _prompt_text(messages)
+        tokens = self._response_tokens(prompt)
+        time.sleep(self.latency_seconds)
+        delay = self._token_delay()
+        for token in tokens:
+            if delay:
+                time.sleep(delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs: Any):
+        """Return a default instance of schema (after the simulated latency)."""
+
+        def respond(prompt: Any) -> Any:
+            time.sleep(self.latency_seconds)
+            parsed = _default_instance(schema)
+            if not include_raw:
+                return parsed
+            raw = AIMessage(
+                content="",
+                usage_metadata=self._usage(str(prompt), [parsed.model_dump_json()]),
+            )
+            return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+        return RunnableLambda(respond)
+
+
+class LocalHashEmbeddings(Embeddings):
+    """Feature-hashing embeddings; deterministic and CPU-only."""
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS, model: str = "local-hash"):
+        self.dimensions = dimensions
+        self.model = model
+
+    def _features(self, text: str) -> list[str]:
+        words = [word.lower() for word in re.findall(r"\w+", text)]
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            vector[value % self.dimensions] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
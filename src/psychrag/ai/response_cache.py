@@ -0,0 +1,300 @@
+"""
+Persistent cache of LLM responses.
+
+Pipeline prompts (query expansion, heading and chunk suggestions, citation
+parsing, TOC extraction) are often sent again verbatim while a user iterates
+in the UI. This cache stores each response on disk, keyed by the SHA-256 of
+provider, model, temperature, prompt and (for structured output) the schema,
+so a repeated prompt is answered without calling the provider.
+
+Caching is opt-in per pipeline function: a call is cached only if its function
+name is listed in ``llm.cache.functions`` of psychrag.config.json. Entries
+expire after ``llm.cache.ttl_seconds``. Chat models not built by llm_factory
+(ChatOpenAI / ChatGoogleGenerativeAI / LocalChatModel) are never cached.
+
+Layout: <cache_dir>/<key[:2]>/<key>.json. Failing to read or write an entry is
+logged, not raised.
+
+Hits, misses and the tokens that hits saved (from the usage the provider
+reported when the response was stored) are counted per function and returned
+by get_cache_stats(); cache_stats_report() summarizes them for the API's
+/health endpoint.
+
+Usage:
+    from psychrag.ai.response_cache import get_cache_stats, invoke_cached
+
+    response = invoke_cached(chat, prompt, function="query_expansion")
+    print(response.content)
+    print(get_cache_stats()["query_expansion"].hit_rate)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from psychrag.config import load_config
+from psychrag.utils.file_utils import write_text_atomic
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry format or key derivation changes
+CACHE_FORMAT_VERSION = 1
+
+# Chat model class -> (provider, attribute holding the model name)
+_CHAT_MODELS = {
+    "ChatOpenAI": ("openai", "model_name"),
+    "ChatGoogleGenerativeAI": ("gemini", "model"),
+    "LocalChatModel": ("local", "model_name"),
+}
+
+
+@dataclass
+class CacheStats:
+    """Cache use of one pipeline function in this process."""
+
+    hits: int = 0
+    misses: int = 0
+    saved_input_tokens: int = 0
+    saved_output_tokens: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.saved_input_tokens + self.saved_output_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_stats: dict[str, CacheStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_cache_stats() -> dict[str, CacheStats]:
+    """Copy of the hit/miss counters per pipeline function."""
+    with _stats_lock:
+        return {name: CacheStats(**vars(stats)) for name, stats in _stats.items()}
+
+
+def cache_stats_report() -> dict[str, dict]:
+    """
+    Hit rate and saved tokens per pipeline function, for reporting.
+
+    Returns:
+        {function: {hits, misses, hit_rate, saved_input_tokens,
+        saved_output_tokens, saved_tokens}}, plus the same under "total".
+    """
+    stats = get_cache_stats()
+    total = CacheStats()
+    for function_stats in stats.values():
+        for name, value in vars(function_stats).items():
+            setattr(total, name, getattr(total, name) + value)
+
+    def row(entry: CacheStats) -> dict:
+        return {
+            **vars(entry),
+            "hit_rate": round(entry.hit_rate, 4),
+            "saved_tokens": entry.saved_tokens,
+        }
+
+    return {**{name: row(entry) for name, entry in sorted(stats.items())}, "total": row(total)}
+
+
+def reset_cache_stats() -> None:
+    """Reset the hit/miss counters."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record(function: str, hit: bool, usage: Optional[dict] = None) -> CacheStats:
+    with _stats_lock:
+        stats = _stats.setdefault(function, CacheStats())
+        if hit:
+            stats.hits += 1
+            stats.saved_input_tokens += (usage or {}).get("input_tokens", 0)
+            stats.saved_output_tokens += (usage or {}).get("output_tokens", 0)
+        else:
+            stats.misses += 1
+        return CacheStats(**vars(stats))
+
+
+def chat_identity(chat: Any) -> Optional[tuple[str, str, Optional[float]]]:
+    """(provider, model, temperature) of a chat model, or None if it can't be cached."""
+    known = _CHAT_MODELS.get(type(chat).__name__)
+    if known is None:
+        return None
+    provider, model_attr = known
+    return provider, getattr(chat, model_attr), getattr(chat, "temperature", None)
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    temperature: Optional[float],
+    prompt: str,
+    schema: Optional[type["BaseModel"]] = None,
+) -> str:
+    """SHA-256 identifying a prompt sent to a model."""
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "provider": provider,
+        "model": model,
+        "temperature": temperature,
+        "schema": schema.model_json_schema() if schema is not None else None,
+        "prompt": prompt,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LLM responses stored as JSON files under a root directory."""
+
+    def __init__(self, root: str | Path, ttl_seconds: int = 0):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[dict]:
+        """Return the entry for key, or None if missing, unreadable or expired."""
+        path = self.entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path}: {e}")
+            return None
+
+        if entry.get("format") != CACHE_FORMAT_VERSION:
+            return None
+        if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def store(self, key: str, entry: dict) -> None:
+        """Write an entry; failures are logged."""
+        entry = {"format": CACHE_FORMAT_VERSION, "created_at": time.time(), **entry}
+        path = self.entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(path, json.dumps(entry))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write LLM cache entry {path}: {e}")
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+
+def get_response_cache(function: Optional[str] = None) -> Optional[ResponseCache]:
+    """
+    Return the configured response cache.
+
+    Args:
+        function: Pipeline function name; if given, the cache is returned only
+            when the function is listed in llm.cache.functions.
+
+    Returns:
+        ResponseCache at llm.cache.cache_dir (default <paths.output_dir>/.llm_cache),
+        or None if caching is disabled (for this function).
+    """
+    config = load_config()
+    cache_config = config.llm.cache
+    if not cache_config.enabled:
+        return None
+    if function is not None and function not in cache_config.functions:
+        return None
+    root = cache_config.cache_dir or Path(config.paths.output_dir) / ".llm_cache"
+    return ResponseCache(root, ttl_seconds=cache_config.ttl_seconds)
+
+
+def _usage(message: Any) -> dict:
+    usage = getattr(message, "usage_metadata", None)
+    if not isinstance(usage, dict):
+        return {}
+    return {
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+    }
+
+
+def invoke_cached(
+    chat: "BaseChatModel",
+    prompt: str,
+    function: str,
+    schema: Optional[type["BaseModel"]] = None,
+) -> Any:
+    """
+    Invoke a chat model, answering from the response cache when possible.
+
+    Args:
+        chat: Chat model from llm_factory.create_langchain_chat.
+        prompt: Prompt text.
+        function: Pipeline function name, checked against llm.cache.functions.
+        schema: Pydantic model for structured output (chat.with_structured_output).
+
+    Returns:
+        The chat message (an AIMessage on a cache hit), or an instance of
+        schema for structured output.
+    """
+    identity = chat_identity(chat)
+    cache = get_response_cache(function) if identity is not None else None
+    if cache is None:
+        if schema is not None:
+            return chat.with_structured_output(schema).invoke(prompt)
+        return chat.invoke(prompt)
+
+    key = make_cache_key(*identity, prompt, schema)
+    entry = cache.load(key)
+    if entry is not None:
+        stats = _record(function, hit=True, usage=entry.get("usage"))
+        logger.info(
+            f"LLM cache hit for {function}: {stats.hits} hits, "
+            f"{stats.hit_rate:.0%} hit rate, {stats.saved_tokens} tokens saved"
+        )
+        if schema is not None:
+            return schema.model_validate(entry["parsed"])
+
+        from langchain_core.messages import AIMessage
+
+        return AIMessage(content=entry["content"], response_metadata={"cache_hit": True})
+
+    _record(function, hit=False)
+    if schema is not None:
+        result = chat.with_structured_output(schema, include_raw=True).invoke(prompt)
+        if result.get("parsing_error") is not None:
+            raise result["parsing_error"]
+        parsed = result["parsed"]
+        if parsed is not None:
+            cache.store(key, {
+                "function": function,
+                "parsed": parsed.model_dump(mode="json"),
+                "usage": _usage(result.get("raw")),
+            })
+        return parsed
+
+    response = chat.invoke(prompt)
+    if response.content:
+        cache.store(key, {
+            "function": function,
+            "content": response.content,
+            "usage": _usage(response),
+        })
+    return response
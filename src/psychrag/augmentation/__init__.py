@@ -2,6 +2,8 @@
 
 from .consolidate_context import consolidate_context, ConsolidationResult, ConsolidatedGroup
 from .augment import (
+    AugmentedPrompt,
+    build_augmented_prompt,
     generate_augmented_prompt,
     get_query_with_context,
     format_context_blocks,
@@ -11,6 +13,8 @@ __all__ = [
     "consolidate_context",
     "ConsolidationResult",
     "ConsolidatedGroup",
+    "AugmentedPrompt",
+    "build_augmented_prompt",
     "generate_augmented_prompt",
     "get_query_with_context",
     "format_context_blocks",
@@ -14,9 +14,11 @@ Usage:
 Functions:
     get_query_with_context(query_id, top_n) - Fetch query with top N contexts from DB
     format_context_blocks(contexts, session) - Format contexts as markdown blocks
+    build_augmented_prompt(query_id, top_n) - Generate prompt with packing and token counts
     generate_augmented_prompt(query_id, top_n) - Generate complete RAG prompt
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -31,9 +33,27 @@ from ..data.models.work import Work
 from ..data.template_loader import load_template
 from ..utils.rag_config_loader import get_default_config, get_config_by_name
 from ..config.app_config import load_config
+from ..utils.token_count import count_tokens
+from .context_packing import get_context_budget, pack_contexts
 
 
 
+@dataclass
+class AugmentedPrompt:
+    """An augmented prompt and the contexts packed into it."""
+
+    prompt: str
+    contexts: list[dict]
+    prompt_tokens: int
+    context_tokens: int
+    token_budget: int  # 0 = no limit
+    dropped_contexts: int = 0
+
+
+def _augmentation_model() -> str:
+    """Model that runs augmented prompts (FULL tier of the active provider)."""
+    llm_config = load_config().llm
+    return getattr(llm_config.models, llm_config.provider).full
 
 
 def _find_heading_from_parent(parent_id: int | None, session: Session) -> str | None:
@@ -205,6 +225,35 @@ def generate_augmented_prompt(
     """
     Generate complete RAG prompt with instructions, context, and question.
 
+    See build_augmented_prompt for details; this returns only the prompt text.
+
+    Args:
+        query_id: ID of the query in the database
+        top_n: Number of top contexts to include. If None, uses config default.
+        config_preset: Name of RAG config preset to use. If None, uses default.
+
+    Returns:
+        Complete formatted prompt string ready for LLM
+
+    Raises:
+        ValueError: If query_id not found in database, or if config preset not found
+
+    Example:
+        >>> prompt = generate_augmented_prompt(query_id=42, top_n=5)
+        >>> print(prompt)
+        You are an academic assistant...
+    """
+    return build_augmented_prompt(query_id, top_n, config_preset).prompt
+
+
+def build_augmented_prompt(
+    query_id: int,
+    top_n: int | None = None,
+    config_preset: str | None = None
+) -> AugmentedPrompt:
+    """
+    Generate complete RAG prompt with instructions, context, and question.
+
     This function retrieves a query from the database, formats its retrieved
     contexts, and generates a comprehensive prompt for the LLM that includes:
     - Instructions on how to use the context
@@ -212,6 +261,10 @@ def generate_augmented_prompt(
     - The original user question
     - Intent and entity metadata for guidance
 
+    The top N contexts are packed into the context token budget of the
+    augmentation model (see context_packing), so the prompt may hold fewer or
+    trimmed contexts.
+
     The prompt template is loaded from the database if available,
     otherwise falls back to the hardcoded default.
 
@@ -221,15 +274,15 @@ def generate_augmented_prompt(
         config_preset: Name of RAG config preset to use. If None, uses default.
 
     Returns:
-        Complete formatted prompt string ready for LLM
+        AugmentedPrompt with the prompt, packed contexts and token counts
 
     Raises:
         ValueError: If query_id not found in database, or if config preset not found
 
     Example:
-        >>> prompt = generate_augmented_prompt(query_id=42, top_n=5)
-        >>> print(prompt)
-        You are an academic assistant...
+        >>> augmented = build_augmented_prompt(query_id=42, top_n=5)
+        >>> print(augmented.prompt_tokens, len(augmented.contexts))
+        6210 4
     """
     # Initialize logging
     log_data = {
@@ -241,8 +294,10 @@ def generate_augmented_prompt(
         }
     }
 
-    # Get query and contexts
+    # Get query and contexts, packed into the model's context budget
     query, top_contexts = get_query_with_context(query_id, top_n, config_preset)
+    packed = pack_contexts(top_contexts, get_context_budget(_augmentation_model()))
+    top_contexts = packed.contexts
 
     # Extract query data
     user_question = query.original_query
@@ -259,6 +314,12 @@ def generate_augmented_prompt(
             "entities": entities,
         }
         log_data["selected_contexts"] = top_contexts
+        log_data["packing"] = {
+            "token_budget": packed.token_budget,
+            "context_tokens": packed.context_tokens,
+            "dropped": packed.dropped,
+            "trimmed": packed.trimmed,
+        }
 
     # Format entities as comma-separated string
     if isinstance(entities, list):
@@ -370,6 +431,13 @@ USER QUESTION
     if load_config().logging.enabled:
         log_data["final_prompt"] = prompt
         _save_augmentation_log(query_id, log_data)
-    
-    return prompt
+
+    return AugmentedPrompt(
+        prompt=prompt,
+        contexts=top_contexts,
+        prompt_tokens=count_tokens(prompt),
+        context_tokens=packed.context_tokens,
+        token_budget=packed.token_budget,
+        dropped_contexts=packed.dropped,
+    )
 
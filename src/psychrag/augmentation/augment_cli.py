@@ -30,6 +30,7 @@ except ImportError:
 
 from .augment import generate_augmented_prompt
 from ..ai.llm_factory import create_langchain_chat
+from ..ai.response_cache import invoke_cached
 from ..ai.config import ModelTier
 
 
@@ -70,7 +71,7 @@ def send_to_llm(prompt: str) -> None:
         )
         
         # Send prompt and get response
-        response = stack.chat.invoke(prompt)
+        response = invoke_cached(stack.chat, prompt, function="augmentation")
         
         # Display response
         print("\n" + "=" * 80)
@@ -0,0 +1,160 @@
+"""
+Token-budgeted packing of retrieved contexts into an augmented prompt.
+
+Consolidated contexts can be whole parent sections, so including the top N
+regardless of size can produce very large prompts. This module estimates the
+tokens of each context and fills a token budget:
+
+1. Trailing structural lines (blank lines, headings without a body, figures
+   and table rules) are trimmed from every context.
+2. The best-scoring context is taken first; the rest are taken by score
+   density (score per token) while they fit.
+3. A context that doesn't fit is cut at a line boundary to the remaining
+   budget, if at least MIN_PARTIAL_TOKENS of it remain; otherwise it is
+   dropped. A cut context also loses trailing fragments of fewer than
+   MIN_TAIL_WORDS words, which the cut may have split off a sentence.
+
+Packed contexts keep their score order, so [S1] is still the best match.
+Tokens are counted with psychrag.utils.token_count.
+
+Usage:
+    from psychrag.augmentation.context_packing import get_context_budget, pack_contexts
+
+    packed = pack_contexts(contexts, get_context_budget("gemini-2.5-pro"))
+    print(packed.context_tokens, packed.dropped)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from psychrag.config import load_config
+from psychrag.utils.token_count import count_tokens
+
+# Tokens of the "[S#] Source: ... | (work_id=..., ...)" header of a block
+BLOCK_HEADER_TOKENS = 40
+
+MIN_TAIL_WORDS = 3
+MIN_PARTIAL_TOKENS = 100
+
+_LOW_VALUE_LINE_RE = re.compile(r'^\s*(#+\s.*|!\[.*\]\(.*\)|\|?[\s:|-]+\|?)?\s*$')
+
+
+def get_context_budget(model: Optional[str] = None) -> int:
+    """Context token budget for a model from augmentation config (0 = no limit)."""
+    config = load_config().augmentation
+    if model is not None and model in config.model_token_budgets:
+        return config.model_token_budgets[model]
+    return config.context_token_budget
+
+
+@dataclass
+class PackedContexts:
+    """Contexts selected for a prompt."""
+
+    contexts: list[dict]
+    context_tokens: int
+    token_budget: int
+    dropped: int = 0  # Contexts left out
+    trimmed: int = 0  # Contexts cut to fit the budget
+
+
+def _is_low_value(line: str, min_words: int) -> bool:
+    return bool(_LOW_VALUE_LINE_RE.match(line)) or len(line.split()) < min_words
+
+
+def trim_tail(lines: list[str], min_words: int = 0) -> list[str]:
+    """
+    Drop trailing low-value lines, keeping at least the first line.
+
+    Blank lines, headings, figures and table rules are always low value;
+    with min_words, so are lines of fewer than min_words words.
+    """
+    end = len(lines)
+    while end > 1 and _is_low_value(lines[end - 1], min_words):
+        end -= 1
+    return lines[:end]
+
+
+def _with_lines(context: dict, lines: list[str], original_count: int) -> dict:
+    """Copy of context with its content cut to lines and end_line adjusted."""
+    packed = dict(context)
+    packed['content'] = '\n'.join(lines)
+    removed = original_count - len(lines)
+    if removed and context.get('end_line'):
+        packed['end_line'] = max(context.get('start_line') or 0, context['end_line'] - removed)
+    return packed
+
+
+def _fit_lines(lines: list[str], budget: int) -> list[str]:
+    """Longest prefix of lines (tail-trimmed) within budget tokens, or []."""
+    kept, tokens = [], BLOCK_HEADER_TOKENS
+    for line in lines:
+        line_tokens = count_tokens(line + '\n')
+        if tokens + line_tokens > budget:
+            break
+        kept.append(line)
+        tokens += line_tokens
+    kept = trim_tail(kept, MIN_TAIL_WORDS) if kept else kept
+    if not kept or count_tokens('\n'.join(kept)) < MIN_PARTIAL_TOKENS:
+        return []
+    return kept
+
+
+def pack_contexts(contexts: list[dict], token_budget: int) -> PackedContexts:
+    """
+    Select and trim contexts to fit a token budget.
+
+    Args:
+        contexts: Context dicts (content, score, start_line, end_line, ...),
+            sorted by score descending.
+        token_budget: Tokens available for context blocks; 0 for no limit.
+
+    Returns:
+        PackedContexts with copies of the selected contexts in input order.
+    """
+    candidates = []
+    for position, context in enumerate(contexts):
+        lines = (context.get('content') or '').strip().split('\n')
+        trimmed = trim_tail(lines)
+        tokens = BLOCK_HEADER_TOKENS + count_tokens('\n'.join(trimmed))
+        candidates.append((position, context, lines, trimmed, tokens))
+
+    if not token_budget:
+        packed = [_with_lines(context, trimmed, len(lines)) for _, context, lines, trimmed, _ in candidates]
+        return PackedContexts(
+            contexts=packed,
+            context_tokens=sum(tokens for *_, tokens in candidates),
+            token_budget=0,
+        )
+
+    # Best match first, then by score per token
+    order = candidates[:1] + sorted(
+        candidates[1:],
+        key=lambda c: (c[1].get('score') or 0) / c[4],
+        reverse=True,
+    )
+
+    selected: dict[int, tuple[dict, int]] = {}
+    remaining = token_budget
+    trimmed_count = 0
+    for position, context, lines, trimmed, tokens in order:
+        if tokens <= remaining:
+            selected[position] = (_with_lines(context, trimmed, len(lines)), tokens)
+            remaining -= tokens
+            continue
+        kept = _fit_lines(trimmed, remaining)
+        if kept:
+            kept_tokens = BLOCK_HEADER_TOKENS + count_tokens('\n'.join(kept))
+            selected[position] = (_with_lines(context, kept, len(lines)), kept_tokens)
+            remaining -= kept_tokens
+            trimmed_count += 1
+
+    packed = [selected[position] for position in sorted(selected)]
+    return PackedContexts(
+        contexts=[context for context, _ in packed],
+        context_tokens=sum(tokens for _, tokens in packed),
+        token_budget=token_budget,
+        dropped=len(contexts) - len(packed),
+        trimmed=trimmed_count,
+    )
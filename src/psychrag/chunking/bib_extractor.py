@@ -71,6 +71,7 @@ def extract_metadata(
     """
     # Lazy import - only load AI module when this function is called
     from psychrag.ai import create_langchain_chat, ModelTier as MT
+    from psychrag.ai.response_cache import invoke_cached
 
     if tier is None:
         tier = MT.LIGHT
@@ -129,7 +130,7 @@ Text to analyze:
 Return only the JSON, no other text."""
 
     # Call the LLM
-    response = chat.invoke(prompt)
+    response = invoke_cached(chat, prompt, function="bib_extraction")
 
     # Parse the response
     import json
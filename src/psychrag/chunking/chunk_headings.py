@@ -24,6 +24,7 @@ from psychrag.data.database import get_session
 from psychrag.data.models import Chunk, Work
 from psychrag.sanitization.extract_titles import HashMismatchError
 from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import MarkdownIndex, build_markdown_index, load_markdown_index
 
 
 def _parse_suggestions(suggestions_path: Path) -> dict[int, str]:
@@ -51,6 +52,11 @@ def _parse_suggestions(suggestions_path: Path) -> dict[int, str]:
     return decisions
 
 
+def _headings_from_index(index: MarkdownIndex) -> list[tuple[int, int, str]]:
+    """H1-H5 headings of a structure index as (line_num, level, heading_text)."""
+    return [(heading.line, heading.level, heading.raw) for heading in index.headings_up_to(5)]
+
+
 def _parse_headings(content: str) -> list[tuple[int, int, str]]:
     """Parse all headings from markdown content.
 
@@ -60,17 +66,7 @@ def _parse_headings(content: str) -> list[tuple[int, int, str]]:
     Returns:
         List of tuples (line_num, level, heading_text).
     """
-    headings = []
-    lines = content.splitlines()
-
-    for i, line in enumerate(lines, start=1):
-        match = re.match(r'^(#+)\s+(.*)$', line)
-        if match:
-            level = len(match.group(1))
-            if level <= 5:  # Only H1-H5
-                headings.append((i, level, line))
-
-    return headings
+    return _headings_from_index(build_markdown_index(content))
 
 
 def _calculate_heading_ranges(
@@ -211,7 +207,8 @@ def chunk_headings(work_id: int, verbose: bool = False) -> int:
         total_lines = len(lines)
 
         decisions = _parse_suggestions(suggestions_path)
-        headings = _parse_headings(content)
+        index = load_markdown_index(sanitized_path, file_hash=sanitized_current_hash, content=content)
+        headings = _headings_from_index(index)
         ranges = _calculate_heading_ranges(headings, total_lines)
 
         if verbose:
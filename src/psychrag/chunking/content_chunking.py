@@ -30,6 +30,7 @@ from psychrag.data.database import get_session
 from psychrag.data.models import Chunk, Work
 from psychrag.sanitization.extract_titles import HashMismatchError
 from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import MarkdownIndex, build_markdown_index, load_markdown_index
 
 
 # Load spaCy model for sentence tokenization
@@ -120,9 +121,13 @@ def _convert_bullets_to_sentences(text: str) -> str:
     return '\n'.join(result_lines)
 
 
-def _parse_markdown_structure(content: str) -> dict:
+def _parse_markdown_structure(content: str, index: Optional[MarkdownIndex] = None) -> dict:
     """Parse markdown into structured elements.
 
+    Args:
+        content: Markdown content.
+        index: Structure index of the content, if already loaded.
+
     Returns:
         Dictionary with:
         - headings: list of (line_num, level, text)
@@ -130,82 +135,22 @@ def _parse_markdown_structure(content: str) -> dict:
         - tables: list of (start_line, end_line, text)
         - figures: list of (line_num, text)
     """
+    if index is None:
+        index = build_markdown_index(content)
     lines = content.splitlines()
 
-    headings = []
-    paragraphs = []
-    tables = []
-    figures = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        line_num = i + 1  # 1-indexed
-
-        # Check for heading
-        heading_match = re.match(r'^(#+)\s+(.*)$', line)
-        if heading_match:
-            level = len(heading_match.group(1))
-            if level <= 5:
-                headings.append((line_num, level, line))
-            i += 1
-            continue
-
-        # Check for figure (image)
-        if re.match(r'^!\[.*\]\(.*\)', line):
-            figures.append((line_num, line))
-            i += 1
-            continue
-
-        # Check for table (starts with |)
-        if line.strip().startswith('|'):
-            table_start = line_num
-            table_lines = [line]
-            i += 1
-            while i < len(lines) and lines[i].strip().startswith('|'):
-                table_lines.append(lines[i])
-                i += 1
-            table_end = table_start + len(table_lines) - 1
-            tables.append((table_start, table_end, '\n'.join(table_lines)))
-            continue
-
-        # Check for paragraph (non-empty, non-special line)
-        if line.strip():
-            para_start = line_num
-            para_lines = [line]
-            i += 1
-            # Continue until blank line or special element
-            while i < len(lines):
-                next_line = lines[i]
-                # Stop at blank line
-                if not next_line.strip():
-                    break
-                # Stop at heading
-                if re.match(r'^#+\s+', next_line):
-                    break
-                # Stop at figure
-                if re.match(r'^!\[.*\]\(.*\)', next_line):
-                    break
-                # Stop at table
-                if next_line.strip().startswith('|'):
-                    break
-                para_lines.append(next_line)
-                i += 1
-
-            para_end = para_start + len(para_lines) - 1
-            para_text = '\n'.join(para_lines)
-            # Convert bullets to sentences
-            para_text = _convert_bullets_to_sentences(para_text)
-            paragraphs.append((para_start, para_end, para_text))
-            continue
-
-        i += 1
+    def block(start: int, end: int) -> str:
+        return '\n'.join(lines[start - 1:end])
 
     return {
-        'headings': headings,
-        'paragraphs': paragraphs,
-        'tables': tables,
-        'figures': figures
+        'headings': [(h.line, h.level, h.raw) for h in index.headings_up_to(5)],
+        # Bullets are converted to sentences
+        'paragraphs': [
+            (start, end, _convert_bullets_to_sentences(block(start, end)))
+            for start, end in index.paragraphs
+        ],
+        'tables': [(start, end, block(start, end)) for start, end in index.tables],
+        'figures': [(line_num, lines[line_num - 1]) for line_num in index.figures],
     }
 
 
@@ -702,7 +647,8 @@ def chunk_content(work_id: int, verbose: bool = False, min_chunk_words: int = MI
         content = sanitized_path.read_text(encoding='utf-8')
 
         # Step 6: Parse markdown structure
-        structure = _parse_markdown_structure(content)
+        index = load_markdown_index(sanitized_path, file_hash=sanitized_current_hash, content=content)
+        structure = _parse_markdown_structure(content, index)
         headings = structure['headings']
         heading_hierarchy = _build_heading_hierarchy(headings)
 
@@ -4,6 +4,17 @@ This module uses an LLM to process entire markdown documents and extract
 bibliographic information, generate proper heading hierarchy, and create
 a table of contents.
 
+Documents above MAX_LINES_DEFAULT lines can be processed in windowed
+(map-reduce) mode: the document is split on heading boundaries into windows of
+about WINDOW_TOKENS tokens, the windows are sent to the LLM concurrently, and
+the results are merged deterministically in document order:
+
+- bibliographic fields: first non-empty value (authors: first non-empty list);
+- sanitized markdown: window outputs joined in order with newlines;
+- TOC: window TOCs concatenated, dropping entries repeated across a boundary.
+
+A window whose response can't be parsed keeps its original text.
+
 Uses lazy imports to avoid loading heavy AI dependencies until actually needed.
 
 Usage:
@@ -14,13 +25,17 @@ Examples:
     # Basic usage
     result = process_with_llm("book.md")
 
-    # Force processing large files
+    # Force processing large files in a single prompt
     result = process_with_llm("large_book.md", force=True)
+
+    # Process large files in parallel windows
+    result = process_with_llm("large_book.md", windowed=True)
 """
 
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -31,12 +46,24 @@ from psychrag.data.database import SessionLocal
 if TYPE_CHECKING:
     from psychrag.ai import LLMSettings, ModelTier
 from psychrag.data.models import Work
-from psychrag.utils import compute_file_hash, set_file_readonly
+from psychrag.utils import set_file_readonly, write_text_atomic
+from psychrag.utils.markdown_index import HeadingEntry, build_markdown_index
+from psychrag.utils.token_count import count_tokens
 
 
 # Maximum lines before requiring force flag
 MAX_LINES_DEFAULT = 2000
 
+# Target document tokens per window in windowed mode (the response repeats
+# the window, so this must stay well below the model's output limit)
+WINDOW_TOKENS = 6000
+
+# Concurrent LLM requests in windowed mode
+MAP_WORKERS = 4
+
+# Maximum tokens of the document outline included in every window prompt
+OUTLINE_TOKENS = 1000
+
 # Output directory for sanitized files
 OUTPUT_DIR = Path("output")
 
@@ -64,8 +91,27 @@ class LLMProcessResult(BaseModel):
     toc: list[TOCEntry]
 
 
-def _build_prompt(markdown_content: str) -> str:
-    """Build the LLM prompt for document processing."""
+def _build_prompt(
+    markdown_content: str,
+    part: int | None = None,
+    total: int | None = None,
+    outline: list[str] | None = None,
+) -> str:
+    """Build the LLM prompt for document processing (or one window of it)."""
+    part_section = ""
+    if part is not None:
+        outline_text = "\n".join(outline or [])
+        part_section = f"""
+## Document Part
+This is part {part} of {total} of a longer document. Process only this part:
+- Extract bibliographic information only if it appears in this part; otherwise use null
+- Use heading levels consistent with the outline of the whole document below
+- The document title (H1) appears only in part 1
+- The TOC lists only the headings in this part
+
+Outline of the whole document (original headings):
+{outline_text}
+"""
     return f"""You are an expert at analyzing academic documents and extracting metadata.
 
 ## Task
@@ -85,7 +131,7 @@ Analyze the following markdown document and:
 - Only modify the heading levels (# symbols)
 - Do not add or remove any text content
 - Do not change formatting other than heading levels
-
+{part_section}
 ## Output Format
 Return your response as valid JSON with this exact structure:
 ```json
@@ -115,29 +161,252 @@ Return your response as valid JSON with this exact structure:
 Return only the JSON response, no additional text."""
 
 
+def _parse_response(response, fallback_content: str, verbose: bool = False) -> LLMProcessResult:
+    """Parse the JSON response; keep fallback_content if it can't be parsed."""
+    response_text = response.content
+    if isinstance(response_text, list):
+        response_text = response_text[0] if response_text else ""
+    if isinstance(response_text, dict):
+        response_text = json.dumps(response_text)
+
+    # Extract JSON from response
+    try:
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0]
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0]
+
+        data = json.loads(response_text.strip())
+
+        # Build result
+        bib_data = data.get("bibliographic", {})
+        bibliographic = BibliographicInfo(
+            title=bib_data.get("title"),
+            authors=bib_data.get("authors", []),
+            year=bib_data.get("year"),
+            publisher=bib_data.get("publisher"),
+            isbn=bib_data.get("isbn"),
+            doi=bib_data.get("doi"),
+        )
+
+        sanitized_markdown = data.get("sanitized_markdown", fallback_content)
+
+        toc_data = data.get("toc", [])
+        toc = [
+            TOCEntry(level=e.get("level", 1), title=e.get("title", ""))
+            for e in toc_data
+        ]
+
+        return LLMProcessResult(
+            bibliographic=bibliographic,
+            sanitized_markdown=sanitized_markdown,
+            toc=toc
+        )
+
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        if verbose:
+            print(f"Warning: Failed to parse LLM response: {e}")
+        # Return minimal result with original content
+        return LLMProcessResult(
+            bibliographic=BibliographicInfo(),
+            sanitized_markdown=fallback_content,
+            toc=[]
+        )
+
+
+def _split_blocks(lines: list[str], max_tokens: int) -> list[list[str]]:
+    """Split an oversized section at blank lines (or line boundaries) into blocks of max_tokens."""
+    blocks: list[list[str]] = []
+    current: list[str] = []
+    tokens = 0
+    for i, line in enumerate(lines):
+        line_tokens = count_tokens(line + "\n")
+        at_paragraph = i == 0 or not lines[i - 1].strip()
+        over = tokens + line_tokens > max_tokens
+        # Prefer to break before a paragraph; break mid-paragraph only when
+        # the block is far over the limit
+        if current and over and (at_paragraph or tokens + line_tokens > 2 * max_tokens):
+            blocks.append(current)
+            current, tokens = [], 0
+        current.append(line)
+        tokens += line_tokens
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def split_windows(content: str, window_tokens: int = WINDOW_TOKENS) -> list[str]:
+    """
+    Split markdown into windows of about window_tokens tokens on heading boundaries.
+
+    Sections (a heading and the lines up to the next heading) are packed into
+    windows in order; a section larger than a window is split at blank lines.
+
+    Args:
+        content: Markdown text.
+        window_tokens: Target tokens per window.
+
+    Returns:
+        Window texts in document order; joined with newlines they give the content.
+    """
+    lines = content.splitlines()
+    starts = sorted({0, *(heading.line - 1 for heading in build_markdown_index(content).headings)})
+    sections = [lines[start:end] for start, end in zip(starts, starts[1:] + [len(lines)])]
+
+    windows: list[list[str]] = []
+    current: list[str] = []
+    tokens = 0
+    for section in sections:
+        section_tokens = count_tokens("\n".join(section) + "\n")
+        if section_tokens > window_tokens:
+            blocks = _split_blocks(section, window_tokens)
+        else:
+            blocks = [section]
+        for block in blocks:
+            block_tokens = section_tokens if len(blocks) == 1 else count_tokens("\n".join(block) + "\n")
+            if current and tokens + block_tokens > window_tokens:
+                windows.append(current)
+                current, tokens = [], 0
+            current.extend(block)
+            tokens += block_tokens
+    if current:
+        windows.append(current)
+
+    # Attach blank-only windows to their neighbour so joining reproduces the content
+    merged: list[list[str]] = []
+    for window in windows:
+        blank = not any(line.strip() for line in window)
+        if merged and (blank or not any(line.strip() for line in merged[-1])):
+            merged[-1].extend(window)
+        else:
+            merged.append(window)
+    return ["\n".join(window) for window in merged]
+
+
+def _outline(headings: list[HeadingEntry], max_tokens: int = OUTLINE_TOKENS) -> list[str]:
+    """
+    Document outline for window prompts, bounded to max_tokens tokens.
+
+    Includes the deepest heading levels that fit (at least the top level);
+    a top level that doesn't fit on its own is cut and the rest counted.
+    """
+    if not headings:
+        return []
+    levels = sorted({heading.level for heading in headings})
+    for depth in range(len(levels), 0, -1):
+        allowed = set(levels[:depth])
+        lines = [heading.raw for heading in headings if heading.level in allowed]
+        if depth == 1 or count_tokens("\n".join(lines)) <= max_tokens:
+            break
+
+    kept: list[str] = []
+    tokens = 0
+    for line in lines:
+        tokens += count_tokens(line + "\n")
+        if tokens > max_tokens:
+            kept.append(f"... ({len(lines) - len(kept)} more headings)")
+            break
+        kept.append(line)
+    return kept
+
+
+def merge_results(results: list[LLMProcessResult]) -> LLMProcessResult:
+    """
+    Merge per-window results in document order.
+
+    Bibliographic fields take the first non-empty value, sanitized markdown is
+    joined in order with newlines (as split_windows split it, so windows kept
+    unchanged reproduce the original text), and TOC entries repeated across a
+    window boundary are dropped.
+    """
+    bibliographic = BibliographicInfo()
+    for field_name in ("title", "year", "publisher", "isbn", "doi"):
+        for result in results:
+            value = getattr(result.bibliographic, field_name)
+            if value not in (None, ""):
+                setattr(bibliographic, field_name, value)
+                break
+    bibliographic.authors = next(
+        (result.bibliographic.authors for result in results if result.bibliographic.authors), []
+    )
+
+    toc: list[TOCEntry] = []
+    for result in results:
+        for entry in result.toc:
+            if toc and toc[-1] == entry:
+                continue
+            toc.append(entry)
+
+    sanitized_markdown = "\n".join(result.sanitized_markdown for result in results)
+    if not sanitized_markdown.endswith("\n"):
+        sanitized_markdown += "\n"
+
+    return LLMProcessResult(
+        bibliographic=bibliographic,
+        sanitized_markdown=sanitized_markdown,
+        toc=toc,
+    )
+
+
+def _process_windowed(
+    chat,
+    content: str,
+    max_workers: int,
+    verbose: bool,
+) -> LLMProcessResult:
+    """Process windows of the document concurrently and merge the results."""
+    from psychrag.ai.response_cache import invoke_cached
+
+    windows = split_windows(content)
+    outline = _outline(build_markdown_index(content).headings)
+    total = len(windows)
+
+    if verbose:
+        print(f"Split into {total} windows, processing with {max_workers} workers...")
+
+    def process_window(numbered: tuple[int, str]) -> LLMProcessResult:
+        part, window = numbered
+        prompt = _build_prompt(window, part=part, total=total, outline=outline)
+        response = invoke_cached(chat, prompt, function="llm_processing")
+        if verbose:
+            print(f"Processed window {part}/{total}")
+        return _parse_response(response, window, verbose)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total))) as executor:
+        # map() yields results in window order regardless of completion order
+        results = list(executor.map(process_window, enumerate(windows, start=1)))
+
+    return merge_results(results)
+
+
 def process_with_llm(
     input_file: str | Path,
     force: bool = False,
     verbose: bool = False,
     settings: "LLMSettings | None" = None,
     tier: "ModelTier | None" = None,
+    windowed: bool = False,
+    max_workers: int = MAP_WORKERS,
 ) -> LLMProcessResult:
     """
     Process a markdown document using LLM for bibliography, TOC, and sanitization.
 
     Args:
         input_file: Path to the input markdown file.
-        force: If True, process files larger than MAX_LINES_DEFAULT.
+        force: If True, process files larger than MAX_LINES_DEFAULT in a single prompt.
         verbose: If True, print progress information.
         settings: Optional LLM settings.
         tier: Model tier to use (default FULL for better quality).
+        windowed: If True, process the document in windows of about
+            WINDOW_TOKENS tokens (no line limit applies).
+        max_workers: Concurrent LLM requests in windowed mode.
 
     Returns:
         LLMProcessResult with bibliographic info, sanitized markdown, and TOC.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
-        ValueError: If the file is too large and force is not set.
+        ValueError: If the file is too large and neither force nor windowed is set.
     """
     input_path = Path(input_file).resolve()
 
@@ -156,20 +425,16 @@ def process_with_llm(
         print(f"Processing: {input_path}")
         print(f"Line count: {line_count}")
 
-    if line_count > MAX_LINES_DEFAULT and not force:
+    if line_count > MAX_LINES_DEFAULT and not (force or windowed):
         raise ValueError(
             f"File has {line_count} lines, exceeding the {MAX_LINES_DEFAULT} line limit. "
-            f"Use --force flag to process large files."
+            f"Use --windowed to process large files in parallel windows, "
+            f"or --force to send them in a single prompt."
         )
 
-    # Build prompt and call LLM
-    if verbose:
-        print("Sending document to LLM...")
-
-    prompt = _build_prompt(content)
-
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai import create_langchain_chat, ModelTier as MT
+    from psychrag.ai.response_cache import invoke_cached
 
     if tier is None:
         tier = MT.FULL
@@ -182,66 +447,18 @@ def process_with_llm(
     )
     chat = langchain_stack.chat
 
-    response = chat.invoke(prompt)
-
-    # Parse response
-    response_text = response.content
-    if isinstance(response_text, list):
-        response_text = response_text[0] if response_text else ""
-    if isinstance(response_text, dict):
-        response_text = json.dumps(response_text)
-
-    # Extract JSON from response
-    try:
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0]
-
-        data = json.loads(response_text.strip())
-
-        # Build result
-        bib_data = data.get("bibliographic", {})
-        bibliographic = BibliographicInfo(
-            title=bib_data.get("title"),
-            authors=bib_data.get("authors", []),
-            year=bib_data.get("year"),
-            publisher=bib_data.get("publisher"),
-            isbn=bib_data.get("isbn"),
-            doi=bib_data.get("doi"),
-        )
-
-        sanitized_markdown = data.get("sanitized_markdown", content)
-
-        toc_data = data.get("toc", [])
-        toc = [
-            TOCEntry(level=e.get("level", 1), title=e.get("title", ""))
-            for e in toc_data
-        ]
-
-        result = LLMProcessResult(
-            bibliographic=bibliographic,
-            sanitized_markdown=sanitized_markdown,
-            toc=toc
-        )
-
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+    if windowed:
+        result = _process_windowed(chat, content, max_workers, verbose)
+    else:
         if verbose:
-            print(f"Warning: Failed to parse LLM response: {e}")
-        # Return minimal result with original content
-        result = LLMProcessResult(
-            bibliographic=BibliographicInfo(),
-            sanitized_markdown=content,
-            toc=[]
-        )
+            print("Sending document to LLM...")
+        response = invoke_cached(chat, _build_prompt(content), function="llm_processing")
+        result = _parse_response(response, content, verbose)
 
     # Save sanitized file
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     sanitized_path = OUTPUT_DIR / f"{input_path.stem}.sanitized.md"
-    sanitized_path.write_text(result.sanitized_markdown, encoding='utf-8')
-
-    # Compute hash of sanitized file
-    sanitized_hash = compute_file_hash(sanitized_path)
+    sanitized_hash = write_text_atomic(sanitized_path, result.sanitized_markdown)
 
     # Set file as read-only to prevent accidental modifications
     set_file_readonly(sanitized_path)
@@ -10,12 +10,17 @@ Examples:
     # Process a document
     venv\\Scripts\\python -m psychrag.chunking.llm_processor_cli book.md
 
-    # Process a large file (>2000 lines)
+    # Process a large file (>2000 lines) in a single prompt
     venv\\Scripts\\python -m psychrag.chunking.llm_processor_cli large_book.md --force
 
+    # Process a large file in parallel windows
+    venv\\Scripts\\python -m psychrag.chunking.llm_processor_cli large_book.md --windowed --workers 8
+
 Options:
     input_file          Path to the markdown file to process
-    --force             Process files larger than 2000 lines
+    --force             Process files larger than 2000 lines in a single prompt
+    --windowed          Process the document in parallel windows split on headings
+    --workers N         Concurrent LLM requests in windowed mode (default: 4)
     -v, --verbose       Print progress information
 """
 
@@ -23,7 +28,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from .llm_processor import process_with_llm
+from .llm_processor import MAP_WORKERS, process_with_llm
 
 
 def main() -> int:
@@ -39,7 +44,18 @@ def main() -> int:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Process files larger than 2000 lines"
+        help="Process files larger than 2000 lines in a single prompt"
+    )
+    parser.add_argument(
+        "--windowed",
+        action="store_true",
+        help="Process the document in parallel windows split on heading boundaries"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAP_WORKERS,
+        help=f"Concurrent LLM requests in windowed mode (default: {MAP_WORKERS})"
     )
     parser.add_argument(
         "-v", "--verbose",
@@ -53,7 +69,9 @@ def main() -> int:
         result = process_with_llm(
             args.input_file,
             force=args.force,
-            verbose=args.verbose
+            verbose=args.verbose,
+            windowed=args.windowed,
+            max_workers=args.workers,
         )
 
         print(f"\n=== Processing Complete ===")
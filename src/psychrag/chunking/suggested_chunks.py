@@ -4,6 +4,11 @@ This module analyzes markdown document headings and uses an LLM to determine
 which sections contain valuable content worth vectorizing versus sections
 like table of contents, indexes, and references that should be skipped.
 
+Documents with more than SHARD_MAX_TITLES headings are split into shards by
+top-level section (see psychrag.sanitization.title_shards); the shards are sent
+to the LLM concurrently and the merged decisions are checked for coverage of
+every heading line before hierarchy rules are applied to the whole document.
+
 Uses lazy imports to avoid loading heavy AI dependencies until actually needed.
 
 Usage:
@@ -19,7 +24,7 @@ Examples:
     result = suggest_chunks_from_work(work_id=1, use_full_model=True)
 
 Functions:
-    suggest_chunks_from_work(work_id, use_full_model, force, verbose) - Analyze from Work by ID
+    suggest_chunks_from_work(work_id, use_full_model, force, verbose, max_workers) - Analyze from Work by ID
     suggest_chunks(input_path, bib_info, verbose) - Analyze from file path (legacy)
 
 Exceptions:
@@ -38,7 +43,15 @@ from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from psychrag.data.template_loader import load_template
 from psychrag.sanitization.extract_titles import extract_titles_to_file, extract_titles_from_work, HashMismatchError
-from psychrag.utils.file_utils import compute_file_hash, set_file_readonly, set_file_writable, is_file_readonly
+from psychrag.sanitization.title_shards import (
+    SHARD_WORKERS,
+    merge_shard_results,
+    outline,
+    run_shards,
+    shard_note,
+    shard_titles,
+)
+from psychrag.utils.file_utils import compute_file_hash, set_file_readonly, set_file_writable, is_file_readonly, write_text_atomic
 
 
 def _build_prompt(titles_content: str, bib_info: BibliographicInfo | None) -> str:
@@ -283,10 +296,61 @@ def _apply_hierarchy_rules(
     return result
 
 
+def _request_decisions(
+    chat,
+    titles_list: list[str],
+    bib_info: BibliographicInfo | None,
+    max_workers: int = SHARD_WORKERS,
+    verbose: bool = False,
+) -> dict[int, str]:
+    """Ask the LLM for SKIP/VECTORIZE decisions, one call per shard of the titles.
+
+    Args:
+        chat: LangChain chat model.
+        titles_list: Title lines ("line_num: heading_line").
+        bib_info: Optional bibliographic information (shared by all shards).
+        max_workers: Maximum concurrent LLM calls.
+        verbose: Whether to print progress information.
+
+    Returns:
+        Dictionary mapping line numbers of titles to SKIP/VECTORIZE decisions.
+    """
+    from psychrag.ai.response_cache import invoke_cached
+
+    shards = shard_titles(titles_list)
+    total = len(shards)
+    prompts = [_build_prompt('\n'.join(shard), bib_info) for shard in shards]
+    if total > 1:
+        document_outline = outline(titles_list)
+        prompts = [
+            prompt + shard_note(part, total, document_outline)
+            for part, prompt in enumerate(prompts, start=1)
+        ]
+        if verbose:
+            print(f"Split {len(titles_list)} headings into {total} shards")
+
+    def invoke(part: int, prompt: str) -> str:
+        response_text = invoke_cached(chat, prompt, function="chunk_suggestions").content
+        # Handle case where content might be a list
+        if isinstance(response_text, list):
+            response_text = '\n'.join(str(item) for item in response_text)
+        return response_text
+
+    responses = run_shards(prompts, invoke, max_workers=max_workers)
+
+    decisions, _ = merge_shard_results(
+        shards,
+        [_parse_llm_response(text) for text in responses],
+        label="Chunk suggestions",
+    )
+    return decisions
+
+
 def suggest_chunks(
     input_path: str | Path,
     bib_info: "BibliographicInfo | None" = None,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: int = SHARD_WORKERS,
 ) -> Path:
     """Analyze document headings and suggest which sections to vectorize.
 
@@ -294,6 +358,7 @@ def suggest_chunks(
         input_path: Path to the sanitized markdown file.
         bib_info: Optional bibliographic information for context.
         verbose: Whether to print progress information.
+        max_workers: Maximum concurrent LLM calls for sharded documents.
 
     Returns:
         Path to the created suggestions file.
@@ -334,8 +399,6 @@ def suggest_chunks(
     if verbose:
         print("Analyzing headings with LLM...")
 
-    prompt = _build_prompt(titles_block, bib_info)
-
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai import create_langchain_chat, ModelTier
 
@@ -346,15 +409,8 @@ def suggest_chunks(
         temperature=0.2
     )
 
-    response = langchain_stack.chat.invoke(prompt)
-    response_text = response.content
-
-    # Handle case where content might be a list
-    if isinstance(response_text, list):
-        response_text = '\n'.join(str(item) for item in response_text)
-
-    # Step 4: Parse response and apply hierarchy rules
-    decisions = _parse_llm_response(response_text)
+    # Step 4: Get decisions and apply hierarchy rules
+    decisions = _request_decisions(langchain_stack.chat, titles_list, bib_info, max_workers, verbose)
     decisions = _apply_hierarchy_rules(decisions, titles_list)
 
     # Step 5: Build output content
@@ -372,7 +428,7 @@ def suggest_chunks(
 
     # Step 6: Save output
     output_path = input_path.with_suffix('.vectorize_suggestions.md')
-    output_path.write_text(output_content, encoding='utf-8')
+    write_text_atomic(output_path, output_content)
 
     if verbose:
         print(f"Suggestions saved to {output_path.name}")
@@ -612,7 +668,7 @@ def save_vec_suggestions_from_response(
                 set_file_writable(output_path)
 
         # Write output file
-        output_path.write_text(output_content, encoding='utf-8')
+        suggestions_hash = write_text_atomic(output_path, output_content)
 
         if verbose:
             print(f"Suggestions written: {output_path}")
@@ -623,9 +679,6 @@ def save_vec_suggestions_from_response(
         if verbose:
             print(f"File set to read-only")
 
-        # Compute hash of suggestions file
-        suggestions_hash = compute_file_hash(output_path)
-
         # Update work's files metadata
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
@@ -648,7 +701,8 @@ def suggest_chunks_from_work(
     work_id: int,
     use_full_model: bool = False,
     force: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: int = SHARD_WORKERS,
 ) -> Path:
     """Analyze document headings from a work and suggest which sections to vectorize.
 
@@ -657,6 +711,7 @@ def suggest_chunks_from_work(
         use_full_model: If True, use ModelTier.FULL instead of ModelTier.LIGHT.
         force: If True, skip hash validation and proceed anyway.
         verbose: If True, print progress messages.
+        max_workers: Maximum concurrent LLM calls for sharded documents.
 
     Returns:
         Path to the created vectorization suggestions file.
@@ -792,8 +847,6 @@ def suggest_chunks_from_work(
         if verbose:
             print("Analyzing headings with LLM...")
 
-        prompt = _build_prompt(titles_block, bib_info)
-
         # Lazy import - only load AI module when LLM is needed
         from psychrag.ai import create_langchain_chat, ModelTier
 
@@ -809,18 +862,14 @@ def suggest_chunks_from_work(
             temperature=0.2
         )
 
-        response = langchain_stack.chat.invoke(prompt)
-        response_text = response.content
-
-        # Handle case where content might be a list
-        if isinstance(response_text, list):
-            response_text = '\n'.join(str(item) for item in response_text)
+        decisions = _request_decisions(
+            langchain_stack.chat, titles_list, bib_info, max_workers, verbose
+        )
 
         if verbose:
             print("LLM response received")
 
-        # Parse response and apply hierarchy rules
-        decisions = _parse_llm_response(response_text)
+        # Apply hierarchy rules
         decisions = _apply_hierarchy_rules(decisions, titles_list)
 
         # Build output content
@@ -851,7 +900,7 @@ def suggest_chunks_from_work(
                 set_file_writable(output_path)
 
         # Write output file
-        output_path.write_text(output_content, encoding='utf-8')
+        suggestions_hash = write_text_atomic(output_path, output_content)
 
         if verbose:
             print(f"Suggestions written: {output_path}")
@@ -862,9 +911,6 @@ def suggest_chunks_from_work(
         if verbose:
             print(f"File set to read-only")
 
-        # Compute hash of suggestions file
-        suggestions_hash = compute_file_hash(output_path)
-
         # Update work's files metadata
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
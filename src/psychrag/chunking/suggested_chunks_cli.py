@@ -23,6 +23,7 @@ Options:
     work_id                 Database ID of the work
     --full-llm              Use full LLM model instead of light (more expensive but better)
     --force                 Proceed even if file hashes don't match database
+    --workers N             Concurrent LLM calls for documents with many headings (default: 4)
     -v, --verbose           Print detailed progress messages
 """
 
@@ -34,6 +35,7 @@ from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from psychrag.chunking.suggested_chunks import suggest_chunks_from_work
 from psychrag.sanitization.extract_titles import HashMismatchError
+from psychrag.sanitization.title_shards import SHARD_WORKERS
 
 
 def main() -> int:
@@ -71,6 +73,13 @@ then updates the database with the new vec_suggestions file metadata.
         help="Proceed even if file hashes don't match database"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SHARD_WORKERS,
+        help=f"Concurrent LLM calls for documents with many headings (default: {SHARD_WORKERS})"
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -126,7 +135,8 @@ then updates the database with the new vec_suggestions file metadata.
                 work_id=args.work_id,
                 use_full_model=args.full_llm,
                 force=args.force,
-                verbose=args.verbose
+                verbose=args.verbose,
+                max_workers=args.workers
             )
 
             print(f"\nSuccess!")
@@ -151,7 +161,8 @@ then updates the database with the new vec_suggestions file metadata.
                     work_id=args.work_id,
                     use_full_model=args.full_llm,
                     force=True,
-                    verbose=args.verbose
+                    verbose=args.verbose,
+                    max_workers=args.workers
                 )
                 print(f"Vectorization suggestions saved to: {output_path}")
                 return 0
@@ -164,7 +175,8 @@ then updates the database with the new vec_suggestions file metadata.
                             work_id=args.work_id,
                             use_full_model=args.full_llm,
                             force=True,
-                            verbose=args.verbose
+                            verbose=args.verbose,
+                            max_workers=args.workers
                         )
                         print(f"\nSuccess! Vectorization suggestions saved to: {output_path}")
                         return 0
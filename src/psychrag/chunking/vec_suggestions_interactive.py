@@ -20,6 +20,7 @@ from pathlib import Path
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import load_markdown_index
 from psychrag.sanitization.extract_titles import HashMismatchError
 
 
@@ -45,24 +46,13 @@ def extract_all_headings_from_sanitized(sanitized_path: Path) -> list[dict]:
     if not sanitized_path.exists():
         raise FileNotFoundError(f"Sanitized file not found: {sanitized_path}")
 
-    content = sanitized_path.read_text(encoding='utf-8')
-    lines = content.splitlines()
+    index = load_markdown_index(sanitized_path)
 
-    headings = []
-    # Parse headings directly from markdown content
-    # Pattern matches markdown headings: # Heading, ## Heading, etc.
-    heading_pattern = re.compile(r'^(#+)\s+(.*)$')
-
-    for i, line in enumerate(lines, start=1):
-        match = heading_pattern.match(line)
-        if match:
-            level = len(match.group(1))
-            if level <= 5:  # Only H1-H5
-                heading_text = line.strip()  # Keep full heading line with markdown symbols
-                headings.append({
-                    "line_num": i,
-                    "heading": heading_text
-                })
+    # Only H1-H5; keep the full heading line with markdown symbols
+    headings = [
+        {"line_num": h.line, "heading": h.raw.strip()}
+        for h in index.headings_up_to(5)
+    ]
 
     if not headings:
         raise ValueError(f"No headings found in sanitized file: {sanitized_path}")
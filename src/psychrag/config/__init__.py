@@ -8,8 +8,13 @@ This module provides configuration management for the application:
 
 from .app_config import (
     AppConfig,
+    AugmentationConfig,
+    ConversionConfig,
     DatabaseConfig,
+    LLMCacheConfig,
+    LLMClientConfig,
     LLMConfig,
+    LLMLocalConfig,
     LLMModelsConfig,
     ModelConfig,
     PathsConfig,
@@ -31,8 +36,13 @@ from .io_folder_data import (
 
 __all__ = [
     "AppConfig",
+    "AugmentationConfig",
+    "ConversionConfig",
     "DatabaseConfig",
+    "LLMCacheConfig",
+    "LLMClientConfig",
     "LLMConfig",
+    "LLMLocalConfig",
     "LLMModelsConfig",
     "ModelConfig",
     "PathsConfig",
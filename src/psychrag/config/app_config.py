@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +23,22 @@ class DatabaseConfig(BaseModel):
     app_user: str = Field(
         default="psych_rag_app_user_test", description="Application user name"
     )
+    pool_size: int = Field(
+        default=5, ge=1, description="Persistent connections kept in the pool"
+    )
+    max_overflow: int = Field(
+        default=10, ge=0, description="Extra connections allowed above pool_size"
+    )
+    pool_timeout: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a free connection"
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        description="Recycle connections older than this many seconds (-1 disables)",
+    )
+    pool_pre_ping: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
 
 
 class ModelConfig(BaseModel):
@@ -41,15 +57,82 @@ class LLMModelsConfig(BaseModel):
     gemini: ModelConfig = Field(
         default=ModelConfig(light="gemini-flash-latest", full="gemini-2.5-pro")
     )
+    local: ModelConfig = Field(
+        default=ModelConfig(light="local-light", full="local-full")
+    )
+
+
+class LLMClientConfig(BaseModel):
+    """HTTP settings for LLM and embedding clients."""
+
+    cache_clients: bool = Field(
+        default=True,
+        description="Reuse chat and embedding clients per provider, model and temperature",
+    )
+    timeout: float = Field(
+        default=120.0, gt=0, description="Request timeout in seconds"
+    )
+    max_retries: int = Field(
+        default=2, ge=0, description="Retries for failed or rate-limited requests"
+    )
+    max_connections: int = Field(
+        default=20, ge=1, description="Maximum open connections per HTTP pool"
+    )
+    max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Idle connections kept open per HTTP pool"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0, ge=0, description="Seconds an idle connection is kept open"
+    )
+
+
+class LLMCacheConfig(BaseModel):
+    """Persistent cache of LLM responses for repeated pipeline prompts."""
+
+    enabled: bool = Field(default=True, description="Consult the LLM response cache")
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Response cache directory (default: <paths.output_dir>/.llm_cache)",
+    )
+    ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        ge=0,
+        description="Seconds a cached response stays valid (0 = never expires)",
+    )
+    functions: list[str] = Field(
+        default_factory=list,
+        description="Pipeline functions whose LLM calls are cached (opt-in; empty = none)",
+    )
+
+
+class LLMLocalConfig(BaseModel):
+    """Offline stand-in models used by the "local" provider (benchmarks, no network)."""
+
+    latency_seconds: float = Field(
+        default=0.0, ge=0, description="Simulated delay before the first token of a chat response"
+    )
+    tokens_per_second: float = Field(
+        default=0.0, ge=0, description="Simulated generation rate (0 = instant)"
+    )
+    response_tokens: int = Field(
+        default=200, ge=1, description="Words in a free-text chat response"
+    )
+    embedding_dimensions: int = Field(
+        default=768, ge=1, description="Size of local embedding vectors (must match the database)"
+    )
+    seed: int = Field(default=0, description="Seed mixed into generated chat responses")
 
 
 class LLMConfig(BaseModel):
     """LLM configuration settings."""
 
-    provider: Literal["openai", "gemini"] = Field(
+    provider: Literal["openai", "gemini", "local"] = Field(
         default="gemini", description="Active LLM provider"
     )
     models: LLMModelsConfig = Field(default_factory=LLMModelsConfig)
+    client: LLMClientConfig = Field(default_factory=LLMClientConfig)
+    cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
+    local: LLMLocalConfig = Field(default_factory=LLMLocalConfig)
 
 
 class PathsConfig(BaseModel):
@@ -83,6 +166,88 @@ class LoggingConfig(BaseModel):
     log_dir: str = Field(default="logs", description="Directory to store logs")
 
 
+PdfEngine = Literal["auto", "docling", "fast"]
+
+
+class ConversionConfig(BaseModel):
+    """Document conversion settings."""
+
+    pdf_engine: PdfEngine = Field(
+        default="auto",
+        description="PDF conversion engine: docling, fast (PyMuPDF text layer) or "
+        "auto (fast for born-digital PDFs, docling otherwise)",
+    )
+
+    converter_idle_timeout: int = Field(
+        default=900,
+        ge=0,
+        description="Seconds an unused docling converter stays loaded (0 disables idle eviction)",
+    )
+    max_converters: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum docling converters (distinct pipeline options) kept loaded",
+    )
+
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache docling documents and markdown outputs per source file and options",
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description="Conversion cache directory (default: <paths.output_dir>/.conversion_cache)",
+    )
+    batch_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes for batch conversion of the input folder",
+    )
+    epub_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Worker processes for converting large EPUBs (1 disables)",
+    )
+    parallel_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes for page-range parallel docling conversion (1 disables)",
+    )
+    parallel_page_threshold: int = Field(
+        default=300,
+        ge=0,
+        description="Minimum page count before a PDF is converted by page ranges in parallel",
+    )
+    pages_per_chunk: int = Field(
+        default=100,
+        ge=1,
+        description="Pages per docling call in parallel conversion",
+    )
+    max_parallel_memory_mb: int = Field(
+        default=0,
+        ge=0,
+        description="Total memory budget for parallel conversion workers in MB (0 = no limit)",
+    )
+    worker_memory_mb: int = Field(
+        default=3000,
+        ge=1,
+        description="Estimated peak memory of one conversion worker in MB",
+    )
+
+
+class AugmentationConfig(BaseModel):
+    """Augmented prompt settings."""
+
+    context_token_budget: int = Field(
+        default=12000,
+        ge=0,
+        description="Tokens of retrieved context packed into an augmented prompt (0 = no limit)",
+    )
+    model_token_budgets: dict[str, int] = Field(
+        default_factory=dict,
+        description="Context token budget per model name, overriding context_token_budget",
+    )
+
+
 class AppConfig(BaseModel):
     """Root application configuration."""
 
@@ -90,6 +255,8 @@ class AppConfig(BaseModel):
     llm: LLMConfig = Field(default_factory=LLMConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    conversion: ConversionConfig = Field(default_factory=ConversionConfig)
+    augmentation: AugmentationConfig = Field(default_factory=AugmentationConfig)
 
 
 # Singleton instance
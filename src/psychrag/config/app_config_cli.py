@@ -125,8 +125,8 @@ def set_config_value(args: argparse.Namespace) -> int:
 
         # LLM settings
         if args.provider:
-            if args.provider not in ["openai", "gemini"]:
-                print(f"Error: Invalid provider '{args.provider}'. Must be 'openai' or 'gemini'", file=sys.stderr)
+            if args.provider not in ["openai", "gemini", "local"]:
+                print(f"Error: Invalid provider '{args.provider}'. Must be 'openai', 'gemini' or 'local'", file=sys.stderr)
                 return 1
             config.llm.provider = args.provider
         if args.openai_light:
@@ -223,7 +223,7 @@ Examples:
     set_parser.add_argument("--db-app-user", type=str, help="Application user name")
 
     # LLM settings
-    set_parser.add_argument("--provider", type=str, choices=["openai", "gemini"], help="LLM provider")
+    set_parser.add_argument("--provider", type=str, choices=["openai", "gemini", "local"], help="LLM provider")
     set_parser.add_argument("--openai-light", type=str, help="OpenAI light model name")
     set_parser.add_argument("--openai-full", type=str, help="OpenAI full model name")
     set_parser.add_argument("--gemini-light", type=str, help="Gemini light model name")
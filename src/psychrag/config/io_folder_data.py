@@ -129,8 +129,9 @@ def get_io_files_by_type(file_type):
 
     with get_session() as session:
         files = session.query(IOFile).filter(IOFile.file_type == file_type).all()
-        # Detach from session
-        session.expunge_all()
+        # Detach from session (only our rows - the session may be request-scoped)
+        for io_file in files:
+            session.expunge(io_file)
         return files
 
 
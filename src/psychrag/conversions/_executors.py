@@ -0,0 +1,16 @@
+"""Process pools for the conversion modules.
+
+Conversion workers (page ranges of a PDF, files of a batch, items of an EPUB)
+run in processes started with "spawn": forking a process that has loaded
+torch/CUDA or started threads (the API server) is not safe.
+"""
+
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+
+def make_process_executor(workers: int) -> Executor:
+    """Return a ProcessPoolExecutor with `workers` spawned worker processes."""
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
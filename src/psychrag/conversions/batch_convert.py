@@ -0,0 +1,373 @@
+"""
+Batch conversion of the input folder.
+
+Converts every PDF and EPUB in paths.input_dir to markdown in
+paths.output_dir, spreading files over a process pool. Each worker keeps its
+own pooled docling converter, so models load once per worker rather than
+once per file.
+
+Scheduling:
+- Files already registered as works (get_processed_files_from_works) or whose
+  outputs already exist are skipped.
+- Remaining files are submitted largest first, so the longest conversions
+  start early and small files fill the gaps at the end.
+
+Resuming: progress is recorded after every file in <output_dir>/.batch_convert.json.
+Re-running after an interruption skips converted files and files that failed
+before (use retry_failed to try them again), and removes the source copy
+left behind by a conversion that was cut off half way.
+
+Example (as script):
+    venv\\Scripts\\python -m psychrag.conversions.batch_convert -v
+    venv\\Scripts\\python -m psychrag.conversions.batch_convert --workers 4 --engine fast
+    venv\\Scripts\\python -m psychrag.conversions.batch_convert --retry-failed
+
+Example (as library):
+    from psychrag.conversions.batch_convert import convert_folder
+
+    report = convert_folder(workers=2)
+    print(f"{len(report.converted)} converted, {len(report.failed)} failed")
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Literal, Optional
+
+from psychrag.config import load_config
+from psychrag.config.app_config import PdfEngine
+from psychrag.config.io_folder_data import INPUT_FORMATS, get_processed_files_from_works
+from psychrag.utils.file_utils import write_text_atomic
+
+from ._executors import make_process_executor
+from .conv_epub2md import convert_epub_to_markdown
+from .conv_pdf2md import convert_pdf_to_markdown
+from .parallel_pdf import get_page_count, resolve_worker_count
+
+STATE_FILENAME = ".batch_convert.json"
+
+FileStatus = Literal["converted", "failed", "skipped"]
+
+
+@dataclass
+class FileResult:
+    """Outcome of converting one input file."""
+
+    filename: str
+    status: FileStatus
+    size_bytes: int = 0
+    pages: Optional[int] = None  # PDFs only
+    seconds: float = 0.0
+    error: Optional[str] = None
+    reason: Optional[str] = None  # Why a file was skipped
+
+    @property
+    def pages_per_second(self) -> Optional[float]:
+        if self.status != "converted" or not self.pages or self.seconds <= 0:
+            return None
+        return self.pages / self.seconds
+
+
+@dataclass
+class BatchReport:
+    """Results of a batch conversion run."""
+
+    results: list[FileResult] = field(default_factory=list)
+    workers: int = 0
+    seconds: float = 0.0
+
+    @property
+    def converted(self) -> list[FileResult]:
+        return [r for r in self.results if r.status == "converted"]
+
+    @property
+    def failed(self) -> list[FileResult]:
+        return [r for r in self.results if r.status == "failed"]
+
+    @property
+    def skipped(self) -> list[FileResult]:
+        return [r for r in self.results if r.status == "skipped"]
+
+
+def _expected_outputs(source: Path, output_dir: Path) -> list[Path]:
+    """Files a completed conversion leaves in the output directory."""
+    stem = source.stem
+    if source.suffix.lower() == ".pdf":
+        return [output_dir / f"{stem}.pdf", output_dir / f"{stem}.style.md", output_dir / f"{stem}.hier.md"]
+    return [output_dir / source.name, output_dir / f"{stem}.md"]
+
+
+def _load_state(output_dir: Path) -> dict[str, dict]:
+    path = output_dir / STATE_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(output_dir: Path, state: dict[str, dict]) -> None:
+    # Atomic, so an interruption never leaves a truncated state file
+    write_text_atomic(output_dir / STATE_FILENAME, json.dumps(state, indent=2))
+
+
+def plan_batch(
+    input_dir: Path,
+    output_dir: Path,
+    processed: set[str],
+    state: dict[str, dict],
+    retry_failed: bool = False,
+) -> tuple[list[Path], list[FileResult]]:
+    """
+    Decide which input files to convert.
+
+    Args:
+        input_dir: Folder with source PDFs/EPUBs.
+        output_dir: Folder the conversions are written to.
+        processed: Filenames already registered as works.
+        state: Saved progress of earlier runs (filename -> result dict).
+        retry_failed: If True, convert files that failed in an earlier run.
+
+    Returns:
+        Tuple of (files to convert, largest first; skipped file results).
+    """
+    sources = [
+        path for path in input_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in INPUT_FORMATS
+    ] if input_dir.exists() else []
+
+    todo: list[Path] = []
+    skipped: list[FileResult] = []
+    for source in sources:
+        size = source.stat().st_size
+        previous = state.get(source.name, {}).get("status")
+        outputs = _expected_outputs(source, output_dir)
+
+        reason = None
+        if source.name in processed:
+            reason = "already registered as a work"
+        elif all(path.exists() for path in outputs):
+            reason = "already converted"
+        elif previous == "failed" and not retry_failed:
+            reason = "failed in an earlier run"
+
+        if reason:
+            skipped.append(FileResult(source.name, "skipped", size_bytes=size, reason=reason))
+        else:
+            todo.append(source)
+
+    todo.sort(key=lambda path: path.stat().st_size, reverse=True)
+    return todo, sorted(skipped, key=lambda r: r.filename)
+
+
+def _remove_partial_outputs(source: Path, output_dir: Path) -> None:
+    """
+    Remove the source copy left by an interrupted conversion.
+
+    The PDF converter refuses to overwrite its copy of the source, so a
+    conversion cut off after copying would otherwise fail on every retry.
+    """
+    outputs = _expected_outputs(source, output_dir)
+    copy = outputs[0]
+    if copy.exists() and not all(path.exists() for path in outputs[1:]):
+        if copy.stat().st_size == source.stat().st_size and not copy.samefile(source):
+            copy.unlink()
+
+
+def _convert_file(
+    source: str, output_dir: str, engine: Optional[PdfEngine], ocr: bool
+) -> FileResult:
+    """Worker: convert one file, returning a result instead of raising."""
+    source = Path(source)
+    output_path = Path(output_dir) / f"{source.stem}.md"
+    result = FileResult(source.name, "converted", size_bytes=source.stat().st_size)
+
+    start = time.perf_counter()
+    try:
+        _remove_partial_outputs(source, Path(output_dir))
+        # Files are already spread over worker processes; don't start
+        # further processes inside each worker
+        if source.suffix.lower() == ".pdf":
+            result.pages = get_page_count(source)
+            convert_pdf_to_markdown(
+                source,
+                output_path=output_path,
+                ocr=ocr,
+                compare=True,
+                engine=engine,
+                workers=1,
+            )
+        else:
+            convert_epub_to_markdown(source, output_path=output_path, workers=1)
+    except Exception as e:
+        result.status = "failed"
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def convert_folder(
+    input_dir: Optional[str | Path] = None,
+    output_dir: Optional[str | Path] = None,
+    workers: Optional[int] = None,
+    engine: Optional[PdfEngine] = None,
+    ocr: bool = False,
+    retry_failed: bool = False,
+    processed: Optional[set[str]] = None,
+    verbose: bool = False,
+    on_result: Optional[Callable[[FileResult], None]] = None,
+) -> BatchReport:
+    """
+    Convert all unprocessed PDFs and EPUBs in a folder.
+
+    Args:
+        input_dir: Source folder (default: paths.input_dir from config).
+        output_dir: Destination folder (default: paths.output_dir from config).
+        workers: Worker processes (default: conversion.batch_workers from config).
+        engine: PDF engine, see convert_pdf_to_markdown.
+        ocr: If True, enable OCR for PDFs converted with docling.
+        retry_failed: If True, retry files that failed in an earlier run.
+        processed: Filenames to skip as already registered
+                  (default: get_processed_files_from_works()).
+        verbose: If True, print progress information.
+        on_result: Called with each FileResult as files finish.
+
+    Returns:
+        BatchReport with one result per input file.
+    """
+    config = load_config()
+    input_dir = Path(input_dir or config.paths.input_dir)
+    output_dir = Path(output_dir or config.paths.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if processed is None:
+        processed = get_processed_files_from_works()
+
+    state = _load_state(output_dir)
+    todo, skipped = plan_batch(input_dir, output_dir, processed, state, retry_failed)
+
+    workers = resolve_worker_count(
+        workers or config.conversion.batch_workers,
+        len(todo),
+        config.conversion.max_parallel_memory_mb,
+        config.conversion.worker_memory_mb,
+    )
+    report = BatchReport(results=list(skipped), workers=workers)
+
+    if verbose:
+        print(f"Batch conversion: {len(todo)} file(s) to convert, {len(skipped)} skipped, {workers} worker(s)")
+        for result in skipped:
+            print(f"  skip {result.filename}: {result.reason}")
+
+    if not todo:
+        return report
+
+    start = time.perf_counter()
+    with make_process_executor(workers) as executor:
+        futures = [
+            executor.submit(_convert_file, str(source), str(output_dir), engine, ocr)
+            for source in todo
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                report.results.append(result)
+
+                entry = asdict(result)
+                entry["pages_per_second"] = result.pages_per_second
+                state[result.filename] = entry
+                _save_state(output_dir, state)
+
+                if verbose:
+                    _print_result(result)
+                if on_result:
+                    on_result(result)
+        except BaseException:
+            # Interrupted: drop queued files; finished ones are in the state file
+            for future in futures:
+                future.cancel()
+            raise
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _print_result(result: FileResult) -> None:
+    if result.status == "failed":
+        print(f"  FAILED {result.filename} after {result.seconds:.1f}s: {result.error}")
+        return
+    rate = result.pages_per_second
+    detail = f"{result.pages} pages, {rate:.2f} pages/s" if rate is not None else "EPUB"
+    print(f"  done {result.filename} in {result.seconds:.1f}s ({detail})")
+
+
+def main() -> int:
+    """
+    Main entry point for the command-line interface.
+
+    Returns:
+        Exit code (0 if no file failed, 1 otherwise).
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert all unprocessed PDFs and EPUBs in the input folder to Markdown.",
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: conversion.batch_workers from config)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "docling", "fast"],
+        default=None,
+        help="PDF conversion engine (default: conversion.pdf_engine from config)"
+    )
+    parser.add_argument(
+        "--ocr",
+        action="store_true",
+        help="Enable OCR for scanned PDFs"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Retry files that failed in an earlier run"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print progress information"
+    )
+    args = parser.parse_args()
+
+    try:
+        report = convert_folder(
+            workers=args.workers,
+            engine=args.engine,
+            ocr=args.ocr,
+            retry_failed=args.retry_failed,
+            verbose=args.verbose,
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted; re-run to resume", file=sys.stderr)
+        return 1
+
+    pages = sum(r.pages or 0 for r in report.converted)
+    print(
+        f"\n{len(report.converted)} converted, {len(report.failed)} failed, "
+        f"{len(report.skipped)} skipped in {report.seconds:.1f}s"
+        + (f" ({pages / report.seconds:.2f} pages/s overall)" if pages and report.seconds else "")
+    )
+    for result in report.failed:
+        print(f"Failed: {result.filename}: {result.error}", file=sys.stderr)
+
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,16 @@
 """
-EPUB to Markdown Converter using Docling and ebooklib.
+EPUB to Markdown Converter using ebooklib, lxml and markdownify.
 
 This module provides functionality to convert EPUB files to Markdown format.
-It extracts HTML content from EPUB files using ebooklib and then converts
-the HTML to Markdown using Docling.
+It reads the document items of the EPUB with ebooklib, parses each with lxml,
+injects headings from the EPUB navigation and converts the item to Markdown.
+Items of large EPUBs are converted in parallel worker processes and written
+to the output in order as they complete. With an output file, converted items
+are streamed to it and not kept, so memory stays bounded for large books.
 
 Example (as script):
     venv\\Scripts\\python conv_epub2md.py input.epub -o output.md
+    venv\\Scripts\\python conv_epub2md.py big_handbook.epub -o output.md --workers 8
 
 Example (as library):
     from conv_epub2md import convert_epub_to_markdown
@@ -16,15 +20,24 @@ Example (as library):
 import argparse
 import shutil
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 
+from psychrag.config import load_config
+from psychrag.conversions._executors import make_process_executor
 from psychrag.conversions.epub_bookmarks2toc import extract_epub_toc
+from psychrag.utils.file_utils import write_text_chunks_atomic
+
+# Below this much XHTML, starting worker processes (each imports the
+# conversions package) costs more than it saves; conversion runs at roughly
+# 1 MB/s per core
+PARALLEL_MIN_BYTES = 16 * 2**20
 
 
 def _extract_hierarchy(book) -> list[dict]:
@@ -140,113 +153,124 @@ def _extract_hierarchy(book) -> list[dict]:
     return hierarchy  # Return empty list if no navigation found
 
 
-def _extract_epub_to_html(epub_path: Path) -> str:
-    """
-    Extract all text content from an EPUB file as a single well-formed HTML.
+def _heading_map(hierarchy: list[dict]) -> dict[str, list[tuple[Optional[str], int, str]]]:
+    """Group navigation entries by document: {document: [(fragment, level, title), ...]}."""
+    doc_headings: dict[str, list[tuple[Optional[str], int, str]]] = {}
+    for entry in hierarchy:
+        doc_headings.setdefault(entry["document"], []).append(
+            (entry["fragment"], entry["level"], entry["title"])
+        )
+    return doc_headings
 
-    Preserves hierarchical heading structure from navigation when available.
 
-    Args:
-        epub_path: Path to the EPUB file.
+def _read_epub_items(epub_path: Path) -> list[tuple[bytes, list[tuple[Optional[str], int, str]]]]:
+    """
+    Read the document items of an EPUB in order.
 
     Returns:
-        Combined HTML content from all document items as a single HTML document.
+        List of (raw XHTML content, navigation headings for that document).
     """
     book = epub.read_epub(str(epub_path))
+    doc_headings = _heading_map(_extract_hierarchy(book))
 
-    # Get hierarchical navigation structure
-    hierarchy = _extract_hierarchy(book)
+    items = []
+    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+        filename = item.get_name().split("/")[-1]
+        items.append((item.get_content(), doc_headings.get(filename, [])))
+    return items
 
-    # Build a mapping from documents to their heading entries
-    # Structure: {document: [(fragment, level, title), ...]}
-    doc_headings = {}
-    for entry in hierarchy:
-        doc = entry["document"]
-        if doc not in doc_headings:
-            doc_headings[doc] = []
-        doc_headings[doc].append((entry["fragment"], entry["level"], entry["title"]))
 
-    # Collect body content from all document items
-    body_parts = []
+def _item_to_markdown(content: bytes, headings: list[tuple[Optional[str], int, str]]) -> str:
+    """
+    Convert one EPUB document item to Markdown.
 
-    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-        content = item.get_content().decode("utf-8", errors="ignore")
-        soup = BeautifulSoup(content, "html.parser")
+    Navigation headings are injected at their anchors (or at the start of the
+    body) so the heading hierarchy follows the EPUB table of contents. Links
+    are unwrapped and images removed.
+    """
+    soup = BeautifulSoup(content, "lxml")
+    body = soup.find("body")
+    if body is None:
+        return ""
+
+    for fragment, level, title in headings:
+        # Create heading tag with appropriate level (h1-h6)
+        heading_tag = soup.new_tag(f"h{level}")
+        heading_tag.string = title
+
+        target = body.find(id=fragment) if fragment else None
+        if target:
+            target.insert_before(heading_tag)
+        else:
+            # No fragment, or fragment not found: insert at beginning of body
+            body.insert(0, heading_tag)
+
+    # Remove all links but preserve their text content
+    for a_tag in body.find_all("a"):
+        a_tag.unwrap()
+
+    # Remove all images
+    for img_tag in body.find_all("img"):
+        img_tag.decompose()
+
+    # h1 -> #, h2 -> ##, etc.
+    converter = MarkdownConverter(heading_style="ATX", bullets="-", strip=["script", "style"])
+    return converter.convert_soup(body).strip()
+
+
+def _iter_markdown(
+    items: list[tuple[bytes, list[tuple[Optional[str], int, str]]]],
+    workers: int,
+) -> Iterator[str]:
+    """
+    Yield the Markdown of each item, in order.
 
-        # Get the filename for this item
-        item_name = item.get_name()
-        filename = item_name.split("/")[-1] if "/" in item_name else item_name
-
-        # Inject headings from navigation hierarchy
-        if filename in doc_headings:
-            body = soup.find("body")
-            if body:
-                for fragment, level, title in doc_headings[filename]:
-                    # Create heading tag with appropriate level (h1-h6)
-                    heading_tag = soup.new_tag(f"h{level}")
-                    heading_tag.string = title
-
-                    if fragment:
-                        # Find element with matching ID and insert heading before it
-                        target = body.find(id=fragment)
-                        if target:
-                            target.insert_before(heading_tag)
-                        else:
-                            # Fragment not found, insert at beginning
-                            body.insert(0, heading_tag)
-                    else:
-                        # No fragment specified, insert at beginning of body
-                        body.insert(0, heading_tag)
-
-        # If no TOC headings were found, preserve existing headings
-        # (They're already in the content, so no action needed)
-
-        # Remove all links but preserve their text content
-        for a_tag in soup.find_all("a"):
-            # Replace anchor with its text content
-            a_tag.unwrap()
-
-        # Remove all images
-        for img_tag in soup.find_all("img"):
-            img_tag.decompose()
-
-        # Extract body content
-        body = soup.find("body")
-        if body:
-            # Get inner HTML of body
-            body_parts.append(str(body))
-
-    # Create a single well-formed HTML document
-    combined_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <title>Converted EPUB</title>
-</head>
-<body>
-{"".join(body_parts)}
-</body>
-</html>"""
-
-    return combined_html
+    Large books are converted in worker processes. At most a few items per
+    worker are in flight, so parsed documents and out-of-order results never
+    pile up in memory.
+    """
+    total_bytes = sum(len(content) for content, _ in items)
+    if workers <= 1 or len(items) < 2 or total_bytes < PARALLEL_MIN_BYTES:
+        for content, headings in items:
+            yield _item_to_markdown(content, headings)
+        return
+
+    window = workers * 2
+    with make_process_executor(min(workers, len(items))) as executor:
+        pending: deque = deque()
+        for content, headings in items:
+            pending.append(executor.submit(_item_to_markdown, content, headings))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def convert_epub_to_markdown(
     epub_path: str | Path,
     output_path: Optional[str | Path] = None,
-    verbose: bool = False
-) -> str:
+    verbose: bool = False,
+    workers: Optional[int] = None
+) -> Optional[str]:
     """
     Convert an EPUB file to Markdown format.
 
+    Each document item of the EPUB is parsed (lxml) and converted on its own,
+    in worker processes for large books, and written to the output file as
+    soon as it and all items before it are done. Items written to a file are
+    not kept in memory.
+
     Args:
         epub_path: Path to the input EPUB file.
         output_path: Optional path for the output Markdown file.
                     If provided, the markdown will be written to this file.
         verbose: If True, print progress information.
+        workers: Worker processes for large EPUBs (1 disables).
+                Defaults to conversion.epub_workers from the config.
 
     Returns:
-        The converted Markdown content as a string.
+        The converted Markdown content as a string, or None when it was
+        written to output_path.
 
     Raises:
         FileNotFoundError: If the EPUB file does not exist.
@@ -261,22 +285,16 @@ def convert_epub_to_markdown(
     if epub_path.suffix.lower() != ".epub":
         raise ValueError(f"File must be an EPUB file, got: {epub_path.suffix}")
 
+    if workers is None:
+        workers = load_config().conversion.epub_workers
+
     if verbose:
         print(f"Converting: {epub_path}")
 
-    # Extract HTML from EPUB
-    html_content = _extract_epub_to_html(epub_path)
-
-    # Convert HTML to Markdown using markdownify
-    # This preserves heading hierarchy (h1 -> #, h2 -> ##, etc.)
-    markdown_content = md(
-        html_content,
-        heading_style="ATX",  # Use # style headings
-        bullets="-",  # Use - for unordered lists
-        strip=["script", "style"],  # Remove script and style tags
-    )
+    items = _read_epub_items(epub_path)
+    if verbose:
+        print(f"{len(items)} document items")
 
-    # Write to output file if specified
     if output_path:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -291,7 +309,18 @@ def convert_epub_to_markdown(
              if verbose:
                 print(f"Copied EPUB to: {dest_epub}")
 
-        output_path.write_text(markdown_content, encoding="utf-8")
+    def chunks() -> Iterator[str]:
+        first = True
+        for part in _iter_markdown(items, workers):
+            if not part:
+                continue
+            yield part if first else "\n\n" + part
+            first = False
+        yield "\n"
+
+    if output_path:
+        # Streamed atomically; a failed conversion leaves no partial output
+        write_text_chunks_atomic(output_path, chunks())
         if verbose:
             print(f"Output written to: {output_path}")
 
@@ -302,8 +331,9 @@ def convert_epub_to_markdown(
         except Exception as e:
             if verbose:
                 print(f"Warning: Could not extract TOC: {e}")
+        return None
 
-    return markdown_content
+    return "".join(chunks())
 
 
 def main() -> int:
@@ -314,7 +344,7 @@ def main() -> int:
         Exit code (0 for success, 1 for error).
     """
     parser = argparse.ArgumentParser(
-        description="Convert EPUB files to Markdown using Docling.",
+        description="Convert EPUB files to Markdown.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -344,13 +374,22 @@ Examples:
         help="Print progress information"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for large EPUBs (1 disables). "
+             "Default: conversion.epub_workers from config"
+    )
+
     args = parser.parse_args()
 
     try:
         markdown_content = convert_epub_to_markdown(
             epub_path=args.epub_path,
             output_path=args.output,
-            verbose=args.verbose
+            verbose=args.verbose,
+            workers=args.workers
         )
 
         # Print to stdout if no output file specified
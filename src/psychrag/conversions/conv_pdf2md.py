@@ -2,7 +2,9 @@
 PDF to Markdown Converter using Docling.
 
 This module provides functionality to convert PDF files to Markdown format
-using the Docling library with hierarchical heading detection.
+using the Docling library with hierarchical heading detection. Born-digital
+PDFs can instead go through the much faster PyMuPDF text-layer engine
+(conv_pdf2md_fast), chosen per file with `engine` or automatically.
 
 Example (as script):
     # Default: compare mode (generates .style.md and .hier.md)
@@ -17,6 +19,12 @@ Example (as script):
     # CPU only
     venv\\Scripts\\python -m psychrag.conversions.conv_pdf2md input.pdf -o output/doc.md --no-gpu
 
+    # Fast PyMuPDF text-layer engine (born-digital PDFs)
+    venv\\Scripts\\python -m psychrag.conversions.conv_pdf2md input.pdf -o output/doc.md --engine fast
+
+    # Long book: convert page ranges in 4 worker processes
+    venv\\Scripts\\python -m psychrag.conversions.conv_pdf2md book.pdf -o output/book.md --workers 4
+
 Example (as library):
     from psychrag.conversions import convert_pdf_to_markdown
 
@@ -36,6 +44,8 @@ Options:
     --style-ver       Force style-based single output
     --hier-ver        Force hierarchical single output
     --no-gpu          Disable GPU acceleration (CPU only)
+    --engine          docling, fast or auto (default: conversion.pdf_engine from config)
+    --workers         Worker processes for long PDFs (default: conversion.parallel_workers)
 
 Note: The source PDF is always copied to the output directory as <file>.pdf
 """
@@ -44,23 +54,35 @@ import argparse
 import shutil
 import sys
 import threading
+import time
 from pathlib import Path
 from typing import Optional
 
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from hierarchical.postprocessor import ResultPostprocessor
+from docling.datamodel.document import ConversionResult
+from docling_core.types.doc.document import SectionHeaderItem
+from hierarchical.postprocessor import ResultPostprocessor, flatten_hierarchy_tree
 from hierarchical.hierarchy_builder import create_toc
 from hierarchical.hierarchy_builder_metadata import HierarchyBuilderMetadata
 
+from psychrag.config import load_config
+from psychrag.config.app_config import PdfEngine
+from psychrag.utils.file_utils import write_text_atomic
+
+from .conv_pdf2md_fast import convert_pdf_fast, has_text_layer
+from .conversion_cache import (
+    CacheKey,
+    ConversionCache,
+    get_conversion_cache,
+    make_cache_key,
+    package_version,
+)
+from .converter_pool import ConverterKey, get_converter_pool
+from .parallel_pdf import convert_pdf_parallel, get_page_count
 from .pdf_bookmarks2toc import extract_bookmarks_to_toc
 
-# Default batch sizes for GPU processing
-DEFAULT_LAYOUT_BATCH_SIZE = 16
-DEFAULT_OCR_BATCH_SIZE = 4
-DEFAULT_TABLE_BATCH_SIZE = 4
+# Bump when the post-processing below changes so cached markdown is
+# regenerated from the cached docling document
+POSTPROCESS_VERSION = 1
 
 
 def _copy_pdf_to_output(
@@ -100,6 +122,182 @@ def _copy_pdf_to_output(
     return dest_pdf
 
 
+def _write_compare_outputs(
+    pdf_path: Path,
+    output_path: Path,
+    style_md: str,
+    hier_md: str,
+    verbose: bool = False
+) -> None:
+    """Write <stem>.style.md, <stem>.hier.md and <stem>.toc_titles.md next to a copy of the PDF."""
+    stem = output_path.stem
+    parent = output_path.parent
+    parent.mkdir(parents=True, exist_ok=True)
+
+    # Copy PDF first (before writing any files)
+    _copy_pdf_to_output(pdf_path, output_path, verbose)
+
+    style_path = parent / f"{stem}.style.md"
+    hier_path = parent / f"{stem}.hier.md"
+    toc_path = parent / f"{stem}.toc_titles.md"
+
+    write_text_atomic(style_path, style_md)
+    write_text_atomic(hier_path, hier_md)
+
+    # Extract TOC from PDF bookmarks
+    try:
+        extract_bookmarks_to_toc(pdf_path, output_path=toc_path, verbose=verbose)
+    except Exception as e:
+        if verbose:
+            print(f"Warning: Could not extract TOC: {e}")
+
+    if verbose:
+        print(f"Style-based output written to: {style_path}")
+        print(f"Hierarchical output written to: {hier_path}")
+
+
+def _write_single_output(
+    pdf_path: Path,
+    output_path: Path,
+    markdown_content: str,
+    verbose: bool = False
+) -> None:
+    """Write the markdown and <stem>.toc_titles.md next to a copy of the PDF."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Copy PDF first (before writing any files)
+    _copy_pdf_to_output(pdf_path, output_path, verbose)
+
+    write_text_atomic(output_path, markdown_content)
+
+    # Extract TOC from PDF bookmarks
+    toc_path = output_path.parent / f"{output_path.stem}.toc_titles.md"
+    try:
+        extract_bookmarks_to_toc(pdf_path, output_path=toc_path, verbose=verbose)
+    except Exception as e:
+        if verbose:
+            print(f"Warning: Could not extract TOC: {e}")
+
+    if verbose:
+        print(f"Output written to: {output_path}")
+
+
+def _resolve_engine(
+    engine: Optional[PdfEngine],
+    pdf_path: Path,
+    ocr: bool,
+    verbose: bool = False
+) -> str:
+    """
+    Pick the conversion engine for a file.
+
+    "auto" uses the fast text-layer engine when OCR is not requested and the
+    PDF passes the text-layer check, and docling otherwise.
+    """
+    if engine is None:
+        engine = load_config().conversion.pdf_engine
+
+    if engine == "auto":
+        engine = "fast" if not ocr and has_text_layer(pdf_path) else "docling"
+        if verbose:
+            print(f"Auto-selected '{engine}' conversion engine")
+
+    if engine not in ("docling", "fast"):
+        raise ValueError(f"Unknown PDF conversion engine: {engine}")
+    return engine
+
+
+def _run_docling(
+    pdf_path: Path,
+    converter_key: ConverterKey,
+    workers: Optional[int],
+    verbose: bool,
+) -> ConversionResult:
+    """
+    Run docling over the whole PDF.
+
+    PDFs with at least conversion.parallel_page_threshold pages are converted
+    by page ranges in worker processes and stitched into one result; shorter
+    ones use the pooled converter in this process.
+    """
+    config = load_config().conversion
+    if workers is None:
+        workers = config.parallel_workers
+
+    if workers > 1:
+        try:
+            page_count = get_page_count(pdf_path)
+        except Exception:
+            page_count = 0  # Let docling report unreadable files
+
+        if page_count >= max(config.parallel_page_threshold, config.pages_per_chunk + 1):
+            return convert_pdf_parallel(
+                pdf_path,
+                converter_key,
+                workers=workers,
+                pages_per_chunk=config.pages_per_chunk,
+                max_memory_mb=config.max_parallel_memory_mb,
+                worker_memory_mb=config.worker_memory_mb,
+                verbose=verbose,
+                page_count=page_count,
+            )
+
+    with get_converter_pool().converter(converter_key) as converter:
+        return converter.convert(str(pdf_path))
+
+
+def _postprocess_fingerprint() -> str:
+    """Identify the post-processing that produced cached markdown."""
+    return f"{POSTPROCESS_VERSION}:{package_version('docling-hierarchical-pdf')}"
+
+
+def _load_or_run_docling(
+    pdf_path: Path,
+    converter_key: ConverterKey,
+    workers: Optional[int],
+    verbose: bool,
+    cache: Optional[ConversionCache],
+    cache_key: Optional[CacheKey],
+) -> ConversionResult:
+    """Return the cached docling result for the PDF, converting and caching it on a miss."""
+    if cache is not None:
+        result = cache.load_result(cache_key)
+        if result is not None:
+            if verbose:
+                print("Using cached docling conversion")
+            return result
+
+    result = _run_docling(pdf_path, converter_key, workers, verbose)
+
+    if cache is not None:
+        cache.store_result(cache_key, result)
+    return result
+
+
+def _copy_result(result: ConversionResult) -> ConversionResult:
+    """
+    Copy a conversion result so it can be post-processed independently.
+
+    Post-processing only rewrites the DoclingDocument; pages, input and
+    timings are read-only there, so they are shared rather than copied.
+    """
+    return result.model_copy(update={"document": result.document.model_copy(deep=True)})
+
+
+def _apply_style_levels(result: ConversionResult, pdf_path: Path) -> None:
+    """Set section header levels in place from font-style heading detection."""
+    postprocessor = ResultPostprocessor(result, pdf_path)
+    headings = postprocessor.get_headers()
+    if headings:
+        root = create_toc(headings)
+        flat_hierarchy = flatten_hierarchy_tree(root, 0)
+        by_ref = {el[0].doc_ref: el for el in flat_hierarchy}
+        for item, _ in result.document.iterate_items():
+            if item.self_ref in by_ref and isinstance(item, SectionHeaderItem):
+                _, level = by_ref[item.self_ref]
+                item.level = level
+
+
 def convert_pdf_to_markdown(
     pdf_path: str | Path,
     output_path: Optional[str | Path] = None,
@@ -107,7 +305,9 @@ def convert_pdf_to_markdown(
     ocr: bool = False,
     hierarchical: bool = True,
     compare: bool = True,
-    use_gpu: bool = True
+    use_gpu: bool = True,
+    engine: Optional[PdfEngine] = None,
+    workers: Optional[int] = None
 ) -> str | tuple[str, str]:
     """
     Convert a PDF file to Markdown format.
@@ -123,6 +323,11 @@ def convert_pdf_to_markdown(
         compare: If True (default), generate both style-based and hierarchical outputs
                 as <file>.style.md and <file>.hier.md.
         use_gpu: If True, use GPU acceleration when available (auto-detects). Default True.
+        engine: "docling" (layout models), "fast" (PyMuPDF text layer, for born-digital
+                PDFs) or "auto" (fast when the PDF has a usable text layer and OCR is
+                not requested). Defaults to conversion.pdf_engine from the config.
+        workers: Worker processes for page-range parallel docling conversion of long
+                PDFs (1 disables). Defaults to conversion.parallel_workers from the config.
 
     Returns:
         If compare=True: tuple of (style_md, hierarchical_md) strings.
@@ -130,7 +335,7 @@ def convert_pdf_to_markdown(
 
     Raises:
         FileNotFoundError: If the PDF file does not exist.
-        ValueError: If the file is not a PDF file.
+        ValueError: If the file is not a PDF file or the engine is unknown.
         FileExistsError: If destination PDF already exists (must be removed first).
     """
     pdf_path = Path(pdf_path)
@@ -142,6 +347,26 @@ def convert_pdf_to_markdown(
     if pdf_path.suffix.lower() != ".pdf":
         raise ValueError(f"File must be a PDF file, got: {pdf_path.suffix}")
 
+    engine = _resolve_engine(engine, pdf_path, ocr, verbose)
+
+    if engine == "fast":
+        if verbose:
+            print(f"Converting with fast text-layer engine: {pdf_path}")
+        start = time.perf_counter()
+        style_md, hier_md = convert_pdf_fast(pdf_path, verbose=verbose)
+        if verbose:
+            print(f"Fast conversion finished in {time.perf_counter() - start:.1f}s")
+
+        if compare:
+            if output_path:
+                _write_compare_outputs(pdf_path, Path(output_path), style_md, hier_md, verbose)
+            return (style_md, hier_md)
+
+        markdown_content = hier_md if hierarchical else style_md
+        if output_path:
+            _write_single_output(pdf_path, Path(output_path), markdown_content, verbose)
+        return markdown_content
+
     if verbose:
         print(f"Converting: {pdf_path}")
         if ocr:
@@ -149,57 +374,58 @@ def convert_pdf_to_markdown(
         if use_gpu:
             print("GPU acceleration enabled (auto-detect)")
 
-    # Configure PDF pipeline options with GPU support and optimized batch sizes
-    pipeline_options = ThreadedPdfPipelineOptions(do_ocr=ocr)
+    # Converters (and their loaded models) are reused across calls in this process
+    converter_key = ConverterKey(ocr=ocr, use_gpu=use_gpu)
 
-    if use_gpu:
-        # Configure accelerator options for GPU support (auto-detect GPU, fallback to CPU)
-        accelerator_options = AcceleratorOptions(
-            device=AcceleratorDevice.AUTO  # Auto-detect GPU, fallback to CPU
-        )
-        pipeline_options.accelerator_options = accelerator_options
-
-        # Set batch sizes for GPU processing
-        pipeline_options.ocr_batch_size = DEFAULT_OCR_BATCH_SIZE
-        pipeline_options.layout_batch_size = DEFAULT_LAYOUT_BATCH_SIZE
-        pipeline_options.table_batch_size = DEFAULT_TABLE_BATCH_SIZE
-
-    # Initialize converter
-    converter = DocumentConverter(
-        format_options={
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-        }
-    )
+    # Unchanged sources skip docling; with unchanged post-processing they
+    # also skip the post-processing passes
+    cache = get_conversion_cache()
+    cache_key = make_cache_key(pdf_path, engine="docling", ocr=ocr) if cache else None
+    variant = "compare" if compare else ("hier" if hierarchical else "style")
+    fingerprint = _postprocess_fingerprint()
+
+    cached_md = cache.load_markdown(cache_key, variant, fingerprint) if cache else None
+    if cached_md is not None:
+        if verbose:
+            print("Using cached markdown outputs")
+        if compare:
+            if output_path:
+                _write_compare_outputs(
+                    pdf_path, Path(output_path), cached_md["style"], cached_md["hier"], verbose
+                )
+            return (cached_md["style"], cached_md["hier"])
+        if output_path:
+            _write_single_output(pdf_path, Path(output_path), cached_md["markdown"], verbose)
+        return cached_md["markdown"]
 
     # Handle compare mode - generate both outputs
     if compare:
         if verbose:
             print("Compare mode: generating both style-based and hierarchical outputs...")
 
+        # Run docling once; both post-processing passes work on the same result.
+        # The hierarchical pass restructures the document, so it gets its own copy.
+        start = time.perf_counter()
+        result_style = _load_or_run_docling(
+            pdf_path, converter_key, workers, verbose, cache, cache_key
+        )
+        result_hier = _copy_result(result_style)
+        if verbose:
+            print(f"Docling conversion finished in {time.perf_counter() - start:.1f}s")
+
         # First pass: style-based
-        result_style = converter.convert(str(pdf_path))
         if verbose:
             print("Generating style-based output...")
-
-        postprocessor = ResultPostprocessor(result_style, pdf_path)
-        headings = postprocessor.get_headers()
-        if headings:
-            from hierarchical.postprocessor import flatten_hierarchy_tree
-            from docling_core.types.doc.document import SectionHeaderItem
-            root = create_toc(headings)
-            flat_hierarchy = flatten_hierarchy_tree(root, 0)
-            by_ref = {el[0].doc_ref: el for el in flat_hierarchy}
-            for item, _ in result_style.document.iterate_items():
-                if item.self_ref in by_ref and isinstance(item, SectionHeaderItem):
-                    _, level = by_ref[item.self_ref]
-                    item.level = level
-
+        start = time.perf_counter()
+        _apply_style_levels(result_style, pdf_path)
         style_md = result_style.document.export_to_markdown()
+        if verbose:
+            print(f"Style-based output generated in {time.perf_counter() - start:.1f}s")
 
         # Second pass: hierarchical (TOC-based)
-        result_hier = converter.convert(str(pdf_path))
         if verbose:
             print("Generating hierarchical (TOC-based) output...")
+        start = time.perf_counter()
 
         # Run hierarchical processing with timeout (same as single-output mode)
         hier_error = [None]
@@ -230,37 +456,20 @@ def convert_pdf_to_markdown(
             # Hierarchical processing succeeded
             hier_md = result_hier.document.export_to_markdown()
 
-        # Write to output files if specified
-        if output_path:
-            output_path = Path(output_path)
-            stem = output_path.stem
-            parent = output_path.parent
-            parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy PDF first (before writing any files)
-            _copy_pdf_to_output(pdf_path, output_path, verbose)
-
-            style_path = parent / f"{stem}.style.md"
-            hier_path = parent / f"{stem}.hier.md"
-            toc_path = parent / f"{stem}.toc_titles.md"
-
-            style_path.write_text(style_md, encoding="utf-8")
-            hier_path.write_text(hier_md, encoding="utf-8")
+        if verbose:
+            print(f"Hierarchical pass finished in {time.perf_counter() - start:.1f}s")
 
-            # Extract TOC from PDF bookmarks
-            try:
-                extract_bookmarks_to_toc(pdf_path, output_path=toc_path, verbose=verbose)
-            except Exception as e:
-                if verbose:
-                    print(f"Warning: Could not extract TOC: {e}")
+        # Timeouts depend on machine load, so only cache complete outputs
+        if cache is not None and not hier_timed_out[0] and not hier_error[0]:
+            cache.store_markdown(cache_key, variant, fingerprint, {"style": style_md, "hier": hier_md})
 
-            if verbose:
-                print(f"Style-based output written to: {style_path}")
-                print(f"Hierarchical output written to: {hier_path}")
+        # Write to output files if specified
+        if output_path:
+            _write_compare_outputs(pdf_path, Path(output_path), style_md, hier_md, verbose)
 
         return (style_md, hier_md)
 
-    result = converter.convert(str(pdf_path))
+    result = _load_or_run_docling(pdf_path, converter_key, workers, verbose, cache, cache_key)
 
     # Apply hierarchical post-processing for better heading structure
     if hierarchical:
@@ -299,23 +508,10 @@ def convert_pdf_to_markdown(
 
         def run_hierarchical():
             try:
-                postprocessor = ResultPostprocessor(result, pdf_path)
                 if use_style_based:
-                    # Force style-based by clearing the TOC cache
-                    postprocessor.result = result
-                    headings = postprocessor.get_headers()
-                    if headings:
-                        from hierarchical.postprocessor import flatten_hierarchy_tree
-                        from docling_core.types.doc.document import SectionHeaderItem
-                        root = create_toc(headings)
-                        flat_hierarchy = flatten_hierarchy_tree(root, 0)
-                        by_ref = {el[0].doc_ref: el for el in flat_hierarchy}
-                        for item, _ in result.document.iterate_items():
-                            if item.self_ref in by_ref and isinstance(item, SectionHeaderItem):
-                                _, level = by_ref[item.self_ref]
-                                item.level = level
+                    _apply_style_levels(result, pdf_path)
                 else:
-                    postprocessor.process()
+                    ResultPostprocessor(result, pdf_path).process()
             except Exception as e:
                 error_container[0] = e
 
@@ -332,20 +528,9 @@ def convert_pdf_to_markdown(
                 if verbose:
                     print("Attempting style-based fallback...")
                 try:
-                    postprocessor = ResultPostprocessor(result, pdf_path)
-                    headings = postprocessor.get_headers()
-                    if headings:
-                        from hierarchical.postprocessor import flatten_hierarchy_tree
-                        from docling_core.types.doc.document import SectionHeaderItem
-                        root = create_toc(headings)
-                        flat_hierarchy = flatten_hierarchy_tree(root, 0)
-                        by_ref = {el[0].doc_ref: el for el in flat_hierarchy}
-                        for item, _ in result.document.iterate_items():
-                            if item.self_ref in by_ref and isinstance(item, SectionHeaderItem):
-                                _, level = by_ref[item.self_ref]
-                                item.level = level
-                        if verbose:
-                            print("Style-based fallback successful")
+                    _apply_style_levels(result, pdf_path)
+                    if verbose:
+                        print("Style-based fallback successful")
                 except Exception as e:
                     if verbose:
                         print(f"Style-based fallback failed: {e}")
@@ -356,26 +541,12 @@ def convert_pdf_to_markdown(
     # Export to markdown
     markdown_content = result.document.export_to_markdown()
 
+    if cache is not None and not (hierarchical and (timed_out[0] or error_container[0])):
+        cache.store_markdown(cache_key, variant, fingerprint, {"markdown": markdown_content})
+
     # Write to output file if specified
     if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copy PDF first (before writing any files)
-        _copy_pdf_to_output(pdf_path, output_path, verbose)
-
-        output_path.write_text(markdown_content, encoding="utf-8")
-
-        # Extract TOC from PDF bookmarks
-        toc_path = output_path.parent / f"{output_path.stem}.toc_titles.md"
-        try:
-            extract_bookmarks_to_toc(pdf_path, output_path=toc_path, verbose=verbose)
-        except Exception as e:
-            if verbose:
-                print(f"Warning: Could not extract TOC: {e}")
-
-        if verbose:
-            print(f"Output written to: {output_path}")
+        _write_single_output(pdf_path, Path(output_path), markdown_content, verbose)
 
     return markdown_content
 
@@ -442,6 +613,22 @@ Examples:
         help="Disable GPU acceleration (use CPU only)"
     )
 
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "docling", "fast"],
+        default=None,
+        help="Conversion engine: docling (layout models), fast (PDF text layer) or "
+             "auto (fast for born-digital PDFs). Default: conversion.pdf_engine from config"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for page-range parallel conversion of long PDFs "
+             "(1 disables). Default: conversion.parallel_workers from config"
+    )
+
     args = parser.parse_args()
 
     try:
@@ -471,7 +658,9 @@ Examples:
             ocr=args.ocr,
             hierarchical=hierarchical,
             compare=compare,
-            use_gpu=not args.no_gpu
+            use_gpu=not args.no_gpu,
+            engine=args.engine,
+            workers=args.workers
         )
 
         # Print to stdout if no output file specified
@@ -0,0 +1,356 @@
+"""
+Fast PDF to Markdown conversion from the PDF text layer using PyMuPDF.
+
+Born-digital PDFs already carry their text, fonts and bookmarks, so running
+docling's layout/table models over them is mostly wasted work. This engine
+reads text spans directly and infers structure from typography:
+
+- Style output: headings are lines set noticeably larger than the body text
+  (or short, bold, stand-alone lines); each distinct heading style gets a
+  level, largest first.
+- Hierarchical output: headings are the lines matching the PDF bookmarks,
+  with the bookmark depth as level. Falls back to the style output when the
+  PDF has no bookmarks or too many bookmarks cannot be located.
+
+Headings use docling's convention (top level is "##"), so both outputs are
+interchangeable with the docling engine's .style.md/.hier.md files.
+
+Scanned PDFs (no usable text layer) still need docling with OCR; use
+has_text_layer() to decide.
+
+Example (as library):
+    from psychrag.conversions.conv_pdf2md_fast import convert_pdf_fast, has_text_layer
+
+    if has_text_layer("book.pdf"):
+        style_md, hier_md = convert_pdf_fast("book.pdf")
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+# Heading detection thresholds
+HEADING_SIZE_RATIO = 1.15  # Font size relative to body text
+MAX_HEADING_CHARS = 150
+MAX_HEADING_LINES = 3
+MAX_STYLE_LEVELS = 5
+
+# Lines inside these top/bottom page fractions may be running headers/footers
+MARGIN_RATIO = 0.08
+REPEATED_MARGIN_MIN_PAGES = 3
+
+# Fraction of bookmarks that must be found for the hierarchical output
+MIN_TOC_MATCH_RATIO = 0.8
+
+_BOLD_FLAG = 1 << 4
+
+# Printed table-of-contents entries: "Title . . . . . 12"
+_TOC_LEADER_RE = re.compile(r"(\.\s?){4,}\s*\w*\d+\s*$")
+
+# Bare page numbers, arabic or roman
+_PAGE_NUMBER_RE = re.compile(r"^(\d+|[ivxlcdm]+)$")
+
+
+@dataclass
+class _Block:
+    """A text block (paragraph or heading candidate) from one page."""
+
+    page_no: int
+    text: str
+    size: float
+    bold: bool
+    line_count: int
+    level: int = 0  # 0 = paragraph, otherwise heading level
+
+
+def _normalize(text: str) -> str:
+    """Normalize text for matching: NFKC, lowercase, alphanumerics only."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return re.sub(r"[^0-9a-z]+", "", text)
+
+
+def _join_lines(lines: list[str]) -> str:
+    """Join wrapped lines into one paragraph, repairing end-of-line hyphenation."""
+    text = ""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if text.endswith("-") and line[:1].islower():
+            text = text[:-1] + line
+        elif text:
+            text += " " + line
+        else:
+            text = line
+    return text
+
+
+def has_text_layer(
+    pdf_path: str | Path,
+    sample_pages: int = 12,
+    min_chars_per_page: int = 200,
+    min_text_page_ratio: float = 0.8,
+) -> bool:
+    """
+    Check whether a PDF has a clean text layer the fast engine can use.
+
+    Samples pages spread across the document. A page counts as text if it
+    has at least min_chars_per_page non-space characters and few Unicode
+    replacement characters (a sign of broken font encodings).
+
+    Args:
+        pdf_path: Path to the PDF file.
+        sample_pages: Maximum number of pages to inspect.
+        min_chars_per_page: Characters needed for a page to count as text.
+        min_text_page_ratio: Fraction of sampled pages that must be text.
+
+    Returns:
+        True if the PDF looks born-digital, False otherwise (including for
+        encrypted or unreadable files).
+    """
+    try:
+        doc = fitz.open(str(pdf_path))
+    except Exception:
+        return False
+
+    try:
+        if doc.needs_pass or doc.page_count == 0:
+            return False
+
+        count = min(sample_pages, doc.page_count)
+        step = doc.page_count / count
+        page_numbers = sorted({int(i * step) for i in range(count)})
+
+        text_pages = 0
+        for page_no in page_numbers:
+            text = doc[page_no].get_text("text")
+            chars = sum(1 for c in text if not c.isspace())
+            if chars < min_chars_per_page:
+                continue
+            if text.count("�") / chars > 0.01:
+                continue
+            text_pages += 1
+
+        return text_pages / len(page_numbers) >= min_text_page_ratio
+    finally:
+        doc.close()
+
+
+def _extract_blocks(doc) -> list[_Block]:
+    """Read text blocks with their dominant font size/weight, dropping running headers/footers."""
+    raw: list[tuple[_Block, bool]] = []  # (block, in page margin)
+
+    for page in doc:
+        height = page.rect.height
+        data = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+        for block in data["blocks"]:
+            if block.get("type") != 0:
+                continue
+
+            lines = []
+            size_chars: Counter = Counter()
+            bold_chars = 0
+            total_chars = 0
+            for line in block["lines"]:
+                line_text = "".join(span["text"] for span in line["spans"])
+                if not line_text.strip():
+                    continue
+                lines.append(line_text)
+                for span in line["spans"]:
+                    n = len(span["text"].strip())
+                    size_chars[round(span["size"] * 2) / 2] += n
+                    total_chars += n
+                    if span["flags"] & _BOLD_FLAG or "bold" in span["font"].lower():
+                        bold_chars += n
+
+            if not lines or total_chars == 0:
+                continue
+
+            y0, y1 = block["bbox"][1], block["bbox"][3]
+            in_margin = y1 < height * MARGIN_RATIO or y0 > height * (1 - MARGIN_RATIO)
+            raw.append((
+                _Block(
+                    page_no=page.number + 1,
+                    text=_join_lines(lines),
+                    size=size_chars.most_common(1)[0][0],
+                    bold=bold_chars / total_chars > 0.8,
+                    line_count=len(lines),
+                ),
+                in_margin,
+            ))
+
+    # Running headers/footers: margin text repeated across pages (ignoring
+    # page numbers), or bare page numbers
+    margin_counts = Counter(
+        re.sub(r"\d+", "", _normalize(b.text)) for b, in_margin in raw if in_margin
+    )
+
+    blocks = []
+    for block, in_margin in raw:
+        if in_margin:
+            text = _normalize(block.text)
+            key = re.sub(r"\d+", "", text)
+            if (
+                _PAGE_NUMBER_RE.match(text)
+                or not key
+                or margin_counts[key] >= REPEATED_MARGIN_MIN_PAGES
+            ):
+                continue
+        blocks.append(block)
+    return blocks
+
+
+def _body_size(blocks: list[_Block]) -> float:
+    """Most common font size, weighted by text length."""
+    sizes: Counter = Counter()
+    for block in blocks:
+        sizes[block.size] += len(block.text)
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def _is_heading_candidate(block: _Block, body_size: float) -> bool:
+    if len(block.text) > MAX_HEADING_CHARS or block.line_count > MAX_HEADING_LINES:
+        return False
+    if not any(c.isalpha() for c in block.text) or _TOC_LEADER_RE.search(block.text):
+        return False
+    if block.size >= body_size * HEADING_SIZE_RATIO:
+        return True
+    # Bold run-in text at body size is only a heading if it is short and
+    # does not read like a sentence
+    return (
+        block.bold
+        and block.size >= body_size
+        and block.line_count == 1
+        and not block.text.rstrip().endswith((".", ",", ";", ":"))
+    )
+
+
+def _assign_style_levels(blocks: list[_Block], body_size: float) -> None:
+    """Set block.level from heading typography: larger (then bold) styles rank higher."""
+    candidates = [b for b in blocks if _is_heading_candidate(b, body_size)]
+    styles = sorted({(b.size, b.bold) for b in candidates}, reverse=True)
+    rank = {style: min(i + 1, MAX_STYLE_LEVELS) for i, style in enumerate(styles)}
+    for block in blocks:
+        block.level = 0
+    for block in candidates:
+        block.level = rank[(block.size, block.bold)]
+
+
+def _matches_title(text: str, title: str) -> bool:
+    """
+    Whether normalized block text is the normalized bookmark title.
+
+    Allows a numbering prefix on the block ("chapter3" + title) and titles
+    split over two blocks (block holds at least half of the title's end).
+    """
+    if not text:
+        return False
+    if text == title or text.endswith(title):
+        return True
+    return title.endswith(text) and len(text) >= len(title) // 2
+
+
+def _assign_toc_levels(blocks: list[_Block], toc: list) -> bool:
+    """
+    Set block.level from PDF bookmarks.
+
+    Each bookmark is matched to the first unused block on its target page
+    (or the next page) whose text matches the bookmark title. Unmatched
+    blocks become paragraphs.
+
+    Returns:
+        True if enough bookmarks were located to trust the result.
+    """
+    by_page: dict[int, list[_Block]] = {}
+    for block in blocks:
+        by_page.setdefault(block.page_no, []).append(block)
+        block.level = 0
+
+    matched = 0
+    used: set[int] = set()
+    for level, title, page_no in toc:
+        target = _normalize(title)
+        if not target:
+            continue
+        for candidate_page in (page_no, page_no + 1):
+            found = None
+            for block in by_page.get(candidate_page, []):
+                if id(block) in used or len(block.text) > MAX_HEADING_CHARS * 2:
+                    continue
+                if _matches_title(_normalize(block.text), target):
+                    found = block
+                    break
+            if found is not None:
+                found.level = level
+                used.add(id(found))
+                matched += 1
+                break
+
+    return bool(toc) and matched / len(toc) >= MIN_TOC_MATCH_RATIO
+
+
+def _to_markdown(blocks: list[_Block]) -> str:
+    parts = []
+    for block in blocks:
+        if block.level:
+            # docling convention: heading level 1 is rendered as "##"
+            parts.append(f"{'#' * min(block.level + 1, 6)} {block.text}")
+        else:
+            parts.append(block.text)
+    return "\n\n".join(parts) + "\n"
+
+
+def convert_pdf_fast(
+    pdf_path: str | Path,
+    verbose: bool = False,
+) -> tuple[str, str]:
+    """
+    Convert a born-digital PDF to style-based and hierarchical Markdown.
+
+    Args:
+        pdf_path: Path to the input PDF file.
+        verbose: If True, print progress information.
+
+    Returns:
+        Tuple of (style_md, hierarchical_md). hierarchical_md equals
+        style_md when the PDF bookmarks cannot be used.
+
+    Raises:
+        FileNotFoundError: If the PDF file does not exist.
+    """
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    doc = fitz.open(str(pdf_path))
+    try:
+        blocks = _extract_blocks(doc)
+        toc = doc.get_toc()
+    finally:
+        doc.close()
+
+    body_size = _body_size(blocks)
+    if verbose:
+        print(f"Fast engine: {len(blocks)} text blocks, body font size {body_size}pt")
+
+    _assign_style_levels(blocks, body_size)
+    style_md = _to_markdown(blocks)
+    if verbose:
+        headings = sum(1 for b in blocks if b.level)
+        print(f"Style-based output: {headings} headings")
+
+    if _assign_toc_levels(blocks, toc):
+        hier_md = _to_markdown(blocks)
+        if verbose:
+            print(f"Hierarchical output: {sum(1 for b in blocks if b.level)}/{len(toc)} bookmarks located")
+    else:
+        if verbose:
+            reason = "no bookmarks" if not toc else "too many bookmarks not found in text"
+            print(f"Hierarchical output: {reason}, using style-based output")
+        hier_md = style_md
+
+    return style_md, hier_md
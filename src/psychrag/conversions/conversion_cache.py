@@ -0,0 +1,203 @@
+"""
+On-disk cache of docling conversion artifacts.
+
+Running docling's layout/table models is by far the slowest part of a PDF
+conversion. This cache stores, per source file and pipeline options:
+
+- the raw docling document and the pages' layout predictions (what the
+  style-based and hierarchical post-processing read), so markdown can be
+  regenerated after a post-processing change without model inference;
+- the generated markdown outputs, so converting the same PDF again (for
+  example after delete_conversion) only writes files.
+
+Entries are keyed by the SHA-256 of the source bytes, the engine and its
+version, and the OCR flag. Markdown outputs are additionally keyed by output
+variant (compare, hier or style) and a post-processing fingerprint; a
+mismatching fingerprint reuses the document but regenerates the markdown.
+
+Layout: <cache_dir>/<sha[:2]>/<sha>-<options digest>/ with meta.json written
+last, so a half-written entry is never read.
+
+Usage:
+    from psychrag.conversions.conversion_cache import get_conversion_cache, make_cache_key
+
+    cache = get_conversion_cache()
+    key = make_cache_key("book.pdf", engine="docling", ocr=False)
+    result = cache.load_result(key) if cache else None
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+from docling.datamodel.base_models import Page
+from docling.datamodel.document import ConversionResult
+from docling_core.types.doc.document import DoclingDocument
+
+from psychrag.config import load_config
+from psychrag.utils.file_utils import compute_file_hash, write_bytes_atomic
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry format changes
+CACHE_FORMAT_VERSION = 1
+
+_PAGE_FIELDS = {"page_no", "size", "predictions"}
+
+
+def package_version(name: str) -> str:
+    """Installed version of a distribution, or "unknown"."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """Identity of a conversion: source bytes and the options that affect inference."""
+
+    source_sha256: str
+    engine: str
+    engine_version: str
+    ocr: bool
+
+    def digest(self) -> str:
+        options = {k: v for k, v in asdict(self).items() if k != "source_sha256"}
+        options["format"] = CACHE_FORMAT_VERSION
+        return hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def make_cache_key(source: str | Path, engine: str = "docling", ocr: bool = False) -> CacheKey:
+    """Build the cache key for a source file converted with `engine`."""
+    return CacheKey(
+        source_sha256=compute_file_hash(Path(source)),
+        engine=engine,
+        engine_version=package_version(engine),
+        ocr=ocr,
+    )
+
+
+class ConversionCache:
+    """Conversion artifacts stored under a cache directory."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def entry_dir(self, key: CacheKey) -> Path:
+        sha = key.source_sha256
+        return self.root / sha[:2] / f"{sha}-{key.digest()}"
+
+    def _has_entry(self, key: CacheKey) -> bool:
+        return (self.entry_dir(key) / "meta.json").exists()
+
+    def load_result(self, key: CacheKey) -> Optional[ConversionResult]:
+        """
+        Load the cached docling document and page predictions.
+
+        Returns:
+            A ConversionResult with `document` and `pages` set, or None on a
+            miss or an unreadable entry.
+        """
+        if not self._has_entry(key):
+            return None
+        entry = self.entry_dir(key)
+        try:
+            document = DoclingDocument.model_validate_json(
+                gzip.decompress((entry / "document.json.gz").read_bytes())
+            )
+            pages = [
+                Page.model_validate(page)
+                for page in json.loads(gzip.decompress((entry / "pages.json.gz").read_bytes()))
+            ]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable conversion cache entry {entry}: {e}")
+            return None
+        return ConversionResult.model_construct(document=document, pages=pages)
+
+    def store_result(self, key: CacheKey, result: ConversionResult) -> None:
+        """
+        Store the docling document and page predictions of a fresh conversion.
+
+        Best effort: a failure to write is logged, not raised.
+        """
+        entry = self.entry_dir(key)
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            pages = [page.model_dump(mode="json", include=_PAGE_FIELDS) for page in result.pages]
+            write_bytes_atomic(
+                entry / "document.json.gz",
+                gzip.compress(result.document.model_dump_json().encode("utf-8")),
+            )
+            write_bytes_atomic(entry / "pages.json.gz", gzip.compress(json.dumps(pages).encode("utf-8")))
+
+            meta = asdict(key)
+            meta["created_at"] = datetime.now(timezone.utc).isoformat()
+            write_bytes_atomic(entry / "meta.json", json.dumps(meta, indent=2).encode("utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache conversion in {entry}: {e}")
+
+    def load_markdown(self, key: CacheKey, variant: str, fingerprint: str) -> Optional[dict[str, str]]:
+        """
+        Load cached markdown outputs.
+
+        Args:
+            key: Conversion key.
+            variant: Output variant ("compare", "hier" or "style").
+            fingerprint: Post-processing fingerprint the outputs must match.
+
+        Returns:
+            Mapping of output name to markdown, or None on a miss.
+        """
+        if not self._has_entry(key):
+            return None
+        path = self.entry_dir(key) / f"markdown.{variant}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("fingerprint") != fingerprint:
+            return None
+        return data["outputs"]
+
+    def store_markdown(
+        self, key: CacheKey, variant: str, fingerprint: str, outputs: dict[str, str]
+    ) -> None:
+        """Store markdown outputs next to an existing document entry (best effort)."""
+        if not self._has_entry(key):
+            return
+        data = {"fingerprint": fingerprint, "outputs": outputs}
+        try:
+            write_bytes_atomic(
+                self.entry_dir(key) / f"markdown.{variant}.json",
+                json.dumps(data).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.warning(f"Could not cache markdown for {self.entry_dir(key)}: {e}")
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+
+def get_conversion_cache() -> Optional[ConversionCache]:
+    """
+    Return the configured conversion cache.
+
+    Returns:
+        ConversionCache at conversion.cache_dir (default <paths.output_dir>/.conversion_cache),
+        or None if conversion.cache_enabled is false.
+    """
+    config = load_config()
+    if not config.conversion.cache_enabled:
+        return None
+    root = config.conversion.cache_dir or Path(config.paths.output_dir) / ".conversion_cache"
+    return ConversionCache(root)
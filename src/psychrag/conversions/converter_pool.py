@@ -0,0 +1,372 @@
+"""
+Reusable docling DocumentConverter pool.
+
+Building a DocumentConverter and initializing its PDF pipeline loads the
+layout, table-structure and (optionally) OCR models, which takes seconds and
+hundreds of MB. This module keeps converters alive per set of pipeline
+options so repeated conversions in one process (API requests, batch CLI runs)
+reuse the loaded models.
+
+Converters are created lazily on first use, shared by every caller asking for
+the same ConverterKey, and evicted when idle for longer than
+``conversion.converter_idle_timeout`` seconds or when more than
+``conversion.max_converters`` distinct keys are loaded (least recently used
+first). A converter is used by one conversion at a time. Models are loaded
+outside the pool lock, so stats() and borrowers of already loaded converters
+never wait for a load.
+
+Usage:
+    from psychrag.conversions.converter_pool import ConverterKey, get_converter_pool
+
+    with get_converter_pool().converter(ConverterKey(ocr=False)) as converter:
+        result = converter.convert("book.pdf")
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+
+from psychrag.config import load_config
+
+logger = logging.getLogger(__name__)
+
+# Default batch sizes for GPU processing
+DEFAULT_LAYOUT_BATCH_SIZE = 16
+DEFAULT_OCR_BATCH_SIZE = 4
+DEFAULT_TABLE_BATCH_SIZE = 4
+
+
+@dataclass(frozen=True)
+class ConverterKey:
+    """Pipeline options that require a distinct DocumentConverter."""
+
+    ocr: bool = False
+    use_gpu: bool = True
+    layout_batch_size: int = DEFAULT_LAYOUT_BATCH_SIZE
+    ocr_batch_size: int = DEFAULT_OCR_BATCH_SIZE
+    table_batch_size: int = DEFAULT_TABLE_BATCH_SIZE
+
+
+@dataclass
+class _PoolEntry:
+    converter: DocumentConverter
+    created_at: float
+    last_used: float
+    load_seconds: float
+    memory_bytes: Optional[int]
+    uses: int = 0
+    # Callers holding or waiting for the converter; counted under the pool
+    # lock so eviction never drops an entry that is about to be used
+    borrowers: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def build_pipeline_options(key: ConverterKey) -> ThreadedPdfPipelineOptions:
+    """Build docling PDF pipeline options for a converter key."""
+    pipeline_options = ThreadedPdfPipelineOptions(do_ocr=key.ocr)
+
+    if key.use_gpu:
+        # Auto-detect GPU, fallback to CPU
+        pipeline_options.accelerator_options = AcceleratorOptions(
+            device=AcceleratorDevice.AUTO
+        )
+
+        # Set batch sizes for GPU processing
+        pipeline_options.ocr_batch_size = key.ocr_batch_size
+        pipeline_options.layout_batch_size = key.layout_batch_size
+        pipeline_options.table_batch_size = key.table_batch_size
+
+    return pipeline_options
+
+
+def _process_memory_bytes() -> Optional[int]:
+    """Resident memory of this process plus allocated CUDA memory, if measurable."""
+    rss = None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        try:
+            import psutil
+            rss = psutil.Process().memory_info().rss
+        except ImportError:
+            return None
+
+    try:
+        import torch
+        if torch.cuda.is_available():
+            rss += torch.cuda.memory_allocated()
+    except Exception:
+        pass
+
+    return rss
+
+
+def _release_memory() -> None:
+    """Return freed model memory to the allocator/driver after an eviction."""
+    gc.collect()
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+class ConverterPool:
+    """Lazily-initialized, idle-evicting pool of docling converters."""
+
+    def __init__(self, max_converters: int = 2, idle_timeout: float = 900):
+        """
+        Args:
+            max_converters: Maximum number of distinct converters kept loaded.
+            idle_timeout: Seconds a converter may stay unused before it is
+                evicted. 0 disables idle eviction.
+        """
+        self.max_converters = max_converters
+        self.idle_timeout = idle_timeout
+        self._entries: dict[ConverterKey, _PoolEntry] = {}
+        # Keys whose converter is being loaded; set once the entry is published
+        self._loading: dict[ConverterKey, threading.Event] = {}
+        self._lock = threading.Lock()
+        # Serializes model loads (outside self._lock) so memory accounting is
+        # not skewed by concurrent loads
+        self._load_lock = threading.Lock()
+        self._created = 0
+        self._evicted = 0
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _create(self, key: ConverterKey) -> _PoolEntry:
+        start = time.perf_counter()
+        memory_before = _process_memory_bytes()
+
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(pipeline_options=build_pipeline_options(key))
+            }
+        )
+        # Load the models now so the load cost and memory are attributed here
+        converter.initialize_pipeline(InputFormat.PDF)
+
+        memory_after = _process_memory_bytes()
+        memory_bytes = None
+        if memory_before is not None and memory_after is not None:
+            memory_bytes = max(memory_after - memory_before, 0)
+
+        load_seconds = time.perf_counter() - start
+        logger.info(
+            f"Loaded docling converter {key} in {load_seconds:.1f}s"
+            + (f" (~{memory_bytes / 2**20:.0f} MiB)" if memory_bytes is not None else "")
+        )
+        now = time.monotonic()
+        return _PoolEntry(
+            converter=converter,
+            created_at=now,
+            last_used=now,
+            load_seconds=load_seconds,
+            memory_bytes=memory_bytes,
+        )
+
+    def _evict_locked(self, now: float, keep: Optional[ConverterKey] = None) -> int:
+        """Evict idle entries and LRU entries over capacity. Caller holds self._lock."""
+        evicted = 0
+
+        if self.idle_timeout > 0:
+            for key, entry in list(self._entries.items()):
+                if key == keep or entry.borrowers:
+                    continue
+                if now - entry.last_used > self.idle_timeout:
+                    del self._entries[key]
+                    evicted += 1
+
+        # Converters being loaded take a slot, and so does `keep` when it
+        # still has to be created
+        limit = self.max_converters - len(self._loading)
+        if keep is not None and keep not in self._entries and keep not in self._loading:
+            limit -= 1
+        idle = sorted(
+            (k for k, e in self._entries.items() if k != keep and not e.borrowers),
+            key=lambda k: self._entries[k].last_used,
+        )
+        while len(self._entries) > limit and idle:
+            del self._entries[idle.pop(0)]
+            evicted += 1
+
+        if evicted:
+            self._evicted += evicted
+            logger.info(f"Evicted {evicted} docling converter(s)")
+        return evicted
+
+    @contextmanager
+    def converter(self, key: ConverterKey) -> Iterator[DocumentConverter]:
+        """
+        Borrow the converter for `key`, creating it on first use.
+
+        The converter is held exclusively until the with-block exits; other
+        callers using the same key wait for it.
+        """
+        entry = self._borrow(key)
+
+        try:
+            with entry.lock:
+                entry.uses += 1
+                try:
+                    yield entry.converter
+                finally:
+                    entry.last_used = time.monotonic()
+        finally:
+            with self._lock:
+                entry.borrowers -= 1
+
+    def _borrow(self, key: ConverterKey) -> _PoolEntry:
+        """Register a borrower of `key`, loading its converter if needed."""
+        while True:
+            with self._lock:
+                evicted = self._evict_locked(time.monotonic(), keep=key)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.borrowers += 1
+                    loaded = None
+                else:
+                    loaded = self._loading.get(key)
+                    if loaded is None:
+                        self._loading[key] = threading.Event()
+            if evicted:
+                _release_memory()
+            if entry is not None:
+                return entry
+            if loaded is None:
+                return self._load(key)
+            # Another caller is loading this key; retry once it is published
+            loaded.wait()
+
+    def _load(self, key: ConverterKey) -> _PoolEntry:
+        """Load the converter for a key reserved in self._loading and publish it."""
+        try:
+            with self._load_lock:
+                entry = self._create(key)
+        except BaseException:
+            with self._lock:
+                self._loading.pop(key).set()
+            raise
+        with self._lock:
+            entry.borrowers += 1
+            self._entries[key] = entry
+            self._created += 1
+            self._loading.pop(key).set()
+            self._start_sweeper_locked()
+        return entry
+
+    def _start_sweeper_locked(self) -> None:
+        """Start the idle-eviction thread if needed. Caller holds self._lock."""
+        if self.idle_timeout <= 0 or (self._sweeper and self._sweeper.is_alive()):
+            return
+        self._stop.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep, name="converter-pool-sweeper", daemon=True
+        )
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Evict idle converters periodically; exit once the pool is empty."""
+        interval = max(self.idle_timeout / 4, 1.0)
+        while not self._stop.wait(interval):
+            self.evict_idle()
+            with self._lock:
+                if not self._entries:
+                    self._sweeper = None
+                    return
+
+    def shutdown(self) -> None:
+        """Stop the idle-eviction thread and drop all idle converters."""
+        self._stop.set()
+        self.clear()
+
+    def evict_idle(self) -> int:
+        """
+        Evict converters idle for longer than idle_timeout.
+
+        Returns:
+            Number of converters evicted.
+        """
+        with self._lock:
+            evicted = self._evict_locked(time.monotonic())
+        if evicted:
+            _release_memory()
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every converter that is not currently in use."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if not entry.borrowers:
+                    del self._entries[key]
+                    self._evicted += 1
+        _release_memory()
+
+    def stats(self) -> dict:
+        """
+        Describe pool usage.
+
+        Returns:
+            Dict with pool limits, lifetime created/evicted counts, estimated
+            total model memory and one entry per loaded converter.
+        """
+        now = time.monotonic()
+        with self._lock:
+            converters = [
+                {
+                    "options": {
+                        "ocr": key.ocr,
+                        "use_gpu": key.use_gpu,
+                        "layout_batch_size": key.layout_batch_size,
+                        "ocr_batch_size": key.ocr_batch_size,
+                        "table_batch_size": key.table_batch_size,
+                    },
+                    "in_use": entry.borrowers > 0,
+                    "uses": entry.uses,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                    "load_seconds": round(entry.load_seconds, 2),
+                    "memory_bytes": entry.memory_bytes,
+                }
+                for key, entry in self._entries.items()
+            ]
+            return {
+                "max_converters": self.max_converters,
+                "idle_timeout": self.idle_timeout,
+                "created": self._created,
+                "evicted": self._evicted,
+                "memory_bytes": sum(c["memory_bytes"] or 0 for c in converters),
+                "loading": len(self._loading),
+                "converters": converters,
+            }
+
+
+# Process-wide pool
+_pool: Optional[ConverterPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_converter_pool() -> ConverterPool:
+    """Return the process-wide converter pool, creating it from config on first use."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            config = load_config().conversion
+            _pool = ConverterPool(
+                max_converters=config.max_converters,
+                idle_timeout=config.converter_idle_timeout,
+            )
+        return _pool
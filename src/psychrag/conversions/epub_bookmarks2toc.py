@@ -21,6 +21,8 @@ import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup
 
+from psychrag.utils.file_utils import write_text_atomic
+
 
 def _extract_hierarchy(book) -> list[dict]:
     """
@@ -180,7 +182,7 @@ def extract_epub_toc(
     # Write output
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(toc_content, encoding="utf-8")
+        write_text_atomic(output_path, toc_content)
         if verbose:
             print(f"TOC written to: {output_path}")
     except Exception as e:
@@ -0,0 +1,215 @@
+"""
+Page-range parallel docling conversion for large PDFs.
+
+A single docling call processes pages sequentially in one process. For long
+books this module splits the PDF into contiguous page ranges, converts the
+ranges in a process pool (each worker keeps its own pooled converter, so
+models load once per worker) and stitches the results back into one
+ConversionResult.
+
+The stitched result keeps absolute page numbers on every item and the page
+list in page order, so the usual post-processing runs once over the whole
+book: style-based heading levels are ranked across all ranges rather than per
+range, and PDF bookmarks map to the right pages in the hierarchical pass.
+
+Memory: each worker holds its own copy of the models plus the page images of
+the range it is converting. pages_per_chunk bounds the latter, and
+conversion.max_parallel_memory_mb caps the number of concurrent workers.
+
+Example:
+    from psychrag.conversions.converter_pool import ConverterKey
+    from psychrag.conversions.parallel_pdf import convert_pdf_parallel
+
+    result = convert_pdf_parallel("handbook.pdf", ConverterKey(), workers=4, pages_per_chunk=100)
+    markdown = result.document.export_to_markdown()
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import fitz  # PyMuPDF
+from docling.datamodel.base_models import LayoutPrediction, Page, PagePredictions
+from docling.datamodel.document import ConversionResult
+from docling_core.types.doc.document import DoclingDocument
+
+from ._executors import make_process_executor
+from .converter_pool import ConverterKey, get_converter_pool
+
+logger = logging.getLogger(__name__)
+
+
+def get_page_count(pdf_path: str | Path) -> int:
+    """Return the number of pages in a PDF."""
+    with fitz.open(str(pdf_path)) as doc:
+        return doc.page_count
+
+
+def plan_page_ranges(page_count: int, pages_per_chunk: int) -> list[tuple[int, int]]:
+    """
+    Split pages 1..page_count into contiguous, inclusive ranges.
+
+    The last range absorbs a short remainder (less than half a chunk) so no
+    worker is started for a handful of pages.
+    """
+    if page_count <= 0:
+        return []
+    if pages_per_chunk <= 0 or pages_per_chunk >= page_count:
+        return [(1, page_count)]
+
+    ranges = []
+    start = 1
+    while start <= page_count:
+        end = min(start + pages_per_chunk - 1, page_count)
+        if page_count - end < pages_per_chunk // 2:
+            end = page_count
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def resolve_worker_count(
+    requested: int,
+    range_count: int,
+    max_memory_mb: int = 0,
+    worker_memory_mb: int = 0,
+) -> int:
+    """
+    Number of worker processes to start.
+
+    Args:
+        requested: Desired number of workers.
+        range_count: Number of page ranges to convert.
+        max_memory_mb: Total memory budget for all workers (0 = no limit).
+        worker_memory_mb: Estimated peak memory per worker.
+
+    Returns:
+        At least 1, at most one worker per range, and no more than the
+        memory budget allows.
+    """
+    workers = max(1, min(requested, range_count))
+    if max_memory_mb > 0 and worker_memory_mb > 0:
+        workers = min(workers, max(1, max_memory_mb // worker_memory_mb))
+    return workers
+
+
+def _convert_range(
+    pdf_path: str, page_range: tuple[int, int], key: ConverterKey
+) -> tuple[DoclingDocument, list[Page]]:
+    """
+    Worker: convert one page range.
+
+    Returns the document and the pages' layout predictions (without the PDF
+    backend or page images, which cannot cross process boundaries and are
+    not needed by post-processing).
+    """
+    with get_converter_pool().converter(key) as converter:
+        result = converter.convert(pdf_path, page_range=page_range)
+
+    pages = [
+        Page(page_no=page.page_no, size=page.size, predictions=page.predictions)
+        for page in result.pages
+    ]
+    return result.document, pages
+
+
+def _page_list(page_numbers: list[int]) -> str:
+    """Format sorted page numbers as ranges, e.g. "3-4, 9"."""
+    spans = []
+    for page_no in page_numbers:
+        if spans and spans[-1][1] == page_no - 1:
+            spans[-1][1] = page_no
+        else:
+            spans.append([page_no, page_no])
+    return ", ".join(str(a) if a == b else f"{a}-{b}" for a, b in spans)
+
+
+def stitch_results(
+    parts: list[tuple[DoclingDocument, list[Page]]], name: str
+) -> ConversionResult:
+    """
+    Merge per-range conversions (in page order) into one ConversionResult.
+
+    Ranges must be contiguous and ordered; item provenance then keeps its
+    absolute page numbers and result.pages[n - 1] is page n, as for a
+    single-call conversion. Pages without layout predictions are logged and
+    get an empty layout.
+    """
+    document = DoclingDocument.concatenate([doc for doc, _ in parts])
+    document.name = name
+
+    # Pages that failed to convert are missing from their range or have no
+    # layout. Keep the list aligned with page numbers using placeholders with
+    # an empty layout: the hierarchical post-processor stops at the first
+    # header whose page has no layout prediction.
+    by_no = {page.page_no: page for _, part_pages in parts for page in part_pages}
+    pages = []
+    failed = []
+    page_count = max([*by_no, *document.pages], default=0)
+    for page_no in range(1, page_count + 1):
+        page = by_no.get(page_no)
+        if page is None or page.predictions.layout is None:
+            failed.append(page_no)
+            page = Page(
+                page_no=page_no,
+                size=page.size if page is not None else None,
+                predictions=PagePredictions(layout=LayoutPrediction()),
+            )
+        pages.append(page)
+    if failed:
+        logger.warning(f"{name}: no layout for {len(failed)} page(s): {_page_list(failed)}")
+
+    return ConversionResult.model_construct(document=document, pages=pages)
+
+
+def convert_pdf_parallel(
+    pdf_path: str | Path,
+    key: ConverterKey,
+    workers: int,
+    pages_per_chunk: int,
+    max_memory_mb: int = 0,
+    worker_memory_mb: int = 0,
+    verbose: bool = False,
+    page_count: Optional[int] = None,
+) -> ConversionResult:
+    """
+    Convert a PDF with docling by page ranges in parallel worker processes.
+
+    Args:
+        pdf_path: Path to the PDF.
+        key: Pipeline options for the workers' converters.
+        workers: Desired number of worker processes.
+        pages_per_chunk: Pages per docling call.
+        max_memory_mb: Total memory budget for all workers (0 = no limit).
+        worker_memory_mb: Estimated peak memory per worker.
+        verbose: If True, print progress information.
+        page_count: Page count, if already known.
+
+    Returns:
+        Stitched ConversionResult (document and page layout predictions).
+    """
+    pdf_path = Path(pdf_path)
+    if page_count is None:
+        page_count = get_page_count(pdf_path)
+
+    ranges = plan_page_ranges(page_count, pages_per_chunk)
+    workers = resolve_worker_count(workers, len(ranges), max_memory_mb, worker_memory_mb)
+
+    if verbose:
+        print(
+            f"Parallel conversion: {page_count} pages in {len(ranges)} ranges "
+            f"on {workers} worker(s)"
+        )
+
+    with make_process_executor(workers) as executor:
+        futures = [
+            executor.submit(_convert_range, str(pdf_path), page_range, key)
+            for page_range in ranges
+        ]
+        parts = []
+        for page_range, future in zip(ranges, futures):
+            parts.append(future.result())
+            if verbose:
+                print(f"Converted pages {page_range[0]}-{page_range[1]}")
+
+    return stitch_results(parts, name=pdf_path.stem)
@@ -19,6 +19,8 @@ from typing import Optional
 
 import fitz  # PyMuPDF
 
+from psychrag.utils.file_utils import write_text_atomic
+
 
 def extract_bookmarks_to_toc(
     pdf_path: str | Path,
@@ -87,7 +89,7 @@ def extract_bookmarks_to_toc(
 
     # Write output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(toc_content, encoding="utf-8")
+    write_text_atomic(output_path, toc_content)
 
     if verbose:
         print(f"TOC written to: {output_path}")
@@ -15,13 +15,14 @@ Example:
     )
 """
 
-import re
 import shutil
 import statistics
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from psychrag.utils.markdown_index import MarkdownIndex, load_markdown_index
+
 
 @dataclass
 class ChunkSizeConfig:
@@ -90,6 +91,15 @@ class StructuralMetrics:
     final_score: float = 0.0
 
 
+def _headings_from_index(index: MarkdownIndex) -> list[Heading]:
+    """H1-H6 headings with text of a structure index as Heading objects."""
+    return [
+        Heading(level=h.level, text=h.text, line_number=h.line, section_start=h.line)
+        for h in index.headings_up_to(6)
+        if h.text
+    ]
+
+
 def extract_headings(md_path: Path) -> list[Heading]:
     """
     Extract all ATX-style headings from a markdown file.
@@ -100,25 +110,7 @@ def extract_headings(md_path: Path) -> list[Heading]:
     Returns:
         List of Heading objects with line numbers and text.
     """
-    headings = []
-    heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
-
-    with open(md_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    for i, line in enumerate(lines, start=1):
-        match = heading_pattern.match(line.strip())
-        if match:
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            headings.append(Heading(
-                level=level,
-                text=text,
-                line_number=i,
-                section_start=i
-            ))
-
-    return headings
+    return _headings_from_index(load_markdown_index(md_path))
 
 
 def compute_section_sizes(headings: list[Heading], total_lines: int, config: ChunkSizeConfig) -> None:
@@ -430,13 +422,15 @@ def compare_and_select(
     config = config or ChunkSizeConfig()
 
     # Process style file
-    style_headings = extract_headings(style_path)
-    style_lines = len(style_path.read_text(encoding='utf-8').splitlines())
+    style_index = load_markdown_index(style_path)
+    style_headings = _headings_from_index(style_index)
+    style_lines = style_index.line_count
     style_metrics = compute_final_score(style_headings, style_lines, weights, config)
 
     # Process hier file
-    hier_headings = extract_headings(hier_path)
-    hier_lines = len(hier_path.read_text(encoding='utf-8').splitlines())
+    hier_index = load_markdown_index(hier_path)
+    hier_headings = _headings_from_index(hier_index)
+    hier_lines = hier_index.line_count
     hier_metrics = compute_final_score(hier_headings, hier_lines, weights, config)
 
     if verbose:
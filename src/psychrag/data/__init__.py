@@ -1,6 +1,6 @@
 """Data models, database connection, and schemas."""
 
-from .database import Base, engine, SessionLocal, get_session
+from .database import Base, engine, SessionLocal, get_session, session_scope
 from .models import Work
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "engine",
     "SessionLocal",
     "get_session",
+    "session_scope",
     "Work",
 ]
 
@@ -1,17 +1,33 @@
 """
 Database connection and session management.
 
-Database configuration (host, port, users) loaded from psychrag.config.json.
-Passwords (secrets) loaded from .env file.
+Database configuration (host, port, users, pool sizing) loaded from
+psychrag.config.json. Passwords (secrets) loaded from .env file.
+
+Sessions opened with get_session() inside a session_scope() (the API opens one
+per request) share a single Session, so helpers called during one request do
+not each check out their own connection. When the outermost get_session()
+block exits, a read-only transaction is rolled back so the connection goes
+back to the pool (e.g. before a long LLM call); transactions with flushed,
+executed or pending writes stay open for the caller's explicit commit.
+
+An async engine (psycopg async driver) with its own pool backs
+get_async_session() for read-heavy API endpoints.
 """
 
 import os
-from contextlib import contextmanager
-from typing import Generator
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Generator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import TextClause, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from psychrag.config import load_config
 from psychrag.data.env_utils import get_required_env_var
@@ -61,21 +77,215 @@ POSTGRES_ADMIN_PASSWORD = get_required_env_var("POSTGRES_ADMIN_PASSWORD", "Admin
 # Build database URL
 DATABASE_URL = get_database_url()
 
+
+class _PoolStatsMixin:
+    """Pool mixin that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.total_wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def recreate(self):
+        # Keep counters across pool recreation (e.g. after invalidation)
+        new_pool = super().recreate()
+        new_pool.checkouts = self.checkouts
+        new_pool.total_wait_seconds = self.total_wait_seconds
+        new_pool.max_wait_seconds = self.max_wait_seconds
+        new_pool.timeouts = self.timeouts
+        return new_pool
+
+
+class InstrumentedQueuePool(_PoolStatsMixin, QueuePool):
+    """QueuePool with checkout wait statistics."""
+
+
+class InstrumentedAsyncQueuePool(_PoolStatsMixin, AsyncAdaptedQueuePool):
+    """Async-adapted QueuePool with checkout wait statistics."""
+
+
+# Pool sizing from psychrag.config.json, shared by the sync and async engines
+_POOL_OPTIONS = dict(
+    pool_size=_db_config.pool_size,
+    max_overflow=_db_config.max_overflow,
+    pool_timeout=_db_config.pool_timeout,
+    pool_recycle=_db_config.pool_recycle,
+    pool_pre_ping=_db_config.pool_pre_ping,
+)
+
 # Create engine
-engine = create_engine(DATABASE_URL, echo=False)
+engine = create_engine(
+    DATABASE_URL, echo=False, poolclass=InstrumentedQueuePool, **_POOL_OPTIONS
+)
 
 # Create session factory
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# Async engine (psycopg 3 async driver, same URL scheme) and session factory
+async_engine = create_async_engine(
+    DATABASE_URL, echo=False, poolclass=InstrumentedAsyncQueuePool, **_POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Base class for declarative models
 Base = declarative_base()
 
+# Session shared by every get_session() call inside an active session_scope()
+_scoped_session: ContextVar[Optional[Session]] = ContextVar(
+    "psychrag_scoped_session", default=None
+)
+
+
+# Session.info keys: nesting depth of get_session() blocks on the scoped
+# session, and whether its current transaction has written anything
+_DEPTH_KEY = "psychrag_get_session_depth"
+_WRITTEN_KEY = "psychrag_written"
+
+# Textual SQL that only reads; anything else executed via text() is a write
+_READ_SQL_RE = re.compile(r"^\s*(SELECT|EXPLAIN|SHOW)\b", re.IGNORECASE)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info[_WRITTEN_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_executed_write(orm_execute_state):
+    # Bulk DML (update(), delete(), query.update(), text("UPDATE ..."))
+    # never flushes, and SELECT ... FOR UPDATE holds row locks
+    statement = orm_execute_state.statement
+    if isinstance(statement, TextClause):
+        is_read = _READ_SQL_RE.match(statement.text) is not None
+    else:
+        is_read = (
+            orm_execute_state.is_select
+            and getattr(statement, "_for_update_arg", None) is None
+        )
+    if not is_read:
+        orm_execute_state.session.info[_WRITTEN_KEY] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_written(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_WRITTEN_KEY, None)
+
+
+def _is_read_only(session: Session) -> bool:
+    """Whether the session's transaction has neither written nor pending changes."""
+    if session.info.get(_WRITTEN_KEY):
+        return False
+    return not (session.new or session.dirty or session.deleted)
+
+
+def _release_read_transaction(session: Session) -> None:
+    """Roll back a transaction without writes so its connection returns to the pool."""
+    if session.in_transaction() and _is_read_only(session):
+        session.rollback()
+
+
+def get_pool_status(pool: Optional[Pool] = None) -> dict:
+    """
+    Report connection pool usage.
+
+    Args:
+        pool: Pool to inspect (default: the sync engine's pool). Pass
+            async_engine.pool for the async engine.
+
+    Returns:
+        Dict with pool sizing, current usage (checked_out, checked_in,
+        overflow) and cumulative checkout wait statistics.
+    """
+    if pool is None:
+        pool = engine.pool
+    status = {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": _db_config.max_overflow,
+    }
+    if isinstance(pool, _PoolStatsMixin):
+        with pool._stats_lock:
+            checkouts = pool.checkouts
+            status.update({
+                "total_checkouts": checkouts,
+                "checkout_timeouts": pool.timeouts,
+                "avg_wait_ms": round(
+                    pool.total_wait_seconds / checkouts * 1000, 3
+                ) if checkouts else 0.0,
+                "max_wait_ms": round(pool.max_wait_seconds * 1000, 3),
+            })
+    return status
+
+
+@contextmanager
+def session_scope() -> Generator[Session, None, None]:
+    """
+    Open a Session shared by all get_session() calls in the current context.
+
+    Used by the API to give each request a single session: router code and
+    library helpers (config loaders, template loader, vectorization) that call
+    get_session() during the request reuse it instead of opening their own.
+    Nested scopes reuse the outer session.
+
+    Yields:
+        SQLAlchemy Session object.
+    """
+    existing = _scoped_session.get()
+    if existing is not None:
+        yield existing
+        return
+
+    session = SessionLocal()
+    token = _scoped_session.set(session)
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        try:
+            _scoped_session.reset(token)
+        except ValueError:
+            # Exited from a different context (e.g. async teardown); just clear
+            _scoped_session.set(None)
+        session.close()
+
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
     """
     Provide a transactional scope around a series of operations.
 
+    Inside a session_scope() the scoped session is yielded and left open for
+    the scope owner to close. When the outermost block exits, a transaction
+    without writes is rolled back so its connection returns to the pool; one
+    with flushed, executed (bulk DML) or pending writes is left for the caller
+    to commit. An exception in a block does not roll back those writes; that
+    is left to session_scope().
+
     Usage:
         with get_session() as session:
             session.add(some_object)
@@ -84,6 +294,23 @@ def get_session() -> Generator[Session, None, None]:
     Yields:
         SQLAlchemy Session object.
     """
+    scoped = _scoped_session.get()
+    if scoped is not None:
+        depth = scoped.info.get(_DEPTH_KEY, 0)
+        scoped.info[_DEPTH_KEY] = depth + 1
+        try:
+            yield scoped
+        except Exception:
+            # Helpers may catch their own errors and carry on, so the request's
+            # writes are left for session_scope() to roll back
+            _release_read_transaction(scoped)
+            raise
+        finally:
+            scoped.info[_DEPTH_KEY] = depth
+        if depth == 0:
+            _release_read_transaction(scoped)
+        return
+
     session = SessionLocal()
     try:
         yield session
@@ -94,6 +321,28 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide an async transactional scope around a series of operations.
+
+    Usage:
+        async with get_async_session() as session:
+            result = await session.execute(select(Work))
+
+    Yields:
+        SQLAlchemy AsyncSession object.
+    """
+    session = AsyncSessionLocal()
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 def get_db_session() -> Generator[Session, None, None]:
     """
     FastAPI dependency for database sessions.
@@ -109,14 +358,8 @@ def get_db_session() -> Generator[Session, None, None]:
     Yields:
         SQLAlchemy Session object.
     """
-    session = SessionLocal()
-    try:
+    with get_session() as session:
         yield session
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
 
 
 def get_admin_database_url() -> str:
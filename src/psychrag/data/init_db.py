@@ -29,6 +29,7 @@ from .models import Chunk, Query, Result, Work, RagConfig  # noqa: F401
 from .models.io_file import IOFile  # noqa: F401
 from .models.prompt_template import PromptTemplate  # noqa: F401
 from .models.prompt_meta import PromptMeta  # noqa: F401
+from .models.work import CORPUS_WORK_PREDICATE
 
 # Import seeding functions
 from .seed_templates import seed_prompt_templates
@@ -194,6 +195,37 @@ def create_vector_indexes(verbose: bool = False) -> None:
         print("Vector indexes created successfully")
 
 
+def create_corpus_indexes(verbose: bool = False) -> None:
+    """
+    Create indexes backing SQL-side corpus filtering and chunk statistics.
+
+    - ix_works_corpus: partial index on works(id) restricted to corpus works,
+      so corpus listing/counting never scans the large JSON/text columns.
+    - ix_chunks_work_id_vector_status: composite index for per-status chunk
+      counts over a set of works.
+
+    Args:
+        verbose: If True, print progress information.
+    """
+    if verbose:
+        print("Creating corpus indexes...")
+
+    with engine.connect() as conn:
+        conn.execute(text(f"""
+            CREATE INDEX IF NOT EXISTS ix_works_corpus
+            ON works (id)
+            WHERE {CORPUS_WORK_PREDICATE}
+        """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_chunks_work_id_vector_status
+            ON chunks (work_id, vector_status)
+        """))
+        conn.commit()
+
+    if verbose:
+        print("Corpus indexes created successfully")
+
+
 def create_fulltext_search(verbose: bool = False) -> None:
     """
     Create full-text search infrastructure for chunks.
@@ -497,6 +529,7 @@ def init_database(verbose: bool = False) -> None:
     enable_pgvector_extension(verbose=verbose)
     create_tables(verbose=verbose)
     create_vector_indexes(verbose=verbose)
+    create_corpus_indexes(verbose=verbose)
     create_fulltext_search(verbose=verbose)
     create_prompt_meta_table(verbose=verbose)
     seed_prompt_templates(verbose=verbose)
@@ -13,6 +13,16 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
 
+# SQL predicate for works that belong to the corpus: heading and content
+# chunking completed and a sanitized file registered. Kept as a literal SQL
+# fragment (no bound parameters) so queries using it match the partial index
+# ix_works_corpus created by init_db / migration 015.
+CORPUS_WORK_PREDICATE = (
+    "processing_status ->> 'content_chunks' = 'completed' "
+    "AND processing_status ->> 'heading_chunks' = 'completed' "
+    "AND (files -> 'sanitized') IS NOT NULL"
+)
+
 
 class Work(Base):
     """
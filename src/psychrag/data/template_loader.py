@@ -3,9 +3,16 @@ Template loader utility for prompt templates.
 
 Provides functions to load LangChain PromptTemplates from the database
 with fallback to hardcoded defaults.
+
+Compiled templates are cached in-process per function_tag (active template)
+and per (function_tag, version), so repeated LLM-facing calls skip both the
+database round trip and the template parse. The cache is invalidated by the
+template management endpoints whenever a template changes, and can be
+pre-populated at startup with warm_template_cache().
 """
 
-from typing import Callable
+import threading
+from typing import Callable, Iterable, Optional
 import logging
 from langchain_core.prompts import PromptTemplate as LCPromptTemplate
 
@@ -14,10 +21,40 @@ from psychrag.data.models.prompt_template import PromptTemplate
 
 logger = logging.getLogger(__name__)
 
+# function_tag -> (active version or None for fallback, compiled template)
+_active_cache: dict[str, tuple[Optional[int], LCPromptTemplate]] = {}
+
+# (function_tag, version) -> (template_content, compiled template)
+_compiled_cache: dict[tuple[str, int], tuple[str, LCPromptTemplate]] = {}
+
+_cache_lock = threading.Lock()
+
+
+def _compile(function_tag: str, version: int, template_content: str) -> LCPromptTemplate:
+    """Return a compiled template for a version, reusing it if content is unchanged."""
+    key = (function_tag, version)
+    with _cache_lock:
+        cached = _compiled_cache.get(key)
+        if cached is not None and cached[0] == template_content:
+            return cached[1]
+
+    template = LCPromptTemplate.from_template(template_content)
+    with _cache_lock:
+        _compiled_cache[key] = (template_content, template)
+    return template
+
+
+def _store_active(
+    function_tag: str, version: Optional[int], template: LCPromptTemplate
+) -> None:
+    with _cache_lock:
+        _active_cache[function_tag] = (version, template)
+
 
 def load_template(
     function_tag: str,
-    fallback_builder: Callable[[], str]
+    fallback_builder: Callable[[], str],
+    use_cache: bool = True,
 ) -> LCPromptTemplate:
     """
     Load active template from database with fallback.
@@ -27,9 +64,15 @@ def load_template(
     error, it falls back to calling fallback_builder() to get the hardcoded
     template string.
 
+    Successful lookups (including "no active template, use fallback") are cached
+    until invalidate_template_cache() is called for the function_tag. Database
+    errors are never cached, so the next call retries the database.
+
     Args:
         function_tag: The function tag to load (e.g., 'query_expansion')
         fallback_builder: Callable that returns the hardcoded template string
+        use_cache: Whether to serve from/populate the in-process cache
+            (default: True)
 
     Returns:
         LangChain PromptTemplate ready for formatting
@@ -40,6 +83,12 @@ def load_template(
         >>> template = load_template("query_expansion", get_hardcoded_prompt)
         >>> result = template.format(query="test")
     """
+    if use_cache:
+        with _cache_lock:
+            cached = _active_cache.get(function_tag)
+        if cached is not None:
+            return cached[1]
+
     try:
         # Attempt to load from database
         with get_session() as session:
@@ -52,14 +101,22 @@ def load_template(
                 logger.info(
                     f"Loaded template from database: {function_tag} v{db_template.version}"
                 )
-                return LCPromptTemplate.from_template(db_template.template_content)
+                template = _compile(
+                    function_tag, db_template.version, db_template.template_content
+                )
+                if use_cache:
+                    _store_active(function_tag, db_template.version, template)
+                return template
 
         # No active template found, use fallback
         logger.info(
             f"No active template in database for {function_tag}, using fallback"
         )
         fallback_str = fallback_builder()
-        return LCPromptTemplate.from_template(fallback_str)
+        template = LCPromptTemplate.from_template(fallback_str)
+        if use_cache:
+            _store_active(function_tag, None, template)
+        return template
 
     except Exception as e:
         # Database error or other issue, use fallback
@@ -69,3 +126,71 @@ def load_template(
         )
         fallback_str = fallback_builder()
         return LCPromptTemplate.from_template(fallback_str)
+
+
+def invalidate_template_cache(function_tag: Optional[str] = None) -> None:
+    """
+    Drop cached templates so the next load_template() call re-reads the database.
+
+    Args:
+        function_tag: Function tag to invalidate. If None, the whole cache
+            is cleared.
+    """
+    with _cache_lock:
+        if function_tag is None:
+            _active_cache.clear()
+            _compiled_cache.clear()
+            return
+
+        _active_cache.pop(function_tag, None)
+        for key in [k for k in _compiled_cache if k[0] == function_tag]:
+            del _compiled_cache[key]
+
+
+def warm_template_cache(function_tags: Optional[Iterable[str]] = None) -> int:
+    """
+    Pre-load and compile all active templates in a single database query.
+
+    Function tags without an active database template are not cached here;
+    their fallback is cached on first use by load_template().
+
+    Args:
+        function_tags: Restrict warm-up to these function tags. If None,
+            every active template is loaded.
+
+    Returns:
+        Number of templates compiled into the cache.
+
+    Raises:
+        Exception: Propagates database errors so callers can decide whether
+            a failed warm-up is fatal.
+    """
+    with get_session() as session:
+        query = session.query(PromptTemplate).filter(PromptTemplate.is_active == True)
+        if function_tags is not None:
+            query = query.filter(PromptTemplate.function_tag.in_(list(function_tags)))
+        rows = [
+            (t.function_tag, t.version, t.template_content) for t in query.all()
+        ]
+
+    for function_tag, version, template_content in rows:
+        template = _compile(function_tag, version, template_content)
+        _store_active(function_tag, version, template)
+
+    logger.info(f"Warmed template cache with {len(rows)} active template(s)")
+    return len(rows)
+
+
+def get_template_cache_info() -> dict:
+    """
+    Describe the current cache contents.
+
+    Returns:
+        Dict mapping function_tag to its cached active version (None when the
+        hardcoded fallback is cached), plus the number of compiled versions.
+    """
+    with _cache_lock:
+        return {
+            "active": {tag: version for tag, (version, _) in _active_cache.items()},
+            "compiled_versions": len(_compiled_cache),
+        }
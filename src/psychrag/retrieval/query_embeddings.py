@@ -6,6 +6,10 @@ that are marked for vectorization (vector_status='to_vec').
 
 Uses lazy imports to avoid loading heavy AI dependencies until actually needed.
 
+vectorize_all_queries embeds the texts of all pending queries together in
+provider-sized batches with a single client, and writes the vectors back in
+one transaction.
+
 Usage:
     from psychrag.retrieval.query_embeddings import vectorize_query, vectorize_all_queries
     result = vectorize_query(query_id=1, verbose=True)
@@ -19,6 +23,9 @@ from dataclasses import dataclass
 from psychrag.data.database import get_session
 from psychrag.data.models import Query
 
+# Texts per embedding request in vectorize_all_queries
+EMBED_BATCH_SIZE = 100
+
 
 @dataclass
 class QueryVectorizationResult:
@@ -57,6 +64,30 @@ def get_pending_queries_count() -> int:
         ).count()
 
 
+def _texts_to_embed(query: Query) -> tuple[list[str], int]:
+    """Texts to embed for a query: original, MQE queries, then HyDE answer.
+
+    Returns:
+        Tuple of (texts, number of MQE texts).
+    """
+    mqe_queries = query.expanded_queries or []
+    texts = [query.original_query, *mqe_queries]
+    if query.hyde_answer:
+        texts.append(query.hyde_answer)
+    return texts, len(mqe_queries)
+
+
+def _assign_embeddings(query: Query, embeddings: list, mqe_count: int) -> None:
+    """Store embeddings (in _texts_to_embed order) on a query and mark it vectorized."""
+    query.embedding_original = embeddings[0]
+    if mqe_count > 0:
+        # MQE embeddings (as JSON array)
+        query.embeddings_mqe = embeddings[1:1 + mqe_count]
+    if len(embeddings) > 1 + mqe_count:
+        query.embedding_hyde = embeddings[1 + mqe_count]
+    query.vector_status = 'vec'
+
+
 def vectorize_query(
     query_id: int,
     verbose: bool = False
@@ -83,23 +114,9 @@ def vectorize_query(
             print(f"Vectorizing query {query_id}: {query.original_query[:50]}...")
 
         # Build list of texts to embed
-        texts_to_embed = []
-
-        # Original query
-        texts_to_embed.append(query.original_query)
+        texts_to_embed, mqe_count = _texts_to_embed(query)
         original_count = 1
-
-        # MQE queries
-        mqe_queries = query.expanded_queries or []
-        texts_to_embed.extend(mqe_queries)
-        mqe_count = len(mqe_queries)
-
-        # HyDE answer
-        hyde_count = 0
-        if query.hyde_answer:
-            texts_to_embed.append(query.hyde_answer)
-            hyde_count = 1
-
+        hyde_count = len(texts_to_embed) - 1 - mqe_count
         total_embeddings = len(texts_to_embed)
 
         if verbose:
@@ -113,24 +130,8 @@ def vectorize_query(
             embeddings_model = create_embeddings()
             embeddings = embeddings_model.embed_documents(texts_to_embed)
 
-            # Assign embeddings to query fields
-            idx = 0
-
-            # Original embedding
-            query.embedding_original = embeddings[idx]
-            idx += 1
-
-            # MQE embeddings (as JSON array)
-            if mqe_count > 0:
-                query.embeddings_mqe = embeddings[idx:idx + mqe_count]
-                idx += mqe_count
-
-            # HyDE embedding
-            if hyde_count > 0:
-                query.embedding_hyde = embeddings[idx]
-
-            # Update status
-            query.vector_status = 'vec'
+            # Assign embeddings to query fields and update status
+            _assign_embeddings(query, embeddings, mqe_count)
             session.commit()
 
             if verbose:
@@ -165,12 +166,19 @@ def vectorize_query(
 
 
 def vectorize_all_queries(
-    verbose: bool = False
+    verbose: bool = False,
+    batch_size: int = EMBED_BATCH_SIZE,
 ) -> BatchVectorizationResult:
     """Vectorize all queries with vector_status='to_vec'.
 
+    The original, MQE and HyDE texts of all pending queries are embedded
+    together in batches of batch_size texts with one embeddings client,
+    and all vectors are written back in a single commit. A query whose texts
+    fall in a failed batch is marked 'vec_err'.
+
     Args:
         verbose: Whether to print progress information.
+        batch_size: Number of texts per embedding request.
 
     Returns:
         BatchVectorizationResult with aggregate counts and errors.
@@ -179,7 +187,7 @@ def vectorize_all_queries(
         # Get all pending queries
         queries = session.query(Query).filter(
             Query.vector_status == 'to_vec'
-        ).all()
+        ).order_by(Query.id).all()
 
         total_queries = len(queries)
 
@@ -196,23 +204,63 @@ def vectorize_all_queries(
                 errors=[]
             )
 
+        # Gather texts of all queries; each query owns texts[start:start + count]
+        texts: list[str] = []
+        spans: list[tuple[Query, int, int, int]] = []  # (query, start, count, mqe_count)
+        for query in queries:
+            query_texts, mqe_count = _texts_to_embed(query)
+            spans.append((query, len(texts), len(query_texts), mqe_count))
+            texts.extend(query_texts)
+
+        embeddings: list = [None] * len(texts)
+        text_errors: dict[int, str] = {}  # text index -> error, for failed batches
+
+        try:
+            # Lazy import - only load AI module when embeddings are needed
+            from psychrag.ai.llm_factory import create_embeddings
+
+            embeddings_model = create_embeddings()
+        except Exception as e:
+            embeddings_model = None
+            text_errors = dict.fromkeys(range(len(texts)), str(e))
+
+        if embeddings_model is not None:
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start:start + batch_size]
+                if verbose:
+                    print(f"  Processing batch {start // batch_size + 1} ({len(batch)} texts)...")
+                try:
+                    batch_embeddings = embeddings_model.embed_documents(batch)
+                    if len(batch_embeddings) != len(batch):
+                        raise ValueError(
+                            f"Expected {len(batch)} embeddings, got {len(batch_embeddings)}"
+                        )
+                    embeddings[start:start + len(batch)] = batch_embeddings
+                except Exception as e:
+                    text_errors.update(dict.fromkeys(range(start, start + len(batch)), str(e)))
+                    if verbose:
+                        print(f"    Batch error: {e}")
+
         success_count = 0
         failed_count = 0
         total_embeddings = 0
         errors = []
 
-        for i, query in enumerate(queries):
-            if verbose:
-                print(f"\nProcessing query {i + 1}/{total_queries} (ID: {query.id})")
-
-            result = vectorize_query(query.id, verbose=verbose)
-
-            if result.success:
+        for query, start, count, mqe_count in spans:
+            error = next(
+                (text_errors[i] for i in range(start, start + count) if i in text_errors),
+                None
+            )
+            if error is None:
+                _assign_embeddings(query, embeddings[start:start + count], mqe_count)
                 success_count += 1
-                total_embeddings += result.total_embeddings
+                total_embeddings += count
             else:
+                query.vector_status = 'vec_err'
                 failed_count += 1
-                errors.append((query.id, result.error or "Unknown error"))
+                errors.append((query.id, error))
+
+        session.commit()
 
         if verbose:
             print(f"\nCompleted: {success_count} success, {failed_count} failed")
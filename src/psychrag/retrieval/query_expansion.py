@@ -244,6 +244,7 @@ def expand_query(
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai.config import ModelTier
     from psychrag.ai.llm_factory import create_langchain_chat
+    from psychrag.ai.response_cache import invoke_cached
 
     # Generate the prompt
     prompt = generate_expansion_prompt(query, n)
@@ -256,7 +257,7 @@ def expand_query(
     if verbose:
         print("Calling LLM...")
 
-    response = chat.invoke(prompt)
+    response = invoke_cached(chat, prompt, function="query_expansion")
     response_text = response.content
 
     # Parse the response
@@ -26,7 +26,7 @@ from typing import Optional
 
 from psychrag.data.database import get_session, SessionLocal
 from psychrag.data.models.work import Work
-from psychrag.utils.file_utils import compute_file_hash, set_file_readonly, set_file_writable, is_file_readonly
+from psychrag.utils.file_utils import compute_file_hash, set_file_readonly, set_file_writable, is_file_readonly, write_text_atomic
 from psychrag.sanitization.extract_titles import HashMismatchError
 
 
@@ -230,10 +230,7 @@ def apply_title_changes(
         markdown_path.stem + '.sanitized.md'
     )
     sanitized_content = '\n'.join(new_lines)
-    sanitized_path.write_text(sanitized_content, encoding='utf-8')
-
-    # Compute new hash and update database
-    new_hash = compute_file_hash(sanitized_path)
+    new_hash = write_text_atomic(sanitized_path, sanitized_content)
 
     with SessionLocal() as session:
         work = session.query(Work).filter(Work.id == work_id).first()
@@ -417,7 +414,7 @@ def apply_title_changes_from_work(
 
         # Write sanitized content
         sanitized_content = '\n'.join(new_lines)
-        output_path.write_text(sanitized_content, encoding='utf-8')
+        sanitized_hash = write_text_atomic(output_path, sanitized_content)
 
         if verbose:
             print(f"Sanitized file written: {output_path}")
@@ -428,9 +425,6 @@ def apply_title_changes_from_work(
         if verbose:
             print(f"File set to read-only")
 
-        # Compute hash of sanitized file
-        sanitized_hash = compute_file_hash(output_path)
-
         # Update work's files metadata
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
@@ -30,8 +30,10 @@ Edit Formats:
 import re
 from pathlib import Path
 
+from psychrag.utils.file_utils import write_text_atomic
 
-def apply_title_edits(markdown_file_path: Path, title_edits: str) -> None:
+
+def apply_title_edits(markdown_file_path: Path, title_edits: str) -> str:
     """Apply title edits to a markdown file based on line numbers.
     
     This function reads a markdown file, applies edits based on line numbers,
@@ -47,6 +49,9 @@ def apply_title_edits(markdown_file_path: Path, title_edits: str) -> None:
         - "123: -" - Remove heading markers (e.g., "## Title" becomes "Title")
         - "123: --" - Replace line with blank line
         
+    Returns:
+        SHA-256 hash of the modified file
+        
     Raises:
         FileNotFoundError: If the markdown file doesn't exist
         ValueError: If the markdown file is not a markdown file
@@ -92,7 +97,7 @@ def apply_title_edits(markdown_file_path: Path, title_edits: str) -> None:
     
     # Write modified content back to file
     modified_content = "".join(modified_lines)
-    markdown_file_path.write_text(modified_content, encoding='utf-8')
+    return write_text_atomic(markdown_file_path, modified_content)
 
 
 def _parse_title_edits(title_edits: str) -> dict[int, str]:
@@ -29,13 +29,13 @@ Exceptions:
     HashMismatchError - Raised when file hash doesn't match database
 """
 
-import re
 from pathlib import Path
 from typing import Optional
 
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
-from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly
+from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly, write_text_atomic
+from psychrag.utils.markdown_index import MarkdownIndex, build_markdown_index, load_markdown_index
 
 
 def _validate_input(input_path: Path) -> None:
@@ -55,6 +55,11 @@ def _validate_input(input_path: Path) -> None:
         raise ValueError(f"Input file must be a markdown file: {input_path}")
 
 
+def _format_titles(index: MarkdownIndex) -> list[str]:
+    """Format the headings of a structure index as "line_num: heading_line"."""
+    return [f"{heading.line}: {heading.raw}" for heading in index.headings]
+
+
 def _extract_titles_from_content(content: str) -> list[str]:
     """Extract titles from markdown content.
 
@@ -64,15 +69,7 @@ def _extract_titles_from_content(content: str) -> list[str]:
     Returns:
         List of strings in format "line_num: heading_line".
     """
-    lines = content.splitlines()
-    title_pattern = re.compile(r'^#+\s+')
-    titles = []
-
-    for line_num, line in enumerate(lines, start=1):
-        if title_pattern.match(line):
-            titles.append(f"{line_num}: {line}")
-
-    return titles
+    return _format_titles(build_markdown_index(content))
 
 
 def extract_titles(input_path: str | Path) -> list[str]:
@@ -91,8 +88,7 @@ def extract_titles(input_path: str | Path) -> list[str]:
     input_path = Path(input_path)
     _validate_input(input_path)
 
-    content = input_path.read_text(encoding='utf-8')
-    return _extract_titles_from_content(content)
+    return _format_titles(load_markdown_index(input_path))
 
 
 def extract_titles_to_file(
@@ -128,8 +124,7 @@ def extract_titles_to_file(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Extract titles
-    content = input_path.read_text(encoding='utf-8')
-    titles = _extract_titles_from_content(content)
+    titles = _format_titles(load_markdown_index(input_path))
 
     # Calculate relative path from output to input
     try:
@@ -152,7 +147,7 @@ def extract_titles_to_file(
     output_content = "\n".join(output_lines)
 
     # Write output file
-    output_path.write_text(output_content, encoding='utf-8')
+    write_text_atomic(output_path, output_content)
 
     return output_path
 
@@ -241,8 +236,7 @@ def extract_titles_from_work(
             print(f"Warning: Hash mismatch detected, proceeding with --force")
 
         # Extract titles
-        content = file_path.read_text(encoding='utf-8')
-        titles = _extract_titles_from_content(content)
+        titles = _format_titles(load_markdown_index(file_path, file_hash=current_hash))
 
         # Determine output path and key based on source
         if source_key == "original_markdown":
@@ -289,7 +283,7 @@ def extract_titles_from_work(
                     print(f"Warning: Could not make file writable: {e}")
 
         # Write output file
-        output_path.write_text(output_content, encoding='utf-8')
+        titles_hash = write_text_atomic(output_path, output_content)
 
         if verbose:
             print(f"Titles saved to: {output_path}")
@@ -297,9 +291,6 @@ def extract_titles_from_work(
         # Set file to read-only
         set_file_readonly(output_path)
 
-        # Compute hash of new titles file
-        titles_hash = compute_file_hash(output_path)
-
         # Update work's files metadata
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
@@ -85,6 +85,7 @@ def extract_table_of_contents(
 
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai import create_langchain_chat, ModelTier as MT
+    from psychrag.ai.response_cache import invoke_cached
 
     if tier is None:
         tier = MT.LIGHT
@@ -119,7 +120,7 @@ Text to analyze:
 Return only the JSON, no other text."""
 
     # Call the LLM
-    response = chat.invoke(prompt)
+    response = invoke_cached(chat, prompt, function="toc_extraction")
 
     # Parse the response
     import json
@@ -4,6 +4,29 @@ Apply string mappings to sanitize markdown documents.
 This module reads a CSV file with old/new string mappings and applies
 them to a markdown document, updating the database with the new hash.
 
+Mappings are applied by apply_mappings, which gives exactly the result of
+calling str.replace for each mapping in CSV order, without rewriting the
+whole document once per mapping:
+1. One pass over the document finds the occurrences of all old strings (an
+   Aho-Corasick automaton, via pyahocorasick when installed). When no two
+   old strings can overlap, the automaton's leftmost-longest matches are
+   the replacements; otherwise each mapping takes, in mapping order, the
+   occurrences earlier mappings left free.
+2. The mapping strings tell up front which later old strings could match
+   an earlier mapping's output (inside or across the edges of its new
+   string, or across the join a deletion leaves). Only replacements of
+   those mappings have their surroundings checked.
+3. The new text is built from the replacements in one pass. If a chain was
+   found, the text is rewritten up to that mapping and scanned again for
+   the remaining ones.
+
+Mappings can affect each other, which is why their order matters. These
+interactions are reported as conflicts (earlier mapping first):
+- overlap: occurrences of both old strings overlap in the document; the
+  earlier mapping replaces the shared text, so the later one matches less.
+- chain: the later mapping replaced text produced by the earlier one (its
+  new string, or text joined together by deleting the earlier old string).
+
 Usage:
     from psychrag.sanitization.san_map import apply_san_mapping, preview_san_mapping
 
@@ -15,12 +38,19 @@ Usage:
 """
 
 import csv
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Literal, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from psychrag.data.database import SessionLocal
 from psychrag.data.models import Work
-from psychrag.utils import compute_file_hash, set_file_writable, set_file_readonly, is_file_readonly
-
+from psychrag.utils import set_file_writable, set_file_readonly, is_file_readonly, write_text_atomic
 
 def load_mappings(csv_path: str | Path) -> list[tuple[str, str]]:
     """
@@ -57,6 +87,463 @@ def load_mappings(csv_path: str | Path) -> list[tuple[str, str]]:
     return mappings
 
 
+ConflictKind = Literal["overlap", "chain"]
+
+
+@dataclass
+class MappingConflict:
+    """An earlier mapping changed what a later one replaced (indices into the mapping list)."""
+
+    first: int
+    second: int
+    kind: ConflictKind
+
+
+@dataclass
+class MappingResult:
+    """Outcome of applying mappings to a text."""
+
+    content: str
+    counts: list[int]  # Replacements made by each mapping, in mapping order
+    matches: list[int]  # Occurrences of each old string in the original text
+    conflicts: list[MappingConflict] = field(default_factory=list)
+
+    @property
+    def total_replacements(self) -> int:
+        return sum(self.counts)
+
+
+def _find_occurrences(
+    content: str, olds: set[str], overlapping: bool = True
+) -> list[tuple[int, str]]:
+    """
+    Every (start, old) where an old string occurs in content.
+
+    With overlapping=False only leftmost-longest, non-overlapping occurrences
+    are returned, which is enough when no two old strings can overlap.
+    """
+    found = []
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for old in olds:
+            automaton.add_word(old, old)
+        automaton.make_automaton()
+        matches = automaton.iter(content) if overlapping else automaton.iter_long(content)
+        for end, old in matches:
+            found.append((end - len(old) + 1, old))
+        return found
+
+    for old in olds:
+        step = 1 if overlapping else len(old)
+        start = content.find(old)
+        while start != -1:
+            found.append((start, old))
+            start = content.find(old, start + step)
+    return found
+
+
+def _count_matches(starts: list[int], length: int) -> int:
+    """Non-overlapping matches among sorted occurrence starts, as str.count counts them."""
+    count = 0
+    next_free = 0
+    for start in starts:
+        if start >= next_free:
+            count += 1
+            next_free = start + length
+    return count
+
+
+def _affix_index(strings: list[str]) -> tuple[dict[str, set[int]], dict[str, set[int]]]:
+    """Indices of strings by each of their proper prefixes and proper suffixes."""
+    prefixes: dict[str, set[int]] = {}
+    suffixes: dict[str, set[int]] = {}
+    for k, string in enumerate(strings):
+        for n in range(1, len(string)):
+            prefixes.setdefault(string[:n], set()).add(k)
+            suffixes.setdefault(string[n:], set()).add(k)
+    return prefixes, suffixes
+
+
+def _overlapping(
+    text: str,
+    olds: list[str],
+    affixes: tuple[dict[str, set[int]], dict[str, set[int]]],
+) -> set[int]:
+    """Indices of old strings that can share characters with `text` once it is in a document."""
+    prefixes, suffixes = affixes
+    hits = {k for k, old in enumerate(olds) if old in text or text in old}
+    for n in range(1, len(text) + 1):
+        hits.update(prefixes.get(text[-n:], ()))
+        hits.update(suffixes.get(text[:n], ()))
+    return hits
+
+
+def _can_overlap(olds: list[str]) -> bool:
+    """Whether occurrences of two different old strings can overlap."""
+    distinct = list(dict.fromkeys(olds))
+    affixes = _affix_index(distinct)
+    return any(_overlapping(old, distinct, affixes) - {k} for k, old in enumerate(distinct))
+
+
+# (before, after, j): old string j reads `before` + text written by an
+# earlier replacement + `after`
+_ChainPattern = tuple[str, str, int]
+_PatternTable = dict[tuple[str, str], list[_ChainPattern]]
+
+
+@dataclass
+class _ChainPatterns:
+    """Ways a later old string can match text written by an earlier mapping."""
+
+    # Per mapping: first later mapping whose old string is inside its new
+    # string (len(mappings) if none)
+    contained: list[int]
+    # Per mapping: patterns around its new string, keyed by the characters
+    # next to it (last of `before`, first of `after`)
+    edges: list[_PatternTable]
+    # Every split of every old string around the join a deletion leaves
+    joins: _PatternTable
+
+
+def _add_pattern(table: _PatternTable, before: str, after: str, j: int) -> None:
+    table.setdefault((before[-1:], after[:1]), []).append((before, after, j))
+
+
+def _chain_patterns(mappings: list[tuple[str, str]]) -> _ChainPatterns:
+    """Index, from the mapping strings alone, where chains could come from."""
+    olds = [old_val for old_val, _ in mappings]
+    prefixes, suffixes = _affix_index(olds)
+
+    joins: _PatternTable = {}
+    for j, old in enumerate(olds):
+        for n in range(1, len(old)):
+            _add_pattern(joins, old[:n], old[n:], j)
+
+    contained = []
+    edges = []
+    for i, (_, new_val) in enumerate(mappings):
+        first = len(mappings)
+        table: _PatternTable = {}
+        if new_val:
+            for j in range(i + 1, len(olds)):
+                old = olds[j]
+                if old in new_val:
+                    first = j
+                    break
+                start = old.find(new_val)
+                while start != -1:
+                    _add_pattern(table, old[:start], old[start + len(new_val):], j)
+                    start = old.find(new_val, start + 1)
+            for n in range(1, len(new_val)):
+                for j in prefixes.get(new_val[-n:], ()):
+                    if i < j < first:
+                        _add_pattern(table, "", olds[j][n:], j)
+                for j in suffixes.get(new_val[:n], ()):
+                    if i < j < first:
+                        _add_pattern(table, olds[j][:-n], "", j)
+        contained.append(first)
+        edges.append(table)
+    return _ChainPatterns(contained, edges, joins)
+
+
+# (start, end, new, mapping index) of one replacement in the original text
+_Replacement = tuple[int, int, str, int]
+
+
+def _select_replacements(
+    content: str,
+    mappings: list[tuple[str, str]],
+    first: int,
+    starts: dict[str, list[int]],
+    overlapping: bool,
+) -> list[_Replacement]:
+    """
+    Pick the occurrences mappings[first:] replace, assuming no chains.
+
+    `starts` holds the sorted occurrence starts of each old string.
+
+    Each mapping takes its old string's occurrences left to right, skipping
+    those overlapping an occurrence it or an earlier mapping already took,
+    exactly as str.replace in mapping order would. Without overlapping old
+    strings every (non-overlapping) occurrence is taken.
+    """
+    taken = bytearray(len(content)) if overlapping else None
+    replacements = []
+    seen = set()
+    for index in range(first, len(mappings)):
+        old_val, new_val = mappings[index]
+        if old_val in seen:
+            continue  # A repeated old string has nothing left to replace
+        seen.add(old_val)
+        next_free = 0
+        for start in starts.get(old_val, ()):
+            end = start + len(old_val)
+            if taken is not None:
+                if start < next_free or taken.find(1, start, end) != -1:
+                    continue
+                taken[start:end] = b"\x01" * len(old_val)
+            replacements.append((start, end, new_val, index))
+            next_free = end
+    replacements.sort()
+    return replacements
+
+
+def _context(
+    content: str, replacements: list[_Replacement], k: int, j: int, length: int, after: bool
+) -> str:
+    """
+    Up to `length` characters next to replacement k as mapping j sees them.
+
+    Neighbouring replacements by mappings before j are applied, later ones
+    are still the original text.
+    """
+    pieces = []
+    size = 0
+    if after:
+        position = replacements[k][1]
+        for n in range(k + 1, len(replacements)):
+            start, end, new_val, index = replacements[n]
+            gap = content[position:min(start, position + length - size)]
+            pieces.append(gap)
+            size += len(gap)
+            if size >= length:
+                break
+            piece = new_val if index < j else content[start:end]
+            pieces.append(piece)
+            size += len(piece)
+            position = end
+            if size >= length:
+                break
+        else:
+            pieces.append(content[position:position + length - size])
+        return "".join(pieces)
+
+    position = replacements[k][0]
+    for n in range(k - 1, -1, -1):
+        start, end, new_val, index = replacements[n]
+        gap = content[max(end, position - (length - size)):position]
+        pieces.append(gap)
+        size += len(gap)
+        if size >= length:
+            break
+        piece = new_val if index < j else content[start:end]
+        pieces.append(piece)
+        size += len(piece)
+        position = start
+        if size >= length:
+            break
+    else:
+        pieces.append(content[max(0, position - (length - size)):position])
+    return "".join(reversed(pieces))
+
+
+def _neighbour_chars(
+    content: str, replacements: list[_Replacement], k: int
+) -> Optional[tuple[list[str], list[str]]]:
+    """
+    Characters that can precede and follow replacement k's output.
+
+    Returns None when a neighbouring deletion makes them hard to tell.
+    """
+    start, end = replacements[k][:2]
+    before = [""]
+    if start:
+        before.append(content[start - 1])
+        if k > 0 and replacements[k - 1][1] == start:
+            if not replacements[k - 1][2]:
+                return None
+            before.append(replacements[k - 1][2][-1])
+    after = [""]
+    if end < len(content):
+        after.append(content[end])
+        if k + 1 < len(replacements) and replacements[k + 1][0] == end:
+            if not replacements[k + 1][2]:
+                return None
+            after.append(replacements[k + 1][2][0])
+    return before, after
+
+
+def _first_chain(
+    content: str, replacements: list[_Replacement], patterns: _ChainPatterns
+) -> Optional[int]:
+    """
+    First mapping that would match text written by an earlier replacement.
+
+    Checks every replacement's surroundings, as the later mapping would see
+    them, against the chain patterns of its mapping. Up to the returned
+    mapping, the replacements equal those of sequential str.replace calls.
+    """
+    first = None
+    size = len(content)
+    for k, (start, end, new_val, index) in enumerate(replacements):
+        contained = patterns.contained[index]
+        if contained < len(patterns.contained) and (first is None or contained < first):
+            first = contained
+        table = patterns.edges[index] if new_val else patterns.joins
+        if not table:
+            continue
+
+        if (k and replacements[k - 1][1] == start) or (
+            k + 1 < len(replacements) and replacements[k + 1][0] == end
+        ):
+            chars = _neighbour_chars(content, replacements, k)
+            if chars is None:
+                candidates = [pattern for found in table.values() for pattern in found]
+            else:
+                candidates = [
+                    pattern
+                    for before in chars[0]
+                    for after in chars[1]
+                    for pattern in table.get((before, after), ())
+                ]
+        else:
+            before = content[start - 1] if start else ""
+            after = content[end] if end < size else ""
+            candidates = table.get((before, ""), []) + table.get(("", after), []) + table.get(
+                (before, after), []
+            )
+        for before, after, j in candidates:
+            if j <= index or (first is not None and j >= first):
+                continue
+            if before and not _context(
+                content, replacements, k, j, len(before), after=False
+            ).endswith(before):
+                continue
+            if after and not _context(
+                content, replacements, k, j, len(after), after=True
+            ).startswith(after):
+                continue
+            first = j
+    return first
+
+
+def _rewrite(content: str, replacements: list[_Replacement]) -> str:
+    """Build the new text from sorted, non-overlapping replacements in one pass."""
+    pieces = []
+    position = 0
+    for start, end, new_val, _ in replacements:
+        pieces.append(content[position:start])
+        pieces.append(new_val)
+        position = end
+    pieces.append(content[position:])
+    return "".join(pieces)
+
+
+def _find_conflicts(
+    mappings: list[tuple[str, str]],
+    occurrences: list[tuple[int, str]],
+    matches: list[int],
+    counts: list[int],
+) -> list[MappingConflict]:
+    """
+    Report overlaps found in the original text and mappings that rewrote earlier output.
+
+    `occurrences` must be sorted by start.
+    """
+    indices: dict[str, list[int]] = {}
+    for index, (old_val, _) in enumerate(mappings):
+        indices.setdefault(old_val, []).append(index)
+
+    # Old strings with overlapping occurrences, by a sweep over match starts
+    overlapping_olds = {frozenset([old]) for old, found in indices.items()
+                        if len(found) > 1 and matches[found[0]]}
+    active: list[tuple[int, str]] = []
+    active_end = 0
+    for start, old in occurrences:
+        if start >= active_end:
+            active = []
+        else:
+            active = [(end, other) for end, other in active if end > start]
+            overlapping_olds.update(frozenset([old, other]) for _, other in active if other != old)
+        active.append((start + len(old), old))
+        active_end = max(active_end, start + len(old))
+
+    pairs: set[tuple[int, int, ConflictKind]] = set()
+    for group in overlapping_olds:
+        found = sorted(index for old in group for index in indices[old])
+        pairs.update((i, j, "overlap") for n, i in enumerate(found) for j in found[n + 1:])
+
+    # More replacements than matches: the mapping rewrote earlier output
+    chained = [j for j, (count, matched) in enumerate(zip(counts, matches)) if count > matched]
+    if chained:
+        olds = [old_val for old_val, _ in mappings]
+        affixes = _affix_index(olds)
+        for i, (_, new_val) in enumerate(mappings):
+            if not counts[i]:
+                continue
+            sources = set(chained) if not new_val else _overlapping(new_val, olds, affixes)
+            pairs.update((i, j, "chain") for j in chained if j > i and j in sources)
+
+    return [MappingConflict(i, j, kind) for i, j, kind in sorted(pairs)]
+
+
+def apply_mappings(content: str, mappings: list[tuple[str, str]]) -> MappingResult:
+    """
+    Apply string mappings to a text.
+
+    Gives the same text and counts as calling content.replace(old, new) for
+    each mapping in order, but builds the new text in one pass over the
+    occurrences found by one scan of the document. Only when a replacement
+    creates a match for a later mapping (a chain) is the rewritten text
+    scanned again, from that mapping on.
+
+    Args:
+        content: Text to rewrite.
+        mappings: List of (old, new) tuples in application order.
+
+    Returns:
+        MappingResult with the new content, per-mapping replacement counts,
+        per-mapping matches in the original text and the conflicts found.
+
+    Raises:
+        ValueError: If an old string is empty.
+    """
+    if any(not old_val for old_val, _ in mappings):
+        raise ValueError("Mapping old strings must not be empty")
+    if not mappings:
+        return MappingResult(content, [], [])
+
+    olds = [old_val for old_val, _ in mappings]
+    overlapping = _can_overlap(olds)
+    occurrences = sorted(_find_occurrences(content, set(olds), overlapping))
+
+    starts: dict[str, list[int]] = {}
+    for start, old in occurrences:
+        starts.setdefault(old, []).append(start)
+    matches = [_count_matches(starts.get(old_val, []), len(old_val)) for old_val in olds]
+
+    if not occurrences:
+        # Nothing matches, and nothing can be produced without a first match
+        return MappingResult(content, [0] * len(mappings), matches)
+
+    patterns = _chain_patterns(mappings)
+    new_content = content
+    counts = [0] * len(mappings)
+    first = 0
+    stage_starts = starts
+    while True:
+        replacements = _select_replacements(new_content, mappings, first, stage_starts, overlapping)
+        chain = _first_chain(new_content, replacements, patterns)
+        if chain is not None:
+            replacements = [r for r in replacements if r[3] < chain]
+        for replacement in replacements:
+            counts[replacement[3]] += 1
+        new_content = _rewrite(new_content, replacements)
+        if chain is None:
+            break
+        # Earlier output creates matches for mapping `chain`: continue from
+        # there on the rewritten text
+        first = chain
+        stage_starts = {}
+        for start, old in sorted(_find_occurrences(
+            new_content, {old_val for old_val, _ in mappings[first:]}, overlapping
+        )):
+            stage_starts.setdefault(old, []).append(start)
+
+    conflicts = _find_conflicts(mappings, occurrences, matches, counts)
+    return MappingResult(new_content, counts, matches, conflicts)
+
+
 def preview_san_mapping(
     markdown_path: str | Path,
     csv_path: str | Path,
@@ -69,7 +556,9 @@ def preview_san_mapping(
         csv_path: Path to the CSV mapping file.
 
     Returns:
-        Dict with 'mappings' (list of tuples) and 'counts' (dict of old -> count).
+        Dict with 'mappings' (list of tuples), 'counts' (dict of old -> count,
+        matched mappings only), 'hits' (replacements per mapping, in order),
+        'conflicts' (list of MappingConflict) and 'total_replacements'.
 
     Raises:
         FileNotFoundError: If files are not found.
@@ -86,17 +575,19 @@ def preview_san_mapping(
     # Read content
     content = markdown_path.read_text(encoding='utf-8')
 
-    # Count occurrences
+    # Count the replacements applying would make, including chained ones
+    result = apply_mappings(content, mappings)
     counts = {}
-    for old_val, new_val in mappings:
-        count = content.count(old_val)
+    for (old_val, new_val), count in zip(mappings, result.counts):
         if count > 0:
-            counts[old_val] = count
+            counts[old_val] = counts.get(old_val, 0) + count
 
     return {
         'mappings': mappings,
         'counts': counts,
-        'total_replacements': sum(counts.values())
+        'hits': result.counts,
+        'conflicts': result.conflicts,
+        'total_replacements': result.total_replacements
     }
 
 
@@ -144,14 +635,10 @@ def apply_san_mapping(
     content = markdown_path.read_text(encoding='utf-8')
 
     # Apply all mappings
-    for old_val, new_val in mappings:
-        content = content.replace(old_val, new_val)
-
-    # Write updated content
-    markdown_path.write_text(content, encoding='utf-8')
+    content = apply_mappings(content, mappings).content
 
-    # Compute new hash
-    new_hash = compute_file_hash(markdown_path)
+    # Write updated content and compute new hash
+    new_hash = write_text_atomic(markdown_path, content)
 
     # Restore read-only status
     if was_readonly:
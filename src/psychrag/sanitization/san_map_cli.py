@@ -48,21 +48,31 @@ def main() -> int:
 
         # Display preview
         print(f"\n=== Preview of {preview['total_replacements']} replacements ===\n")
-        print(f"{'Old Value':<30} {'New Value':<30} {'Count'}")
-        print("-" * 70)
-
-        for old_val, new_val in preview['mappings']:
-            if old_val in preview['counts']:
-                count = preview['counts'][old_val]
-                # Truncate long strings for display
-                old_display = old_val[:27] + "..." if len(old_val) > 30 else old_val
-                new_display = new_val[:27] + "..." if len(new_val) > 30 else new_val
-                print(f"{old_display:<30} {new_display:<30} {count}")
+        print(f"{'#':>3} {'Old Value':<30} {'New Value':<30} {'Count'}")
+        print("-" * 74)
+
+        for number, ((old_val, new_val), count) in enumerate(
+            zip(preview['mappings'], preview['hits']), start=1
+        ):
+            # Truncate long strings for display
+            old_display = old_val[:27] + "..." if len(old_val) > 30 else old_val
+            new_display = new_val[:27] + "..." if len(new_val) > 30 else new_val
+            if count:
+                print(f"{number:>3} {old_display:<30} {new_display:<30} {count}")
             else:
                 # Show mappings with 0 matches for debugging
-                old_display = old_val[:27] + "..." if len(old_val) > 30 else old_val
-                new_display = new_val[:27] + "..." if len(new_val) > 30 else new_val
-                print(f"{old_display:<30} {new_display:<30} 0 (no matches)")
+                print(f"{number:>3} {old_display:<30} {new_display:<30} 0 (no matches)")
+
+        if preview['conflicts']:
+            # Mappings are numbered from 1 in CSV order
+            print("\nMappings affected by earlier mappings:")
+            for conflict in preview['conflicts']:
+                earlier = conflict.first + 1
+                later = conflict.second + 1
+                if conflict.kind == "overlap":
+                    print(f"  #{later} overlaps #{earlier}; #{earlier} is applied first")
+                else:
+                    print(f"  #{later} rewrites text produced by #{earlier}")
 
         print(f"\nTotal: {preview['total_replacements']} replacements")
 
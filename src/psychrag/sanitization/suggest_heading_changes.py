@@ -3,6 +3,11 @@
 This module uses AI to analyze markdown headings and suggest corrections
 based on the table of contents stored in the database.
 
+Documents with more than SHARD_MAX_TITLES headings are split into shards by
+top-level section (see title_shards); the shards are sent to the LLM
+concurrently, each with the full ToC, and the merged changes are checked for
+coverage of every heading line in the titles file.
+
 Uses lazy imports to avoid loading heavy AI dependencies until actually needed.
 
 Usage:
@@ -16,7 +21,7 @@ Examples:
 
 Functions:
     suggest_heading_changes(titles_file) - Analyze titles and suggest hierarchy changes
-    suggest_heading_changes_from_work(work_id, source_key, use_full_model, force, verbose) - Analyze from Work by ID
+    suggest_heading_changes_from_work(work_id, source_key, use_full_model, force, verbose, max_workers) - Analyze from Work by ID
 """
 
 from __future__ import annotations
@@ -30,8 +35,9 @@ from psychrag.data.database import SessionLocal, get_session
 from psychrag.data.models import Work
 from psychrag.data.template_loader import load_template
 from psychrag.utils import compute_file_hash
-from psychrag.utils.file_utils import set_file_writable, set_file_readonly
+from psychrag.utils.file_utils import set_file_writable, set_file_readonly, write_text_atomic
 from .extract_titles import HashMismatchError
+from .title_shards import SHARD_WORKERS, merge_shard_results, outline, run_shards, shard_note, shard_titles
 
 # Directory for LLM logs
 LLM_LOGS_DIR = Path("logs")
@@ -95,11 +101,68 @@ def _extract_text_from_response(response_content) -> str:
         return str(response_content)
 
 
-def suggest_heading_changes(titles_file: str | Path) -> Path:
+def _request_changes(
+    chat,
+    title: str,
+    authors: str,
+    toc: list,
+    titles_codeblock: str,
+    max_workers: int = SHARD_WORKERS,
+    verbose: bool = False,
+) -> list[str]:
+    """Ask the LLM for heading changes, one call per shard of the titles.
+
+    Args:
+        chat: LangChain chat model.
+        title: Document title.
+        authors: Document authors.
+        toc: Table of contents as list of dicts (shared by all shards).
+        titles_codeblock: The titles content from the titles file.
+        max_workers: Maximum concurrent LLM calls.
+        verbose: If True, print progress messages.
+
+    Returns:
+        Change lines ("line : ACTION : title") in titles order.
+    """
+    from psychrag.ai.response_cache import invoke_cached
+
+    titles = titles_codeblock.split('\n')
+    shards = shard_titles(titles)
+    total = len(shards)
+    document_outline = outline(titles) if total > 1 else []
+
+    prompts = [_build_prompt(title, authors, toc, '\n'.join(shard)) for shard in shards]
+    if total > 1:
+        prompts = [
+            prompt + shard_note(part, total, document_outline)
+            for part, prompt in enumerate(prompts, start=1)
+        ]
+        if verbose:
+            print(f"Split {len(titles)} headings into {total} shards")
+
+    def invoke(part: int, prompt: str) -> str:
+        response = invoke_cached(chat, prompt, function="heading_suggestions")
+        response_text = _extract_text_from_response(response.content)
+        prefix = "suggest_heading" if total == 1 else f"suggest_heading_part{part}of{total}"
+        _log_llm_interaction(prompt, response_text, filename_prefix=prefix)
+        return response_text
+
+    responses = run_shards(prompts, invoke, max_workers=max_workers)
+
+    shard_changes = [
+        {int(change.split(':', 1)[0]): change for change in reversed(_parse_llm_response(text))}
+        for text in responses
+    ]
+    changes, _ = merge_shard_results(shards, shard_changes, label="Heading suggestions")
+    return list(changes.values())
+
+
+def suggest_heading_changes(titles_file: str | Path, max_workers: int = SHARD_WORKERS) -> Path:
     """Analyze titles and suggest heading hierarchy changes using AI.
 
     Args:
         titles_file: Path to a *.titles.md file created by extract_titles_to_file.
+        max_workers: Maximum concurrent LLM calls for sharded documents.
 
     Returns:
         Path to the created changes file (*.title_changes.md).
@@ -156,9 +219,6 @@ def suggest_heading_changes(titles_file: str | Path) -> Path:
         title = work.title or "Unknown Title"
         authors = work.authors or "Unknown Author"
 
-    # Build the LLM prompt
-    prompt = _build_prompt(title, authors, toc, titles_codeblock)
-
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai import create_langchain_chat, ModelTier
 
@@ -171,14 +231,7 @@ def suggest_heading_changes(titles_file: str | Path) -> Path:
     )
     chat = langchain_stack.chat
 
-    response = chat.invoke(prompt)
-    response_text = _extract_text_from_response(response.content)
-
-    # Log the interaction
-    _log_llm_interaction(prompt, response_text)
-
-    # Parse the LLM response to extract changes
-    changes = _parse_llm_response(response_text)
+    changes = _request_changes(chat, title, authors, toc, titles_codeblock, max_workers)
 
     # Build output content
     output_lines = [
@@ -196,7 +249,7 @@ def suggest_heading_changes(titles_file: str | Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     stem = titles_file.stem.replace('.titles', '')
     output_path = output_dir / f"{stem}.title_changes.md"
-    output_path.write_text(output_content, encoding='utf-8')
+    write_text_atomic(output_path, output_content)
 
     return output_path
 
@@ -665,14 +718,11 @@ def save_title_changes_from_response(
                 pass  # Ignore errors, will fail on write if needed
         
         # Write output file
-        output_path.write_text(output_content, encoding='utf-8')
+        output_hash = write_text_atomic(output_path, output_content)
         
         # Set file to read-only
         set_file_readonly(output_path)
         
-        # Compute hash of new file
-        output_hash = compute_file_hash(output_path)
-        
         # Update work's files metadata
         updated_files = dict(work.files) if work.files else {}
         updated_files[output_key] = {
@@ -692,7 +742,8 @@ def suggest_heading_changes_from_work(
     source_key: str,
     use_full_model: bool = False,
     force: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: int = SHARD_WORKERS,
 ) -> Path:
     """Suggest heading changes for a work's markdown file using AI and update the database.
 
@@ -702,6 +753,7 @@ def suggest_heading_changes_from_work(
         use_full_model: If True, use ModelTier.FULL instead of ModelTier.LIGHT.
         force: If True, skip hash validation and proceed anyway.
         verbose: If True, print progress messages.
+        max_workers: Maximum concurrent LLM calls for sharded documents.
 
     Returns:
         Path to the created title_changes file.
@@ -831,9 +883,6 @@ def suggest_heading_changes_from_work(
             print(f"Authors: {authors}")
             print(f"TOC entries: {len(toc)}")
 
-        # Build the LLM prompt
-        prompt = _build_prompt(title, authors, toc, titles_codeblock)
-
         # Lazy import - only load AI module when LLM is needed
         from psychrag.ai import create_langchain_chat, ModelTier
 
@@ -851,18 +900,11 @@ def suggest_heading_changes_from_work(
         )
         chat = langchain_stack.chat
 
-        response = chat.invoke(prompt)
-        response_text = _extract_text_from_response(response.content)
-
-        # Log the interaction
-        _log_llm_interaction(prompt, response_text)
+        changes = _request_changes(chat, title, authors, toc, titles_codeblock, max_workers, verbose)
 
         if verbose:
             print("LLM response received")
 
-        # Parse the LLM response to extract changes
-        changes = _parse_llm_response(response_text)
-
         # Calculate relative path from markdown to titles
         try:
             relative_uri = markdown_path.relative_to(titles_path.parent)
@@ -894,14 +936,11 @@ def suggest_heading_changes_from_work(
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write output file
-        output_path.write_text(output_content, encoding='utf-8')
+        output_hash = write_text_atomic(output_path, output_content)
 
         if verbose:
             print(f"Title changes saved to: {output_path}")
 
-        # Compute hash of new file
-        output_hash = compute_file_hash(output_path)
-
         # Update work's files metadata
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
@@ -28,6 +28,7 @@ Options:
     --source SOURCE         Which file to use: 'original_markdown' or 'sanitized' (auto-select if only one pair exists)
     --full-llm              Use full LLM model instead of light (more expensive but better)
     --force                 Proceed even if file hashes don't match database
+    --workers N             Concurrent LLM calls for documents with many headings (default: 4)
     -v, --verbose           Print detailed progress messages
 """
 
@@ -38,6 +39,7 @@ from pathlib import Path
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from .suggest_heading_changes import suggest_heading_changes_from_work
+from .title_shards import SHARD_WORKERS
 from .extract_titles import HashMismatchError
 
 
@@ -86,6 +88,13 @@ then updates the database with the new title_changes file metadata.
         help="Proceed even if file hashes don't match database"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SHARD_WORKERS,
+        help=f"Concurrent LLM calls for documents with many headings (default: {SHARD_WORKERS})"
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -175,7 +184,8 @@ then updates the database with the new title_changes file metadata.
                 source_key=source_key,
                 use_full_model=args.full_llm,
                 force=args.force,
-                verbose=args.verbose
+                verbose=args.verbose,
+                max_workers=args.workers
             )
 
             print(f"\nSuccess!")
@@ -201,7 +211,8 @@ then updates the database with the new title_changes file metadata.
                     source_key=source_key,
                     use_full_model=args.full_llm,
                     force=True,
-                    verbose=args.verbose
+                    verbose=args.verbose,
+                    max_workers=args.workers
                 )
                 print(f"Title changes saved to: {output_path}")
                 return 0
@@ -215,7 +226,8 @@ then updates the database with the new title_changes file metadata.
                             source_key=source_key,
                             use_full_model=args.full_llm,
                             force=True,
-                            verbose=args.verbose
+                            verbose=args.verbose,
+                            max_workers=args.workers
                         )
                         print(f"\nSuccess! Title changes saved to: {output_path}")
                         return 0
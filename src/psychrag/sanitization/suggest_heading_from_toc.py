@@ -19,6 +19,8 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+from psychrag.utils.file_utils import write_text_atomic
+
 # Directory for LLM logs
 LLM_LOGS_DIR = Path("logs")
 
@@ -125,6 +127,7 @@ def suggest_heading_from_toc(
 
     # Lazy import - only load AI module when LLM is needed
     from psychrag.ai import create_langchain_chat, ModelTier
+    from psychrag.ai.response_cache import invoke_cached
 
     # Call LLM with FULL tier
     langchain_stack = create_langchain_chat(
@@ -135,7 +138,7 @@ def suggest_heading_from_toc(
     )
     chat = langchain_stack.chat
 
-    response = chat.invoke(prompt)
+    response = invoke_cached(chat, prompt, function="heading_suggestions")
     response_text = _extract_text_from_response(response.content)
 
     # Log the interaction
@@ -164,7 +167,7 @@ def suggest_heading_from_toc(
         output_path = Path(output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(output_content, encoding='utf-8')
+    write_text_atomic(output_path, output_content)
 
     return output_path
 
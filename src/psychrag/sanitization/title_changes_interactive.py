@@ -14,13 +14,13 @@ Usage:
     table_data = get_title_changes_table_data(work_id=1, source_key='original_markdown')
 """
 
-import re
 from pathlib import Path
 from typing import Optional
 
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import load_markdown_index
 from psychrag.sanitization.apply_title_changes import parse_title_changes
 from psychrag.sanitization.extract_titles import HashMismatchError
 
@@ -46,26 +46,14 @@ def extract_all_headings(markdown_path: Path) -> list[dict]:
     if not markdown_path.exists():
         raise FileNotFoundError(f"Markdown file not found: {markdown_path}")
 
-    headings = []
-    heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$')
+    index = load_markdown_index(markdown_path)
 
-    content = markdown_path.read_text(encoding='utf-8')
-    lines = content.splitlines()
-
-    for line_num, line in enumerate(lines, start=1):
-        match = heading_pattern.match(line)
-        if match:
-            hash_marks = match.group(1)
-            title_text = match.group(2).strip()
-            heading_level = f"H{len(hash_marks)}"
-
-            headings.append({
-                "line_num": line_num,
-                "heading": heading_level,
-                "title": title_text
-            })
-
-    return headings
+    # Headings need text after the whitespace that follows the "#" marks
+    return [
+        {"line_num": h.line, "heading": f"H{h.level}", "title": h.text}
+        for h in index.headings_up_to(6)
+        if len(h.raw) - h.level >= 2
+    ]
 
 
 def parse_title_changes_file(title_changes_path: Path) -> dict[int, dict]:
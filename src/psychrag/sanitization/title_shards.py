@@ -0,0 +1,220 @@
+"""Shard a titles list for concurrent LLM calls.
+
+Heading and chunk suggestions send the titles codeblock of a titles.md file
+("line_num: heading_line" per heading) to an LLM. For books with thousands of
+headings one call runs into output limits and takes minutes, so the list is
+split into shards of at most SHARD_MAX_TITLES titles:
+
+- titles are grouped into sections at the shallowest heading level present;
+  a section larger than a shard is split at its next heading level;
+- consecutive sections are packed into shards in document order.
+
+Shards are sent concurrently (at most SHARD_WORKERS at a time), each with a
+note giving its position and the top-level outline of the whole document.
+merge_shard_results() keeps each shard's results for its own title lines and
+checks coverage against the titles list: headings without a result and
+results for lines outside the shard are logged.
+
+Usage:
+    from psychrag.sanitization.title_shards import merge_shard_results, run_shards, shard_titles
+
+    shards = shard_titles(titles_list)
+    responses = run_shards([build(shard) for shard in shards], invoke)  # invoke(part, prompt)
+    merged, coverage = merge_shard_results(shards, [parse(text) for text in responses])
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum titles per LLM call
+SHARD_MAX_TITLES = 250
+
+# Concurrent LLM calls
+SHARD_WORKERS = 4
+
+_TITLE_RE = re.compile(r'^\s*(\d+):\s*(#*)')
+
+
+def parse_title_line(title: str) -> tuple[int, int] | None:
+    """Return (line_num, heading_level) of a "line_num: heading_line" title, or None."""
+    match = _TITLE_RE.match(title)
+    if not match:
+        return None
+    return int(match.group(1)), len(match.group(2))
+
+
+def _sections(titles: list[str], max_titles: int) -> list[list[str]]:
+    """Split titles at their shallowest heading level, recursing into oversized sections."""
+    levels = [(parse_title_line(title) or (0, 0))[1] for title in titles]
+    headed = [level for level in levels if level > 0]
+    if not headed:
+        return [titles[i:i + max_titles] for i in range(0, len(titles), max_titles)]
+    top = min(headed)
+
+    sections: list[list[str]] = []
+    for title, level in zip(titles, levels):
+        if level == top or not sections:
+            sections.append([])
+        sections[-1].append(title)
+
+    pieces: list[list[str]] = []
+    for section in sections:
+        if len(section) <= max_titles:
+            pieces.append(section)
+            continue
+        # Keep the section heading with the first of its subsections
+        head, children = section[:1], section[1:]
+        if (parse_title_line(head[0]) or (0, 0))[1] != top:
+            # Titles before the first top-level heading
+            head, children = [], section
+        subsections = _sections(children, max(1, max_titles - len(head)))
+        subsections[0] = head + subsections[0]
+        pieces.extend(subsections)
+    return pieces
+
+
+def shard_titles(titles: list[str], max_titles: int = SHARD_MAX_TITLES) -> list[list[str]]:
+    """
+    Split a titles list into shards of at most max_titles titles on section boundaries.
+
+    Args:
+        titles: Title lines ("line_num: heading_line") in document order.
+        max_titles: Maximum titles per shard.
+
+    Returns:
+        Shards in document order; concatenated they give titles. A list of at
+        most max_titles titles is returned as a single shard.
+    """
+    if len(titles) <= max_titles:
+        return [titles]
+
+    shards: list[list[str]] = []
+    current: list[str] = []
+    for piece in _sections(titles, max_titles):
+        if current and len(current) + len(piece) > max_titles:
+            shards.append(current)
+            current = []
+        current.extend(piece)
+    if current:
+        shards.append(current)
+    return shards
+
+
+def outline(titles: list[str]) -> list[str]:
+    """Titles at the shallowest heading level (the top-level outline)."""
+    parsed = [(title, parse_title_line(title)) for title in titles]
+    levels = [p[1] for _, p in parsed if p and p[1] > 0]
+    if not levels:
+        return []
+    top = min(levels)
+    return [title for title, p in parsed if p and p[1] == top]
+
+
+def shard_note(part: int, total: int, document_outline: list[str]) -> str:
+    """Prompt section telling the LLM which part of the headings it sees."""
+    outline_text = "\n".join(document_outline) or "(no top-level headings)"
+    return f"""
+
+## Document Part
+The headings listed above are part {part} of {total} of this document's headings.
+Return results only for the headings listed above, one per line number.
+Keep levels consistent with the rest of the document, whose top-level outline is:
+```
+{outline_text}
+```"""
+
+
+def run_shards(
+    prompts: list[str],
+    invoke: Callable[[int, str], str],
+    max_workers: int = SHARD_WORKERS,
+) -> list[str]:
+    """
+    Call invoke on every prompt concurrently.
+
+    Args:
+        prompts: One prompt per shard.
+        invoke: Called with (part, prompt), part numbered from 1; sends the
+            prompt to the LLM and returns the response text.
+        max_workers: Maximum concurrent calls.
+
+    Returns:
+        Response texts in the order of prompts.
+    """
+    if len(prompts) == 1:
+        return [invoke(1, prompts[0])]
+    parts = range(1, len(prompts) + 1)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as executor:
+        return list(executor.map(invoke, parts, prompts))
+
+
+@dataclass
+class Coverage:
+    """Line numbers of merged results compared with the titles list."""
+
+    missing: list[int] = field(default_factory=list)  # Titles without a result
+    unexpected: list[int] = field(default_factory=list)  # Results for lines outside their shard
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing and not self.unexpected
+
+
+def _title_lines(titles: list[str]) -> list[int]:
+    return [parsed[0] for parsed in map(parse_title_line, titles) if parsed]
+
+
+def merge_shard_results(
+    shards: list[list[str]],
+    shard_results: list[dict[int, T]],
+    label: str = "LLM",
+) -> tuple[dict[int, T], Coverage]:
+    """
+    Merge per-shard results keyed by line number and check their coverage.
+
+    A shard's result counts only for the title lines of that shard; results
+    for other lines are dropped. Missing and dropped lines are logged.
+
+    Args:
+        shards: Shards from shard_titles.
+        shard_results: Results of each shard, keyed by title line number.
+        label: Name of the step, for the log messages.
+
+    Returns:
+        (results in titles order, Coverage).
+    """
+    merged: dict[int, T] = {}
+    unexpected: set[int] = set()
+    for shard, results in zip(shards, shard_results):
+        shard_lines = _title_lines(shard)
+        owned = set(shard_lines)
+        unexpected.update(line_num for line_num in results if line_num not in owned)
+        for line_num in shard_lines:
+            if line_num in results and line_num not in merged:
+                merged[line_num] = results[line_num]
+
+    title_lines = [line_num for shard in shards for line_num in _title_lines(shard)]
+    coverage = Coverage(
+        missing=[line_num for line_num in title_lines if line_num not in merged],
+        unexpected=sorted(unexpected),
+    )
+    if coverage.missing:
+        logger.warning(
+            f"{label} returned no result for {len(coverage.missing)} of {len(title_lines)} "
+            f"headings (lines {coverage.missing[:10]}{'...' if len(coverage.missing) > 10 else ''})"
+        )
+    if coverage.unexpected:
+        logger.warning(
+            f"{label} returned results for {len(coverage.unexpected)} lines outside the "
+            f"headings it was given; they are ignored (lines {coverage.unexpected[:10]})"
+        )
+    return merged, coverage
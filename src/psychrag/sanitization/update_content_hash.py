@@ -17,31 +17,26 @@ Examples:
 
 import re
 from pathlib import Path
+from typing import Optional
 
 from psychrag.data.database import get_session
 from psychrag.data.models import Chunk, Work
 from psychrag.utils import compute_file_hash, set_file_readonly
+from psychrag.utils.markdown_index import load_markdown_index
 
 
-def _parse_headings_from_file(file_path: Path) -> dict[int, str]:
+def _parse_headings_from_file(file_path: Path, file_hash: Optional[str] = None) -> dict[int, str]:
     """Parse headings from a markdown file.
 
     Args:
         file_path: Path to the markdown file.
+        file_hash: SHA-256 of the file if already computed.
 
     Returns:
         Dictionary mapping line numbers to heading text.
     """
-    content = file_path.read_text(encoding='utf-8')
-    lines = content.splitlines()
-    headings = {}
-
-    for i, line in enumerate(lines, start=1):
-        match = re.match(r'^(#+)\s+(.*)$', line)
-        if match:
-            headings[i] = line
-
-    return headings
+    index = load_markdown_index(file_path, file_hash=file_hash)
+    return {heading.line: heading.raw for heading in index.headings}
 
 
 def _parse_vectorize_suggestions(file_path: Path) -> dict[int, str]:
@@ -319,7 +314,7 @@ def update_content_hash(work_id: int, verbose: bool = False) -> bool:
             print(f"Suggestions: {suggestions_path}")
 
         # Step 4: Parse headings from sanitized file
-        sanitized_headings = _parse_headings_from_file(markdown_path)
+        sanitized_headings = _parse_headings_from_file(markdown_path, file_hash=current_hash)
         if verbose:
             print(f"Found {len(sanitized_headings)} headings in sanitized file")
 
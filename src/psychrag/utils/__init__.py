@@ -5,6 +5,9 @@ from .file_utils import (
     is_file_readonly,
     set_file_readonly,
     set_file_writable,
+    write_bytes_atomic,
+    write_text_atomic,
+    write_text_chunks_atomic,
 )
 from .model_info import (
     ActiveLLMInfo,
@@ -16,6 +19,9 @@ __all__ = [
     "is_file_readonly",
     "set_file_readonly",
     "set_file_writable",
+    "write_bytes_atomic",
+    "write_text_atomic",
+    "write_text_chunks_atomic",
     "ActiveLLMInfo",
     "get_active_llm_info",
 ]
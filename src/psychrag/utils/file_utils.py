@@ -3,12 +3,19 @@
 This module provides cross-platform file utilities including:
 - Setting files to read-only
 - Computing file hashes
+- Writing files atomically
 """
 
+import codecs
 import hashlib
 import os
 import stat
+import uuid
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Characters encoded and written per step by write_text_atomic
+_WRITE_CHUNK_CHARS = 1 << 20
 
 
 def compute_file_hash(file_path: Path) -> str:
@@ -28,6 +35,100 @@ def compute_file_hash(file_path: Path) -> str:
     return sha256.hexdigest()
 
 
+def _write_atomic(file_path: Path, chunks: Iterable[bytes]) -> str:
+    """Write byte chunks to a temporary file, fsync, rename over file_path; return the hash."""
+    file_path = Path(file_path)
+    if file_path.exists() and is_file_readonly(file_path):
+        raise PermissionError(f"File is read-only: {file_path}")
+
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    sha256 = hashlib.sha256()
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for data in chunks:
+                sha256.update(data)
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if file_path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(file_path.stat().st_mode))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return sha256.hexdigest()
+
+
+def _encode_chunks(chunks: Iterable[str], encoding: str) -> Iterator[bytes]:
+    encoder = codecs.getincrementalencoder(encoding)()
+    for text in chunks:
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        yield encoder.encode(text)
+    yield encoder.encode("", final=True)
+
+
+def write_text_atomic(file_path: Path, content: str, encoding: str = "utf-8") -> str:
+    """
+    Write text to a file atomically and return the SHA-256 hash of the written bytes.
+
+    The content is encoded and hashed in chunks while it is written to a
+    temporary file in the same directory, which is fsynced and then renamed
+    over the target. Readers see either the old file or the complete new one,
+    never a partial write, and the hash needs no second read of the file.
+    Newlines are translated as Path.write_text does, so the hash equals
+    compute_file_hash of the result.
+
+    An existing file's permission bits are kept; a read-only file must be
+    made writable first (set_file_writable), as with Path.write_text.
+
+    Args:
+        file_path: Path to the file to write.
+        content: Text to write.
+        encoding: Text encoding.
+
+    Returns:
+        Hexadecimal hash string.
+
+    Raises:
+        PermissionError: If the existing file is read-only.
+    """
+    chunks = (
+        content[start:start + _WRITE_CHUNK_CHARS]
+        for start in range(0, len(content), _WRITE_CHUNK_CHARS)
+    )
+    return write_text_chunks_atomic(file_path, chunks, encoding)
+
+
+def write_text_chunks_atomic(
+    file_path: Path, chunks: Iterable[str], encoding: str = "utf-8"
+) -> str:
+    """
+    Write text produced piece by piece to a file atomically; see write_text_atomic.
+
+    Each chunk is written as soon as it is produced, so a large document
+    never has to be held in memory. If producing a chunk raises, the
+    temporary file is removed and the target is left untouched.
+
+    Returns:
+        Hexadecimal hash string.
+    """
+    return _write_atomic(file_path, _encode_chunks(chunks, encoding))
+
+
+def write_bytes_atomic(file_path: Path, data: bytes) -> str:
+    """
+    Write bytes to a file atomically; see write_text_atomic.
+
+    Returns:
+        Hexadecimal hash string.
+    """
+    return _write_atomic(file_path, [data])
+
+
 def set_file_readonly(file_path: Path) -> None:
     """
     Set a file to read-only on both Windows and Linux.
@@ -7,17 +7,37 @@ Supported citation formats:
 - APA (American Psychological Association)
 - MLA (Modern Language Association)
 - Chicago (Chicago Manual of Style)
+
+parse_citations_with_llm() parses many citations with one structured-output
+call per CITATION_BATCH_SIZE citations. Each item of the batch response is
+validated against Citation on its own; items that fail validation or are
+missing from the response are parsed again with a single-citation call.
+
+Usage:
+    from psychrag.utils.llm_citation_parser import parse_citations_with_llm
+
+    results = parse_citations_with_llm(citation_texts, "APA")
+    for result in results:
+        print(result.citation.title if result.citation else result.error)
 """
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, create_model
 
 if TYPE_CHECKING:
     from psychrag.ai.config import LLMSettings
 
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ["APA", "MLA", "Chicago"]
+
+# Citations per structured-output call in parse_citations_with_llm
+CITATION_BATCH_SIZE = 20
+
 
 class Citation(BaseModel):
     """Parsed citation data from LLM.
@@ -103,6 +123,35 @@ class Citation(BaseModel):
     )
 
 
+# Batch response item: the Citation fields without their constraints, so one
+# out-of-range value fails only its own item when validated against Citation
+_BatchCitation = create_model(
+    "BatchCitation",
+    index=(int, Field(description="Index of the citation in the input list")),
+    **{
+        name: (field.annotation, Field(default=None, description=field.description))
+        for name, field in Citation.model_fields.items()
+    },
+)
+
+
+class CitationBatch(BaseModel):
+    """Structured output of a batch citation parsing call."""
+
+    citations: list[_BatchCitation] = Field(
+        default_factory=list,
+        description="One entry per input citation, with its index",
+    )
+
+
+class CitationParseResult(BaseModel):
+    """Result of parsing one citation of a batch."""
+
+    citation_text: str
+    citation: Citation | None = None
+    error: str | None = None
+
+
 def _build_citation_prompt(citation_text: str, citation_format: str) -> str:
     """Build the LLM prompt for citation parsing.
 
@@ -151,6 +200,61 @@ Return ONLY valid JSON matching this structure:
 Do not include any explanatory text, only the JSON object."""
 
 
+def _build_batch_citation_prompt(citation_texts: list[str], citation_format: str) -> str:
+    """Build the LLM prompt for parsing several citations at once.
+
+    Args:
+        citation_texts: The citation strings to parse
+        citation_format: Citation format (APA, MLA, or Chicago)
+
+    Returns:
+        Formatted prompt string for the LLM
+    """
+    numbered = "\n".join(f"[{index}] {text}" for index, text in enumerate(citation_texts))
+    return f"""You are an expert bibliographic data extractor. Parse each of the following {citation_format} citations and extract all available fields.
+
+## Citations to Parse (one per line, prefixed with its index):
+{numbered}
+
+## Citation Format: {citation_format}
+
+## Extraction Rules:
+1. Extract all available bibliographic information
+2. For authors: return as a list of simple name strings (preserve format as-is)
+3. For year: extract 4-digit year only
+4. For work_type: infer from citation structure ('book', 'article', 'chapter', etc.)
+5. Distinguish between publisher and container_title:
+   - container_title: journal name or book title (for articles/chapters)
+   - publisher: publishing company or organization
+6. If a field cannot be determined, return null
+7. For volume and issue, keep them separate if possible
+8. Parse every citation independently; never merge fields across citations
+
+## Output Format:
+Return ONLY valid JSON with one entry per citation, in input order:
+{{
+    "citations": [
+        {{
+            "index": integer (the citation's index above),
+            "title": "string or null",
+            "authors": ["string1", "string2"] or null,
+            "year": integer or null,
+            "publisher": "string or null",
+            "isbn": "string or null",
+            "doi": "string or null",
+            "container_title": "string or null",
+            "volume": "string or null",
+            "issue": "string or null",
+            "pages": "string or null",
+            "url": "string or null",
+            "work_type": "string or null"
+        }}
+    ]
+}}
+
+Do not include any explanatory text, only the JSON object."""
+
+
 def parse_citation_with_llm(
     citation_text: str,
     citation_format: str,
@@ -185,7 +289,7 @@ def parse_citation_with_llm(
     if not citation_text or not citation_text.strip():
         raise ValueError("citation_text cannot be empty")
 
-    if citation_format not in ["APA", "MLA", "Chicago"]:
+    if citation_format not in SUPPORTED_FORMATS:
         raise ValueError(f"Unsupported citation format: {citation_format}")
 
     # Load LLM settings
@@ -200,19 +304,108 @@ def parse_citation_with_llm(
         # Use llm_factory to create chat model with proper configuration
         from psychrag.ai.llm_factory import create_langchain_chat
         from psychrag.ai.config import ModelTier
+        from psychrag.ai.response_cache import invoke_cached
 
         # Create chat stack using factory
         langchain_stack = create_langchain_chat(settings, tier=ModelTier.LIGHT)
         chat = langchain_stack.chat
 
-        # Create structured output runnable
-        structured_llm = chat.with_structured_output(Citation)
-
-        # Invoke runnable
-        citation = structured_llm.invoke(prompt)
+        # Invoke with structured output (answered from the response cache if seen before)
+        citation = invoke_cached(chat, prompt, function="citation_parsing", schema=Citation)
 
         return citation
 
     except Exception as e:
         # Wrap errors with context
         raise ValueError(f"LLM citation parsing failed: {str(e)}") from e
+
+
+def _parse_batch(chat, texts: list[str], citation_format: str) -> dict[int, Citation]:
+    """Parse one batch; return the valid citations by index within the batch."""
+    from psychrag.ai.response_cache import invoke_cached
+
+    prompt = _build_batch_citation_prompt(texts, citation_format)
+    batch = invoke_cached(chat, prompt, function="citation_parsing", schema=CitationBatch)
+
+    parsed: dict[int, Citation] = {}
+    for item in batch.citations if batch is not None else []:
+        fields = item.model_dump(exclude={"index"})
+        if not 0 <= item.index < len(texts) or item.index in parsed:
+            continue
+        try:
+            parsed[item.index] = Citation.model_validate(fields)
+        except ValidationError as e:
+            logger.warning(f"Batch citation {item.index} failed validation, parsing it alone: {e}")
+    return parsed
+
+
+def parse_citations_with_llm(
+    citation_texts: list[str],
+    citation_format: str,
+    settings: LLMSettings | None = None,
+    batch_size: int = CITATION_BATCH_SIZE,
+) -> list[CitationParseResult]:
+    """Parse many citation strings using LLM, several per call.
+
+    Citations are sent in batches of batch_size with structured output. Each
+    returned item is validated on its own; an item that is invalid or missing
+    from the response (or a whole batch whose call fails) is parsed again with
+    parse_citation_with_llm.
+
+    Args:
+        citation_texts: The citation texts to parse
+        citation_format: Citation format - "APA", "MLA", or "Chicago"
+        settings: LLM settings (loads from .env if None)
+        batch_size: Citations per LLM call
+
+    Returns:
+        One CitationParseResult per input, in input order; failed items have
+        citation None and an error message.
+
+    Raises:
+        ValueError: If the format is invalid
+    """
+    if citation_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported citation format: {citation_format}")
+
+    results = [CitationParseResult(citation_text=text) for text in citation_texts]
+    pending = []
+    for index, text in enumerate(citation_texts):
+        if not text or not text.strip():
+            results[index].error = "citation_text cannot be empty"
+        else:
+            pending.append(index)
+    if not pending:
+        return results
+
+    if settings is None:
+        from psychrag.ai.config import LLMSettings
+        settings = LLMSettings()
+
+    from psychrag.ai.llm_factory import create_langchain_chat
+    from psychrag.ai.config import ModelTier
+
+    chat = create_langchain_chat(settings, tier=ModelTier.LIGHT).chat
+
+    batch_size = max(1, batch_size)
+    for start in range(0, len(pending), batch_size):
+        indices = pending[start:start + batch_size]
+        texts = [citation_texts[index].strip() for index in indices]
+        try:
+            parsed = _parse_batch(chat, texts, citation_format)
+        except Exception as e:
+            logger.warning(f"Batch citation parsing failed, parsing {len(texts)} citations alone: {e}")
+            parsed = {}
+
+        for position, index in enumerate(indices):
+            if position in parsed:
+                results[index].citation = parsed[position]
+                continue
+            try:
+                results[index].citation = parse_citation_with_llm(
+                    citation_texts[index], citation_format, settings
+                )
+            except ValueError as e:
+                results[index].error = str(e)
+
+    return results
@@ -0,0 +1,219 @@
+"""Structure index of a markdown file.
+
+Title extraction, title-change editing, heading and content chunking,
+conversion comparison and hash validation all need the structure of the same
+markdown files. This module parses a file once into a compact index and
+caches it in a sidecar file keyed by the file's SHA-256, so each stage reads
+the index instead of parsing the document again.
+
+Structure (line numbers are 1-based as in str.splitlines(), ranges inclusive):
+- headings: lines starting with "#" marks followed by whitespace, any level;
+  consumers filter by level.
+- paragraphs: runs of non-blank lines that are not headings, tables or figures.
+- tables: runs of lines starting with "|" (after leading whitespace).
+- figures: image lines ("![alt](src)").
+- line_offsets: character offset of each line, plus the text length, to
+  slice a range of lines out of the text without splitting all of it.
+
+Sidecar: <file>.index.json (e.g. book.sanitized.md.index.json). It is rebuilt
+when the file's hash changes; failing to write it is logged, not raised.
+
+Usage:
+    from psychrag.utils.markdown_index import load_markdown_index
+
+    index = load_markdown_index("output/book.sanitized.md")
+    for heading in index.headings:
+        print(heading.line, heading.level, heading.text)
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .file_utils import compute_file_hash, write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+# Bump when parsing rules or the sidecar format change
+INDEX_FORMAT_VERSION = 1
+
+SIDECAR_SUFFIX = ".index.json"
+
+_HEADING_RE = re.compile(r'^(#+)\s+(.*)$')
+_FIGURE_RE = re.compile(r'^!\[.*\]\(.*\)')
+
+
+def _starts_block(line: str) -> bool:
+    """Whether a line is a heading, figure or table row (ends a paragraph)."""
+    return bool(_HEADING_RE.match(line) or _FIGURE_RE.match(line) or line.strip().startswith('|'))
+
+
+@dataclass(frozen=True)
+class HeadingEntry:
+    """A heading line."""
+
+    line: int
+    level: int  # Number of "#" marks
+    raw: str  # The full line
+
+    @property
+    def text(self) -> str:
+        """Heading text without the "#" marks, stripped."""
+        return self.raw[self.level:].strip()
+
+
+@dataclass
+class MarkdownIndex:
+    """Parsed structure of a markdown document."""
+
+    source_hash: str
+    line_count: int
+    line_offsets: list[int] = field(default_factory=list)  # line_count + 1 entries
+    headings: list[HeadingEntry] = field(default_factory=list)
+    paragraphs: list[tuple[int, int]] = field(default_factory=list)
+    tables: list[tuple[int, int]] = field(default_factory=list)
+    figures: list[int] = field(default_factory=list)
+
+    def headings_up_to(self, max_level: int) -> list[HeadingEntry]:
+        """Headings of level 1 to max_level."""
+        return [heading for heading in self.headings if heading.level <= max_level]
+
+    def span(self, start: int, end: int) -> tuple[int, int]:
+        """Character span of lines start..end (inclusive) in the text, line breaks included."""
+        return self.line_offsets[start - 1], self.line_offsets[end]
+
+    def to_dict(self) -> dict:
+        return {
+            "format": INDEX_FORMAT_VERSION,
+            "source_hash": self.source_hash,
+            "line_count": self.line_count,
+            "line_offsets": self.line_offsets,
+            "headings": [[heading.line, heading.level, heading.raw] for heading in self.headings],
+            "paragraphs": self.paragraphs,
+            "tables": self.tables,
+            "figures": self.figures,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MarkdownIndex":
+        return cls(
+            source_hash=data["source_hash"],
+            line_count=data["line_count"],
+            line_offsets=data["line_offsets"],
+            headings=[HeadingEntry(line, level, raw) for line, level, raw in data["headings"]],
+            paragraphs=[tuple(span) for span in data["paragraphs"]],
+            tables=[tuple(span) for span in data["tables"]],
+            figures=data["figures"],
+        )
+
+
+def build_markdown_index(content: str, source_hash: str = "") -> MarkdownIndex:
+    """
+    Parse markdown content into a structure index.
+
+    Args:
+        content: Markdown text (as read with read_text, universal newlines).
+        source_hash: Hash of the file the content was read from, if any.
+
+    Returns:
+        MarkdownIndex of the content.
+    """
+    lines = content.splitlines()
+    offsets = [0]
+    for line in content.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+
+    index = MarkdownIndex(source_hash=source_hash, line_count=len(lines), line_offsets=offsets)
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        line_num = i + 1
+
+        heading_match = _HEADING_RE.match(line)
+        if heading_match:
+            index.headings.append(HeadingEntry(line_num, len(heading_match.group(1)), line))
+            i += 1
+        elif _FIGURE_RE.match(line):
+            index.figures.append(line_num)
+            i += 1
+        elif line.strip().startswith('|'):
+            i += 1
+            while i < len(lines) and lines[i].strip().startswith('|'):
+                i += 1
+            index.tables.append((line_num, i))
+        elif line.strip():
+            # A paragraph runs until a blank line or another element
+            i += 1
+            while i < len(lines) and lines[i].strip() and not _starts_block(lines[i]):
+                i += 1
+            index.paragraphs.append((line_num, i))
+        else:
+            i += 1
+
+    return index
+
+
+def sidecar_path(path: Path) -> Path:
+    """Sidecar file holding the index of `path`."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _read_sidecar(path: Path, file_hash: str) -> Optional[MarkdownIndex]:
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if data.get("format") != INDEX_FORMAT_VERSION or data.get("source_hash") != file_hash:
+        return None
+    try:
+        return MarkdownIndex.from_dict(data)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_sidecar(path: Path, index: MarkdownIndex) -> None:
+    try:
+        write_text_atomic(path, json.dumps(index.to_dict(), separators=(",", ":")))
+    except OSError as e:
+        logger.warning(f"Could not write markdown index {path}: {e}")
+
+
+def load_markdown_index(
+    path: str | Path,
+    file_hash: Optional[str] = None,
+    content: Optional[str] = None,
+) -> MarkdownIndex:
+    """
+    Return the structure index of a markdown file, from its sidecar if current.
+
+    Args:
+        path: Markdown file.
+        file_hash: SHA-256 of the file if the caller already computed it.
+        content: Text of the file if the caller already read it.
+
+    Returns:
+        MarkdownIndex of the file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Markdown file not found: {path}")
+    if file_hash is None:
+        file_hash = compute_file_hash(path)
+
+    sidecar = sidecar_path(path)
+    index = _read_sidecar(sidecar, file_hash)
+    if index is not None:
+        return index
+
+    if content is None:
+        content = path.read_text(encoding='utf-8')
+    index = build_markdown_index(content, file_hash)
+    _write_sidecar(sidecar, index)
+    return index
@@ -0,0 +1,89 @@
+"""
+Token counting for prompt sizing.
+
+Tokens are counted with tiktoken when it is installed and its encoding file is
+already in tiktoken's local cache; otherwise they are estimated from the
+character count. The encoding is loaded with tiktoken's downloads blocked, so
+counting works on offline hosts and never blocks a request on the network. To
+use exact counts, fill the cache once on a connected machine:
+
+    python -c "import tiktoken; tiktoken.get_encoding('o200k_base')"
+
+Both providers tokenize differently from tiktoken's encoding, so counts are
+estimates for budgeting, not billing.
+
+Usage:
+    from psychrag.utils.token_count import count_tokens
+
+    tokens = count_tokens(prompt)
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+
+try:
+    import tiktoken
+    import tiktoken.load
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ENCODING_NAME = "o200k_base"
+
+# Estimate without tiktoken
+CHARS_PER_TOKEN = 4
+
+_offline_lock = threading.Lock()
+
+
+class _DownloadBlocked(OSError):
+    """tiktoken tried to fetch a file that is not in its local cache."""
+
+
+def _read_file_offline(blobpath: str) -> bytes:
+    """tiktoken.load.read_file replacement that reads local paths only."""
+    if "://" in blobpath:
+        raise _DownloadBlocked(f"not downloading {blobpath}")
+    with open(blobpath, "rb") as f:
+        return f.read()
+
+
+@contextmanager
+def _downloads_blocked() -> Iterator[None]:
+    """Make tiktoken load files from its cache (or local paths) only."""
+    with _offline_lock:
+        original = tiktoken.load.read_file
+        # tiktoken.load.read_file_cached calls read_file only on a cache miss
+        tiktoken.load.read_file = _read_file_offline
+        try:
+            yield
+        finally:
+            tiktoken.load.read_file = original
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        with _downloads_blocked():
+            return tiktoken.get_encoding(ENCODING_NAME)
+    except _DownloadBlocked:
+        logger.info(f"tiktoken encoding {ENCODING_NAME} is not cached locally; estimating tokens")
+        return None
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {ENCODING_NAME} unavailable, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text (estimated from its length without a cached tiktoken encoding)."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
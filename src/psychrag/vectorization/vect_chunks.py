@@ -4,6 +4,8 @@ This module creates vector embeddings for chunks in the database
 that are marked for vectorization (vector_status='to_vec').
 
 Uses lazy imports to avoid loading heavy AI dependencies until actually needed.
+Eligible chunks are streamed through a server-side cursor, so memory stays
+flat however large the backlog is.
 
 Usage:
     from psychrag.vectorization.vect_chunks import vectorize_chunks
@@ -19,11 +21,19 @@ Examples:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
 
 # Database imports are lightweight - keep them
-from psychrag.data.database import get_session
+from psychrag.data.database import engine, get_session
 from psychrag.data.models import Chunk, Work
 
+# Rows fetched per round trip from the server-side cursor
+STREAM_PAGE_SIZE = 500
+
 
 @dataclass
 class VectorizationResult:
@@ -36,6 +46,17 @@ class VectorizationResult:
     errors: list[tuple[int, str]]  # (chunk_id, error_message)
 
 
+def _eligible_filters(work_id: int | None) -> list:
+    filters = [
+        Chunk.vector_status == 'to_vec',
+        Chunk.parent_id.isnot(None),
+        Chunk.embedding.is_(None),
+    ]
+    if work_id is not None:
+        filters.append(Chunk.work_id == work_id)
+    return filters
+
+
 def get_eligible_chunks_count(work_id: int | None = None) -> int:
     """Get count of chunks eligible for vectorization.
 
@@ -46,34 +67,82 @@ def get_eligible_chunks_count(work_id: int | None = None) -> int:
         Number of eligible chunks.
     """
     with get_session() as session:
-        query = session.query(Chunk).filter(
-            Chunk.vector_status == 'to_vec',
-            Chunk.parent_id.isnot(None),
-            Chunk.embedding.is_(None)
-        )
-        
-        if work_id is not None:
-            query = query.filter(Chunk.work_id == work_id)
-        
-        return query.count()
+        return session.execute(
+            select(func.count(Chunk.id)).where(*_eligible_filters(work_id))
+        ).scalar_one()
+
+
+def estimate_eligible_chunks(session: Session, work_id: int | None = None) -> int:
+    """Estimate the number of eligible chunks from the query planner.
+
+    Costs one EXPLAIN instead of a scan of the chunks table, so it can be
+    used for progress reporting on large backlogs.
+
+    Args:
+        session: Database session.
+        work_id: ID of the work in the database (None for all works).
+
+    Returns:
+        Planner row estimate (approximate).
+    """
+    stmt = select(Chunk.id).where(*_eligible_filters(work_id))
+    # Filter values are ints and constants, safe to inline
+    sql = stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _stream_eligible_chunks(
+    work_id: int | None,
+    limit: int | None,
+    batch_size: int,
+) -> Iterator[list[tuple[int, str]]]:
+    """Yield eligible (chunk_id, content) rows in batches, in id order.
+
+    Rows come from a server-side cursor on a connection of their own:
+    committing the embedding updates would close a cursor opened in the
+    same transaction.
+    """
+    stmt = (
+        select(Chunk.id, Chunk.content)
+        .where(*_eligible_filters(work_id))
+        .order_by(Chunk.id)
+    )
+    if limit:
+        stmt = stmt.limit(limit)
+
+    with engine.connect() as connection:
+        result = connection.execution_options(
+            yield_per=max(batch_size, STREAM_PAGE_SIZE)
+        ).execute(stmt)
+        for partition in result.partitions(batch_size):
+            yield [(chunk_id, content) for chunk_id, content in partition]
 
 
 def vectorize_chunks(
     work_id: int | None = None,
     limit: int | None = None,
     batch_size: int = 20,
-    verbose: bool = False
+    verbose: bool = False,
+    on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> VectorizationResult:
     """Vectorize chunks for a work (or all works) using embedding model.
 
+    Eligible chunks are streamed in batches rather than loaded up front, so
+    memory use does not grow with the size of the backlog. Only ids and
+    content are read; embeddings are written with one bulk UPDATE per batch.
+
     Args:
         work_id: ID of the work in the database (None for all works).
         limit: Maximum number of chunks to process (None for all).
         batch_size: Number of chunks to embed in a single API call.
         verbose: Whether to print progress information.
+        on_progress: Called after each batch with (processed, estimated_total).
 
     Returns:
-        VectorizationResult with counts and any errors.
+        VectorizationResult with counts and any errors. total_eligible is
+        exact when every eligible chunk was processed, and the planner
+        estimate otherwise (a limit stopped the run early).
 
     Raises:
         ValueError: If work_id specified but work not found.
@@ -91,89 +160,71 @@ def vectorize_chunks(
             if verbose:
                 print(f"Processing chunks across all works")
 
-        # Get eligible chunks
-        query = session.query(Chunk).filter(
-            Chunk.vector_status == 'to_vec',
-            Chunk.parent_id.isnot(None),
-            Chunk.embedding.is_(None)
-        ).order_by(Chunk.id)
-        
-        if work_id is not None:
-            query = query.filter(Chunk.work_id == work_id)
-
-        total_eligible = query.count()
-
-        if limit:
-            chunks = query.limit(limit).all()
-        else:
-            chunks = query.all()
+        estimated_eligible = estimate_eligible_chunks(session, work_id)
+        # Progress counts towards the limit; total_eligible keeps the full estimate
+        estimated_total = min(estimated_eligible, limit) if limit else estimated_eligible
 
         if verbose:
-            print(f"Found {total_eligible} eligible chunks, processing {len(chunks)}")
-
-        if not chunks:
-            return VectorizationResult(
-                total_eligible=total_eligible,
-                processed=0,
-                success=0,
-                failed=0,
-                errors=[]
-            )
-
-        # Lazy import - only load AI module when actually creating embeddings
-        from psychrag.ai.llm_factory import create_embeddings
-
-        # Create embeddings model
-        embeddings_model = create_embeddings()
+            print(f"About {estimated_total} eligible chunks to process")
 
+        embeddings_model = None
+        processed = 0
         success_count = 0
         failed_count = 0
         errors = []
 
-        # Process in batches
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            batch_texts = [chunk.content for chunk in batch]
+        for batch_number, batch in enumerate(
+            _stream_eligible_chunks(work_id, limit, batch_size), start=1
+        ):
+            if embeddings_model is None:
+                # Lazy import - only load AI module when actually creating embeddings
+                from psychrag.ai.llm_factory import create_embeddings
+
+                embeddings_model = create_embeddings()
 
             if verbose:
-                print(f"  Processing batch {i // batch_size + 1} ({len(batch)} chunks)...")
+                print(f"  Processing batch {batch_number} ({len(batch)} chunks)...")
 
             try:
                 # Get embeddings for batch
-                embeddings = embeddings_model.embed_documents(batch_texts)
-
-                # Update each chunk
-                for chunk, embedding in zip(batch, embeddings):
-                    try:
-                        chunk.embedding = embedding
-                        chunk.vector_status = 'vec'
-                        success_count += 1
-                    except Exception as e:
-                        chunk.vector_status = 'vec_err'
-                        failed_count += 1
-                        errors.append((chunk.id, str(e)))
-                        if verbose:
-                            print(f"    Error updating chunk {chunk.id}: {e}")
-
+                embeddings = embeddings_model.embed_documents([content for _, content in batch])
+                if len(embeddings) != len(batch):
+                    raise ValueError(
+                        f"Expected {len(batch)} embeddings, got {len(embeddings)}"
+                    )
+                updates = [
+                    {"id": chunk_id, "embedding": embedding, "vector_status": 'vec'}
+                    for (chunk_id, _), embedding in zip(batch, embeddings)
+                ]
+                success_count += len(batch)
             except Exception as e:
                 # Batch failed - mark all chunks in batch as error
-                for chunk in batch:
-                    chunk.vector_status = 'vec_err'
-                    failed_count += 1
-                    errors.append((chunk.id, str(e)))
+                updates = [{"id": chunk_id, "vector_status": 'vec_err'} for chunk_id, _ in batch]
+                failed_count += len(batch)
+                errors.extend((chunk_id, str(e)) for chunk_id, _ in batch)
 
                 if verbose:
                     print(f"    Batch error: {e}")
 
             # Commit after each batch
+            session.execute(update(Chunk), updates)
             session.commit()
 
+            processed += len(batch)
+            estimated_total = max(estimated_total, processed)
+            if verbose:
+                print(f"    {processed}/~{estimated_total} chunks")
+            if on_progress:
+                on_progress(processed, estimated_total)
+
         if verbose:
             print(f"\nCompleted: {success_count} success, {failed_count} failed")
 
+        # The stream ran dry unless the limit cut it short
+        exhausted = not limit or processed < limit
         return VectorizationResult(
-            total_eligible=total_eligible,
-            processed=len(chunks),
+            total_eligible=processed if exhausted else max(estimated_eligible, processed),
+            processed=processed,
             success=success_count,
             failed=failed_count,
             errors=errors
@@ -12,13 +12,24 @@ Usage:
         ...
 """
 
-from typing import Annotated
+from typing import Annotated, AsyncGenerator, Literal, Optional
 
 from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from psychrag.data.database import get_async_session, session_scope
 
 
 class CommonQueryParams:
-    """Common query parameters used across multiple endpoints."""
+    """
+    Common pagination and sorting parameters used by list endpoints.
+
+    Omitting ``limit`` returns every matching item, which keeps existing
+    clients working. With a ``limit``, follow ``next_cursor`` from the
+    response to fetch the next page (keyset pagination, see
+    psychrag_api.pagination).
+    """
 
     def __init__(
         self,
@@ -31,32 +42,85 @@ class CommonQueryParams:
             ),
         ] = 0,
         limit: Annotated[
-            int,
+            Optional[int],
             Query(
                 ge=1,
-                le=100,
-                description="Maximum number of items to return",
+                le=500,
+                description="Maximum number of items to return (default: all)",
                 example=20,
             ),
-        ] = 20,
+        ] = None,
+        cursor: Annotated[
+            Optional[str],
+            Query(
+                description="Opaque cursor from a previous page's next_cursor",
+            ),
+        ] = None,
+        sort: Annotated[
+            Optional[str],
+            Query(
+                description="Field to sort by (allowed fields depend on the endpoint)",
+            ),
+        ] = None,
+        order: Annotated[
+            Optional[Literal["asc", "desc"]],
+            Query(
+                description="Sort direction (default depends on the endpoint)",
+            ),
+        ] = None,
     ):
         self.skip = skip
         self.limit = limit
+        self.cursor = cursor
+        self.sort = sort
+        self.order = order
 
 
 # Type alias for dependency injection
 CommonParams = Annotated[CommonQueryParams, Depends()]
 
 
-# Placeholder for database session dependency
-# Will be implemented when integrating with psychrag.data.database
-async def get_db_session():
+async def request_session_scope() -> AsyncGenerator[None, None]:
     """
-    Get database session dependency.
-    
-    TODO: Integrate with psychrag.data.database.get_session()
+    Open one database session for the lifetime of a request.
+
+    Registered as an application-wide dependency in main.py. Because it is an
+    async dependency it runs in the request's own context, so every
+    ``get_session()`` call made by the endpoint and by library helpers it
+    invokes reuses this session instead of checking out a new connection.
     """
-    # Placeholder - will yield actual session when implemented
-    yield None
+    with session_scope():
+        yield
+
 
+async def get_db_session() -> AsyncGenerator[Session, None]:
+    """
+    Get the request-scoped database session.
 
+    Yields:
+        The SQLAlchemy Session shared by the current request.
+    """
+    with session_scope() as session:
+        yield session
+
+
+# Type alias for dependency injection
+DbSession = Annotated[Session, Depends(get_db_session)]
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get an async database session for the request.
+
+    Used by read-heavy endpoints so concurrent listing/detail calls wait on
+    the database without holding a worker thread.
+
+    Yields:
+        SQLAlchemy AsyncSession, closed when the request finishes.
+    """
+    async with get_async_session() as session:
+        yield session
+
+
+# Type alias for dependency injection
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
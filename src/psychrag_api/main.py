@@ -16,10 +16,15 @@ Interactive Documentation:
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from psychrag.ai.response_cache import cache_stats_report
+from psychrag.conversions.converter_pool import get_converter_pool
+from psychrag.data.database import async_engine, get_pool_status
+from psychrag.data.template_loader import warm_template_cache
 from psychrag_api.config import get_settings
+from psychrag_api.dependencies import request_session_scope
 from psychrag_api.routers import (
     chunking,
     conversion,
@@ -41,9 +46,17 @@ async def lifespan(app: FastAPI):
     """Application lifespan events for startup/shutdown."""
     # Startup
     print("PsychRAG API starting up...")
+    try:
+        count = warm_template_cache()
+        print(f"Warmed prompt template cache ({count} active templates)")
+    except Exception as e:
+        # Templates still load lazily (with fallback) on first use
+        print(f"Prompt template warm-up skipped: {e}")
     yield
     # Shutdown
     print("PsychRAG API shutting down...")
+    get_converter_pool().shutdown()
+    await async_engine.dispose()
 
 
 # Create FastAPI application with comprehensive OpenAPI configuration
@@ -52,6 +65,8 @@ app = FastAPI(
     description=settings_config.api_description,
     version=settings_config.api_version,
     lifespan=lifespan,
+    # One shared database session per request
+    dependencies=[Depends(request_session_scope)],
     # OpenAPI configuration
     openapi_url="/openapi.json",
     docs_url="/docs",  # Swagger UI
@@ -139,6 +154,13 @@ async def root():
 
 @app.get("/health", tags=["Init"])
 async def health_check():
-    """Health check endpoint for monitoring."""
-    return {"status": "healthy", "version": settings_config.api_version}
+    """Health check endpoint for monitoring: connection and converter pool usage, LLM cache hit rates."""
+    return {
+        "status": "healthy",
+        "version": settings_config.api_version,
+        "database_pool": get_pool_status(),
+        "async_database_pool": get_pool_status(async_engine.pool),
+        "converter_pool": get_converter_pool().stats(),
+        "llm_cache": cache_stats_report(),
+    }
 
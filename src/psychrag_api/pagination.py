@@ -0,0 +1,148 @@
+"""
+Keyset pagination helpers for list endpoints.
+
+List endpoints accept the shared CommonQueryParams (limit, cursor, sort,
+order, skip). Pages are fetched with keyset ("seek") pagination: results are
+ordered by (sort column, id) and the opaque cursor encodes the last row's
+values, so fetching page N never scans the N-1 pages before it.
+
+Usage:
+    page = await fetch_page(
+        session, stmt, commons,
+        sortable={"id": Work.id, "title": Work.title},
+        id_column=Work.id,
+        default_sort="id",
+    )
+    items = [build_item(row) for row in page.rows]
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from psychrag_api.dependencies import CommonQueryParams
+
+_SORT_KEY = "_page_sort_key"
+_SORT_ID = "_page_sort_id"
+
+
+@dataclass
+class Page:
+    """One page of rows plus the cursor for the next page."""
+
+    rows: list[Row]
+    total: int
+    next_cursor: Optional[str]
+
+
+def encode_cursor(sort: str, value: Any, row_id: int) -> str:
+    """Encode the last row's sort value and id as an opaque cursor string."""
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "v": value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: str, column) -> tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or was issued for a
+            different sort field.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if payload["s"] != sort:
+            raise ValueError("cursor was issued for a different sort field")
+        value = payload["v"]
+        if value is not None and column.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        return value, int(payload["id"])
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid pagination cursor: {e}",
+        )
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select,
+    params: CommonQueryParams,
+    sortable: dict[str, Any],
+    id_column,
+    default_sort: str,
+    default_order: str = "desc",
+) -> Page:
+    """
+    Execute a projected select as one keyset-paginated, server-sorted page.
+
+    Args:
+        session: Async database session.
+        stmt: Select with the endpoint's projection and filters (no ORDER BY).
+        params: Pagination/sort parameters from the request.
+        sortable: Allowed sort fields mapped to non-nullable columns.
+        id_column: Primary key column used as the unique tie-breaker.
+        default_sort: Sort field used when the request does not give one.
+        default_order: "asc" or "desc" when the request does not give one.
+
+    Returns:
+        Page with the rows (including the projected columns), the total
+        number of rows matching the filters, and next_cursor (None on the
+        last page or when no limit was requested).
+
+    Raises:
+        HTTPException: 400 for an unknown sort field or invalid cursor.
+    """
+    sort = params.sort or default_sort
+    if sort not in sortable:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sort field '{sort}'. Allowed: {', '.join(sorted(sortable))}",
+        )
+    order = params.order or default_order
+    sort_column = sortable[sort]
+
+    total = await session.scalar(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    ) or 0
+
+    page_stmt = stmt.add_columns(sort_column.label(_SORT_KEY), id_column.label(_SORT_ID))
+
+    if params.cursor:
+        last_value, last_id = decode_cursor(params.cursor, sort, sort_column)
+        key = tuple_(sort_column, id_column)
+        page_stmt = page_stmt.where(
+            key < tuple_(last_value, last_id)
+            if order == "desc"
+            else key > tuple_(last_value, last_id)
+        )
+
+    if order == "desc":
+        page_stmt = page_stmt.order_by(sort_column.desc(), id_column.desc())
+    else:
+        page_stmt = page_stmt.order_by(sort_column.asc(), id_column.asc())
+
+    if params.skip:
+        page_stmt = page_stmt.offset(params.skip)
+    if params.limit is not None:
+        # One extra row tells us whether another page exists
+        page_stmt = page_stmt.limit(params.limit + 1)
+
+    rows = list((await session.execute(page_stmt)).all())
+
+    next_cursor = None
+    if params.limit is not None and len(rows) > params.limit:
+        rows = rows[:params.limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(sort, last[_SORT_KEY], last[_SORT_ID])
+
+    return Page(rows=rows, total=total, next_cursor=next_cursor)
@@ -20,13 +20,17 @@ Endpoints:
 
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
 
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
 from psychrag.sanitization import extract_titles_from_work, HashMismatchError
 from psychrag.chunking.chunk_headings import chunk_headings
 from psychrag.chunking.content_chunking import chunk_content
-from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly
+from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly, write_text_atomic
+from psychrag_api.dependencies import AsyncDbSession, CommonParams
+from psychrag_api.pagination import fetch_page
 from psychrag_api.schemas.chunking import (
     WorkListResponse,
     WorkListItem,
@@ -85,40 +89,53 @@ def _get_file_status(work: Work, file_key: str) -> FileStatusInfo:
     "/works",
     response_model=WorkListResponse,
     summary="List works with sanitized files",
-    description="Returns all works that have sanitized files ready for chunking.",
+    description="Returns works that have sanitized files ready for chunking. "
+                "Supports keyset pagination (limit/cursor) and sorting by "
+                "updated_at, id or title.",
 )
-async def list_works_for_chunking() -> WorkListResponse:
-    """List all works that have sanitized files."""
-    with get_session() as session:
-        works = session.query(Work).order_by(Work.updated_at.desc()).all()
-    
-        work_items = []
-        for work in works:
-            # Only include works that have sanitized file
-            if not work.files or "sanitized" not in work.files:
-                continue
-            
-            # Get processing status
-            heading_status = None
-            content_status = None
-            if work.processing_status:
-                heading_status = work.processing_status.get("heading_chunks")
-                content_status = work.processing_status.get("content_chunks")
-            
-            work_items.append(
-                WorkListItem(
-                    id=work.id,
-                    title=work.title,
-                    authors=work.authors,
-                    year=work.year,
-                    work_type=work.work_type,
-                    has_sanitized=True,
-                    heading_chunks_status=heading_status,
-                    content_chunks_status=content_status,
-                )
-            )
-        
-        return WorkListResponse(works=work_items, total=len(work_items))
+async def list_works_for_chunking(
+    session: AsyncDbSession, commons: CommonParams
+) -> WorkListResponse:
+    """List works that have sanitized files, most recently updated first."""
+    stmt = select(
+        Work.id,
+        Work.title,
+        Work.authors,
+        Work.year,
+        Work.work_type,
+        Work.processing_status["heading_chunks"].as_string().label("heading_chunks_status"),
+        Work.processing_status["content_chunks"].as_string().label("content_chunks_status"),
+    ).where(Work.files["sanitized"].is_not(None))
+    page = await fetch_page(
+        session,
+        stmt,
+        commons,
+        sortable={
+            "updated_at": Work.updated_at,
+            "id": Work.id,
+            "title": Work.title,
+        },
+        id_column=Work.id,
+        default_sort="updated_at",
+    )
+
+    work_items = [
+        WorkListItem(
+            id=work.id,
+            title=work.title,
+            authors=work.authors,
+            year=work.year,
+            work_type=work.work_type,
+            has_sanitized=True,
+            heading_chunks_status=work.heading_chunks_status,
+            content_chunks_status=work.content_chunks_status,
+        )
+        for work in page.rows
+    ]
+
+    return WorkListResponse(
+        works=work_items, total=page.total, next_cursor=page.next_cursor
+    )
 
 
 @router.get(
@@ -127,33 +144,33 @@ async def list_works_for_chunking() -> WorkListResponse:
     summary="Get work detail",
     description="Returns detailed information about a work including file statuses.",
 )
-async def get_work_detail(work_id: int) -> WorkDetailResponse:
+async def get_work_detail(
+    work_id: int, session: AsyncDbSession
+) -> WorkDetailResponse:
     """Get detailed work information."""
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        # Get file statuses
-        file_statuses = {
-            "sanitized": _get_file_status(work, "sanitized"),
-            "sanitized_titles": _get_file_status(work, "sanitized_titles"),
-            "vec_suggestions": _get_file_status(work, "vec_suggestions"),
-        }
-        
-        return WorkDetailResponse(
-            id=work.id,
-            title=work.title,
-            authors=work.authors,
-            year=work.year,
-            work_type=work.work_type,
-            files=file_statuses,
-            processing_status=work.processing_status,
-        )
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
+        )
+
+    # Get file statuses
+    file_statuses = {
+        key: await run_in_threadpool(_get_file_status, work, key)
+        for key in ("sanitized", "sanitized_titles", "vec_suggestions")
+    }
+
+    return WorkDetailResponse(
+        id=work.id,
+        title=work.title,
+        authors=work.authors,
+        year=work.year,
+        work_type=work.work_type,
+        files=file_statuses,
+        processing_status=work.processing_status,
+    )
 
 
 @router.get(
@@ -162,41 +179,42 @@ async def get_work_detail(work_id: int) -> WorkDetailResponse:
     summary="Get sanitized file content",
     description="Returns the content of the sanitized file.",
 )
-async def get_sanitized_content(work_id: int) -> SanitizedContentResponse:
+async def get_sanitized_content(
+    work_id: int, session: AsyncDbSession
+) -> SanitizedContentResponse:
     """Get sanitized file content."""
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        if not work.files or "sanitized" not in work.files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work {work_id} does not have sanitized file"
-            )
-        
-        file_info = work.files["sanitized"]
-        file_path = Path(file_info["path"])
-        
-        if not file_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Sanitized file not found on disk: {file_path}"
-            )
-        
-        content = file_path.read_text(encoding='utf-8')
-        current_hash = compute_file_hash(file_path)
-        
-        return SanitizedContentResponse(
-            content=content,
-            filename=file_path.name,
-            current_hash=current_hash
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
+        )
+
+    if not work.files or "sanitized" not in work.files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work {work_id} does not have sanitized file"
+        )
+
+    file_info = work.files["sanitized"]
+    file_path = Path(file_info["path"])
+
+    if not file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sanitized file not found on disk: {file_path}"
         )
 
+    content = await run_in_threadpool(file_path.read_text, encoding='utf-8')
+    current_hash = await run_in_threadpool(compute_file_hash, file_path)
+
+    return SanitizedContentResponse(
+        content=content,
+        filename=file_path.name,
+        current_hash=current_hash
+    )
+
 
 @router.put(
     "/work/{work_id}/sanitized/content",
@@ -237,15 +255,12 @@ async def update_sanitized_content(
             # Make file writable if it's read-only
             set_file_writable(file_path)
             
-            # Write new content
-            file_path.write_text(request.content, encoding='utf-8')
+            # Write new content and compute new hash
+            new_hash = write_text_atomic(file_path, request.content)
             
             # Set back to read-only
             set_file_readonly(file_path)
             
-            # Compute new hash
-            new_hash = compute_file_hash(file_path)
-            
             # Update work.files with new hash (recreate dict to trigger SQLAlchemy change detection)
             updated_files = dict(work.files)
             updated_files["sanitized"] = {
@@ -321,41 +336,42 @@ async def extract_sanitized_titles(
     summary="Get sanitized titles content",
     description="Returns the content of the sanitized_titles file.",
 )
-async def get_san_titles_content(work_id: int) -> SanTitlesContentResponse:
+async def get_san_titles_content(
+    work_id: int, session: AsyncDbSession
+) -> SanTitlesContentResponse:
     """Get sanitized titles file content."""
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        if not work.files or "sanitized_titles" not in work.files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work {work_id} does not have sanitized_titles file"
-            )
-        
-        file_info = work.files["sanitized_titles"]
-        file_path = Path(file_info["path"])
-        
-        if not file_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Sanitized titles file not found on disk: {file_path}"
-            )
-        
-        content = file_path.read_text(encoding='utf-8')
-        current_hash = compute_file_hash(file_path)
-        
-        return SanTitlesContentResponse(
-            content=content,
-            filename=file_path.name,
-            current_hash=current_hash
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
         )
 
+    if not work.files or "sanitized_titles" not in work.files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work {work_id} does not have sanitized_titles file"
+        )
+
+    file_info = work.files["sanitized_titles"]
+    file_path = Path(file_info["path"])
+
+    if not file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sanitized titles file not found on disk: {file_path}"
+        )
+
+    content = await run_in_threadpool(file_path.read_text, encoding='utf-8')
+    current_hash = await run_in_threadpool(compute_file_hash, file_path)
+
+    return SanTitlesContentResponse(
+        content=content,
+        filename=file_path.name,
+        current_hash=current_hash
+    )
+
 
 @router.put(
     "/work/{work_id}/san-titles/content",
@@ -396,15 +412,12 @@ async def update_san_titles_content(
             # Make file writable if it's read-only
             set_file_writable(file_path)
             
-            # Write new content
-            file_path.write_text(request.content, encoding='utf-8')
+            # Write new content and compute new hash
+            new_hash = write_text_atomic(file_path, request.content)
             
             # Set back to read-only
             set_file_readonly(file_path)
             
-            # Compute new hash
-            new_hash = compute_file_hash(file_path)
-            
             # Update work.files with new hash (recreate dict to trigger SQLAlchemy change detection)
             updated_files = dict(work.files)
             updated_files["sanitized_titles"] = {
@@ -793,12 +806,11 @@ async def update_vec_suggestions_table(
 
         # Write file (make writable, write, set read-only)
         set_file_writable(vec_sugg_path)
-        vec_sugg_path.write_text(markdown_content, encoding='utf-8')
+        new_hash = write_text_atomic(vec_sugg_path, markdown_content)
         set_file_readonly(vec_sugg_path)
 
         # Update hash in database
         # Need to create a new dict to trigger SQLAlchemy's change detection for JSON columns
-        new_hash = compute_file_hash(vec_sugg_path)
         with get_session() as session:
             work = session.query(Work).filter(Work.id == work_id).first()
             
@@ -4,16 +4,21 @@ Conversion Router - Document conversion operations.
 Endpoints:
     GET  /conv/io-folder-data - Get input/output folder data
     POST /conv/convert-file   - Convert a file from input folder
+    POST /conv/convert-batch  - Convert all unprocessed files in the input folder
 """
 
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from psychrag_api.schemas.conversion import (
     AddWorkRequest,
     AddWorkResponse,
+    BatchFileResultSchema,
     ConversionInspectionResponse,
+    ConvertBatchRequest,
+    ConvertBatchResponse,
     ConvertFileRequest,
     ConvertFileResponse,
     DeleteConversionResponse,
@@ -29,10 +34,13 @@ from psychrag_api.schemas.conversion import (
     ManualPromptResponse,
     ParseCitationRequest,
     ParseCitationResponse,
+    ParseCitationsBatchRequest,
+    ParseCitationsBatchResponse,
     ReadinessCheckResponse,
 )
 from psychrag.config import load_config
 from psychrag.config.io_folder_data import get_io_folder_data
+from psychrag.conversions.batch_convert import convert_folder
 from psychrag.conversions.conv_pdf2md import convert_pdf_to_markdown
 from psychrag.conversions.conv_epub2md import convert_epub_to_markdown
 from psychrag.conversions.inspection import get_conversion_inspection
@@ -43,6 +51,7 @@ from psychrag.data.models.io_file import IOFile
 from psychrag.sanitization.extract_titles import extract_titles
 from psychrag.sanitization.apply_title_edits import apply_title_edits
 from psychrag.sanitization.delete_conversion import delete_conversion
+from psychrag.utils.file_utils import write_text_atomic
 
 router = APIRouter()
 
@@ -158,13 +167,17 @@ async def convert_file_endpoint(request: ConvertFileRequest) -> ConvertFileRespo
         output_files = []
 
         if file_ext == ".pdf":
-            # Convert the PDF with compare=True, use_gpu=True, verbose=True
-            convert_pdf_to_markdown(
+            # Convert the PDF with compare=True, use_gpu=True, verbose=True.
+            # Runs in a worker thread; the loaded docling converter is pooled
+            # and reused by later requests.
+            await run_in_threadpool(
+                convert_pdf_to_markdown,
                 pdf_path=input_file_path,
                 output_path=output_path,
                 verbose=True,
                 compare=True,
                 use_gpu=True,
+                engine=request.engine,
             )
             
             expected_files = [
@@ -216,6 +229,63 @@ async def convert_file_endpoint(request: ConvertFileRequest) -> ConvertFileRespo
         ) from e
 
 
+@router.post(
+    "/convert-batch",
+    response_model=ConvertBatchResponse,
+    summary="Convert all unprocessed input files",
+    description="Convert every PDF and EPUB in the input folder that is not yet a work, "
+                "using a pool of worker processes.",
+    responses={
+        200: {"description": "Batch finished (individual files may have failed)"},
+        500: {"description": "Batch conversion could not run"},
+    },
+)
+async def convert_batch_endpoint(request: ConvertBatchRequest) -> ConvertBatchResponse:
+    """
+    Convert all unprocessed files in the input directory.
+
+    Files are converted largest first across worker processes. Files that
+    are already works or already converted are skipped, so the request can
+    be repeated to resume an interrupted batch. Failures are reported per
+    file rather than failing the request.
+
+    This is a blocking operation that may take a long time for large folders.
+    """
+    try:
+        report = await run_in_threadpool(
+            convert_folder,
+            workers=request.workers,
+            engine=request.engine,
+            retry_failed=request.retry_failed,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch conversion failed: {str(e)}",
+        ) from e
+
+    return ConvertBatchResponse(
+        converted=len(report.converted),
+        failed=len(report.failed),
+        skipped=len(report.skipped),
+        workers=report.workers,
+        seconds=round(report.seconds, 2),
+        results=[
+            BatchFileResultSchema(
+                filename=r.filename,
+                status=r.status,
+                size_bytes=r.size_bytes,
+                pages=r.pages,
+                seconds=round(r.seconds, 2),
+                pages_per_second=r.pages_per_second,
+                error=r.error,
+                reason=r.reason,
+            )
+            for r in report.results
+        ],
+    )
+
+
 @router.get(
     "/inspection/{io_file_id}",
     response_model=ConversionInspectionResponse,
@@ -561,7 +631,7 @@ async def update_file_content(
         
         # Handle toc_titles differently - save raw markdown
         if file_type == "toc_titles":
-            file_path.write_text(request.content, encoding="utf-8")
+            write_text_atomic(file_path, request.content)
             updated_content = request.content
         else:
             # For style and hier, apply title edits
@@ -1165,6 +1235,69 @@ async def parse_citation_llm(
         ) from e
 
 
+@router.post(
+    "/parse-citations-llm",
+    response_model=ParseCitationsBatchResponse,
+    summary="Parse many citations using LLM",
+    description=(
+        "Parse a list of citation strings with the LLM, several citations per call. "
+        "Each citation gets its own result; failures don't fail the request."
+    ),
+    responses={
+        200: {"description": "Citations parsed (see per-item success)"},
+        400: {"description": "Invalid citation format"},
+    },
+)
+async def parse_citations_llm(
+    request: ParseCitationsBatchRequest
+) -> ParseCitationsBatchResponse:
+    """
+    Parse many citation strings using LLM.
+
+    Citations are grouped by format and parsed in batches with
+    parse_citations_with_llm, so registering a folder of works doesn't
+    cost one LLM round trip per citation.
+
+    Args:
+        request: Citations with their formats
+
+    Returns:
+        ParseCitationsBatchResponse with one result per citation
+    """
+    from psychrag.utils.llm_citation_parser import parse_citations_with_llm
+
+    by_format: dict[str, list[int]] = {}
+    for index, item in enumerate(request.items):
+        by_format.setdefault(item.citation_format, []).append(index)
+
+    results: list[ParseCitationResponse | None] = [None] * len(request.items)
+    for citation_format, indices in by_format.items():
+        try:
+            parsed = await run_in_threadpool(
+                parse_citations_with_llm,
+                [request.items[index].citation_text for index in indices],
+                citation_format,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+
+        for index, result in zip(indices, parsed):
+            if result.citation is not None:
+                results[index] = ParseCitationResponse(success=True, **result.citation.model_dump())
+            else:
+                results[index] = ParseCitationResponse(success=False, error=result.error)
+
+    parsed_count = sum(1 for result in results if result.success)
+    return ParseCitationsBatchResponse(
+        results=results,
+        parsed=parsed_count,
+        failed=len(results) - parsed_count,
+    )
+
+
 @router.get(
     "/original-markdown/{io_file_id}",
     response_model=FileContentResponse,
@@ -1307,7 +1440,7 @@ async def update_original_markdown(
                 detail=f"Original markdown file not found: {target_filename}",
             )
             
-        file_path.write_text(request.content, encoding="utf-8")
+        write_text_atomic(file_path, request.content)
         
         return FileContentResponse(
             content=request.content,
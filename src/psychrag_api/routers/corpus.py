@@ -14,11 +14,14 @@ Endpoints:
 
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from psychrag.data.database import get_session
-from psychrag.data.models.work import Work
+from psychrag.data.models.work import CORPUS_WORK_PREDICATE, Work
 from psychrag.data.models.chunk import Chunk
+from psychrag_api.dependencies import AsyncDbSession, CommonParams
+from psychrag_api.pagination import fetch_page
 from psychrag_api.schemas.corpus import (
     ChunkVectorStats,
     CorpusStatsResponse,
@@ -35,6 +38,7 @@ def _is_corpus_work(work: Work) -> bool:
     """
     Check if a work is part of the corpus.
 
+    Python counterpart of CORPUS_WORK_PREDICATE, used for single-work checks.
     A work is in the corpus if:
     1. It has processing_status
     2. processing_status["content_chunks"] == "completed"
@@ -62,61 +66,44 @@ def _is_corpus_work(work: Work) -> bool:
     return True
 
 
-def _get_corpus_works(session) -> list[Work]:
-    """
-    Get all works in the corpus.
-
-    Filters works to only include those with completed chunking and sanitized files.
-
-    Args:
-        session: Database session
+# Vector statuses reported in corpus chunk statistics
+_VECTOR_STATUSES = ("no_vec", "to_vec", "vec", "vec_err")
 
-    Returns:
-        List of Work objects that are in the corpus
-    """
-    # Get all works (we need to filter in Python due to JSON field complexity)
-    all_works = session.query(Work).all()
 
-    # Filter to corpus works
-    corpus_works = [work for work in all_works if _is_corpus_work(work)]
+def _corpus_work_ids():
+    """Select the IDs of corpus works (served by the ix_works_corpus partial index)."""
+    return select(Work.id).where(text(CORPUS_WORK_PREDICATE))
 
-    return corpus_works
 
-
-def _get_chunk_vector_stats(session, corpus_work_ids: list[int]) -> dict[str, int]:
+async def _get_corpus_stats(session: AsyncSession) -> tuple[int, dict[str, int]]:
     """
-    Get chunk statistics by vector_status for corpus works.
+    Count corpus works and their chunks by vector_status in a single query.
 
     Args:
-        session: Database session
-        corpus_work_ids: List of work IDs to include in statistics
+        session: Async database session
 
     Returns:
-        Dict with counts for each vector_status: {no_vec, to_vec, vec, vec_err}
+        Tuple of (total corpus works, {no_vec, to_vec, vec, vec_err} counts)
     """
-    if not corpus_work_ids:
-        return {"no_vec": 0, "to_vec": 0, "vec": 0, "vec_err": 0}
-
-    # Query chunks grouped by vector_status
-    stats_query = (
-        session.query(
-            Chunk.vector_status,
-            func.count(Chunk.id)
+    corpus_ids = _corpus_work_ids().cte("corpus_works")
+    stmt = (
+        select(
+            select(func.count()).select_from(corpus_ids).scalar_subquery(),
+            *[
+                func.count(Chunk.id).filter(Chunk.vector_status == vector_status)
+                for vector_status in _VECTOR_STATUSES
+            ],
         )
-        .filter(Chunk.work_id.in_(corpus_work_ids))
-        .group_by(Chunk.vector_status)
-        .all()
+        .where(Chunk.work_id.in_(select(corpus_ids.c.id)))
     )
+    row = (await session.execute(stmt)).one()
 
-    # Initialize all statuses to 0
-    result = {"no_vec": 0, "to_vec": 0, "vec": 0, "vec_err": 0}
-
-    # Populate with actual counts
-    for vector_status, count in stats_query:
-        if vector_status in result:
-            result[vector_status] = count
-
-    return result
+    total_works = row[0] or 0
+    chunk_stats = {
+        vector_status: count or 0
+        for vector_status, count in zip(_VECTOR_STATUSES, row[1:])
+    }
+    return total_works, chunk_stats
 
 
 @router.get(
@@ -126,7 +113,7 @@ def _get_chunk_vector_stats(session, corpus_work_ids: list[int]) -> dict[str, in
     description="Get count of corpus works and chunk vectorization statistics. "
                 "Corpus works are those with completed chunking (both content and heading).",
 )
-async def get_corpus_stats() -> CorpusStatsResponse:
+async def get_corpus_stats(session: AsyncDbSession) -> CorpusStatsResponse:
     """
     Get corpus statistics.
 
@@ -137,60 +124,68 @@ async def get_corpus_stats() -> CorpusStatsResponse:
     Only includes works where both content_chunks and heading_chunks are "completed"
     and that have a sanitized file.
     """
-    with get_session() as session:
-        # Get corpus works
-        corpus_works = _get_corpus_works(session)
-        corpus_work_ids = [work.id for work in corpus_works]
-
-        # Get chunk statistics
-        chunk_stats = _get_chunk_vector_stats(session, corpus_work_ids)
+    total_works, chunk_stats = await _get_corpus_stats(session)
 
-        return CorpusStatsResponse(
-            total_works=len(corpus_works),
-            chunk_stats=ChunkVectorStats(**chunk_stats)
-        )
+    return CorpusStatsResponse(
+        total_works=total_works,
+        chunk_stats=ChunkVectorStats(**chunk_stats)
+    )
 
 
 @router.get(
     "/works",
     response_model=CorpusWorksResponse,
     summary="List corpus works",
-    description="Get all works that have completed chunking (both content and heading) "
-                "and are ready for vectorization. Returns works sorted by ID descending.",
+    description="Get works that have completed chunking (both content and heading) "
+                "and are ready for vectorization. Returns works sorted by ID descending "
+                "by default; supports keyset pagination (limit/cursor) and sorting by "
+                "id or title.",
 )
-async def list_corpus_works() -> CorpusWorksResponse:
+async def list_corpus_works(
+    session: AsyncDbSession, commons: CommonParams
+) -> CorpusWorksResponse:
     """
-    List all corpus works.
+    List corpus works.
 
     Returns works where:
     - processing_status["content_chunks"] == "completed"
     - processing_status["heading_chunks"] == "completed"
     - work.files["sanitized"] exists
 
-    Works are sorted by ID descending (newest first).
+    Works are sorted by ID descending (newest first) unless another sort
+    is requested.
     """
-    with get_session() as session:
-        corpus_works = _get_corpus_works(session)
-
-        # Build work list items
-        work_items = []
-        for work in corpus_works:
-            work_items.append(
-                CorpusWorkListItem(
-                    id=work.id,
-                    title=work.title,
-                    authors=work.authors,
-                    sanitized_path=work.files["sanitized"]["path"]
-                )
-            )
-
-        # Sort by ID descending (newest first)
-        work_items.sort(key=lambda x: x.id, reverse=True)
+    # Filter and sort in SQL, reading only the columns the list needs
+    stmt = select(
+        Work.id,
+        Work.title,
+        Work.authors,
+        Work.files["sanitized"]["path"].as_string().label("sanitized_path"),
+    ).where(text(CORPUS_WORK_PREDICATE))
+    page = await fetch_page(
+        session,
+        stmt,
+        commons,
+        sortable={"id": Work.id, "title": Work.title},
+        id_column=Work.id,
+        default_sort="id",
+    )
 
-        return CorpusWorksResponse(
-            works=work_items,
-            total=len(work_items)
+    work_items = [
+        CorpusWorkListItem(
+            id=work.id,
+            title=work.title,
+            authors=work.authors,
+            sanitized_path=work.sanitized_path
         )
+        for work in page.rows
+    ]
+
+    return CorpusWorksResponse(
+        works=work_items,
+        total=page.total,
+        next_cursor=page.next_cursor
+    )
 
 
 @router.get(
@@ -200,7 +195,9 @@ async def list_corpus_works() -> CorpusWorksResponse:
     description="Get detailed information about a specific corpus work. "
                 "Returns 404 if work doesn't exist or isn't in the corpus.",
 )
-async def get_corpus_work_detail(work_id: int) -> CorpusWorkDetailResponse:
+async def get_corpus_work_detail(
+    work_id: int, session: AsyncDbSession
+) -> CorpusWorkDetailResponse:
     """
     Get detailed information about a corpus work.
 
@@ -214,51 +211,50 @@ async def get_corpus_work_detail(work_id: int) -> CorpusWorkDetailResponse:
         404: Work not found or not in corpus
         400: Work doesn't have completed chunking
     """
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
+        )
 
-        if not work:
+    # Verify work is in corpus
+    if not _is_corpus_work(work):
+        # Provide specific error message about what's missing
+        if not work.processing_status:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Work {work_id} has no processing status"
+            )
+
+        content_status = work.processing_status.get("content_chunks")
+        heading_status = work.processing_status.get("heading_chunks")
+
+        if content_status != "completed" or heading_status != "completed":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Work {work_id} has not completed chunking "
+                       f"(content_chunks: {content_status}, heading_chunks: {heading_status})"
+            )
+
+        if not work.files or "sanitized" not in work.files:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
+                detail=f"Work {work_id} does not have a sanitized file"
             )
 
-        # Verify work is in corpus
-        if not _is_corpus_work(work):
-            # Provide specific error message about what's missing
-            if not work.processing_status:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Work {work_id} has no processing status"
-                )
-
-            content_status = work.processing_status.get("content_chunks")
-            heading_status = work.processing_status.get("heading_chunks")
-
-            if content_status != "completed" or heading_status != "completed":
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Work {work_id} has not completed chunking "
-                           f"(content_chunks: {content_status}, heading_chunks: {heading_status})"
-                )
-
-            if not work.files or "sanitized" not in work.files:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Work {work_id} does not have a sanitized file"
-                )
-
-        sanitized_info = work.files["sanitized"]
-
-        return CorpusWorkDetailResponse(
-            id=work.id,
-            title=work.title,
-            authors=work.authors,
-            year=work.year,
-            publisher=work.publisher,
-            sanitized_path=sanitized_info["path"],
-            sanitized_hash=sanitized_info["hash"]
-        )
+    sanitized_info = work.files["sanitized"]
+
+    return CorpusWorkDetailResponse(
+        id=work.id,
+        title=work.title,
+        authors=work.authors,
+        year=work.year,
+        publisher=work.publisher,
+        sanitized_path=sanitized_info["path"],
+        sanitized_hash=sanitized_info["hash"]
+    )
 
 
 @router.get(
@@ -267,7 +263,9 @@ async def get_corpus_work_detail(work_id: int) -> CorpusWorkDetailResponse:
     summary="Get sanitized markdown content",
     description="Retrieve the sanitized markdown file content for a corpus work.",
 )
-async def get_sanitized_content(work_id: int) -> SanitizedContentResponse:
+async def get_sanitized_content(
+    work_id: int, session: AsyncDbSession
+) -> SanitizedContentResponse:
     """
     Get the sanitized markdown content for a work.
 
@@ -281,41 +279,40 @@ async def get_sanitized_content(work_id: int) -> SanitizedContentResponse:
         404: Work not found or sanitized file missing
         500: Error reading file from disk
     """
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
+    work = await session.get(Work, work_id)
 
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-
-        if not work.files or "sanitized" not in work.files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work {work_id} does not have a sanitized file"
-            )
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
+        )
 
-        sanitized_path = Path(work.files["sanitized"]["path"])
+    if not work.files or "sanitized" not in work.files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work {work_id} does not have a sanitized file"
+        )
 
-        if not sanitized_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Sanitized file not found on disk: {sanitized_path}"
-            )
+    sanitized_path = Path(work.files["sanitized"]["path"])
 
-        # Read file content
-        try:
-            content = sanitized_path.read_text(encoding="utf-8")
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to read sanitized file: {str(e)}"
-            )
+    if not sanitized_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sanitized file not found on disk: {sanitized_path}"
+        )
 
-        return SanitizedContentResponse(
-            content=content,
-            filename=sanitized_path.name,
-            work_id=work.id,
-            work_title=work.title
+    # Read file content off the event loop
+    try:
+        content = await run_in_threadpool(sanitized_path.read_text, encoding="utf-8")
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to read sanitized file: {str(e)}"
         )
+
+    return SanitizedContentResponse(
+        content=content,
+        filename=sanitized_path.name,
+        work_id=work.id,
+        work_title=work.title
+    )
@@ -10,6 +10,7 @@ Endpoints for query management:
     POST /rag/queries/{id}/consolidate     - Run consolidation
     GET  /rag/queries/{id}/augment/prompt  - Get augmented prompt
     POST /rag/queries/{id}/augment/run     - Run augmented prompt with LLM
+    POST /rag/queries/{id}/augment/stream  - Run augmented prompt, streaming tokens (SSE)
     POST /rag/queries/{id}/augment/manual  - Save manually-run LLM response
     GET  /rag/queries/{id}/results         - List query results
     GET  /rag/queries/{id}/results/{id}    - Get specific result
@@ -20,7 +21,15 @@ Endpoints for query expansion:
     POST /rag/expansion/manual             - Parse & save manual expansion response
 """
 
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import json
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Text, cast, func, select
 
 from psychrag.data.database import get_session
 from psychrag.data.models import Query, Result
@@ -32,10 +41,13 @@ from psychrag.retrieval import (
     expand_query,
     retrieve,
 )
-from psychrag.augmentation import consolidate_context, generate_augmented_prompt
+from psychrag.augmentation import AugmentedPrompt, build_augmented_prompt, consolidate_context
 from psychrag.ai.config import ModelTier
 from psychrag.ai.llm_factory import create_langchain_chat
+from psychrag.ai.response_cache import invoke_cached
 
+from psychrag_api.dependencies import AsyncDbSession, CommonParams
+from psychrag_api.pagination import fetch_page
 from psychrag_api.schemas.rag_queries import (
     QueryListItem,
     QueryListResponse,
@@ -59,9 +71,16 @@ from psychrag_api.schemas.rag_queries import (
     ResultItem,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+def _json_present(column):
+    """SQL expression: True when a JSON column holds a non-empty value."""
+    return func.coalesce(cast(column, Text), "null").not_in(["null", "[]", "{}"])
+
+
 def _get_query_status(query: Query) -> str:
     """Determine the current status of a query."""
     if query.vector_status == "to_vec":
@@ -80,27 +99,57 @@ def _get_query_status(query: Query) -> str:
 @router.get(
     "/queries",
     response_model=QueryListResponse,
-    summary="List all queries",
-    description="List all queries with their current status.",
+    summary="List queries",
+    description="List queries with their current status. Supports keyset "
+                "pagination (limit/cursor) and sorting by created_at, "
+                "updated_at or id.",
 )
-async def list_queries() -> QueryListResponse:
-    """List all queries with status information."""
-    with get_session() as session:
-        queries = session.query(Query).order_by(Query.created_at.desc()).all()
+async def list_queries(
+    session: AsyncDbSession, commons: CommonParams
+) -> QueryListResponse:
+    """List queries with status information, newest first by default."""
+    # Project only what the list view needs; embeddings and the retrieval
+    # context blobs are reduced to presence flags in SQL.
+    stmt = select(
+        Query.id,
+        Query.original_query,
+        Query.created_at,
+        Query.updated_at,
+        Query.intent,
+        Query.entities,
+        Query.vector_status,
+        _json_present(Query.retrieved_context).label("retrieved_context"),
+        _json_present(Query.clean_retrieval_context).label("clean_retrieval_context"),
+    )
+    page = await fetch_page(
+        session,
+        stmt,
+        commons,
+        sortable={
+            "created_at": Query.created_at,
+            "updated_at": Query.updated_at,
+            "id": Query.id,
+        },
+        id_column=Query.id,
+        default_sort="created_at",
+    )
 
-        items = []
-        for q in queries:
-            items.append(QueryListItem(
-                id=q.id,
-                original_query=q.original_query,
-                created_at=q.created_at,
-                updated_at=q.updated_at,
-                status=_get_query_status(q),
-                intent=q.intent,
-                entities_count=len(q.entities) if q.entities else 0
-            ))
+    items = [
+        QueryListItem(
+            id=q.id,
+            original_query=q.original_query,
+            created_at=q.created_at,
+            updated_at=q.updated_at,
+            status=_get_query_status(q),
+            intent=q.intent,
+            entities_count=len(q.entities) if q.entities else 0
+        )
+        for q in page.rows
+    ]
 
-        return QueryListResponse(queries=items, total=len(items))
+    return QueryListResponse(
+        queries=items, total=page.total, next_cursor=page.next_cursor
+    )
 
 
 @router.get(
@@ -109,32 +158,31 @@ async def list_queries() -> QueryListResponse:
     summary="Get query details",
     description="Get detailed information about a specific query.",
 )
-async def get_query(query_id: int) -> QueryDetailResponse:
+async def get_query(query_id: int, session: AsyncDbSession) -> QueryDetailResponse:
     """Get detailed query information."""
-    with get_session() as session:
-        query = session.query(Query).filter(Query.id == query_id).first()
-
-        if not query:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Query with ID {query_id} not found"
-            )
+    query = await session.get(Query, query_id)
 
-        return QueryDetailResponse(
-            id=query.id,
-            original_query=query.original_query,
-            expanded_queries=query.expanded_queries,
-            hyde_answer=query.hyde_answer,
-            intent=query.intent,
-            entities=query.entities,
-            vector_status=query.vector_status,
-            has_retrieved_context=bool(query.retrieved_context),
-            has_clean_context=bool(query.clean_retrieval_context),
-            clean_retrieval_context=query.clean_retrieval_context,
-            created_at=query.created_at,
-            updated_at=query.updated_at
+    if not query:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Query with ID {query_id} not found"
         )
 
+    return QueryDetailResponse(
+        id=query.id,
+        original_query=query.original_query,
+        expanded_queries=query.expanded_queries,
+        hyde_answer=query.hyde_answer,
+        intent=query.intent,
+        entities=query.entities,
+        vector_status=query.vector_status,
+        has_retrieved_context=bool(query.retrieved_context),
+        has_clean_context=bool(query.clean_retrieval_context),
+        clean_retrieval_context=query.clean_retrieval_context,
+        created_at=query.created_at,
+        updated_at=query.updated_at
+    )
+
 
 @router.patch(
     "/queries/{query_id}",
@@ -296,29 +344,19 @@ async def get_augment_prompt(
 ) -> AugmentPromptResponse:
     """Get the augmented prompt for a query."""
     try:
-        prompt = generate_augmented_prompt(query_id=query_id, top_n=top_n, config_preset=config_preset)
+        augmented = build_augmented_prompt(query_id=query_id, top_n=top_n, config_preset=config_preset)
 
         with get_session() as session:
             query = session.query(Query).filter(Query.id == query_id).first()
-            context_count = len(query.clean_retrieval_context or [])
-
-            # If top_n was not specified, get it from the config that was used
-            if top_n is None:
-                if config_preset:
-                    from psychrag.utils.rag_config_loader import get_config_by_name
-                    config = get_config_by_name(config_preset)
-                else:
-                    from psychrag.utils.rag_config_loader import get_default_config
-                    config = get_default_config()
-                actual_top_n = config["augmentation"]["top_n_contexts"]
-            else:
-                actual_top_n = top_n
 
             return AugmentPromptResponse(
                 query_id=query_id,
                 original_query=query.original_query,
-                prompt=prompt,
-                context_count=min(context_count, actual_top_n)
+                prompt=augmented.prompt,
+                context_count=len(augmented.contexts),
+                prompt_tokens=augmented.prompt_tokens,
+                context_tokens=augmented.context_tokens,
+                token_budget=augmented.token_budget,
             )
     except ValueError as e:
         raise HTTPException(
@@ -342,29 +380,23 @@ async def run_augment(
     """Run augmented prompt with LLM and save result."""
     try:
         # Generate the prompt
-        prompt = generate_augmented_prompt(query_id=query_id, top_n=top_n, config_preset=config_preset)
+        augmented = build_augmented_prompt(query_id=query_id, top_n=top_n, config_preset=config_preset)
 
         # Create LangChain chat with FULL model and search
         stack = create_langchain_chat(tier=ModelTier.FULL, search=True, temperature=0.2)
 
         # Call LLM
-        response = stack.chat.invoke(prompt)
+        response = invoke_cached(stack.chat, augmented.prompt, function="augmentation")
         response_text = response.content
 
         # Save result to database
-        with get_session() as session:
-            result = Result(
-                query_id=query_id,
-                response_text=response_text
-            )
-            session.add(result)
-            session.commit()
-            result_id = result.id
+        result_id = _save_result(query_id, response_text)
 
         return AugmentRunResponse(
             query_id=query_id,
             result_id=result_id,
             response_text=response_text,
+            prompt_tokens=augmented.prompt_tokens,
             message="Augmented prompt executed and result saved"
         )
     except ValueError as e:
@@ -374,6 +406,111 @@ async def run_augment(
         )
 
 
+def _save_result(query_id: int, response_text: str) -> int:
+    """Save an LLM response as a Result of the query and return its ID."""
+    with get_session() as session:
+        result = Result(
+            query_id=query_id,
+            response_text=response_text
+        )
+        session.add(result)
+        session.commit()
+        return result.id
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _chunk_text(content) -> str:
+    """Text of a streamed message chunk (Gemini may send a list of parts)."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for part in content or []:
+        if isinstance(part, str):
+            parts.append(part)
+        elif isinstance(part, dict) and part.get("type", "text") == "text":
+            parts.append(part.get("text", ""))
+    return "".join(parts)
+
+
+async def _stream_augment_events(
+    http_request: Request,
+    chat,
+    augmented: AugmentedPrompt,
+    query_id: int,
+) -> AsyncIterator[str]:
+    """
+    Yield token events as the LLM streams its answer, then save the Result.
+
+    Stops without saving if the client disconnects; closing the LLM stream
+    cancels the provider request.
+    """
+    parts: list[str] = []
+    try:
+        async for chunk in chat.astream(augmented.prompt):
+            if await http_request.is_disconnected():
+                logger.info(f"Client disconnected from augment stream of query {query_id}")
+                return
+            text = _chunk_text(chunk.content)
+            if text:
+                parts.append(text)
+                yield _sse_event("token", {"text": text})
+    except asyncio.CancelledError:
+        logger.info(f"Augment stream of query {query_id} cancelled")
+        raise
+    except Exception as e:
+        logger.exception(f"Augment stream of query {query_id} failed")
+        yield _sse_event("error", {"detail": f"LLM request failed: {e}"})
+        return
+
+    response_text = "".join(parts)
+    result_id = await run_in_threadpool(_save_result, query_id, response_text)
+    yield _sse_event("done", {
+        "query_id": query_id,
+        "result_id": result_id,
+        "response_text": response_text,
+        "prompt_tokens": augmented.prompt_tokens,
+    })
+
+
+@router.post(
+    "/queries/{query_id}/augment/stream",
+    summary="Stream augmented prompt",
+    description=(
+        "Run the augmented prompt with LLM and stream the answer as Server-Sent Events: "
+        "'token' events with {text} as tokens arrive, then 'done' with {query_id, "
+        "result_id, response_text, prompt_tokens} once the result is saved, or 'error' with {detail}. "
+        "Nothing is saved if the client disconnects."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_augment(
+    query_id: int,
+    http_request: Request,
+    top_n: int | None = None,
+    config_preset: str | None = None
+) -> StreamingResponse:
+    """Run augmented prompt with LLM, streaming tokens over SSE."""
+    try:
+        augmented = build_augmented_prompt(query_id=query_id, top_n=top_n, config_preset=config_preset)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
+    stack = create_langchain_chat(tier=ModelTier.FULL, search=True, temperature=0.2)
+
+    return StreamingResponse(
+        _stream_augment_events(http_request, stack.chat, augmented, query_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/queries/{query_id}/augment/manual",
     response_model=AugmentManualResponse,
@@ -493,38 +630,38 @@ async def save_manual_expansion(request: ExpansionManualRequest) -> ExpansionMan
     summary="List query results",
     description="List all generated results for a query.",
 )
-async def list_results(query_id: int) -> ResultListResponse:
+async def list_results(query_id: int, session: AsyncDbSession) -> ResultListResponse:
     """List all results for a query."""
-    with get_session() as session:
-        # Verify query exists
-        query = session.query(Query).filter(Query.id == query_id).first()
-        if not query:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Query with ID {query_id} not found"
-            )
-
-        # Get results
-        results = session.query(Result)\
-            .filter(Result.query_id == query_id)\
-            .order_by(Result.created_at.desc())\
-            .all()
-
-        items = [
-            ResultItem(
-                id=r.id,
-                query_id=r.query_id,
-                response_text=r.response_text,
-                created_at=r.created_at
-            )
-            for r in results
-        ]
+    # Verify query exists
+    query_exists = await session.scalar(select(Query.id).where(Query.id == query_id))
+    if query_exists is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Query with ID {query_id} not found"
+        )
 
-        return ResultListResponse(
-            query_id=query_id,
-            results=items,
-            total=len(items)
+    # Get results
+    results = (await session.execute(
+        select(Result)
+        .where(Result.query_id == query_id)
+        .order_by(Result.created_at.desc())
+    )).scalars().all()
+
+    items = [
+        ResultItem(
+            id=r.id,
+            query_id=r.query_id,
+            response_text=r.response_text,
+            created_at=r.created_at
         )
+        for r in results
+    ]
+
+    return ResultListResponse(
+        query_id=query_id,
+        results=items,
+        total=len(items)
+    )
 
 
 @router.get(
@@ -533,22 +670,23 @@ async def list_results(query_id: int) -> ResultListResponse:
     summary="Get result details",
     description="Get a specific result.",
 )
-async def get_result(query_id: int, result_id: int) -> ResultItem:
+async def get_result(
+    query_id: int, result_id: int, session: AsyncDbSession
+) -> ResultItem:
     """Get a specific result."""
-    with get_session() as session:
-        result = session.query(Result)\
-            .filter(Result.id == result_id, Result.query_id == query_id)\
-            .first()
-
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Result with ID {result_id} not found for query {query_id}"
-            )
+    result = await session.scalar(
+        select(Result).where(Result.id == result_id, Result.query_id == query_id)
+    )
 
-        return ResultItem(
-            id=result.id,
-            query_id=result.query_id,
-            response_text=result.response_text,
-            created_at=result.created_at
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Result with ID {result_id} not found for query {query_id}"
         )
+
+    return ResultItem(
+        id=result.id,
+        query_id=result.query_id,
+        response_text=result.response_text,
+        created_at=result.created_at
+    )
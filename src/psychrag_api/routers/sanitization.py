@@ -13,6 +13,8 @@ Endpoints:
 
 from pathlib import Path
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
 
 from psychrag.data.database import get_session
 from psychrag.data.models.work import Work
@@ -26,8 +28,10 @@ from psychrag.sanitization import (
     verify_title_changes_integrity,
     HashMismatchError,
 )
-from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly
+from psychrag.utils.file_utils import compute_file_hash, set_file_writable, set_file_readonly, write_text_atomic
 from psychrag.config import load_config
+from psychrag_api.dependencies import AsyncDbSession, CommonParams
+from psychrag_api.pagination import fetch_page
 from psychrag_api.schemas.sanitization import (
     # Legacy schemas removed
     # New work-based schemas
@@ -121,43 +125,70 @@ def _check_file_status(work: Work, file_key: str) -> FileStatusInfo:
 @router.get(
     "/works",
     response_model=WorkListResponse,
-    summary="List all works",
-    description="Get a list of all works in the database with their sanitization status.",
+    summary="List works",
+    description="Get a list of works in the database with their sanitization status. "
+                "Supports keyset pagination (limit/cursor) and sorting by id, "
+                "title, created_at or updated_at.",
 )
-async def list_works() -> WorkListResponse:
+async def list_works(
+    session: AsyncDbSession, commons: CommonParams
+) -> WorkListResponse:
     """
-    List all works with their sanitization status.
+    List works with their sanitization status.
     
-    Returns works sorted by ID descending (newest first).
+    Returns works sorted by ID descending (newest first) unless another
+    sort is requested.
     """
-    with get_session() as session:
-        works = session.query(Work).order_by(Work.id.desc()).all()
-        
-        work_items = []
-        needs_sanitization = 0
-        
-        for work in works:
-            has_sanitized = bool(work.files and "sanitized" in work.files)
-            has_original_markdown = bool(work.files and "original_markdown" in work.files)
-            
-            if not has_sanitized and has_original_markdown:
-                needs_sanitization += 1
-            
-            work_items.append(WorkListItem(
-                id=work.id,
-                title=work.title,
-                authors=work.authors,
-                year=work.year,
-                work_type=work.work_type,
-                has_sanitized=has_sanitized,
-                has_original_markdown=has_original_markdown,
-            ))
-        
-        return WorkListResponse(
-            works=work_items,
-            total=len(work_items),
-            needs_sanitization=needs_sanitization,
+    has_sanitized = Work.files["sanitized"].is_not(None)
+    has_original_markdown = Work.files["original_markdown"].is_not(None)
+
+    stmt = select(
+        Work.id,
+        Work.title,
+        Work.authors,
+        Work.year,
+        Work.work_type,
+        has_sanitized.label("has_sanitized"),
+        has_original_markdown.label("has_original_markdown"),
+    )
+    page = await fetch_page(
+        session,
+        stmt,
+        commons,
+        sortable={
+            "id": Work.id,
+            "title": Work.title,
+            "created_at": Work.created_at,
+            "updated_at": Work.updated_at,
+        },
+        id_column=Work.id,
+        default_sort="id",
+    )
+
+    # Counted across all works, not just the returned page
+    needs_sanitization = await session.scalar(
+        select(func.count()).where(~has_sanitized, has_original_markdown)
+    )
+
+    work_items = [
+        WorkListItem(
+            id=work.id,
+            title=work.title,
+            authors=work.authors,
+            year=work.year,
+            work_type=work.work_type,
+            has_sanitized=work.has_sanitized,
+            has_original_markdown=work.has_original_markdown,
         )
+        for work in page.rows
+    ]
+
+    return WorkListResponse(
+        works=work_items,
+        total=page.total,
+        needs_sanitization=needs_sanitization,
+        next_cursor=page.next_cursor,
+    )
 
 
 @router.get(
@@ -166,39 +197,44 @@ async def list_works() -> WorkListResponse:
     summary="Get work detail",
     description="Get detailed information about a work including all file statuses.",
 )
-async def get_work_detail(work_id: int) -> WorkDetailResponse:
+async def get_work_detail(
+    work_id: int, session: AsyncDbSession
+) -> WorkDetailResponse:
     """
     Get detailed work information with file status validation.
     
     Checks existence and hash validation for all sanitization-related files.
     """
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        # Check status of all relevant files
-        original_markdown_status = _check_file_status(work, "original_markdown")
-        titles_status = _check_file_status(work, "titles")
-        title_changes_status = _check_file_status(work, "title_changes")
-        sanitized_status = _check_file_status(work, "sanitized")
-        
-        return WorkDetailResponse(
-            id=work.id,
-            title=work.title,
-            authors=work.authors,
-            year=work.year,
-            work_type=work.work_type,
-            original_markdown=original_markdown_status,
-            titles=titles_status,
-            title_changes=title_changes_status,
-            sanitized=sanitized_status,
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
         )
 
+    # Check status of all relevant files
+    original_markdown_status = await run_in_threadpool(
+        _check_file_status, work, "original_markdown"
+    )
+    titles_status = await run_in_threadpool(_check_file_status, work, "titles")
+    title_changes_status = await run_in_threadpool(
+        _check_file_status, work, "title_changes"
+    )
+    sanitized_status = await run_in_threadpool(_check_file_status, work, "sanitized")
+
+    return WorkDetailResponse(
+        id=work.id,
+        title=work.title,
+        authors=work.authors,
+        year=work.year,
+        work_type=work.work_type,
+        original_markdown=original_markdown_status,
+        titles=titles_status,
+        title_changes=title_changes_status,
+        sanitized=sanitized_status,
+    )
+
 
 @router.post(
     "/work/{work_id}/extract-titles",
@@ -554,55 +590,56 @@ async def save_manual_title_changes(
     summary="Get title changes file content",
     description="Retrieve the content of a work's title_changes file for viewing/editing.",
 )
-async def get_title_changes_content(work_id: int) -> TitleChangesContentResponse:
+async def get_title_changes_content(
+    work_id: int, session: AsyncDbSession
+) -> TitleChangesContentResponse:
     """
     Get the content of a work's title_changes file.
     
     Retrieves the raw markdown content from the title_changes file referenced
     in work.files["title_changes"].
     """
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        if not work.files or "title_changes" not in work.files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work {work_id} does not have a title_changes file"
-            )
-        
-        title_changes_info = work.files["title_changes"]
-        title_changes_path = Path(title_changes_info["path"])
-        
-        if not title_changes_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Title changes file not found on disk: {title_changes_path}"
-            )
-        
-        # Read file content
-        try:
-            content = title_changes_path.read_text(encoding="utf-8")
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to read title changes file: {str(e)}"
-            )
-        
-        # Get current hash
-        current_hash = compute_file_hash(title_changes_path)
-        
-        return TitleChangesContentResponse(
-            content=content,
-            filename=title_changes_path.name,
-            hash=current_hash
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
         )
 
+    if not work.files or "title_changes" not in work.files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work {work_id} does not have a title_changes file"
+        )
+
+    title_changes_info = work.files["title_changes"]
+    title_changes_path = Path(title_changes_info["path"])
+
+    if not title_changes_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Title changes file not found on disk: {title_changes_path}"
+        )
+
+    # Read file content
+    try:
+        content = await run_in_threadpool(title_changes_path.read_text, encoding="utf-8")
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to read title changes file: {str(e)}"
+        )
+
+    # Get current hash
+    current_hash = await run_in_threadpool(compute_file_hash, title_changes_path)
+
+    return TitleChangesContentResponse(
+        content=content,
+        filename=title_changes_path.name,
+        hash=current_hash
+    )
+
 
 @router.put(
     "/work/{work_id}/title-changes/content",
@@ -653,9 +690,9 @@ async def update_title_changes_content(
                 detail=f"Failed to make file writable: {str(e)}"
             )
         
-        # Write new content
+        # Write new content and compute new hash
         try:
-            title_changes_path.write_text(request.content, encoding="utf-8")
+            new_hash = write_text_atomic(title_changes_path, request.content)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -669,9 +706,6 @@ async def update_title_changes_content(
             # Not critical, log but continue
             print(f"Warning: Failed to set file read-only: {e}")
         
-        # Compute new hash
-        new_hash = compute_file_hash(title_changes_path)
-        
         # Update work.files with new hash
         updated_files = dict(work.files) if work.files else {}
         updated_files["title_changes"] = {
@@ -696,55 +730,56 @@ async def update_title_changes_content(
     summary="Get titles file content",
     description="Retrieve the content of a work's titles file for viewing/editing.",
 )
-async def get_titles_content(work_id: int) -> TitlesContentResponse:
+async def get_titles_content(
+    work_id: int, session: AsyncDbSession
+) -> TitlesContentResponse:
     """
     Get the content of a work's titles file.
     
     Retrieves the raw markdown content from the titles file referenced
     in work.files["titles"].
     """
-    with get_session() as session:
-        work = session.query(Work).filter(Work.id == work_id).first()
-        
-        if not work:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work with ID {work_id} not found"
-            )
-        
-        if not work.files or "titles" not in work.files:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Work {work_id} does not have a titles file"
-            )
-        
-        titles_info = work.files["titles"]
-        titles_path = Path(titles_info["path"])
-        
-        if not titles_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Titles file not found on disk: {titles_path}"
-            )
-        
-        # Read file content
-        try:
-            content = titles_path.read_text(encoding="utf-8")
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to read titles file: {str(e)}"
-            )
-        
-        # Get current hash
-        current_hash = compute_file_hash(titles_path)
-        
-        return TitlesContentResponse(
-            content=content,
-            filename=titles_path.name,
-            hash=current_hash
+    work = await session.get(Work, work_id)
+
+    if not work:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work with ID {work_id} not found"
+        )
+
+    if not work.files or "titles" not in work.files:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Work {work_id} does not have a titles file"
         )
 
+    titles_info = work.files["titles"]
+    titles_path = Path(titles_info["path"])
+
+    if not titles_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Titles file not found on disk: {titles_path}"
+        )
+
+    # Read file content
+    try:
+        content = await run_in_threadpool(titles_path.read_text, encoding="utf-8")
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to read titles file: {str(e)}"
+        )
+
+    # Get current hash
+    current_hash = await run_in_threadpool(compute_file_hash, titles_path)
+
+    return TitlesContentResponse(
+        content=content,
+        filename=titles_path.name,
+        hash=current_hash
+    )
+
 
 @router.put(
     "/work/{work_id}/titles/content",
@@ -795,9 +830,9 @@ async def update_titles_content(
                 detail=f"Failed to make file writable: {str(e)}"
             )
         
-        # Write new content
+        # Write new content and compute new hash
         try:
-            titles_path.write_text(request.content, encoding="utf-8")
+            new_hash = write_text_atomic(titles_path, request.content)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -811,9 +846,6 @@ async def update_titles_content(
             # Not critical, log but continue
             print(f"Warning: Failed to set file read-only: {e}")
         
-        # Compute new hash of the titles file
-        new_hash = compute_file_hash(titles_path)
-        
         # Update work.files with new hash
         # Must create a new dict to trigger SQLAlchemy's change detection for JSON columns
         updated_files = dict(work.files) if work.files else {}
@@ -878,11 +910,8 @@ async def add_sanitized_markdown(
                 detail=f"A file with this name already exists: {sanitized_path.name}"
             )
         
-        # Write the sanitized content
-        sanitized_path.write_text(request.content, encoding='utf-8')
-        
-        # Compute content hash
-        content_hash = compute_file_hash(sanitized_path)
+        # Write the sanitized content and compute content hash
+        content_hash = write_text_atomic(sanitized_path, request.content)
         
         # Set file to read-only
         set_file_readonly(sanitized_path)
@@ -969,7 +998,6 @@ async def get_title_changes_table(work_id: int) -> HeadingTableResponse:
     This provides complete document context for the interactive table editor.
     """
     from psychrag.sanitization.title_changes_interactive import get_title_changes_table_data
-    from psychrag.utils.file_utils import compute_file_hash
 
     try:
         # Get merged table data from module
@@ -1043,7 +1071,6 @@ async def update_title_changes_table(
     """
     from psychrag.sanitization.title_changes_interactive import reconstruct_title_changes_markdown
     from psychrag.utils.file_utils import (
-        compute_file_hash,
         set_file_writable,
         set_file_readonly,
         is_file_readonly
@@ -1105,15 +1132,12 @@ async def update_title_changes_table(
             if title_changes_path.exists() and is_file_readonly(title_changes_path):
                 set_file_writable(title_changes_path)
 
-            # Write content
-            title_changes_path.write_text(markdown_content, encoding='utf-8')
+            # Write content and compute new hash
+            new_hash = write_text_atomic(title_changes_path, markdown_content)
 
             # Set read-only
             set_file_readonly(title_changes_path)
 
-            # Compute new hash
-            new_hash = compute_file_hash(title_changes_path)
-
             # Update work.files metadata
             updated_files = dict(work.files) if work.files else {}
             updated_files[title_changes_key] = {
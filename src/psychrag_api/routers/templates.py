@@ -10,6 +10,7 @@ from sqlalchemy import desc
 from typing import List
 
 from psychrag.data.database import get_db_session
+from psychrag.data.template_loader import invalidate_template_cache
 from psychrag.data.models.prompt_template import PromptTemplate
 from psychrag.data.models.prompt_meta import PromptMeta
 from psychrag_api.schemas.templates import (
@@ -250,6 +251,9 @@ def update_template(
     session.commit()
     session.refresh(template)
 
+    # Content changed in place - drop cached compiled templates for this tag
+    invalidate_template_cache(function_tag)
+
     return template
 
 
@@ -299,4 +303,7 @@ def set_active_version(
     session.commit()
     session.refresh(target_template)
 
+    # Active version changed - next load_template() re-reads the database
+    invalidate_template_cache(function_tag)
+
     return target_template
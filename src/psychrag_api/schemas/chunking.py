@@ -24,6 +24,7 @@ class WorkListResponse(BaseModel):
     """Response for work listing."""
     works: list[WorkListItem] = Field(..., description="List of works with sanitized files")
     total: int = Field(..., description="Total number of works")
+    next_cursor: str | None = Field(None, description="Cursor for the next page, or None on the last page")
 
 
 # File Status Schema
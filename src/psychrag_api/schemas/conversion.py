@@ -2,6 +2,8 @@
 Pydantic schemas for Conversion router.
 """
 
+from typing import Literal, Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -45,6 +47,11 @@ class ConvertFileRequest(BaseModel):
         ...,
         description="Name of the file to convert (must exist in input directory)",
     )
+    engine: Optional[Literal["auto", "docling", "fast"]] = Field(
+        None,
+        description="PDF conversion engine (default: conversion.pdf_engine from config). "
+        "Ignored for EPUB files.",
+    )
 
 
 class ConvertFileResponse(BaseModel):
@@ -88,6 +95,90 @@ class ConvertFileResponse(BaseModel):
     )
 
 
+class ConvertBatchRequest(BaseModel):
+    """Request to convert every unprocessed file in the input folder."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "workers": 2,
+                "engine": "auto",
+                "retry_failed": False,
+            }
+        }
+    )
+
+    workers: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Worker processes (default: conversion.batch_workers from config)",
+    )
+    engine: Optional[Literal["auto", "docling", "fast"]] = Field(
+        None,
+        description="PDF conversion engine (default: conversion.pdf_engine from config)",
+    )
+    retry_failed: bool = Field(
+        False,
+        description="Retry files that failed in an earlier batch run",
+    )
+
+
+class BatchFileResultSchema(BaseModel):
+    """Outcome for one file of a batch conversion."""
+
+    filename: str = Field(..., description="Input filename")
+    status: Literal["converted", "failed", "skipped"] = Field(..., description="Conversion outcome")
+    size_bytes: int = Field(..., description="Input file size in bytes")
+    pages: Optional[int] = Field(None, description="Page count (PDFs only)")
+    seconds: float = Field(..., description="Conversion time in seconds")
+    pages_per_second: Optional[float] = Field(None, description="Conversion throughput (PDFs only)")
+    error: Optional[str] = Field(None, description="Error message if the conversion failed")
+    reason: Optional[str] = Field(None, description="Why the file was skipped")
+
+
+class ConvertBatchResponse(BaseModel):
+    """Response after a batch conversion."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "converted": 1,
+                "failed": 0,
+                "skipped": 1,
+                "workers": 2,
+                "seconds": 84.2,
+                "results": [
+                    {
+                        "filename": "memory_handbook.pdf",
+                        "status": "converted",
+                        "size_bytes": 18234112,
+                        "pages": 412,
+                        "seconds": 84.1,
+                        "pages_per_second": 4.9,
+                    },
+                    {
+                        "filename": "learning_theory.pdf",
+                        "status": "skipped",
+                        "size_bytes": 5120331,
+                        "seconds": 0.0,
+                        "reason": "already registered as a work",
+                    },
+                ],
+            }
+        }
+    )
+
+    converted: int = Field(..., description="Number of files converted")
+    failed: int = Field(..., description="Number of files that failed")
+    skipped: int = Field(..., description="Number of files skipped")
+    workers: int = Field(..., description="Worker processes used")
+    seconds: float = Field(..., description="Wall-clock time of the conversion phase")
+    results: list[BatchFileResultSchema] = Field(
+        default_factory=list,
+        description="Per-file results",
+    )
+
+
 class InspectionItemSchema(BaseModel):
     """Schema for a single inspection item."""
 
@@ -639,5 +730,54 @@ class ParseCitationResponse(BaseModel):
         default=None,
         description="Type of work",
     )
+    error: str | None = Field(
+        default=None,
+        description="Why parsing failed (bulk parsing only)",
+    )
+
+
+class ParseCitationsBatchRequest(BaseModel):
+    """Request to parse many citations with LLM."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "citation_text": "Friston, K. (2012). Prediction, perception and agency. International Journal of Psychophysiology, 83(2), 248-252.",
+                        "citation_format": "APA",
+                    },
+                    {
+                        "citation_text": "Clark, Andy. Surfing Uncertainty. Oxford University Press, 2016.",
+                        "citation_format": "MLA",
+                    },
+                ]
+            }
+        }
+    )
+
+    items: list[ParseCitationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Citations to parse; each may use its own format",
+    )
+
+
+class ParseCitationsBatchResponse(BaseModel):
+    """Response from bulk LLM citation parsing."""
+
+    results: list[ParseCitationResponse] = Field(
+        ...,
+        description="One result per requested citation, in request order",
+    )
+    parsed: int = Field(
+        ...,
+        description="Number of citations parsed successfully",
+    )
+    failed: int = Field(
+        ...,
+        description="Number of citations that could not be parsed",
+    )
 
 
@@ -107,7 +107,8 @@ class CorpusWorksResponse(BaseModel):
                         "sanitized_path": "c:\\output\\eysenck_cognitive.sanitized.md"
                     }
                 ],
-                "total": 1
+                "total": 1,
+                "next_cursor": None
             }
         }
     )
@@ -121,6 +122,10 @@ class CorpusWorksResponse(BaseModel):
         ge=0,
         description="Total number of works"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, or None on the last page"
+    )
 
 
 class CorpusWorkDetailResponse(BaseModel):
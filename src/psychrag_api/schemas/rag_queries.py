@@ -35,6 +35,9 @@ class QueryListResponse(BaseModel):
 
     queries: list[QueryListItem] = Field(..., description="List of queries")
     total: int = Field(..., description="Total number of queries")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or None on the last page"
+    )
 
 
 class QueryDetailResponse(BaseModel):
@@ -201,6 +204,9 @@ class AugmentPromptResponse(BaseModel):
     original_query: str = Field(..., description="The original query")
     prompt: str = Field(..., description="The generated augmented prompt")
     context_count: int = Field(..., description="Number of context items included")
+    prompt_tokens: int = Field(..., description="Tokens in the prompt")
+    context_tokens: int = Field(..., description="Tokens of the included context blocks")
+    token_budget: int = Field(..., description="Context token budget of the model (0 = no limit)")
 
 
 class AugmentRunRequest(BaseModel):
@@ -218,6 +224,7 @@ class AugmentRunResponse(BaseModel):
     query_id: int = Field(..., description="Query ID")
     result_id: int = Field(..., description="ID of the saved result")
     response_text: str = Field(..., description="The LLM response")
+    prompt_tokens: int = Field(..., description="Tokens in the prompt sent to the LLM")
     message: str = Field(..., description="Status message")
 
 
@@ -30,6 +30,9 @@ class WorkListResponse(BaseModel):
     works: list[WorkListItem] = Field(..., description="List of works")
     total: int = Field(..., description="Total number of works")
     needs_sanitization: int = Field(..., description="Number of works needing sanitization")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or None on the last page"
+    )
 
 
 class FileStatusInfo(BaseModel):
@@ -55,14 +55,14 @@ class LLMModelsConfigSchema(BaseModel):
 class LLMConfigSchema(BaseModel):
     """LLM configuration settings."""
 
-    provider: Literal["openai", "gemini"] = Field(description="Active LLM provider")
+    provider: Literal["openai", "gemini", "local"] = Field(description="Active LLM provider")
     models: LLMModelsConfigSchema
 
 
 class LLMConfigUpdateRequest(BaseModel):
     """Request to update LLM configuration."""
 
-    provider: Literal["openai", "gemini"] | None = Field(
+    provider: Literal["openai", "gemini", "local"] | None = Field(
         default=None, description="Active LLM provider"
     )
     openai_light: str | None = Field(default=None, description="OpenAI light model")
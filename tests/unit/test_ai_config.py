@@ -42,9 +42,10 @@ class TestLLMProvider:
     def test_enum_iteration(self):
         """Test that enum can be iterated."""
         providers = list(LLMProvider)
-        assert len(providers) == 2
+        assert len(providers) == 3
         assert LLMProvider.OPENAI in providers
         assert LLMProvider.GEMINI in providers
+        assert LLMProvider.LOCAL in providers
 
 
 class TestModelTier:
@@ -253,6 +254,20 @@ class TestLLMSettings:
             model = settings.get_model(ModelTier.FULL)
             assert model == "gemini-2.5-pro"
 
+    def test_get_model_local(self):
+        """Test get_model returns the local stand-in model names."""
+        with patch("psychrag.ai.config.load_config") as mock_load:
+            mock_config = MagicMock()
+            mock_config.llm.provider = "local"
+            mock_config.llm.models.local.light = "local-light"
+            mock_config.llm.models.local.full = "local-full"
+            mock_load.return_value = mock_config
+
+            settings = LLMSettings()
+            assert settings.provider == LLMProvider.LOCAL
+            assert settings.get_model(ModelTier.LIGHT) == "local-light"
+            assert settings.get_model(ModelTier.FULL) == "local-full"
+
     def test_get_model_default_tier(self):
         """Test get_model defaults to LIGHT tier."""
         with patch("psychrag.ai.config.load_config") as mock_load:
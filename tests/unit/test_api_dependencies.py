@@ -0,0 +1,35 @@
+"""
+Unit tests for psychrag_api.dependencies.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from psychrag.data.database import get_session
+from psychrag_api.dependencies import DbSession, request_session_scope
+
+
+@patch("psychrag.data.database.SessionLocal")
+def test_request_shares_one_session(mock_session_local):
+    """Test that endpoint, helpers and DbSession share the request session."""
+    mock_session = MagicMock()
+    mock_session_local.return_value = mock_session
+
+    app = FastAPI(dependencies=[Depends(request_session_scope)])
+
+    def helper():
+        with get_session() as session:
+            return session
+
+    @app.get("/shared")
+    async def shared(db: DbSession):
+        return {"same": helper() is db and helper() is db}
+
+    with TestClient(app) as client:
+        response = client.get("/shared")
+
+    assert response.json() == {"same": True}
+    mock_session_local.assert_called_once()
+    mock_session.close.assert_called_once()
@@ -0,0 +1,136 @@
+"""
+Unit tests for psychrag_api.pagination.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from psychrag.data.models.work import Work
+from psychrag_api.dependencies import CommonQueryParams
+from psychrag_api.pagination import decode_cursor, encode_cursor, fetch_page
+
+
+def _params(**kwargs) -> CommonQueryParams:
+    return CommonQueryParams(**kwargs)
+
+
+def _row(**values):
+    row = MagicMock()
+    row._mapping = values
+    return row
+
+
+def _session(rows, total):
+    session = MagicMock()
+    session.scalar = AsyncMock(return_value=total)
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+class TestCursor:
+    """Tests for cursor encoding and decoding."""
+
+    def test_round_trip_int(self):
+        cursor = encode_cursor("id", 42, 42)
+        assert decode_cursor(cursor, "id", Work.id) == (42, 42)
+
+    def test_round_trip_datetime(self):
+        ts = datetime(2025, 1, 2, 3, 4, 5)
+        cursor = encode_cursor("updated_at", ts, 7)
+        assert decode_cursor(cursor, "updated_at", Work.updated_at) == (ts, 7)
+
+    def test_rejects_garbage(self):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("not-a-cursor", "id", Work.id)
+        assert exc_info.value.status_code == 400
+
+    def test_rejects_other_sort_field(self):
+        cursor = encode_cursor("title", "Abc", 3)
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, "id", Work.id)
+        assert exc_info.value.status_code == 400
+
+
+class TestFetchPage:
+    """Tests for fetch_page()."""
+
+    def _run(self, session, params, default_order="desc"):
+        return asyncio.run(fetch_page(
+            session,
+            select(Work.id, Work.title),
+            params,
+            sortable={"id": Work.id, "title": Work.title},
+            id_column=Work.id,
+            default_sort="id",
+            default_order=default_order,
+        ))
+
+    def _executed_sql(self, session) -> str:
+        stmt = session.execute.call_args[0][0]
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_unlimited_returns_all_without_cursor(self):
+        rows = [_row(_page_sort_key=i, _page_sort_id=i) for i in (3, 2, 1)]
+        session = _session(rows, total=3)
+
+        page = self._run(session, _params())
+
+        assert page.rows == rows
+        assert page.total == 3
+        assert page.next_cursor is None
+        assert "LIMIT" not in self._executed_sql(session)
+
+    def test_limit_sets_next_cursor(self):
+        rows = [_row(_page_sort_key=i, _page_sort_id=i) for i in (5, 4, 3)]
+        session = _session(rows, total=5)
+
+        page = self._run(session, _params(limit=2))
+
+        assert page.rows == rows[:2]
+        assert page.total == 5
+        assert decode_cursor(page.next_cursor, "id", Work.id) == (4, 4)
+
+    def test_last_page_has_no_cursor(self):
+        rows = [_row(_page_sort_key=1, _page_sort_id=1)]
+        session = _session(rows, total=1)
+
+        page = self._run(session, _params(limit=2))
+
+        assert page.next_cursor is None
+
+    def test_cursor_adds_keyset_condition(self):
+        session = _session([], total=0)
+
+        self._run(session, _params(limit=2, cursor=encode_cursor("id", 4, 4)))
+
+        sql = self._executed_sql(session)
+        assert "(works.id, works.id) < (" in sql
+        assert "ORDER BY works.id DESC" in sql
+
+    def test_ascending_order(self):
+        session = _session([], total=0)
+
+        self._run(session, _params(
+            limit=2, sort="title", order="asc", cursor=encode_cursor("title", "B", 2)
+        ))
+
+        sql = self._executed_sql(session)
+        assert "(works.title, works.id) > (" in sql
+        assert "ORDER BY works.title ASC, works.id ASC" in sql
+
+    def test_invalid_sort_field(self):
+        session = _session([], total=0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._run(session, _params(sort="embedding"))
+
+        assert exc_info.value.status_code == 400
+        session.execute.assert_not_called()
@@ -8,6 +8,7 @@ Tests cover:
 - Error handling
 """
 
+import hashlib
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
@@ -304,11 +305,10 @@ Content here
 class TestApplyTitleChanges:
     """Tests for apply_title_changes function (legacy)."""
 
-    @patch('psychrag.sanitization.apply_title_changes.compute_file_hash')
     @patch('psychrag.sanitization.apply_title_changes.set_file_readonly')
     @patch('psychrag.sanitization.apply_title_changes.SessionLocal')
     def test_apply_title_changes_success(
-        self, mock_session_local, mock_set_readonly, mock_compute_hash, tmp_path
+        self, mock_session_local, mock_set_readonly, tmp_path
     ):
         """Test successful application of title changes."""
         # Setup mock database session
@@ -345,9 +345,6 @@ Even more content
 """
         changes_file.write_text(changes_content, encoding='utf-8')
 
-        # Mock hash computation
-        mock_compute_hash.return_value = "abc123hash"
-
         result_path = apply_title_changes(changes_file, work_id=1)
 
         # Verify sanitized file was created
@@ -366,7 +363,7 @@ Even more content
         assert "### Subsection" not in sanitized_content
 
         # Verify database was updated
-        assert mock_work.content_hash == "abc123hash"
+        assert mock_work.content_hash == hashlib.sha256(sanitized_path.read_bytes()).hexdigest()
         assert mock_work.markdown_path == str(sanitized_path.absolute())
         mock_session.commit.assert_called_once()
 
@@ -540,7 +537,7 @@ More content
         # Verify database was updated
         # session.refresh(work)  # Not needed with mocks as we modify the object in place
         assert "sanitized" in work.files
-        assert work.files["sanitized"]["hash"] == sanitized_hash
+        assert work.files["sanitized"]["hash"] == hashlib.sha256(output_path.read_bytes()).hexdigest()
         assert work.files["sanitized"]["path"] == str(output_path.resolve())
 
         # Verify file was set to read-only
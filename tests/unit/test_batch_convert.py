@@ -0,0 +1,161 @@
+"""
+Unit tests for batch_convert module.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from psychrag.conversions.batch_convert import (
+    STATE_FILENAME,
+    FileResult,
+    _convert_file,
+    convert_folder,
+    plan_batch,
+)
+
+
+def _write_pdf(path, pages=1, padding=0):
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page().insert_text((72, 72), "x" * padding)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def folders(tmp_path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+    output_dir.mkdir()
+    return input_dir, output_dir
+
+
+@pytest.fixture
+def thread_executor():
+    """Run batch workers in threads so mocks apply."""
+    with patch(
+        "psychrag.conversions.batch_convert.make_process_executor",
+        side_effect=lambda workers: ThreadPoolExecutor(workers),
+    ) as make_executor:
+        yield make_executor
+
+
+class TestPlanBatch:
+    """Tests for plan_batch."""
+
+    def test_largest_first(self, folders):
+        input_dir, output_dir = folders
+        _write_pdf(input_dir / "small.pdf")
+        _write_pdf(input_dir / "large.pdf", pages=20)
+        (input_dir / "book.epub").write_bytes(b"x" * 10)
+        (input_dir / "notes.txt").write_text("ignored")
+
+        todo, skipped = plan_batch(input_dir, output_dir, processed=set(), state={})
+
+        assert [p.name for p in todo] == ["large.pdf", "small.pdf", "book.epub"]
+        assert skipped == []
+
+    def test_skips_works_converted_and_failed(self, folders):
+        input_dir, output_dir = folders
+        for name in ("work.pdf", "done.pdf", "broken.pdf", "new.pdf"):
+            _write_pdf(input_dir / name)
+        for name in ("done.pdf", "done.style.md", "done.hier.md"):
+            (output_dir / name).write_text("x")
+        state = {"broken.pdf": {"status": "failed"}}
+
+        todo, skipped = plan_batch(input_dir, output_dir, {"work.pdf"}, state)
+
+        assert [p.name for p in todo] == ["new.pdf"]
+        assert {r.filename: r.reason for r in skipped} == {
+            "broken.pdf": "failed in an earlier run",
+            "done.pdf": "already converted",
+            "work.pdf": "already registered as a work",
+        }
+
+        todo, _ = plan_batch(input_dir, output_dir, {"work.pdf"}, state, retry_failed=True)
+        assert sorted(p.name for p in todo) == ["broken.pdf", "new.pdf"]
+
+
+class TestConvertFile:
+    """Tests for the _convert_file worker."""
+
+    @patch("psychrag.conversions.batch_convert.convert_pdf_to_markdown")
+    def test_reports_pages(self, mock_convert, folders):
+        input_dir, output_dir = folders
+        pdf = _write_pdf(input_dir / "book.pdf", pages=3)
+
+        result = _convert_file(str(pdf), str(output_dir), None, False)
+
+        assert result.status == "converted"
+        assert result.pages == 3
+        assert mock_convert.call_args.kwargs["workers"] == 1
+
+    @patch("psychrag.conversions.batch_convert.convert_pdf_to_markdown", side_effect=RuntimeError("boom"))
+    def test_failure_is_returned(self, mock_convert, folders):
+        input_dir, output_dir = folders
+        pdf = _write_pdf(input_dir / "book.pdf")
+
+        result = _convert_file(str(pdf), str(output_dir), None, False)
+
+        assert result.status == "failed"
+        assert result.error == "RuntimeError: boom"
+        assert result.pages_per_second is None
+
+    @patch("psychrag.conversions.batch_convert.convert_pdf_to_markdown")
+    def test_removes_copy_from_interrupted_run(self, mock_convert, folders):
+        input_dir, output_dir = folders
+        pdf = _write_pdf(input_dir / "book.pdf")
+        (output_dir / "book.pdf").write_bytes(pdf.read_bytes())
+
+        _convert_file(str(pdf), str(output_dir), None, False)
+
+        assert not (output_dir / "book.pdf").exists()
+
+
+class TestConvertFolder:
+    """Tests for convert_folder."""
+
+    def test_converts_and_records_state(self, folders, thread_executor):
+        input_dir, output_dir = folders
+        _write_pdf(input_dir / "a.pdf")
+        _write_pdf(input_dir / "b.pdf")
+        seen = []
+
+        def fake_convert(source, output_dir, engine, ocr):
+            if source.endswith("b.pdf"):
+                return FileResult("b.pdf", "failed", error="ValueError: bad")
+            return FileResult("a.pdf", "converted", pages=10, seconds=2.0)
+
+        with patch("psychrag.conversions.batch_convert._convert_file", side_effect=fake_convert):
+            report = convert_folder(
+                input_dir, output_dir, workers=4, processed=set(), on_result=seen.append
+            )
+
+        assert report.workers == 2
+        assert [r.filename for r in report.converted] == ["a.pdf"]
+        assert report.converted[0].pages_per_second == 5.0
+        assert [r.filename for r in report.failed] == ["b.pdf"]
+        assert len(seen) == 2
+
+        state = json.loads((output_dir / STATE_FILENAME).read_text())
+        assert state["a.pdf"]["status"] == "converted"
+        assert state["a.pdf"]["pages_per_second"] == 5.0
+        assert state["b.pdf"]["error"] == "ValueError: bad"
+
+    def test_resume_skips_failed(self, folders, thread_executor):
+        input_dir, output_dir = folders
+        _write_pdf(input_dir / "b.pdf")
+        (output_dir / STATE_FILENAME).write_text(json.dumps({"b.pdf": {"status": "failed"}}))
+
+        with patch("psychrag.conversions.batch_convert._convert_file") as mock_convert:
+            report = convert_folder(input_dir, output_dir, processed=set())
+
+        mock_convert.assert_not_called()
+        thread_executor.assert_not_called()
+        assert [r.reason for r in report.skipped] == ["failed in an earlier run"]
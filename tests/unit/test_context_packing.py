@@ -0,0 +1,151 @@
+"""
+Unit tests for context_packing module.
+
+Tests cover:
+- Trimming low-value tail lines
+- Filling the budget by score density, partial contexts and dropping
+- Per-model budgets from config
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from psychrag.augmentation import context_packing
+from psychrag.augmentation.context_packing import (
+    BLOCK_HEADER_TOKENS,
+    MIN_TAIL_WORDS,
+    get_context_budget,
+    pack_contexts,
+    trim_tail,
+)
+from psychrag.config import AppConfig
+from psychrag.utils import token_count
+from psychrag.utils.token_count import count_tokens
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens():
+    """Count tokens as ceil(chars / 4) so tests don't depend on tiktoken."""
+    token_count._encoding.cache_clear()
+    with patch.object(token_count, "TIKTOKEN_AVAILABLE", False):
+        yield
+    token_count._encoding.cache_clear()
+
+
+def _context(score, words, start_line=1, **extra):
+    lines = [" ".join(f"w{i}{j}" for j in range(10)) for i in range(words // 10)]
+    return {
+        "work_id": 1,
+        "score": score,
+        "content": "\n".join(lines),
+        "start_line": start_line,
+        "end_line": start_line + len(lines) - 1,
+        **extra,
+    }
+
+
+class TestTrimTail:
+    """Tests for trim_tail."""
+
+    def test_drops_structural_tail(self):
+        lines = [
+            "A paragraph about working memory capacity.",
+            "- Baddeley",
+            "",
+            "## Next Section",
+            "![figure](fig.png)",
+            "|---|---|",
+            "",
+        ]
+
+        assert trim_tail(lines) == lines[:2]
+
+    def test_short_fragments_dropped_only_with_min_words(self):
+        lines = ["A paragraph about working memory capacity.", "Yes.", "12", ""]
+
+        assert trim_tail(lines) == lines[:3]
+        assert trim_tail(lines, MIN_TAIL_WORDS) == lines[:1]
+
+    def test_keeps_first_line(self):
+        assert trim_tail(["# Heading", ""]) == ["# Heading"]
+
+
+class TestPackContexts:
+    """Tests for pack_contexts."""
+
+    def test_everything_fits(self):
+        contexts = [_context(0.9, 50), _context(0.5, 50)]
+
+        packed = pack_contexts(contexts, token_budget=10_000)
+
+        assert [c["score"] for c in packed.contexts] == [0.9, 0.5]
+        assert packed.dropped == 0
+        assert packed.context_tokens == sum(
+            BLOCK_HEADER_TOKENS + count_tokens(c["content"]) for c in contexts
+        )
+
+    def test_fills_budget_by_score_density(self):
+        best = _context(0.9, 100)
+        long_context = _context(0.8, 1000)
+        short_context = _context(0.6, 100)
+        budget = 2 * (BLOCK_HEADER_TOKENS + count_tokens(best["content"])) + 10
+
+        packed = pack_contexts([best, long_context, short_context], budget)
+
+        assert [c["score"] for c in packed.contexts] == [0.9, 0.6]
+        assert packed.dropped == 1
+        assert packed.context_tokens <= budget
+
+    def test_best_match_always_first_and_cut_to_fit(self):
+        contexts = [_context(0.9, 2000, start_line=10)]
+
+        packed = pack_contexts(contexts, token_budget=500)
+
+        assert packed.trimmed == 1
+        assert packed.context_tokens <= 500
+        kept = packed.contexts[0]
+        kept_lines = kept["content"].count("\n") + 1
+        assert contexts[0]["content"].startswith(kept["content"])
+        assert kept["end_line"] == 10 + kept_lines - 1
+
+    def test_too_small_remainder_dropped(self):
+        contexts = [_context(0.9, 100), _context(0.8, 1000)]
+        first_tokens = BLOCK_HEADER_TOKENS + count_tokens(contexts[0]["content"])
+
+        packed = pack_contexts(contexts, token_budget=first_tokens + 60)
+
+        assert len(packed.contexts) == 1
+        assert packed.dropped == 1
+
+    def test_no_limit_only_trims_tails(self):
+        context = _context(0.9, 30)
+        context["content"] += "\n\n## Dangling heading"
+
+        packed = pack_contexts([context], token_budget=0)
+
+        assert packed.token_budget == 0
+        assert "Dangling" not in packed.contexts[0]["content"]
+        assert packed.contexts[0]["end_line"] == context["end_line"] - 2
+
+    def test_input_not_modified(self):
+        context = _context(0.9, 2000)
+        original = dict(context)
+
+        pack_contexts([context], token_budget=300)
+
+        assert context == original
+
+
+class TestGetContextBudget:
+    """Tests for get_context_budget."""
+
+    def test_model_override_and_default(self):
+        config = AppConfig()
+        config.augmentation.context_token_budget = 8000
+        config.augmentation.model_token_budgets = {"gemini-2.5-pro": 24000}
+
+        with patch.object(context_packing, "load_config", return_value=config):
+            assert get_context_budget("gemini-2.5-pro") == 24000
+            assert get_context_budget("gpt-4o") == 8000
+            assert get_context_budget() == 8000
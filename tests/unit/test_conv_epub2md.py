@@ -3,12 +3,46 @@ Unit tests for conv_epub2md module.
 """
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from psychrag.conversions.conv_epub2md import convert_epub_to_markdown, main
+from ebooklib import epub
+
+from psychrag.conversions.conv_epub2md import _item_to_markdown, convert_epub_to_markdown, main
+
+
+@pytest.fixture
+def book_epub(tmp_path):
+    """Two-chapter EPUB with nested navigation, a link and an image."""
+    book = epub.EpubBook()
+    book.set_identifier("test-book")
+    book.set_title("Test Book")
+    book.set_language("en")
+
+    ch1 = epub.EpubHtml(title="Chapter 1", file_name="ch1.xhtml", lang="en")
+    ch1.content = (
+        "<html><body><h1>Chapter 1</h1><p>Chapter one text.</p>"
+        '<h2>Section 1.1</h2><p id="s11">Section text, <a href="ch2.xhtml">see the appendix</a>.</p>'
+        '<img src="cover.jpg" alt=""/></body></html>'
+    )
+    ch2 = epub.EpubHtml(title="Chapter 2", file_name="ch2.xhtml", lang="en")
+    ch2.content = "<html><body><h1>Chapter 2</h1><p>Chapter two text.</p></body></html>"
+    for chapter in (ch1, ch2):
+        book.add_item(chapter)
+
+    book.toc = [
+        (epub.Section("Chapter 1", href="ch1.xhtml"), [epub.Link("ch1.xhtml#s11", "Section 1.1", "s11")]),
+        epub.Link("ch2.xhtml", "Chapter 2", "ch2"),
+    ]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ["nav", ch1, ch2]
+
+    path = tmp_path / "book.epub"
+    epub.write_epub(str(path), book)
+    return path
 
 
 class TestConvertEpubToMarkdown:
@@ -28,130 +62,87 @@ class TestConvertEpubToMarkdown:
         with pytest.raises(ValueError, match="File must be an EPUB file"):
             convert_epub_to_markdown(txt_file)
 
-    @patch("psychrag.conversions.conv_epub2md._extract_epub_to_html")
-    @patch("psychrag.conversions.conv_epub2md.md")
-    def test_successful_conversion(self, mock_md, mock_extract, tmp_path):
+    def test_successful_conversion(self, book_epub):
         """Test successful EPUB to Markdown conversion."""
-        # Create mock EPUB file
-        epub_file = tmp_path / "test.epub"
-        epub_file.write_text("fake epub content")
-
-        # Setup mocks
-        mock_extract.return_value = "<html><body>Test</body></html>"
-        mock_md.return_value = "# Test Markdown"
-
-        # Run conversion
-        result = convert_epub_to_markdown(epub_file)
+        result = convert_epub_to_markdown(book_epub)
 
-        # Verify
-        assert result == "# Test Markdown"
-        mock_extract.assert_called_once_with(epub_file)
-        mock_md.assert_called_once()
+        assert "# Chapter 1" in result
+        assert "Chapter one text." in result
+        assert result.index("Chapter one text.") < result.index("Chapter two text.")
 
-    @patch("psychrag.conversions.conv_epub2md._extract_epub_to_html")
-    @patch("psychrag.conversions.conv_epub2md.md")
-    def test_output_file_created(self, mock_md, mock_extract, tmp_path):
+    def test_output_file_created(self, book_epub, tmp_path):
         """Test that output file is created when output_path is specified."""
-        # Create mock EPUB file
-        epub_file = tmp_path / "test.epub"
-        epub_file.write_text("fake epub content")
         output_file = tmp_path / "output" / "test.md"
 
-        # Setup mocks
-        mock_extract.return_value = "<html><body>Test</body></html>"
-        mock_md.return_value = "# Test Output"
-
-        # Run conversion
-        convert_epub_to_markdown(epub_file, output_path=output_file)
+        result = convert_epub_to_markdown(book_epub, output_path=output_file)
 
-        # Verify output file was created
-        assert output_file.exists()
-        assert output_file.read_text(encoding="utf-8") == "# Test Output"
+        assert result is None
+        assert output_file.read_text(encoding="utf-8") == convert_epub_to_markdown(book_epub)
+        assert (output_file.parent / book_epub.name).exists()
+        assert not list(output_file.parent.glob("*.tmp"))
 
-    @patch("psychrag.conversions.conv_epub2md._extract_epub_to_html")
-    @patch("psychrag.conversions.conv_epub2md.md")
-    def test_verbose_mode(self, mock_md, mock_extract, tmp_path, capsys):
+    def test_verbose_mode(self, book_epub, capsys):
         """Test verbose output."""
-        # Create mock EPUB file
-        epub_file = tmp_path / "test.epub"
-        epub_file.write_text("fake epub content")
-
-        # Setup mocks
-        mock_extract.return_value = "<html><body>Test</body></html>"
-        mock_md.return_value = "# Test"
+        convert_epub_to_markdown(book_epub, verbose=True)
 
-        # Run with verbose
-        convert_epub_to_markdown(epub_file, verbose=True)
-
-        # Check output
         captured = capsys.readouterr()
         assert "Converting:" in captured.out
 
-    @patch("psychrag.conversions.conv_epub2md._extract_epub_to_html")
-    @patch("psychrag.conversions.conv_epub2md.md")
-    def test_path_object_input(self, mock_md, mock_extract, tmp_path):
-        """Test that Path objects are accepted as input."""
-        epub_file = tmp_path / "test.epub"
-        epub_file.write_text("fake content")
+    def test_path_object_input(self, book_epub):
+        """Test that Path and str inputs are accepted."""
+        assert convert_epub_to_markdown(Path(book_epub)) == convert_epub_to_markdown(str(book_epub))
+
+    def test_hierarchy_preservation(self, book_epub):
+        """Test that the document's heading levels are kept."""
+        result = convert_epub_to_markdown(book_epub)
 
-        # Setup mocks
-        mock_extract.return_value = "<html><body>Test</body></html>"
-        mock_md.return_value = "# Test"
+        assert "# Chapter 1" in result
+        assert "## Section 1.1" in result
+        assert "# Chapter 2" in result
+        assert result.index("Chapter one text.") < result.index("## Section 1.1")
 
-        result = convert_epub_to_markdown(Path(epub_file))
-        assert isinstance(result, str)
+    def test_links_and_images_removed(self, book_epub):
+        """Test that links keep their text and images are dropped."""
+        result = convert_epub_to_markdown(book_epub)
 
-    @patch("psychrag.conversions.conv_epub2md._extract_epub_to_html")
-    @patch("psychrag.conversions.conv_epub2md.md")
-    def test_hierarchy_preservation(self, mock_md, mock_extract, tmp_path):
-        """Test that hierarchical structure is preserved in HTML extraction."""
-        # Create mock EPUB file
-        epub_file = tmp_path / "test.epub"
-        epub_file.write_text("fake epub content")
+        assert "see the appendix" in result
+        assert "](" not in result
+        assert "cover.jpg" not in result
 
-        # Setup mocks - simulate HTML with hierarchical headings
-        mock_html = """<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"><title>Test</title></head>
-<body>
-<h1>Chapter 1</h1>
-<p>Chapter 1 content</p>
-<h2>Section 1.1</h2>
-<p>Section content</p>
-<h3>Subsection 1.1.1</h3>
-<p>Subsection content</p>
-<h2>Section 1.2</h2>
-<p>More content</p>
-</body>
-</html>"""
-        mock_extract.return_value = mock_html
+    def test_parallel_matches_sequential(self, book_epub, monkeypatch):
+        """Test that worker-process conversion keeps item order and content."""
+        sequential = convert_epub_to_markdown(book_epub, workers=1)
 
-        # Simulate markdown output with hierarchy
-        mock_md.return_value = """# Chapter 1
+        monkeypatch.setattr("psychrag.conversions.conv_epub2md.PARALLEL_MIN_BYTES", 0)
+        with patch(
+            "psychrag.conversions.conv_epub2md.make_process_executor",
+            side_effect=lambda workers: ThreadPoolExecutor(workers),
+        ) as make_executor:
+            parallel = convert_epub_to_markdown(book_epub, workers=2)
 
-Chapter 1 content
+        make_executor.assert_called_once_with(2)
+        assert parallel == sequential
 
-## Section 1.1
 
-Section content
+class TestItemToMarkdown:
+    """Tests for _item_to_markdown."""
 
-### Subsection 1.1.1
+    def test_navigation_headings_injected(self):
+        """Test that navigation headings go before their anchor or at the start."""
+        content = b'<html><body><p>Intro.</p><p id="s1">Section text.</p></body></html>'
 
-Subsection content
+        result = _item_to_markdown(content, [(None, 1, "Chapter"), ("s1", 2, "Section")])
 
-## Section 1.2
+        assert result.startswith("# Chapter")
+        assert result.index("Intro.") < result.index("## Section") < result.index("Section text.")
 
-More content"""
+    def test_missing_anchor_goes_first(self):
+        content = b"<html><body><p>Text.</p></body></html>"
 
-        # Run conversion
-        result = convert_epub_to_markdown(epub_file)
+        assert _item_to_markdown(content, [("gone", 2, "Heading")]).startswith("## Heading")
 
-        # Verify hierarchy is reflected in the result
-        assert "# Chapter 1" in result
-        assert "## Section 1.1" in result
-        assert "### Subsection 1.1.1" in result
-        assert "## Section 1.2" in result
-        mock_extract.assert_called_once_with(epub_file)
+    def test_no_body(self):
+        assert _item_to_markdown(b"<?xml version='1.0'?><ncx/>", []) == ""
 
 
 class TestMain:
@@ -185,7 +176,8 @@ class TestMain:
         mock_convert.assert_called_once_with(
             epub_path="test.epub",
             output_path=str(output_file),
-            verbose=False
+            verbose=False,
+            workers=None
         )
 
     @patch("psychrag.conversions.conv_epub2md.convert_epub_to_markdown")
@@ -223,5 +215,6 @@ class TestMain:
         mock_convert.assert_called_once_with(
             epub_path="test.epub",
             output_path=None,
-            verbose=True
+            verbose=True,
+            workers=None
         )
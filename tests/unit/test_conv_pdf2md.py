@@ -7,7 +7,27 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from psychrag.conversions.conv_pdf2md import convert_pdf_to_markdown, main
+import fitz
+from docling.datamodel.document import ConversionResult
+from docling_core.types.doc.document import DoclingDocument
+
+from psychrag.conversions.conv_pdf2md import _copy_result, convert_pdf_to_markdown, main
+from psychrag.conversions.conversion_cache import ConversionCache
+from psychrag.conversions.converter_pool import ConverterPool
+
+
+@pytest.fixture(autouse=True)
+def fresh_converter_pool(monkeypatch):
+    """Give each test its own converter pool so mocked converters don't leak."""
+    pool = ConverterPool()
+    monkeypatch.setattr("psychrag.conversions.conv_pdf2md.get_converter_pool", lambda: pool)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def no_conversion_cache(monkeypatch):
+    """Disable the conversion cache unless a test installs one."""
+    monkeypatch.setattr("psychrag.conversions.conv_pdf2md.get_conversion_cache", lambda: None)
 
 
 class TestConvertPdfToMarkdown:
@@ -27,7 +47,7 @@ class TestConvertPdfToMarkdown:
         with pytest.raises(ValueError, match="File must be a PDF file"):
             convert_pdf_to_markdown(txt_file)
 
-    @patch("psychrag.conversions.conv_pdf2md.DocumentConverter")
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
     def test_successful_conversion(self, mock_converter_class, tmp_path):
         """Test successful PDF to Markdown conversion in compare mode (default)."""
         # Create mock PDF file
@@ -51,7 +71,7 @@ class TestConvertPdfToMarkdown:
         assert isinstance(style_md, str)
         assert isinstance(hier_md, str)
 
-    @patch("psychrag.conversions.conv_pdf2md.DocumentConverter")
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
     def test_output_file_created(self, mock_converter_class, tmp_path):
         """Test that output files are created when output_path is specified."""
         # Create mock PDF file
@@ -82,7 +102,7 @@ class TestConvertPdfToMarkdown:
         pdf_copy = output_file.parent / "test.pdf"
         assert pdf_copy.exists(), "PDF should be copied to output directory"
 
-    @patch("psychrag.conversions.conv_pdf2md.DocumentConverter")
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
     def test_verbose_mode(self, mock_converter_class, tmp_path, capsys):
         """Test verbose output."""
         # Create mock PDF file
@@ -103,7 +123,7 @@ class TestConvertPdfToMarkdown:
         captured = capsys.readouterr()
         assert "Converting:" in captured.out
 
-    @patch("psychrag.conversions.conv_pdf2md.DocumentConverter")
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
     def test_path_object_input(self, mock_converter_class, tmp_path):
         """Test that Path objects are accepted as input."""
         pdf_file = tmp_path / "test.pdf"
@@ -123,6 +143,236 @@ class TestConvertPdfToMarkdown:
         assert isinstance(style_md, str)
         assert isinstance(hier_md, str)
 
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    def test_compare_mode_converts_once(self, mock_converter_class, tmp_path):
+        """Test that compare mode runs docling a single time for both outputs."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("fake content")
+
+        mock_result = MagicMock()
+        mock_result.document.export_to_markdown.return_value = "# Test"
+        mock_converter_class.return_value.convert.return_value = mock_result
+
+        convert_pdf_to_markdown(pdf_file)
+
+        mock_converter_class.return_value.convert.assert_called_once_with(str(pdf_file))
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    def test_converter_reused_across_calls(self, mock_converter_class, tmp_path):
+        """Test that repeated conversions with the same options share one converter."""
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("fake content")
+
+        mock_result = MagicMock()
+        mock_result.document.export_to_markdown.return_value = "# Test"
+        mock_converter_class.return_value.convert.return_value = mock_result
+
+        convert_pdf_to_markdown(pdf_file)
+        convert_pdf_to_markdown(pdf_file, compare=False, hierarchical=False)
+        convert_pdf_to_markdown(pdf_file, ocr=True)
+
+        # Two distinct option sets -> two converters, three conversions
+        assert mock_converter_class.call_count == 2
+        assert mock_converter_class.return_value.convert.call_count == 3
+
+
+class TestEngineSelection:
+    """Tests for the engine parameter of convert_pdf_to_markdown."""
+
+    @pytest.fixture
+    def text_pdf(self, tmp_path):
+        doc = fitz.open()
+        for _ in range(2):
+            page = doc.new_page()
+            page.insert_text((72, 100), "Chapter One", fontsize=20, fontname="hebo")
+            page.insert_textbox(
+                fitz.Rect(72, 140, 540, 500),
+                "A born-digital page with a real text layer. " * 10,
+                fontsize=10,
+            )
+        path = tmp_path / "text.pdf"
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    def test_fast_engine_writes_outputs(self, mock_converter_class, text_pdf, tmp_path):
+        """Test that the fast engine produces the usual files without docling."""
+        output_file = tmp_path / "out" / "text.md"
+
+        style_md, hier_md = convert_pdf_to_markdown(
+            text_pdf, output_path=output_file, engine="fast"
+        )
+
+        mock_converter_class.assert_not_called()
+        assert "## Chapter One" in style_md
+        assert (output_file.parent / "text.style.md").read_text(encoding="utf-8") == style_md
+        assert (output_file.parent / "text.hier.md").read_text(encoding="utf-8") == hier_md
+        assert (output_file.parent / "text.pdf").exists()
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    def test_auto_picks_fast_for_text_pdf(self, mock_converter_class, text_pdf):
+        """Test that auto uses the fast engine for a born-digital PDF."""
+        result = convert_pdf_to_markdown(text_pdf, engine="auto", compare=False)
+
+        mock_converter_class.assert_not_called()
+        assert "Chapter One" in result
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    def test_auto_uses_docling_with_ocr(self, mock_converter_class, text_pdf):
+        """Test that requesting OCR always routes auto to docling."""
+        mock_result = MagicMock()
+        mock_result.document.export_to_markdown.return_value = "# Docling"
+        mock_converter_class.return_value.convert.return_value = mock_result
+
+        result = convert_pdf_to_markdown(text_pdf, engine="auto", ocr=True, compare=False)
+
+        assert result == "# Docling"
+        mock_converter_class.return_value.convert.assert_called_once()
+
+    def test_unknown_engine(self, text_pdf):
+        """Test that an unknown engine name is rejected."""
+        with pytest.raises(ValueError, match="Unknown PDF conversion engine"):
+            convert_pdf_to_markdown(text_pdf, engine="magic")
+
+
+class TestParallelRouting:
+    """Tests for routing long PDFs to page-range parallel conversion."""
+
+    @pytest.fixture
+    def pdf_file(self, tmp_path):
+        pdf_file = tmp_path / "book.pdf"
+        pdf_file.write_text("fake pdf content")
+        return pdf_file
+
+    @patch("psychrag.conversions.conv_pdf2md.convert_pdf_parallel")
+    @patch("psychrag.conversions.conv_pdf2md.get_page_count", return_value=800)
+    def test_long_pdf_converted_in_parallel(self, mock_count, mock_parallel, pdf_file):
+        """Test that a long PDF is split across workers."""
+        mock_parallel.return_value.document.export_to_markdown.return_value = "# Book"
+
+        result = convert_pdf_to_markdown(
+            pdf_file, engine="docling", compare=False, hierarchical=False, workers=3
+        )
+
+        assert result == "# Book"
+        assert mock_parallel.call_args.kwargs["workers"] == 3
+        assert mock_parallel.call_args.kwargs["page_count"] == 800
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    @patch("psychrag.conversions.conv_pdf2md.convert_pdf_parallel")
+    @patch("psychrag.conversions.conv_pdf2md.get_page_count", return_value=20)
+    def test_short_pdf_single_call(self, mock_count, mock_parallel, mock_converter_class, pdf_file):
+        """Test that short PDFs use one in-process docling call."""
+        mock_converter_class.return_value.convert.return_value.document.export_to_markdown.return_value = "# Short"
+
+        result = convert_pdf_to_markdown(
+            pdf_file, engine="docling", compare=False, hierarchical=False, workers=3
+        )
+
+        assert result == "# Short"
+        mock_parallel.assert_not_called()
+
+    @patch("psychrag.conversions.converter_pool.DocumentConverter")
+    @patch("psychrag.conversions.conv_pdf2md.convert_pdf_parallel")
+    @patch("psychrag.conversions.conv_pdf2md.get_page_count", return_value=800)
+    def test_single_worker_disables_parallel(self, mock_count, mock_parallel, mock_converter_class, pdf_file):
+        """Test that workers=1 never starts worker processes."""
+        mock_converter_class.return_value.convert.return_value.document.export_to_markdown.return_value = "# Book"
+
+        convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=False, workers=1)
+
+        mock_parallel.assert_not_called()
+        mock_count.assert_not_called()
+
+
+class TestConversionCaching:
+    """Tests for the conversion cache in convert_pdf_to_markdown."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        cache = ConversionCache(tmp_path / "cache")
+        monkeypatch.setattr("psychrag.conversions.conv_pdf2md.get_conversion_cache", lambda: cache)
+        return cache
+
+    @pytest.fixture
+    def pdf_file(self, tmp_path):
+        pdf_file = tmp_path / "book.pdf"
+        pdf_file.write_text("fake pdf content")
+        return pdf_file
+
+    @staticmethod
+    def _docling_result():
+        document = DoclingDocument(name="book")
+        document.add_heading("Chapter 1", level=1)
+        document.add_text(label="text", text="Body text.")
+        return ConversionResult.model_construct(document=document, pages=[])
+
+    @patch("psychrag.conversions.conv_pdf2md._apply_style_levels")
+    @patch("psychrag.conversions.conv_pdf2md._run_docling")
+    def test_second_conversion_uses_cached_markdown(
+        self, mock_run, mock_style, cache, pdf_file, tmp_path
+    ):
+        """Test that an unchanged PDF is not converted again."""
+        mock_run.return_value = self._docling_result()
+
+        first = convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=True)
+        output_file = tmp_path / "out" / "book.md"
+        second = convert_pdf_to_markdown(
+            pdf_file, output_path=output_file, engine="docling", compare=False, hierarchical=True
+        )
+
+        assert mock_run.call_count == 1
+        assert mock_style.call_count == 1
+        assert second == first
+        assert "Chapter 1" in second
+        assert output_file.read_text(encoding="utf-8") == first
+
+    @patch("psychrag.conversions.conv_pdf2md._apply_style_levels")
+    @patch("psychrag.conversions.conv_pdf2md._run_docling")
+    def test_postprocessing_change_reuses_document(
+        self, mock_run, mock_style, cache, pdf_file, monkeypatch
+    ):
+        """Test that new post-processing reruns on the cached document, not docling."""
+        mock_run.return_value = self._docling_result()
+
+        convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=True)
+        monkeypatch.setattr("psychrag.conversions.conv_pdf2md.POSTPROCESS_VERSION", 999)
+        result = convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=True)
+
+        assert mock_run.call_count == 1
+        assert mock_style.call_count == 2
+        assert "Chapter 1" in result
+
+    @patch("psychrag.conversions.conv_pdf2md._apply_style_levels")
+    @patch("psychrag.conversions.conv_pdf2md._run_docling")
+    def test_ocr_is_part_of_the_key(self, mock_run, mock_style, cache, pdf_file):
+        """Test that changing OCR converts again."""
+        mock_run.side_effect = lambda *args: self._docling_result()
+
+        convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=True)
+        convert_pdf_to_markdown(pdf_file, engine="docling", compare=False, hierarchical=True, ocr=True)
+
+        assert mock_run.call_count == 2
+
+
+class TestCopyResult:
+    """Tests for _copy_result."""
+
+    def test_document_is_independent(self):
+        """Test that edits to the copy's document do not affect the original."""
+        document = DoclingDocument(name="test")
+        document.add_heading("Chapter 1", level=1)
+        pages = []
+        result = ConversionResult.model_construct(document=document, pages=pages)
+
+        copy = _copy_result(result)
+        copy.document.texts[0].level = 3
+
+        assert result.document.texts[0].level == 1
+        assert copy.document is not result.document
+        assert copy.pages is result.pages
+
 
 class TestMain:
     """Tests for the main CLI function."""
@@ -164,7 +414,9 @@ class TestMain:
             ocr=False,
             hierarchical=True,  # NEW: default is True
             compare=True,       # NEW: default is True
-            use_gpu=True        # NEW: default is True
+            use_gpu=True,       # NEW: default is True
+            engine=None,
+            workers=None
         )
 
     @patch("psychrag.conversions.conv_pdf2md.convert_pdf_to_markdown")
@@ -207,5 +459,7 @@ class TestMain:
             ocr=False,
             hierarchical=True,  # NEW
             compare=True,       # NEW
-            use_gpu=True        # NEW
+            use_gpu=True,       # NEW
+            engine=None,
+            workers=None
         )
@@ -0,0 +1,164 @@
+"""
+Unit tests for conv_pdf2md_fast module.
+"""
+
+import fitz
+import pytest
+
+from psychrag.conversions.conv_pdf2md_fast import (
+    _join_lines,
+    convert_pdf_fast,
+    has_text_layer,
+)
+
+BODY = (
+    "Working memory holds a small amount of information in an active state "
+    "for use in ongoing tasks. It is distinct from long-term memory and has "
+    "a limited capacity that researchers have tried to measure for decades."
+)
+
+
+def _make_pdf(path, pages, toc=None):
+    """Write a PDF where each page is a list of (text, fontsize, fontname) lines."""
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        y = 100
+        for text, size, font in lines:
+            rect = fitz.Rect(72, y, 540, y + 200)
+            page.insert_textbox(rect, text, fontsize=size, fontname=font)
+            y += 30 + size * (len(text) // 70 + 1) * 1.3
+    if toc:
+        doc.set_toc(toc)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def book_pdf(tmp_path):
+    pages = [
+        [
+            ("Memory", 20, "hebo"),
+            (BODY, 10, "helv"),
+            ("Short-term stores", 14, "hebo"),
+            (BODY, 10, "helv"),
+        ],
+        [
+            ("Attention", 20, "hebo"),
+            (BODY, 10, "helv"),
+            (BODY, 10, "helv"),
+        ],
+    ]
+    toc = [
+        [1, "Memory", 1],
+        [2, "Short-term stores", 1],
+        [1, "Attention", 2],
+    ]
+    return _make_pdf(tmp_path / "book.pdf", pages, toc)
+
+
+class TestJoinLines:
+    """Tests for _join_lines."""
+
+    def test_repairs_hyphenation(self):
+        assert _join_lines(["a long wo-", "rd here"]) == "a long word here"
+
+    def test_keeps_hyphen_before_capital(self):
+        assert _join_lines(["non-", "Euclidean"]) == "non- Euclidean"
+
+
+class TestHasTextLayer:
+    """Tests for has_text_layer."""
+
+    def test_born_digital(self, book_pdf):
+        assert has_text_layer(book_pdf) is True
+
+    def test_image_only_pages(self, tmp_path):
+        pdf = _make_pdf(tmp_path / "scan.pdf", [[("p. 1", 10, "helv")]] * 3)
+        assert has_text_layer(pdf) is False
+
+    def test_unreadable_file(self, tmp_path):
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("not a pdf")
+        assert has_text_layer(bad) is False
+
+
+class TestConvertPdfFast:
+    """Tests for convert_pdf_fast."""
+
+    def test_style_headings_from_font_size(self, book_pdf):
+        style_md, _ = convert_pdf_fast(book_pdf)
+
+        assert "## Memory" in style_md
+        assert "### Short-term stores" in style_md
+        assert "## Attention" in style_md
+        assert "Working memory holds" in style_md
+
+    def test_hier_headings_from_bookmarks(self, tmp_path):
+        # Both subheadings share a font style, but the bookmarks nest them
+        pages = [[
+            ("Memory", 20, "hebo"),
+            ("Overview", 14, "hebo"),
+            (BODY, 10, "helv"),
+            ("Short-term stores", 14, "hebo"),
+            (BODY, 10, "helv"),
+        ]]
+        toc = [[1, "Memory", 1], [2, "Overview", 1], [3, "Short-term stores", 1]]
+        pdf = _make_pdf(tmp_path / "toc.pdf", pages, toc)
+
+        style_md, hier_md = convert_pdf_fast(pdf)
+
+        assert "### Short-term stores" in style_md
+        assert "## Memory" in hier_md
+        assert "### Overview" in hier_md
+        assert "#### Short-term stores" in hier_md
+
+    def test_unmatched_bookmarks_fall_back_to_style(self, tmp_path):
+        pages = [[
+            ("Memory", 20, "hebo"),
+            (BODY, 10, "helv"),
+            ("Short-term stores", 14, "hebo"),
+            (BODY, 10, "helv"),
+        ]]
+        # Only 2 of 4 bookmarks exist in the text
+        toc = [
+            [1, "Memory", 1],
+            [2, "Short-term stores", 1],
+            [2, "Iconic memory", 1],
+            [2, "Echoic memory", 1],
+        ]
+        pdf = _make_pdf(tmp_path / "toc.pdf", pages, toc)
+
+        style_md, hier_md = convert_pdf_fast(pdf)
+
+        assert hier_md == style_md
+
+    def test_no_bookmarks_uses_style(self, tmp_path):
+        pages = [[("Memory", 20, "hebo"), (BODY, 10, "helv")]]
+        pdf = _make_pdf(tmp_path / "plain.pdf", pages)
+
+        style_md, hier_md = convert_pdf_fast(pdf)
+
+        assert hier_md == style_md
+
+    def test_running_headers_removed(self, tmp_path):
+        doc = fitz.open()
+        for i in range(4):
+            page = doc.new_page()
+            page.insert_text((72, 30), "Journal of Examples", fontsize=9)
+            page.insert_textbox(fitz.Rect(72, 100, 540, 400), BODY, fontsize=10)
+            page.insert_text((300, page.rect.height - 20), str(i + 1), fontsize=9)
+        pdf = tmp_path / "headers.pdf"
+        doc.save(str(pdf))
+        doc.close()
+
+        style_md, _ = convert_pdf_fast(pdf)
+
+        assert "Journal of Examples" not in style_md
+        assert "\n\n2\n\n" not in style_md
+        assert style_md.count("Working memory holds") == 4
+
+    def test_file_not_found(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            convert_pdf_fast(tmp_path / "missing.pdf")
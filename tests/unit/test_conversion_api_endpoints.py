@@ -1,5 +1,6 @@
 """
-Unit tests for conversion API endpoints (file-content, suggestion, select-file).
+Unit tests for conversion API endpoints (file-content, suggestion, select-file, convert-batch,
+parse-citations-llm).
 """
 
 from pathlib import Path
@@ -9,16 +10,22 @@ import shutil
 import pytest
 from fastapi import HTTPException
 
+from psychrag.conversions.batch_convert import BatchReport, FileResult
 from psychrag_api.routers.conversion import (
+    convert_batch_endpoint,
     get_file_content,
     update_file_content,
     get_file_suggestion,
+    parse_citations_llm,
     select_file,
 )
 from psychrag_api.schemas.conversion import (
+    ConvertBatchRequest,
     FileContentUpdateRequest,
     FileSelectionRequest,
+    ParseCitationsBatchRequest,
 )
+from psychrag.utils.llm_citation_parser import Citation, CitationParseResult
 
 
 class TestGetFileContent:
@@ -119,7 +126,7 @@ class TestUpdateFileContent:
     @patch("psychrag_api.routers.conversion.load_config")
     @patch("psychrag_api.routers.conversion.extract_titles")
     @patch("psychrag.sanitization.apply_title_edits.Path.read_text")
-    @patch("pathlib.Path.write_text")
+    @patch("psychrag.sanitization.apply_title_edits.write_text_atomic")
     @patch("pathlib.Path.exists")
     async def test_update_file_success(
         self, mock_exists, mock_write_text, mock_read_text, mock_extract_titles, mock_load_config, mock_get_session
@@ -352,3 +359,81 @@ class TestSelectFile:
         assert exc_info.value.status_code == 400
         assert "already exists" in exc_info.value.detail
 
+
+class TestConvertBatch:
+    """Tests for convert_batch_endpoint."""
+
+    @pytest.mark.asyncio
+    @patch("psychrag_api.routers.conversion.convert_folder")
+    async def test_reports_per_file_results(self, mock_convert_folder):
+        """Test that per-file outcomes and throughput are returned."""
+        mock_convert_folder.return_value = BatchReport(
+            results=[
+                FileResult("old.pdf", "skipped", size_bytes=10, reason="already registered as a work"),
+                FileResult("book.pdf", "converted", size_bytes=100, pages=40, seconds=8.0),
+                FileResult("bad.pdf", "failed", size_bytes=50, seconds=1.0, error="ValueError: bad"),
+            ],
+            workers=2,
+            seconds=9.0,
+        )
+
+        response = await convert_batch_endpoint(ConvertBatchRequest(workers=2, retry_failed=True))
+
+        assert mock_convert_folder.call_args.kwargs == {
+            "workers": 2, "engine": None, "retry_failed": True
+        }
+        assert (response.converted, response.failed, response.skipped) == (1, 1, 1)
+        by_name = {r.filename: r for r in response.results}
+        assert by_name["book.pdf"].pages_per_second == 5.0
+        assert by_name["bad.pdf"].error == "ValueError: bad"
+
+    @pytest.mark.asyncio
+    @patch("psychrag_api.routers.conversion.convert_folder", side_effect=OSError("disk"))
+    async def test_batch_error_returns_500(self, mock_convert_folder):
+        """Test that a batch that cannot run raises 500."""
+        with pytest.raises(HTTPException) as exc_info:
+            await convert_batch_endpoint(ConvertBatchRequest())
+
+        assert exc_info.value.status_code == 500
+
+
+class TestParseCitationsLLM:
+    """Tests for parse_citations_llm bulk endpoint."""
+
+    @pytest.mark.asyncio
+    @patch("psychrag.utils.llm_citation_parser.parse_citations_with_llm")
+    async def test_grouped_by_format_in_request_order(self, mock_parse):
+        def parse(texts, citation_format):
+            return [
+                CitationParseResult(citation_text=text, citation=Citation(title=f"{citation_format}: {text}"))
+                if "bad" not in text else CitationParseResult(citation_text=text, error="unparseable")
+                for text in texts
+            ]
+
+        mock_parse.side_effect = parse
+        request = ParseCitationsBatchRequest(items=[
+            {"citation_text": "APA citation one", "citation_format": "APA"},
+            {"citation_text": "MLA citation one", "citation_format": "MLA"},
+            {"citation_text": "APA bad citation", "citation_format": "APA"},
+        ])
+
+        response = await parse_citations_llm(request)
+
+        assert mock_parse.call_count == 2
+        assert [r.title for r in response.results] == [
+            "APA: APA citation one", "MLA: MLA citation one", None,
+        ]
+        assert response.results[2].success is False
+        assert response.results[2].error == "unparseable"
+        assert (response.parsed, response.failed) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_format(self):
+        request = ParseCitationsBatchRequest(items=[
+            {"citation_text": "Some citation text", "citation_format": "Harvard"},
+        ])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await parse_citations_llm(request)
+
+        assert exc_info.value.status_code == 400
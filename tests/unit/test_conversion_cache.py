@@ -0,0 +1,100 @@
+"""
+Unit tests for conversion_cache module.
+"""
+
+from docling.datamodel.base_models import Cluster, LayoutPrediction, Page, PagePredictions
+from docling.datamodel.document import ConversionResult
+from docling_core.types.doc import BoundingBox, DocItemLabel, Size
+from docling_core.types.doc.document import DoclingDocument
+
+from psychrag.conversions.conversion_cache import (
+    CacheKey,
+    ConversionCache,
+    make_cache_key,
+)
+
+
+def _key(**overrides):
+    fields = {"source_sha256": "ab" * 32, "engine": "docling", "engine_version": "2.0", "ocr": False}
+    fields.update(overrides)
+    return CacheKey(**fields)
+
+
+def _result():
+    document = DoclingDocument(name="book")
+    document.add_heading("Chapter 1", level=1)
+    cluster = Cluster(
+        id=0, label=DocItemLabel.SECTION_HEADER, bbox=BoundingBox(l=10, t=10, r=200, b=30)
+    )
+    page = Page(
+        page_no=1,
+        size=Size(width=600, height=800),
+        predictions=PagePredictions(layout=LayoutPrediction(clusters=[cluster])),
+    )
+    return ConversionResult.model_construct(document=document, pages=[page])
+
+
+class TestCacheKey:
+    """Tests for CacheKey."""
+
+    def test_options_change_digest(self):
+        assert _key().digest() == _key().digest()
+        assert _key(ocr=True).digest() != _key().digest()
+        assert _key(engine_version="2.1").digest() != _key().digest()
+
+    def test_make_cache_key_hashes_source(self, tmp_path):
+        source = tmp_path / "book.pdf"
+        source.write_bytes(b"one")
+        first = make_cache_key(source)
+        source.write_bytes(b"two")
+
+        assert make_cache_key(source).source_sha256 != first.source_sha256
+
+
+class TestConversionCache:
+    """Tests for ConversionCache."""
+
+    def test_result_round_trip(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        assert cache.load_result(_key()) is None
+
+        cache.store_result(_key(), _result())
+        loaded = cache.load_result(_key())
+
+        assert loaded.document.export_to_markdown() == _result().document.export_to_markdown()
+        assert loaded.pages[0].page_no == 1
+        assert loaded.pages[0].size.height == 800
+        assert loaded.pages[0].predictions.layout.clusters[0].label == DocItemLabel.SECTION_HEADER
+        assert cache.load_result(_key(ocr=True)) is None
+
+    def test_markdown_requires_matching_fingerprint(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        cache.store_result(_key(), _result())
+
+        cache.store_markdown(_key(), "compare", "v1", {"style": "# S", "hier": "# H"})
+
+        assert cache.load_markdown(_key(), "compare", "v1") == {"style": "# S", "hier": "# H"}
+        assert cache.load_markdown(_key(), "compare", "v2") is None
+        assert cache.load_markdown(_key(), "style", "v1") is None
+
+    def test_markdown_not_stored_without_document(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+
+        cache.store_markdown(_key(), "style", "v1", {"markdown": "# S"})
+
+        assert cache.load_markdown(_key(), "style", "v1") is None
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        cache = ConversionCache(tmp_path)
+        cache.store_result(_key(), _result())
+        (cache.entry_dir(_key()) / "document.json.gz").write_bytes(b"corrupt")
+
+        assert cache.load_result(_key()) is None
+
+    def test_clear(self, tmp_path):
+        cache = ConversionCache(tmp_path / "cache")
+        cache.store_result(_key(), _result())
+
+        cache.clear()
+
+        assert cache.load_result(_key()) is None
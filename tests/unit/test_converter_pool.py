@@ -0,0 +1,251 @@
+"""
+Unit tests for converter_pool module.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
+
+from psychrag.conversions.converter_pool import (
+    ConverterKey,
+    ConverterPool,
+    build_pipeline_options,
+)
+
+
+class _GatedLock:
+    """Lock whose acquisition waits until `gate` is set."""
+
+    def __init__(self):
+        self.reached = threading.Event()
+        self.gate = threading.Event()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.reached.set()
+        self.gate.wait(5)
+        return self._lock.__enter__()
+
+    def __exit__(self, *exc):
+        return self._lock.__exit__(*exc)
+
+    def locked(self):
+        return self._lock.locked()
+
+
+@pytest.fixture
+def mock_converter_class():
+    with patch("psychrag.conversions.converter_pool.DocumentConverter") as mock_class:
+        mock_class.side_effect = lambda **kwargs: MagicMock()
+        yield mock_class
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic()."""
+    now = [1000.0]
+    with patch("psychrag.conversions.converter_pool.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestBuildPipelineOptions:
+    """Tests for build_pipeline_options."""
+
+    def test_gpu_batch_sizes(self):
+        options = build_pipeline_options(ConverterKey(ocr=True, layout_batch_size=8))
+        assert options.do_ocr is True
+        assert options.layout_batch_size == 8
+
+    def test_cpu_keeps_docling_defaults(self):
+        options = build_pipeline_options(ConverterKey(use_gpu=False, layout_batch_size=99))
+        defaults = ThreadedPdfPipelineOptions()
+        assert options.do_ocr is False
+        assert options.layout_batch_size == defaults.layout_batch_size
+        assert options.accelerator_options == defaults.accelerator_options
+
+
+class TestConverterPool:
+    """Tests for ConverterPool."""
+
+    def test_lazy_creation_and_reuse(self, mock_converter_class):
+        pool = ConverterPool()
+        assert mock_converter_class.call_count == 0
+
+        with pool.converter(ConverterKey()) as first:
+            first.initialize_pipeline.assert_called_once()
+        with pool.converter(ConverterKey()) as second:
+            pass
+
+        assert first is second
+        assert mock_converter_class.call_count == 1
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["converters"][0]["uses"] == 2
+
+    def test_distinct_keys_get_distinct_converters(self, mock_converter_class):
+        pool = ConverterPool()
+
+        with pool.converter(ConverterKey(ocr=False)) as plain:
+            pass
+        with pool.converter(ConverterKey(ocr=True)) as ocr:
+            pass
+
+        assert plain is not ocr
+        assert len(pool.stats()["converters"]) == 2
+
+    def test_lru_eviction_over_capacity(self, mock_converter_class, clock):
+        pool = ConverterPool(max_converters=1)
+
+        with pool.converter(ConverterKey(ocr=False)) as first:
+            pass
+        clock[0] += 1
+        with pool.converter(ConverterKey(ocr=True)):
+            pass
+        clock[0] += 1
+        with pool.converter(ConverterKey(ocr=False)) as again:
+            pass
+
+        assert again is not first
+        stats = pool.stats()
+        assert stats["evicted"] == 2
+        assert len(stats["converters"]) == 1
+
+    def test_idle_eviction(self, mock_converter_class, clock):
+        pool = ConverterPool(idle_timeout=60)
+        pool._start_sweeper_locked = lambda: None  # no background thread in tests
+
+        with pool.converter(ConverterKey()):
+            pass
+
+        clock[0] += 30
+        assert pool.evict_idle() == 0
+        clock[0] += 31
+        assert pool.evict_idle() == 1
+        assert pool.stats()["converters"] == []
+
+    def test_in_use_converter_is_not_evicted(self, mock_converter_class, clock):
+        pool = ConverterPool(idle_timeout=60)
+        pool._start_sweeper_locked = lambda: None
+
+        with pool.converter(ConverterKey()):
+            clock[0] += 120
+            assert pool.evict_idle() == 0
+            pool.clear()
+            assert len(pool.stats()["converters"]) == 1
+            assert pool.stats()["converters"][0]["in_use"] is True
+
+    def test_borrower_between_locks_keeps_entry(self, mock_converter_class, clock):
+        pool = ConverterPool(idle_timeout=60)
+        pool._start_sweeper_locked = lambda: None
+        key = ConverterKey()
+        with pool.converter(key):
+            pass
+        entry = pool._entries[key]
+        entry.lock = _GatedLock()
+        borrowed = []
+
+        def work():
+            with pool.converter(key) as converter:
+                borrowed.append(converter)
+
+        # The borrower has left the pool lock but not yet taken the entry lock
+        thread = threading.Thread(target=work)
+        thread.start()
+        assert entry.lock.reached.wait(5)
+
+        clock[0] += 120
+        assert pool.evict_idle() == 0
+        entry.lock.gate.set()
+        thread.join()
+
+        assert borrowed == [entry.converter]
+        assert pool.stats()["converters"][0]["in_use"] is False
+        clock[0] += 120
+        assert pool.evict_idle() == 1
+        assert mock_converter_class.call_count == 1
+
+    def test_load_does_not_block_pool(self, mock_converter_class):
+        pool = ConverterPool(max_converters=2)
+        pool._start_sweeper_locked = lambda: None
+        loaded = ConverterKey(ocr=False)
+        slow = ConverterKey(ocr=True)
+        with pool.converter(loaded):
+            pass
+        started = threading.Event()
+        release = threading.Event()
+
+        def load(**kwargs):
+            started.set()
+            release.wait(5)
+            return MagicMock()
+
+        def work():
+            with pool.converter(slow):
+                pass
+
+        mock_converter_class.side_effect = load
+        thread = threading.Thread(target=work)
+        thread.start()
+        assert started.wait(5)
+
+        # Neither stats nor another key's borrower waits for the load
+        assert pool.stats()["loading"] == 1
+        with pool.converter(loaded):
+            pass
+        release.set()
+        thread.join()
+
+        stats = pool.stats()
+        assert stats["loading"] == 0
+        assert stats["created"] == 2
+
+    def test_failed_load_releases_key(self, mock_converter_class):
+        pool = ConverterPool()
+        pool._start_sweeper_locked = lambda: None
+        mock_converter_class.side_effect = [RuntimeError("no models"), MagicMock()]
+
+        with pytest.raises(RuntimeError):
+            with pool.converter(ConverterKey()):
+                pass
+        with pool.converter(ConverterKey()):
+            pass
+
+        assert pool.stats()["created"] == 1
+
+    def test_same_key_is_used_exclusively(self, mock_converter_class):
+        pool = ConverterPool()
+        key = ConverterKey()
+        active = []
+        overlap = []
+
+        def work():
+            with pool.converter(key):
+                active.append(1)
+                if len(active) > 1:
+                    overlap.append(True)
+                threading.Event().wait(0.01)
+                active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert overlap == []
+        assert mock_converter_class.call_count == 1
+
+    def test_memory_accounting(self, mock_converter_class):
+        pool = ConverterPool()
+        with patch(
+            "psychrag.conversions.converter_pool._process_memory_bytes",
+            side_effect=[100, 100 + 50 * 2**20],
+        ):
+            with pool.converter(ConverterKey()):
+                pass
+
+        stats = pool.stats()
+        assert stats["converters"][0]["memory_bytes"] == 50 * 2**20
+        assert stats["memory_bytes"] == 50 * 2**20
@@ -2,17 +2,48 @@
 Unit tests for database module.
 """
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select, text, update
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from psychrag.data.database import (
     get_session,
+    get_async_session,
     get_admin_database_url,
+    get_pool_status,
+    session_scope,
+    engine,
+    async_engine,
+    InstrumentedQueuePool,
+    InstrumentedAsyncQueuePool,
     DATABASE_URL,
 )
 
 
+_TestBase = declarative_base()
+
+
+class _Item(_TestBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+@pytest.fixture
+def sqlite_sessions(tmp_path):
+    """Sessions on an instrumented SQLite pool, for checking connection release."""
+    sqlite_engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", poolclass=InstrumentedQueuePool
+    )
+    _TestBase.metadata.create_all(sqlite_engine)
+    with patch("psychrag.data.database.SessionLocal", sessionmaker(bind=sqlite_engine)):
+        yield sqlite_engine
+    sqlite_engine.dispose()
+
+
 class TestGetSession:
     """Tests for the get_session context manager."""
 
@@ -41,6 +72,188 @@ class TestGetSession:
         mock_session.close.assert_called_once()
 
 
+class TestGetAsyncSession:
+    """Tests for the get_async_session context manager."""
+
+    @pytest.mark.asyncio
+    @patch("psychrag.data.database.AsyncSessionLocal")
+    async def test_async_session_yields_and_closes(self, mock_session_local):
+        """Test that async session is yielded and closed properly."""
+        mock_session = AsyncMock()
+        mock_session_local.return_value = mock_session
+
+        async with get_async_session() as session:
+            assert session == mock_session
+
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("psychrag.data.database.AsyncSessionLocal")
+    async def test_async_session_rollback_on_exception(self, mock_session_local):
+        """Test that async session is rolled back on exception."""
+        mock_session = AsyncMock()
+        mock_session_local.return_value = mock_session
+
+        with pytest.raises(ValueError):
+            async with get_async_session():
+                raise ValueError("Test error")
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.close.assert_awaited_once()
+
+
+class TestSessionScope:
+    """Tests for the shared session scope."""
+
+    @patch("psychrag.data.database.SessionLocal")
+    def test_get_session_reuses_scoped_session(self, mock_session_local):
+        """Test that get_session yields the scoped session without closing it."""
+        mock_session = MagicMock()
+        mock_session_local.return_value = mock_session
+
+        with session_scope() as scoped:
+            with get_session() as first:
+                pass
+            with get_session() as second:
+                pass
+            assert first is scoped
+            assert second is scoped
+            mock_session.close.assert_not_called()
+
+        mock_session_local.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    @patch("psychrag.data.database.SessionLocal")
+    def test_scope_cleared_on_exit(self, mock_session_local):
+        """Test that sessions after the scope are independent again."""
+        mock_session_local.side_effect = [MagicMock(), MagicMock()]
+
+        with session_scope() as scoped:
+            pass
+        with get_session() as session:
+            assert session is not scoped
+
+    @patch("psychrag.data.database.SessionLocal")
+    def test_nested_scope_reuses_outer(self, mock_session_local):
+        """Test that a nested scope does not open a second session."""
+        with session_scope() as outer:
+            with session_scope() as inner:
+                assert inner is outer
+        mock_session_local.assert_called_once()
+
+    @patch("psychrag.data.database.SessionLocal")
+    def test_scope_rollback_on_exception(self, mock_session_local):
+        """Test that errors inside a scoped get_session roll back."""
+        mock_session = MagicMock()
+        mock_session_local.return_value = mock_session
+
+        with pytest.raises(ValueError):
+            with session_scope():
+                with get_session():
+                    raise ValueError("Test error")
+
+        mock_session.rollback.assert_called()
+        mock_session.close.assert_called_once()
+
+    def test_scoped_read_returns_connection(self, sqlite_sessions):
+        """Test that a read in a scoped get_session does not hold its connection."""
+        with session_scope():
+            with get_session() as session:
+                with get_session() as nested:
+                    nested.execute(text("SELECT 1"))
+                # Still inside the outermost block
+                assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 1
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 0
+            assert session.execute(text("SELECT count(*) FROM items")).scalar() == 0
+
+    def test_scoped_write_left_for_caller_commit(self, sqlite_sessions):
+        """Test that flushed writes keep their transaction until committed."""
+        with session_scope():
+            with get_session() as session:
+                session.add(_Item(name="a"))
+                session.flush()
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 1
+            session.commit()
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 0
+
+            with get_session() as session:
+                item = session.query(_Item).one()
+                assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 1
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 0
+            # Loaded objects are refreshed on next use
+            assert item.name == "a"
+
+    @pytest.mark.parametrize("write", [
+        lambda session: session.execute(update(_Item).values(name="b")),
+        lambda session: session.query(_Item).update({"name": "b"}),
+        lambda session: session.execute(text("UPDATE items SET name = 'b'")),
+        lambda session: session.execute(select(_Item).with_for_update()),
+    ])
+    def test_scoped_bulk_dml_left_for_caller_commit(self, sqlite_sessions, write):
+        """Test that writes without a flush are not committed on exit."""
+        with session_scope() as scoped:
+            scoped.add(_Item(name="a"))
+            scoped.commit()
+
+            with get_session() as session:
+                write(session)
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 1
+            session.rollback()
+
+            with get_session() as session:
+                assert session.query(_Item.name).scalar() == "a"
+
+    def test_nested_exception_keeps_scoped_writes(self, sqlite_sessions):
+        """Test that an error caught by a helper does not discard the request's writes."""
+        with session_scope():
+            with get_session() as session:
+                session.add(_Item(name="a"))
+                session.flush()
+                try:
+                    with get_session():
+                        raise ValueError("helper fallback")
+                except ValueError:
+                    pass
+                session.commit()
+
+            with get_session() as session:
+                assert session.query(_Item).count() == 1
+
+    def test_nested_exception_releases_read_transaction(self, sqlite_sessions):
+        """Test that an error in a read-only block still returns the connection."""
+        with session_scope():
+            with pytest.raises(ValueError):
+                with get_session() as session:
+                    session.execute(text("SELECT 1"))
+                    raise ValueError("Test error")
+            assert get_pool_status(sqlite_sessions.pool)["checked_out"] == 0
+
+
+class TestPoolStatus:
+    """Tests for connection pool configuration and metrics."""
+
+    def test_engine_uses_instrumented_pool(self):
+        """Test that the engine pool records checkout statistics."""
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        assert isinstance(async_engine.pool, InstrumentedAsyncQueuePool)
+
+    def test_pool_status_keys(self):
+        """Test that pool status reports usage and wait metrics."""
+        status = get_pool_status()
+        for key in (
+            "pool_size",
+            "checked_out",
+            "checked_in",
+            "overflow",
+            "max_overflow",
+            "total_checkouts",
+            "avg_wait_ms",
+            "max_wait_ms",
+        ):
+            assert key in status
+        assert status["checked_out"] == 0
+
+
 class TestDatabaseUrl:
     """Tests for database URL construction."""
 
@@ -12,6 +12,8 @@ Usage:
     pytest tests/unit/test_extract_titles.py -v
 """
 
+import hashlib
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -458,7 +460,7 @@ Content
         # Verify database was updated
         mock_session.refresh.assert_called_once_with(work)
         assert "titles" in work.files
-        assert work.files["titles"]["hash"] == titles_hash
+        assert work.files["titles"]["hash"] == hashlib.sha256(expected_path.read_bytes()).hexdigest()
 
         # Verify file was set to read-only
         mock_set_readonly.assert_called_once_with(expected_path)
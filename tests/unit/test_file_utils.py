@@ -0,0 +1,131 @@
+"""
+Unit tests for file utilities.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from psychrag.utils import file_utils
+from psychrag.utils.file_utils import (
+    compute_file_hash,
+    set_file_readonly,
+    write_bytes_atomic,
+    write_text_atomic,
+    write_text_chunks_atomic,
+)
+
+
+class TestWriteTextAtomic:
+    """Tests for write_text_atomic function."""
+
+    def test_returns_hash_of_written_file(self, tmp_path):
+        """Test that the returned hash matches a fresh hash of the file."""
+        path = tmp_path / "book.sanitized.md"
+
+        file_hash = write_text_atomic(path, "# Título\n\nContent\n")
+
+        assert path.read_text(encoding="utf-8") == "# Título\n\nContent\n"
+        assert file_hash == compute_file_hash(path)
+
+    def test_hash_across_chunks(self, tmp_path):
+        """Test content spanning several encode chunks, with multi-byte characters."""
+        path = tmp_path / "big.md"
+        content = "é line\n" * 1000
+
+        with patch.object(file_utils, "_WRITE_CHUNK_CHARS", 7 * 37):
+            file_hash = write_text_atomic(path, content)
+
+        assert path.read_text(encoding="utf-8") == content
+        assert file_hash == compute_file_hash(path)
+
+    def test_encoding_with_bom_written_once(self, tmp_path):
+        """Test that a stateful encoding is not restarted per chunk."""
+        path = tmp_path / "utf16.md"
+
+        with patch.object(file_utils, "_WRITE_CHUNK_CHARS", 3):
+            file_hash = write_text_atomic(path, "abcdefgh", encoding="utf-16")
+
+        assert path.read_bytes() == "abcdefgh".encode("utf-16")
+        assert file_hash == compute_file_hash(path)
+
+    def test_replaces_existing_file_keeping_mode(self, tmp_path):
+        """Test overwriting an existing file keeps its permission bits."""
+        path = tmp_path / "titles.md"
+        path.write_text("old", encoding="utf-8")
+        path.chmod(0o640)
+
+        write_text_atomic(path, "new")
+
+        assert path.read_text(encoding="utf-8") == "new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["titles.md"]
+
+    def test_readonly_file_rejected(self, tmp_path):
+        """Test that a read-only file is not overwritten."""
+        path = tmp_path / "titles.md"
+        path.write_text("old", encoding="utf-8")
+        set_file_readonly(path)
+
+        with pytest.raises(PermissionError):
+            write_text_atomic(path, "new")
+
+        assert path.read_text(encoding="utf-8") == "old"
+
+    def test_failed_write_leaves_original(self, tmp_path):
+        """Test that a failure before the rename leaves the target untouched."""
+        path = tmp_path / "titles.md"
+        path.write_text("old", encoding="utf-8")
+
+        with patch.object(file_utils.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_text_atomic(path, "new")
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["titles.md"]
+
+    @pytest.mark.skipif(os.linesep == "\n", reason="newline translation only on Windows")
+    def test_newlines_translated_like_write_text(self, tmp_path):
+        """Test that newlines are written as Path.write_text would."""
+        expected = tmp_path / "expected.md"
+        expected.write_text("a\nb\n", encoding="utf-8")
+
+        file_hash = write_text_atomic(tmp_path / "actual.md", "a\nb\n")
+
+        assert file_hash == compute_file_hash(expected)
+
+
+class TestWriteChunksAndBytesAtomic:
+    """Tests for write_text_chunks_atomic and write_bytes_atomic."""
+
+    def test_chunks_written_in_order(self, tmp_path):
+        path = tmp_path / "book.md"
+
+        file_hash = write_text_chunks_atomic(path, (f"part {i}\n" for i in range(3)))
+
+        assert path.read_text(encoding="utf-8") == "part 0\npart 1\npart 2\n"
+        assert file_hash == compute_file_hash(path)
+
+    def test_failing_producer_leaves_original(self, tmp_path):
+        path = tmp_path / "book.md"
+        path.write_text("old", encoding="utf-8")
+
+        def chunks():
+            yield "new"
+            raise RuntimeError("conversion failed")
+
+        with pytest.raises(RuntimeError):
+            write_text_chunks_atomic(path, chunks())
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["book.md"]
+
+    def test_bytes(self, tmp_path):
+        path = tmp_path / "pages.json.gz"
+
+        file_hash = write_bytes_atomic(path, b"\x1f\x8b data")
+
+        assert path.read_bytes() == b"\x1f\x8b data"
+        assert file_hash == compute_file_hash(path)
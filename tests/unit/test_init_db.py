@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from psychrag.data.init_db import (
+    create_corpus_indexes,
     create_database_and_user,
     create_tables,
     init_database,
@@ -71,6 +72,23 @@ class TestCreateTables:
         mock_base.metadata.create_all.assert_called_once_with(bind=mock_engine)
 
 
+class TestCreateCorpusIndexes:
+    """Tests for the create_corpus_indexes function."""
+
+    @patch("psychrag.data.init_db.engine")
+    def test_creates_partial_corpus_index(self, mock_engine):
+        """Test that the corpus partial index and chunk index are created."""
+        mock_conn = MagicMock()
+        mock_engine.connect.return_value.__enter__.return_value = mock_conn
+
+        create_corpus_indexes(verbose=True)
+
+        statements = [str(call.args[0]) for call in mock_conn.execute.call_args_list]
+        assert any("ix_works_corpus" in sql and "WHERE" in sql for sql in statements)
+        assert any("ix_chunks_work_id_vector_status" in sql for sql in statements)
+        mock_conn.commit.assert_called_once()
+
+
 class TestInitDatabase:
     """Tests for the init_database function."""
 
@@ -78,6 +96,7 @@ class TestInitDatabase:
     @patch("psychrag.data.init_db.seed_prompt_templates")
     @patch("psychrag.data.init_db.create_prompt_meta_table")
     @patch("psychrag.data.init_db.create_fulltext_search")
+    @patch("psychrag.data.init_db.create_corpus_indexes")
     @patch("psychrag.data.init_db.create_vector_indexes")
     @patch("psychrag.data.init_db.create_tables")
     @patch("psychrag.data.init_db.enable_pgvector_extension")
@@ -88,6 +107,7 @@ class TestInitDatabase:
         mock_enable_pgvector,
         mock_create_tables,
         mock_create_vector_indexes,
+        mock_create_corpus_indexes,
         mock_create_fulltext_search,
         mock_create_prompt_meta_table,
         mock_seed_prompt_templates,
@@ -100,6 +120,7 @@ class TestInitDatabase:
         mock_enable_pgvector.assert_called_once_with(verbose=True)
         mock_create_tables.assert_called_once_with(verbose=True)
         mock_create_vector_indexes.assert_called_once_with(verbose=True)
+        mock_create_corpus_indexes.assert_called_once_with(verbose=True)
         mock_create_fulltext_search.assert_called_once_with(verbose=True)
         mock_create_prompt_meta_table.assert_called_once_with(verbose=True)
         mock_seed_prompt_templates.assert_called_once_with(verbose=True)
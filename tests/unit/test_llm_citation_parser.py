@@ -27,7 +27,10 @@ from unittest.mock import Mock, patch
 
 from psychrag.utils.llm_citation_parser import (
     Citation,
+    CitationBatch,
     parse_citation_with_llm,
+    parse_citations_with_llm,
+    _build_batch_citation_prompt,
     _build_citation_prompt,
 )
 
@@ -141,6 +144,68 @@ class TestParseCitationWithLLM:
             parse_citation_with_llm("citation text", "INVALID")
 
 
+class TestParseCitationsWithLLM:
+    """Tests for parse_citations_with_llm batch function."""
+
+    @pytest.fixture
+    def mocks(self):
+        with patch("psychrag.ai.llm_factory.create_langchain_chat"), \
+             patch("psychrag.ai.response_cache.invoke_cached") as mock_invoke, \
+             patch("psychrag.utils.llm_citation_parser.parse_citation_with_llm") as mock_single:
+            yield mock_invoke, mock_single
+
+    def test_batched_with_per_item_fallback(self, mocks):
+        mock_invoke, mock_single = mocks
+        texts = ["Citation zero.", "Citation one.", "Citation two."]
+        mock_invoke.return_value = CitationBatch.model_validate({"citations": [
+            {"index": 0, "title": "Zero", "year": 2012},
+            {"index": 1, "title": "One", "year": 12},  # fails Citation validation
+            {"index": 7, "title": "Out of range"},
+        ]})
+        mock_single.side_effect = [Citation(title="One again"), ValueError("LLM citation parsing failed: x")]
+
+        results = parse_citations_with_llm(texts, "APA", settings=Mock())
+
+        assert mock_invoke.call_count == 1
+        assert mock_invoke.call_args.kwargs["schema"] is CitationBatch
+        assert [r.citation.title if r.citation else None for r in results] == ["Zero", "One again", None]
+        assert results[2].error == "LLM citation parsing failed: x"
+        assert [c.args[0] for c in mock_single.call_args_list] == ["Citation one.", "Citation two."]
+
+    def test_split_into_batches(self, mocks):
+        mock_invoke, mock_single = mocks
+        mock_invoke.side_effect = lambda chat, prompt, function, schema: CitationBatch.model_validate(
+            {"citations": [{"index": i, "title": f"T{i}"} for i in range(prompt.count("\n[") + 1)]}
+        )
+
+        results = parse_citations_with_llm([f"Citation {i}." for i in range(5)], "MLA", settings=Mock(), batch_size=2)
+
+        assert mock_invoke.call_count == 3
+        assert all(r.citation is not None for r in results)
+        mock_single.assert_not_called()
+
+    def test_failed_batch_falls_back_and_empty_items_skipped(self, mocks):
+        mock_invoke, mock_single = mocks
+        mock_invoke.side_effect = RuntimeError("rate limited")
+        mock_single.return_value = Citation(title="Alone")
+
+        results = parse_citations_with_llm(["Citation.", "  "], "Chicago", settings=Mock())
+
+        assert results[0].citation.title == "Alone"
+        assert results[1].error == "citation_text cannot be empty"
+        mock_single.assert_called_once()
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError, match="Unsupported citation format"):
+            parse_citations_with_llm(["citation"], "Harvard")
+
+    def test_batch_prompt_numbers_citations(self):
+        prompt = _build_batch_citation_prompt(["First.", "Second."], "APA")
+
+        assert "[0] First.\n[1] Second." in prompt
+        assert '"citations"' in prompt
+
+
 class TestIntegrationScenarios:
     """Integration test scenarios with realistic citations."""
     
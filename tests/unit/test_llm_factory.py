@@ -2,23 +2,38 @@
 Unit tests for LLM factory module.
 
 Tests factory functions for creating PydanticAI and LangChain instances,
-including lazy loading behavior, error handling, and mocking of external API calls.
+including lazy loading behavior, client caching, error handling, and mocking of
+external API calls.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
+from psychrag.ai import llm_factory
 from psychrag.ai.config import LLMProvider, LLMSettings, ModelTier
 from psychrag.ai.llm_factory import (
     LLMStack,
     LangChainStack,
     PydanticAIStack,
+    clear_client_cache,
     create_embeddings,
     create_langchain_chat,
     create_llm_stack,
     create_pydantic_agent,
 )
+from psychrag.ai.local_models import LocalChatModel, LocalHashEmbeddings
+from psychrag.config import AppConfig, LLMClientConfig
+
+
+@pytest.fixture(autouse=True)
+def client_config():
+    """Default client settings and an empty client cache for every test."""
+    config = LLMClientConfig()
+    clear_client_cache()
+    with patch.object(llm_factory, "_client_config", return_value=config):
+        yield config
+    clear_client_cache()
 
 
 class TestPydanticAIStack:
@@ -232,6 +247,9 @@ class TestCreateLangchainChat:
             model="gpt-4o-mini",
             api_key="sk-test123",
             temperature=0.2,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_openai.ChatOpenAI")
@@ -249,6 +267,9 @@ class TestCreateLangchainChat:
             model="gpt-4o",
             api_key="sk-test123",
             temperature=0.2,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_openai.ChatOpenAI")
@@ -264,6 +285,9 @@ class TestCreateLangchainChat:
             model="gpt-4o-mini",
             api_key="sk-test123",
             temperature=0.7,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_openai.ChatOpenAI")
@@ -312,6 +336,9 @@ class TestCreateLangchainChat:
             model="gemini-flash-latest",
             google_api_key="AIza-test456",
             temperature=0.2,
+            timeout=120.0,
+            max_retries=2,
+            client_args={"limits": ANY},
         )
 
     @patch("langchain_google_genai.ChatGoogleGenerativeAI")
@@ -329,6 +356,9 @@ class TestCreateLangchainChat:
             model="gemini-2.5-pro",
             google_api_key="AIza-test456",
             temperature=0.2,
+            timeout=120.0,
+            max_retries=2,
+            client_args={"limits": ANY},
         )
 
     @patch("langchain_google_genai.ChatGoogleGenerativeAI")
@@ -344,6 +374,9 @@ class TestCreateLangchainChat:
             model="gemini-flash-latest",
             google_api_key="AIza-test456",
             temperature=0.5,
+            timeout=120.0,
+            max_retries=2,
+            client_args={"limits": ANY},
         )
 
     @patch("langchain_google_genai.ChatGoogleGenerativeAI")
@@ -416,6 +449,9 @@ class TestCreateEmbeddings:
         mock_embeddings_class.assert_called_once_with(
             model="text-embedding-3-small",
             api_key="sk-test123",
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_openai.OpenAIEmbeddings")
@@ -437,6 +473,9 @@ class TestCreateEmbeddings:
         mock_embeddings_class.assert_called_once_with(
             model="text-embedding-3-small",
             api_key="sk-default",
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_google_genai.GoogleGenerativeAIEmbeddings")
@@ -451,6 +490,7 @@ class TestCreateEmbeddings:
         mock_embeddings_class.assert_called_once_with(
             model="models/text-embedding-004",
             google_api_key="AIza-test456",
+            client_args={"limits": ANY, "timeout": 120.0},
         )
 
     @patch("langchain_google_genai.GoogleGenerativeAIEmbeddings")
@@ -472,6 +512,7 @@ class TestCreateEmbeddings:
         mock_embeddings_class.assert_called_once_with(
             model="models/text-embedding-004",
             google_api_key="AIza-default",
+            client_args={"limits": ANY, "timeout": 120.0},
         )
 
     def test_create_embeddings_unsupported_provider(self, mock_settings_openai):
@@ -825,6 +866,9 @@ class TestErrorHandling:
             model="gpt-4o-mini",
             api_key="",
             temperature=0.2,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("langchain_openai.ChatOpenAI")
@@ -845,6 +889,9 @@ class TestErrorHandling:
             model="gpt-4o-mini",
             api_key="sk-test",
             temperature=0.0,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
         
         # Test maximum temperature
@@ -854,6 +901,9 @@ class TestErrorHandling:
             model="gpt-4o-mini",
             api_key="sk-test",
             temperature=2.0,
+            timeout=120.0,
+            max_retries=2,
+            http_client=ANY,
         )
 
     @patch("pydantic_ai.Agent")
@@ -997,6 +1047,7 @@ class TestErrorHandling:
         mock_embeddings_class.assert_called_once_with(
             model="models/text-embedding-004",
             google_api_key="",
+            client_args={"limits": ANY, "timeout": 120.0},
         )
 
     @patch("psychrag.ai.llm_factory.create_langchain_chat")
@@ -1031,3 +1082,140 @@ class TestErrorHandling:
         # Pydantic should be called before LangChain fails
         mock_pydantic_func.assert_called_once()
 
+
+
+class TestClientCache:
+    """Tests for reuse of chat and embedding clients."""
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock(spec=LLMSettings)
+        settings.provider = LLMProvider.OPENAI
+        settings.openai_api_key = "sk-test123"
+        settings.get_model.return_value = "gpt-4o-mini"
+        return settings
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_chat_reused_per_model_and_temperature(self, mock_chat_class, settings):
+        mock_chat_class.side_effect = lambda **kwargs: MagicMock()
+
+        first = create_langchain_chat(settings).chat
+        second = create_langchain_chat(settings).chat
+        warmer = create_langchain_chat(settings, temperature=0.7).chat
+
+        assert first is second
+        assert warmer is not first
+        assert mock_chat_class.call_count == 2
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_different_api_key_gets_new_client(self, mock_chat_class, settings):
+        mock_chat_class.side_effect = lambda **kwargs: MagicMock()
+        first = create_langchain_chat(settings).chat
+
+        settings.openai_api_key = "sk-other"
+        second = create_langchain_chat(settings).chat
+
+        assert first is not second
+
+    @patch("langchain_openai.OpenAIEmbeddings")
+    @patch("langchain_openai.ChatOpenAI")
+    def test_openai_clients_share_http_pool(self, mock_chat_class, mock_embeddings_class, settings):
+        create_langchain_chat(settings)
+        create_langchain_chat(settings, tier=ModelTier.FULL, temperature=0.0)
+        create_embeddings(settings)
+
+        pools = [call.kwargs["http_client"] for call in mock_chat_class.call_args_list]
+        pools.append(mock_embeddings_class.call_args.kwargs["http_client"])
+        assert len({id(pool) for pool in pools}) == 1
+        assert pools[0].timeout.read == 120.0
+
+    @patch("langchain_openai.OpenAIEmbeddings")
+    def test_embeddings_reused(self, mock_embeddings_class, settings):
+        mock_embeddings_class.side_effect = lambda **kwargs: MagicMock()
+
+        assert create_embeddings(settings) is create_embeddings(settings)
+        mock_embeddings_class.assert_called_once()
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_cache_disabled_builds_each_call(self, mock_chat_class, settings, client_config):
+        client_config.cache_clients = False
+
+        create_langchain_chat(settings)
+        create_langchain_chat(settings)
+
+        assert mock_chat_class.call_count == 2
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_config_change_gets_new_client(self, mock_chat_class, settings, client_config):
+        mock_chat_class.side_effect = lambda **kwargs: MagicMock()
+        first = create_langchain_chat(settings).chat
+
+        client_config.timeout = 30.0
+        second = create_langchain_chat(settings).chat
+
+        assert first is not second
+        assert mock_chat_class.call_args.kwargs["timeout"] == 30.0
+
+    @patch("langchain_openai.ChatOpenAI")
+    @patch("psychrag.ai.llm_factory.LLMSettings")
+    def test_default_settings_loaded_once(self, mock_settings_class, mock_chat_class, settings):
+        mock_settings_class.return_value = settings
+
+        create_langchain_chat()
+        create_embeddings()
+        create_langchain_chat()
+
+        mock_settings_class.assert_called_once()
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_clear_client_cache(self, mock_chat_class, settings):
+        mock_chat_class.side_effect = lambda **kwargs: MagicMock()
+        first = create_langchain_chat(settings).chat
+
+        clear_client_cache()
+
+        assert create_langchain_chat(settings).chat is not first
+
+
+class TestLocalProvider:
+    """Tests for the offline "local" provider."""
+
+    @pytest.fixture
+    def app_config(self):
+        config = AppConfig()
+        config.llm.local.tokens_per_second = 40.0
+        with patch.object(llm_factory, "load_config", return_value=config):
+            yield config
+
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock(spec=LLMSettings)
+        settings.provider = LLMProvider.LOCAL
+        settings.get_model.return_value = "local-light"
+        return settings
+
+    def test_chat_uses_local_settings(self, settings, app_config):
+        chat = create_langchain_chat(settings, temperature=0.0).chat
+
+        assert isinstance(chat, LocalChatModel)
+        assert chat.model_name == "local-light"
+        assert chat.tokens_per_second == 40.0
+        assert create_langchain_chat(settings, temperature=0.0).chat is chat
+
+    def test_local_config_change_gets_new_client(self, settings, app_config):
+        first = create_langchain_chat(settings).chat
+
+        app_config.llm.local.seed = 7
+
+        assert create_langchain_chat(settings).chat is not first
+
+    def test_embeddings(self, settings, app_config):
+        embeddings = create_embeddings(settings)
+
+        assert isinstance(embeddings, LocalHashEmbeddings)
+        assert len(embeddings.embed_query("working memory")) == 768
+
+    def test_pydantic_agent_uses_test_model(self, settings):
+        agent = create_pydantic_agent(settings).agent
+
+        assert agent.run_sync("Hello").output
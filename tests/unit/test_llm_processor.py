@@ -16,12 +16,28 @@ import json
 
 from psychrag.chunking.llm_processor import (
     _build_prompt,
+    _outline,
+    merge_results,
     process_with_llm,
+    split_windows,
     TOCEntry,
     BibliographicInfo,
     LLMProcessResult,
     MAX_LINES_DEFAULT,
 )
+from psychrag.utils import token_count
+from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import build_markdown_index
+from psychrag.utils.token_count import count_tokens
+
+
+@pytest.fixture
+def estimated_tokens():
+    """Count tokens as ceil(chars / 4) so tests don't depend on tiktoken."""
+    token_count._encoding.cache_clear()
+    with patch.object(token_count, "TIKTOKEN_AVAILABLE", False):
+        yield
+    token_count._encoding.cache_clear()
 
 
 class TestBuildPrompt:
@@ -174,17 +190,17 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_success(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test successful LLM processing."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         # Mock database session
         mock_session = MagicMock()
@@ -251,9 +267,9 @@ class TestProcessWithLLM:
             
             with patch('psychrag.chunking.llm_processor.SessionLocal') as mock_session_local, \
                  patch('psychrag.chunking.llm_processor.set_file_readonly'), \
-                 patch('psychrag.chunking.llm_processor.compute_file_hash') as mock_compute_hash:
+                 patch('psychrag.chunking.llm_processor.write_text_atomic') as mock_write_atomic:
                 
-                mock_compute_hash.return_value = "test_hash"
+                mock_write_atomic.return_value = "test_hash"
                 mock_session = MagicMock()
                 mock_work = MagicMock()
                 mock_work.id = 1
@@ -267,16 +283,16 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_json_in_code_block(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack
     ):
         """Test parsing JSON response wrapped in markdown code block."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         json_data = {
             "bibliographic": {"title": "Test Book"},
@@ -304,16 +320,16 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_malformed_json(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack
     ):
         """Test handling of malformed JSON response."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         response = Mock()
         response.content = "This is not valid JSON {"
@@ -341,16 +357,16 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_response_as_list(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack
     ):
         """Test handling when response.content is a list."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         json_data = {
             "bibliographic": {"title": "Test Book"},
@@ -378,16 +394,16 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_response_as_dict(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack
     ):
         """Test handling when response.content is already a dict."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         json_data = {
             "bibliographic": {"title": "Test Book"},
@@ -415,16 +431,16 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_missing_fields(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack
     ):
         """Test handling when JSON response is missing some fields."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         # Missing bibliographic and toc fields
         json_data = {
@@ -453,10 +469,10 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_custom_settings(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test processing with custom LLM settings."""
@@ -465,7 +481,7 @@ class TestProcessWithLLM:
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         mock_settings = MagicMock(spec=LLMSettings)
         
@@ -491,10 +507,10 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_custom_tier(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test processing with custom model tier."""
@@ -503,7 +519,7 @@ class TestProcessWithLLM:
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         mock_session = MagicMock()
         mock_work = MagicMock()
@@ -527,10 +543,10 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_default_tier(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test that default tier is FULL."""
@@ -539,7 +555,7 @@ class TestProcessWithLLM:
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         mock_session = MagicMock()
         mock_work = MagicMock()
@@ -563,17 +579,15 @@ class TestProcessWithLLM:
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_saves_sanitized_file(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test that sanitized file is saved correctly."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
         
         mock_session = MagicMock()
         mock_work = MagicMock()
@@ -597,20 +611,22 @@ class TestProcessWithLLM:
                 assert sanitized_file.exists()
                 assert sanitized_file.read_text(encoding='utf-8') == "# Test Book\n\nSanitized content"
                 mock_set_readonly.assert_called_once_with(sanitized_file)
+                work_call = mock_session.add.call_args[0][0]
+                assert work_call.content_hash == compute_file_hash(sanitized_file)
 
     @patch('psychrag.chunking.llm_processor.SessionLocal')
     @patch('psychrag.chunking.llm_processor.set_file_readonly')
-    @patch('psychrag.chunking.llm_processor.compute_file_hash')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
     @patch('psychrag.ai.create_langchain_chat')
     def test_process_with_llm_creates_database_entry(
-        self, mock_create_chat, mock_compute_hash, mock_set_readonly,
+        self, mock_create_chat, mock_write_atomic, mock_set_readonly,
         mock_session_local, mock_langchain_stack, mock_langchain_response
     ):
         """Test that database entry is created correctly."""
         mock_stack, mock_chat = mock_langchain_stack
         mock_create_chat.return_value = mock_stack
         mock_chat.invoke.return_value = mock_langchain_response
-        mock_compute_hash.return_value = "test_hash"
+        mock_write_atomic.return_value = "test_hash"
         
         mock_session = MagicMock()
         mock_work = MagicMock()
@@ -636,3 +652,166 @@ class TestProcessWithLLM:
                 assert work_call.year == 2024
                 mock_session.commit.assert_called_once()
 
+
+def _window_response(markdown, title=None, authors=(), toc=()):
+    response = Mock()
+    response.content = json.dumps({
+        "bibliographic": {"title": title, "authors": list(authors)},
+        "sanitized_markdown": markdown,
+        "toc": [{"level": level, "title": text} for level, text in toc],
+    })
+    return response
+
+
+@pytest.mark.usefixtures("estimated_tokens")
+class TestSplitWindows:
+    """Tests for split_windows()."""
+
+    def test_small_document_single_window(self):
+        content = "# Title\n\nText.\n\n## Section\n\nMore text."
+
+        assert split_windows(content, window_tokens=1000) == [content]
+
+    def test_windows_start_at_headings(self):
+        sections = [f"## Section {i}\n\n" + "word " * 60 for i in range(6)]
+        content = "\n".join(sections)
+
+        windows = split_windows(content, window_tokens=200)
+
+        assert len(windows) > 1
+        assert all(window.startswith("## Section") for window in windows)
+        assert "\n".join(windows) == content
+
+    def test_oversized_section_split_at_blank_lines(self):
+        paragraphs = ["sentence " * 40 for _ in range(10)]
+        content = "## Long\n\n" + "\n\n".join(paragraphs)
+
+        windows = split_windows(content, window_tokens=200)
+
+        assert len(windows) > 1
+        assert "\n".join(windows) == content
+        for window in windows[1:]:
+            assert window.startswith("sentence")
+
+
+@pytest.mark.usefixtures("estimated_tokens")
+class TestOutline:
+    """Tests for the window prompt outline."""
+
+    def _headings(self, content):
+        return build_markdown_index(content).headings
+
+    def test_all_levels_when_small(self):
+        content = "# Book\n## One\n### Detail\n## Two\n"
+
+        assert _outline(self._headings(content)) == ["# Book", "## One", "### Detail", "## Two"]
+
+    def test_drops_deep_levels_to_fit(self):
+        chapters = "".join(
+            f"# Chapter {i}\n" + "".join(f"## Section {i}.{j}\n" for j in range(50))
+            for i in range(10)
+        )
+
+        outline = _outline(self._headings(chapters), max_tokens=200)
+
+        assert outline == [f"# Chapter {i}" for i in range(10)]
+
+    def test_top_level_cut_to_budget(self):
+        chapters = "".join(f"# Chapter {i}\n" for i in range(1000))
+
+        outline = _outline(self._headings(chapters), max_tokens=100)
+
+        assert outline[0] == "# Chapter 0"
+        assert outline[-1].startswith("... (") and outline[-1].endswith(" more headings)")
+        assert count_tokens("\n".join(outline)) <= 110
+
+
+class TestMergeResults:
+    """Tests for merge_results()."""
+
+    def test_unchanged_windows_reproduce_content(self, estimated_tokens):
+        paragraphs = ["sentence " * 40 for _ in range(10)]
+        content = "# Book\n\n## Long\n\n" + "\n\n".join(paragraphs) + "\n\n## Next\ntext\n"
+
+        windows = split_windows(content, window_tokens=150)
+        merged = merge_results([
+            LLMProcessResult(bibliographic=BibliographicInfo(), sanitized_markdown=window, toc=[])
+            for window in windows
+        ])
+
+        assert len(windows) > 1
+        assert merged.sanitized_markdown == content
+
+    def test_merge_in_window_order(self):
+        results = [
+            LLMProcessResult(
+                bibliographic=BibliographicInfo(title="Book"),
+                sanitized_markdown="# Book\n\n# Chapter 1\n",
+                toc=[TOCEntry(level=1, title="Book"), TOCEntry(level=1, title="Chapter 1")],
+            ),
+            LLMProcessResult(
+                bibliographic=BibliographicInfo(title="Other", authors=["A. Author"], year=2020),
+                sanitized_markdown="\n# Chapter 1\n\n## Section\n",
+                toc=[TOCEntry(level=1, title="Chapter 1"), TOCEntry(level=2, title="Section")],
+            ),
+            LLMProcessResult(
+                bibliographic=BibliographicInfo(authors=["B. Author"], year=2021),
+                sanitized_markdown="# Chapter 2",
+                toc=[TOCEntry(level=1, title="Chapter 2")],
+            ),
+        ]
+
+        merged = merge_results(results)
+
+        assert merged.bibliographic.title == "Book"
+        assert merged.bibliographic.authors == ["A. Author"]
+        assert merged.bibliographic.year == 2020
+        assert merged.sanitized_markdown == (
+            "# Book\n\n# Chapter 1\n\n\n# Chapter 1\n\n## Section\n\n# Chapter 2\n"
+        )
+        assert [entry.title for entry in merged.toc] == ["Book", "Chapter 1", "Section", "Chapter 2"]
+
+
+class TestProcessWindowed:
+    """Tests for process_with_llm(windowed=True)."""
+
+    @patch('psychrag.chunking.llm_processor.SessionLocal')
+    @patch('psychrag.chunking.llm_processor.set_file_readonly')
+    @patch('psychrag.chunking.llm_processor.write_text_atomic')
+    @patch('psychrag.chunking.llm_processor.split_windows')
+    @patch('psychrag.ai.create_langchain_chat')
+    def test_windows_processed_and_merged(
+        self, mock_create_chat, mock_split, mock_write_atomic, mock_set_readonly, mock_session_local
+    ):
+        mock_split.return_value = ["# Book\n\nIntro", "## Part\n\nBody", "## Broken\n\nText"]
+        responses = {
+            "Intro": _window_response("# Book\n\nIntro", title="Book", toc=[(1, "Book")]),
+            "Body": _window_response("# Part\n\nBody", authors=["A. Author"], toc=[(1, "Part")]),
+        }
+
+        def invoke(prompt):
+            for marker, response in responses.items():
+                if f"\n{marker}\n---" in prompt:
+                    return response
+            return Mock(content="not json")
+
+        chat = mock_create_chat.return_value.chat
+        chat.invoke.side_effect = invoke
+        mock_write_atomic.return_value = "test_hash"
+
+        with TemporaryDirectory() as tmpdir:
+            input_file = Path(tmpdir) / "book.md"
+            input_file.write_text("\n".join(["Line"] * (MAX_LINES_DEFAULT + 100)), encoding='utf-8')
+
+            with patch('psychrag.chunking.llm_processor.OUTPUT_DIR', Path(tmpdir)):
+                result = process_with_llm(input_file, windowed=True, max_workers=3)
+
+        assert chat.invoke.call_count == 3
+        prompts = [c.args[0] for c in chat.invoke.call_args_list]
+        assert all("of 3 of a longer document" in prompt for prompt in prompts)
+        assert result.bibliographic.title == "Book"
+        assert result.bibliographic.authors == ["A. Author"]
+        assert [entry.title for entry in result.toc] == ["Book", "Part"]
+        # The unparseable window keeps its original text
+        assert result.sanitized_markdown == "# Book\n\nIntro\n# Part\n\nBody\n## Broken\n\nText\n"
+        mock_write_atomic.assert_called_once()
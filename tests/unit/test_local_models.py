@@ -0,0 +1,117 @@
+"""
+Unit tests for local_models module.
+
+Tests cover:
+- Deterministic chat responses, streaming and simulated latency
+- Query expansion responses that parse
+- Structured output defaults
+- Hashing embeddings
+"""
+
+import math
+from typing import Optional
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from psychrag.ai import local_models
+from psychrag.ai.local_models import LocalChatModel, LocalHashEmbeddings
+from psychrag.retrieval.query_expansion import generate_expansion_prompt, parse_expansion_response
+
+
+class TestLocalChatModel:
+    """Tests for LocalChatModel."""
+
+    def test_deterministic_per_prompt_and_seed(self):
+        chat = LocalChatModel(response_tokens=30)
+
+        first = chat.invoke("Explain working memory capacity limits.").content
+        second = chat.invoke("Explain working memory capacity limits.").content
+        other_seed = LocalChatModel(response_tokens=30, seed=1).invoke(
+            "Explain working memory capacity limits."
+        ).content
+
+        assert first == second
+        assert first != other_seed
+        assert len(first.split()) == 30
+        assert set(first.lower().rstrip(".").split()) <= {"explain", "working", "memory", "capacity", "limits"}
+
+    def test_stream_matches_invoke(self):
+        chat = LocalChatModel(response_tokens=12)
+
+        streamed = "".join(chunk.content for chunk in chat.stream("Attention and perception"))
+
+        assert streamed == chat.invoke("Attention and perception").content
+
+    def test_usage_metadata(self):
+        message = LocalChatModel(response_tokens=10).invoke("Define cognitive dissonance.")
+
+        assert message.usage_metadata["output_tokens"] > 0
+        assert message.usage_metadata["total_tokens"] == (
+            message.usage_metadata["input_tokens"] + message.usage_metadata["output_tokens"]
+        )
+
+    def test_simulated_latency(self):
+        chat = LocalChatModel(response_tokens=10, latency_seconds=0.5, tokens_per_second=20.0)
+
+        with patch.object(local_models.time, "sleep") as mock_sleep:
+            chat.invoke("Define priming.")
+            assert mock_sleep.call_args.args[0] == 0.5 + 11 / 20.0
+
+            mock_sleep.reset_mock()
+            list(chat.stream("Define priming."))
+            delays = [call.args[0] for call in mock_sleep.call_args_list]
+            assert delays == [0.5] + [1 / 20.0] * 11
+
+    @patch("psychrag.retrieval.query_expansion.load_template", side_effect=lambda name, fallback: fallback())
+    def test_query_expansion_response_parses(self, _mock_template):
+        prompt = generate_expansion_prompt("How does sleep affect memory consolidation?", n=4)
+
+        parsed = parse_expansion_response(LocalChatModel().invoke(prompt).content)
+
+        assert len(parsed.expanded_queries) == 4
+        assert parsed.hyde_answer
+        assert "consolidation" in parsed.entities
+
+    def test_structured_output_defaults(self):
+        class Suggestion(BaseModel):
+            items: list[str] = []
+            title: Optional[str] = None
+            count: int
+
+        chat = LocalChatModel()
+
+        parsed = chat.with_structured_output(Suggestion).invoke("prompt")
+        result = chat.with_structured_output(Suggestion, include_raw=True).invoke("prompt")
+
+        assert parsed.items == [] and parsed.title is None
+        assert result["parsed"].items == []
+        assert result["parsing_error"] is None
+        assert result["raw"].usage_metadata["input_tokens"] > 0
+
+
+class TestLocalHashEmbeddings:
+    """Tests for LocalHashEmbeddings."""
+
+    def test_dimensions_and_normalization(self):
+        vector = LocalHashEmbeddings().embed_query("Working memory holds about four chunks.")
+
+        assert len(vector) == 768
+        assert math.isclose(math.sqrt(sum(x * x for x in vector)), 1.0)
+
+    def test_deterministic_and_similar_for_shared_words(self):
+        embeddings = LocalHashEmbeddings()
+        query, related, unrelated = embeddings.embed_documents([
+            "working memory capacity",
+            "the capacity of working memory is limited",
+            "operant conditioning in pigeons",
+        ])
+
+        def cosine(a, b):
+            return sum(x * y for x, y in zip(a, b))
+
+        assert query == embeddings.embed_query("working memory capacity")
+        assert cosine(query, related) > cosine(query, unrelated)
+
+    def test_empty_text(self):
+        assert LocalHashEmbeddings(dimensions=16).embed_query("") == [0.0] * 16
@@ -0,0 +1,132 @@
+"""
+Unit tests for markdown_index module.
+
+Tests cover:
+- Parsing headings, paragraphs, tables, figures and line offsets
+- Sidecar reuse and invalidation by file hash
+- Failing to write the sidecar
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from psychrag.utils import markdown_index
+from psychrag.utils.file_utils import compute_file_hash
+from psychrag.utils.markdown_index import (
+    build_markdown_index,
+    load_markdown_index,
+    sidecar_path,
+)
+
+CONTENT = """# Title
+
+First paragraph
+continues here.
+## Section
+- bullet one
+- bullet two
+
+| a | b |
+|---|---|
+![figure](img.png)
+####### Deep
+    # Indented
+"""
+
+
+class TestBuildMarkdownIndex:
+    """Tests for build_markdown_index."""
+
+    def test_structure(self):
+        index = build_markdown_index(CONTENT, "abc")
+
+        assert index.source_hash == "abc"
+        assert index.line_count == 13
+        assert [(h.line, h.level, h.text) for h in index.headings] == [
+            (1, 1, "Title"),
+            (5, 2, "Section"),
+            (12, 7, "Deep"),
+        ]
+        assert index.paragraphs == [(3, 4), (6, 7), (13, 13)]
+        assert index.tables == [(9, 10)]
+        assert index.figures == [11]
+
+    def test_headings_up_to(self):
+        index = build_markdown_index(CONTENT)
+
+        assert [h.line for h in index.headings_up_to(2)] == [1, 5]
+
+    def test_span_slices_lines(self):
+        content = "one\r\ntwo\nthree"
+        index = build_markdown_index(content)
+
+        start, end = index.span(2, 3)
+        assert content[start:end] == "two\nthree"
+        start, end = index.span(1, 1)
+        assert content[start:end] == "one\r\n"
+
+    def test_round_trip(self):
+        index = build_markdown_index(CONTENT, "abc")
+
+        assert markdown_index.MarkdownIndex.from_dict(index.to_dict()) == index
+
+    def test_empty_content(self):
+        index = build_markdown_index("")
+
+        assert index.line_count == 0
+        assert index.line_offsets == [0]
+        assert index.headings == []
+
+
+class TestLoadMarkdownIndex:
+    """Tests for load_markdown_index and its sidecar."""
+
+    @pytest.fixture
+    def markdown(self, tmp_path):
+        path = tmp_path / "book.sanitized.md"
+        path.write_text(CONTENT, encoding="utf-8")
+        return path
+
+    def test_writes_sidecar(self, markdown):
+        index = load_markdown_index(markdown)
+
+        assert sidecar_path(markdown).name == "book.sanitized.md.index.json"
+        assert sidecar_path(markdown).exists()
+        assert index.source_hash == compute_file_hash(markdown)
+
+    def test_reuses_sidecar(self, markdown):
+        first = load_markdown_index(markdown)
+
+        with patch.object(markdown_index, "build_markdown_index") as mock_build:
+            second = load_markdown_index(markdown)
+
+        mock_build.assert_not_called()
+        assert second == first
+
+    def test_rebuilds_when_file_changes(self, markdown):
+        load_markdown_index(markdown)
+        markdown.write_text("# Other\n", encoding="utf-8")
+
+        index = load_markdown_index(markdown)
+
+        assert [h.text for h in index.headings] == ["Other"]
+        assert index.source_hash == compute_file_hash(markdown)
+
+    def test_ignores_corrupt_sidecar(self, markdown):
+        sidecar_path(markdown).write_text("{not json", encoding="utf-8")
+
+        index = load_markdown_index(markdown)
+
+        assert len(index.headings) == 3
+
+    def test_unwritable_sidecar_is_logged(self, markdown, caplog):
+        with patch.object(markdown_index, "write_text_atomic", side_effect=OSError("read-only")):
+            index = load_markdown_index(markdown)
+
+        assert len(index.headings) == 3
+        assert "Could not write markdown index" in caplog.text
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_markdown_index(tmp_path / "missing.md")
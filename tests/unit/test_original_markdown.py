@@ -102,7 +102,7 @@ class TestOriginalMarkdown:
     @pytest.mark.asyncio
     @patch("psychrag_api.routers.conversion.get_session")
     @patch("psychrag_api.routers.conversion.load_config")
-    @patch("pathlib.Path.write_text")
+    @patch("psychrag_api.routers.conversion.write_text_atomic")
     @patch("pathlib.Path.exists")
     async def test_update_original_markdown_success(
         self, mock_exists, mock_write_text, mock_load_config, mock_get_session
@@ -130,7 +130,7 @@ class TestOriginalMarkdown:
 
         assert response.content == "# Updated Content"
         assert response.filename == "test.md"
-        mock_write_text.assert_called_once_with("# Updated Content", encoding="utf-8")
+        mock_write_text.assert_called_once_with(Path("/output/test.md"), "# Updated Content")
 
     @pytest.mark.asyncio
     @patch("psychrag_api.routers.conversion.get_session")
@@ -0,0 +1,155 @@
+"""
+Unit tests for parallel_pdf module.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import fitz
+from docling.datamodel.base_models import Cluster, LayoutPrediction, Page, PagePredictions
+from docling_core.types.doc import DocItemLabel
+from docling_core.types.doc.base import BoundingBox, CoordOrigin, Size
+from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
+from docling_core.types.doc.page import BoundingRectangle, TextCell
+from hierarchical.postprocessor import ResultPostprocessor
+
+from psychrag.conversions.converter_pool import ConverterKey
+from psychrag.conversions.parallel_pdf import (
+    convert_pdf_parallel,
+    get_page_count,
+    plan_page_ranges,
+    resolve_worker_count,
+    stitch_results,
+)
+
+
+def _part(page_numbers, layout=True):
+    """
+    A per-range conversion: one heading and paragraph per page.
+
+    Each page's layout has a section header cluster under its heading, as
+    docling predicts it; layout=False simulates a range without predictions.
+    """
+    doc = DoclingDocument(name="part")
+    pages = []
+    for page_no in page_numbers:
+        doc.add_page(page_no=page_no, size=Size(width=600, height=800))
+        prov = ProvenanceItem(
+            page_no=page_no,
+            bbox=BoundingBox(l=0, t=800, r=600, b=0, coord_origin=CoordOrigin.BOTTOMLEFT),
+            charspan=(0, 1),
+        )
+        doc.add_heading(f"Heading {page_no}", level=1, prov=prov)
+        doc.add_text(label="text", text=f"Body {page_no}", prov=prov)
+
+        bbox = BoundingBox(l=10, t=10, r=200, b=30)
+        cell = TextCell(
+            rect=BoundingRectangle.from_bounding_box(bbox),
+            text=f"Heading {page_no}",
+            orig=f"Heading {page_no}",
+            from_ocr=False,
+        )
+        cluster = Cluster(id=0, label=DocItemLabel.SECTION_HEADER, bbox=bbox, cells=[cell])
+        predictions = PagePredictions(layout=LayoutPrediction(clusters=[cluster]) if layout else None)
+        pages.append(Page(page_no=page_no, size=Size(width=600, height=800), predictions=predictions))
+    return doc, pages
+
+
+class TestPlanPageRanges:
+    """Tests for plan_page_ranges."""
+
+    def test_even_split(self):
+        assert plan_page_ranges(300, 100) == [(1, 100), (101, 200), (201, 300)]
+
+    def test_short_remainder_joins_last_range(self):
+        assert plan_page_ranges(240, 100) == [(1, 100), (101, 240)]
+
+    def test_long_remainder_gets_own_range(self):
+        assert plan_page_ranges(260, 100) == [(1, 100), (101, 200), (201, 260)]
+
+    def test_small_document_single_range(self):
+        assert plan_page_ranges(40, 100) == [(1, 40)]
+        assert plan_page_ranges(0, 100) == []
+
+
+class TestResolveWorkerCount:
+    """Tests for resolve_worker_count."""
+
+    def test_bounded_by_ranges(self):
+        assert resolve_worker_count(8, 3) == 3
+
+    def test_memory_budget(self):
+        assert resolve_worker_count(4, 10, max_memory_mb=7000, worker_memory_mb=3000) == 2
+
+    def test_at_least_one_worker(self):
+        assert resolve_worker_count(4, 10, max_memory_mb=1000, worker_memory_mb=3000) == 1
+
+
+class TestStitchResults:
+    """Tests for stitch_results."""
+
+    def test_keeps_order_and_page_numbers(self):
+        result = stitch_results([_part([1, 2]), _part([3, 4])], name="book")
+
+        assert result.document.name == "book"
+        assert sorted(result.document.pages) == [1, 2, 3, 4]
+        headings = [t for t in result.document.texts if t.text.startswith("Heading")]
+        assert [h.text for h in headings] == [f"Heading {n}" for n in range(1, 5)]
+        assert [h.prov[0].page_no for h in headings] == [1, 2, 3, 4]
+        assert [p.page_no for p in result.pages] == [1, 2, 3, 4]
+
+    def test_missing_pages_are_padded(self):
+        doc, pages = _part([3, 4])
+        result = stitch_results([_part([1]), (doc, pages[1:])], name="book")
+
+        # result.pages[n - 1] must be page n for post-processing
+        assert [p.page_no for p in result.pages] == [1, 2, 3, 4]
+        assert result.pages[1].predictions.layout.clusters == []
+
+    def test_failed_range_keeps_later_style_headers(self, caplog):
+        result = stitch_results(
+            [_part([1, 2]), _part([3, 4], layout=False), _part([5, 6])], name="book"
+        )
+
+        headers = ResultPostprocessor(result).get_headers()
+
+        # Style-based detection (cluster fonts) still covers the pages after
+        # the failed range
+        assert [h["text"] for h in headers] == [
+            "Heading 1", "Heading 2", "Heading 5", "Heading 6"
+        ]
+        assert "no layout for 2 page(s): 3-4" in caplog.text
+
+
+class TestConvertPdfParallel:
+    """Tests for convert_pdf_parallel."""
+
+    def test_converts_ranges_and_stitches(self, tmp_path):
+        pdf = tmp_path / "book.pdf"
+        doc = fitz.open()
+        for _ in range(6):
+            doc.new_page()
+        doc.save(str(pdf))
+        doc.close()
+
+        calls = []
+
+        def fake_convert_range(pdf_path, page_range, key):
+            calls.append(page_range)
+            return _part(range(page_range[0], page_range[1] + 1))
+
+        with patch(
+            "psychrag.conversions.parallel_pdf.make_process_executor",
+            side_effect=lambda workers: ThreadPoolExecutor(workers),
+        ) as make_executor, patch(
+            "psychrag.conversions.parallel_pdf._convert_range", side_effect=fake_convert_range
+        ):
+            result = convert_pdf_parallel(pdf, ConverterKey(), workers=4, pages_per_chunk=2)
+
+        assert get_page_count(pdf) == 6
+        make_executor.assert_called_once_with(3)
+        assert sorted(calls) == [(1, 2), (3, 4), (5, 6)]
+        assert result.document.name == "book"
+        assert [p.page_no for p in result.pages] == list(range(1, 7))
+        markdown = result.document.export_to_markdown()
+        assert markdown.index("Heading 2") < markdown.index("Heading 3") < markdown.index("Heading 6")
@@ -488,32 +488,24 @@ class TestVectorizeAllQueries:
         assert result.total_embeddings == 0
         assert result.errors == []
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @staticmethod
+    def _embeddings_model():
+        """Embeddings model returning [index of text in its batch, text length]."""
+        model = MagicMock()
+        model.embed_documents.side_effect = lambda texts: [
+            [float(i), float(len(text))] for i, text in enumerate(texts)
+        ]
+        return model
+
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_single_success(self, mock_get_session, mock_vectorize_query, mock_session):
+    def test_vectorize_all_queries_single_success(self, mock_get_session, mock_create_embeddings, mock_session):
         """Test batch vectorization with one successful query."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_create_embeddings.return_value = self._embeddings_model()
 
-        # Create pending query
-        query_id = 1
-        query = Query(
-            id=query_id,
-            original_query="Test query",
-            vector_status="to_vec"
-        )
-        # Configure query chain to return this query
-        mock_query = create_mock_query_chain(return_data=[query])
-        mock_session.query.return_value = mock_query
-
-        # Mock successful vectorization
-        mock_vectorize_query.return_value = QueryVectorizationResult(
-            query_id=query_id,
-            total_embeddings=1,
-            original_count=1,
-            mqe_count=0,
-            hyde_count=0,
-            success=True
-        )
+        query = Query(id=1, original_query="Test query", vector_status="to_vec")
+        mock_session.query.return_value = create_mock_query_chain(return_data=[query])
 
         result = vectorize_all_queries()
 
@@ -523,124 +515,89 @@ class TestVectorizeAllQueries:
         assert result.failed == 0
         assert result.total_embeddings == 1
         assert result.errors == []
-        mock_vectorize_query.assert_called_once_with(query_id, verbose=False)
+        assert query.vector_status == "vec"
+        assert query.embedding_original == [0.0, 10.0]
+        mock_session.commit.assert_called_once()
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_multiple_success(self, mock_get_session, mock_vectorize_query, mock_session):
-        """Test batch vectorization with multiple successful queries."""
+    def test_vectorize_all_queries_batches_texts_across_queries(
+        self, mock_get_session, mock_create_embeddings, mock_session
+    ):
+        """Test that texts of all queries share requests and one client."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        model = self._embeddings_model()
+        mock_create_embeddings.return_value = model
 
-        # Create multiple pending queries
         queries = [
-            Query(id=i+1, original_query=f"Query {i}", vector_status="to_vec")
-            for i in range(3)
+            Query(id=1, original_query="q1", vector_status="to_vec"),
+            Query(id=2, original_query="q2", expanded_queries=["m1", "m22"],
+                  hyde_answer="hyde", vector_status="to_vec"),
+            Query(id=3, original_query="q3", expanded_queries=["m3"], vector_status="to_vec"),
         ]
-        # Configure query chain to return these queries
-        mock_query = create_mock_query_chain(return_data=queries)
-        mock_session.query.return_value = mock_query
+        mock_session.query.return_value = create_mock_query_chain(return_data=queries)
 
-        # Mock successful vectorizations
-        def mock_vectorize_side_effect(query_id, verbose=False):
-            return QueryVectorizationResult(
-                query_id=query_id,
-                total_embeddings=2,  # Each has 2 embeddings
-                original_count=1,
-                mqe_count=1,
-                hyde_count=0,
-                success=True
-            )
+        result = vectorize_all_queries(batch_size=4)
 
-        mock_vectorize_query.side_effect = mock_vectorize_side_effect
-
-        result = vectorize_all_queries()
-
-        assert result.total_queries == 3
-        assert result.processed == 3
         assert result.success == 3
-        assert result.failed == 0
-        assert result.total_embeddings == 6  # 3 queries * 2 embeddings each
-        assert result.errors == []
-        assert mock_vectorize_query.call_count == 3
+        assert result.total_embeddings == 7  # 1 + 4 + 2
+        mock_create_embeddings.assert_called_once()
+        assert [c.args[0] for c in model.embed_documents.call_args_list] == [
+            ["q1", "q2", "m1", "m22"],
+            ["hyde", "q3", "m3"],
+        ]
+        # Query 2 spans both batches
+        assert queries[1].embedding_original == [1.0, 2.0]
+        assert queries[1].embeddings_mqe == [[2.0, 2.0], [3.0, 3.0]]
+        assert queries[1].embedding_hyde == [0.0, 4.0]
+        assert queries[2].embedding_original == [1.0, 2.0]
+        assert queries[2].embeddings_mqe == [[2.0, 2.0]]
+        assert queries[2].embedding_hyde is None
+        mock_session.commit.assert_called_once()
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_with_failures(self, mock_get_session, mock_vectorize_query, mock_session):
-        """Test batch vectorization with some failures."""
+    def test_vectorize_all_queries_with_failures(self, mock_get_session, mock_create_embeddings, mock_session):
+        """Test that a failed batch fails only the queries with texts in it."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        model = MagicMock()
+        model.embed_documents.side_effect = [
+            [[0.1], [0.2]],
+            RuntimeError("API error"),
+            [[0.5]],
+        ]
+        mock_create_embeddings.return_value = model
 
-        # Create multiple pending queries
         queries = [
-            Query(id=i+1, original_query=f"Query {i}", vector_status="to_vec")
-            for i in range(3)
+            Query(id=1, original_query="Query 0", expanded_queries=["m"], vector_status="to_vec"),
+            Query(id=2, original_query="Query 1", expanded_queries=["m"], vector_status="to_vec"),
+            Query(id=3, original_query="Query 2", vector_status="to_vec"),
         ]
-        # Configure query chain to return these queries
-        mock_query = create_mock_query_chain(return_data=queries)
-        mock_session.query.return_value = mock_query
+        mock_session.query.return_value = create_mock_query_chain(return_data=queries)
 
-        # Mock mixed results: success, failure, success
-        def mock_vectorize_side_effect(query_id, verbose=False):
-            if query_id == queries[1].id:
-                return QueryVectorizationResult(
-                    query_id=query_id,
-                    total_embeddings=0,
-                    original_count=0,
-                    mqe_count=0,
-                    hyde_count=0,
-                    success=False,
-                    error="API error"
-                )
-            else:
-                return QueryVectorizationResult(
-                    query_id=query_id,
-                    total_embeddings=1,
-                    original_count=1,
-                    mqe_count=0,
-                    hyde_count=0,
-                    success=True
-                )
-
-        mock_vectorize_query.side_effect = mock_vectorize_side_effect
-
-        result = vectorize_all_queries()
+        result = vectorize_all_queries(batch_size=2)
 
         assert result.total_queries == 3
         assert result.processed == 3
         assert result.success == 2
         assert result.failed == 1
-        assert result.total_embeddings == 2  # Only successful queries contribute
-        assert len(result.errors) == 1
-        assert result.errors[0][0] == queries[1].id
-        assert result.errors[0][1] == "API error"
+        assert result.total_embeddings == 3  # Only successful queries contribute
+        assert result.errors == [(2, "API error")]
+        assert [q.vector_status for q in queries] == ["vec", "vec_err", "vec"]
+        assert queries[2].embedding_original == [0.5]
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_all_failures(self, mock_get_session, mock_vectorize_query, mock_session):
-        """Test batch vectorization when all queries fail."""
+    def test_vectorize_all_queries_all_failures(self, mock_get_session, mock_create_embeddings, mock_session):
+        """Test batch vectorization when the embeddings client cannot be created."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_create_embeddings.side_effect = RuntimeError("Network timeout")
 
-        # Create pending queries
         queries = [
             Query(id=i+1, original_query=f"Query {i}", vector_status="to_vec")
             for i in range(2)
         ]
-        # Configure query chain to return these queries
-        mock_query = create_mock_query_chain(return_data=queries)
-        mock_session.query.return_value = mock_query
-
-        # Mock all failures
-        def mock_vectorize_side_effect(query_id, verbose=False):
-            return QueryVectorizationResult(
-                query_id=query_id,
-                total_embeddings=0,
-                original_count=0,
-                mqe_count=0,
-                hyde_count=0,
-                success=False,
-                error="Network timeout"
-            )
-
-        mock_vectorize_query.side_effect = mock_vectorize_side_effect
+        mock_session.query.return_value = create_mock_query_chain(return_data=queries)
 
         result = vectorize_all_queries()
 
@@ -649,79 +606,47 @@ class TestVectorizeAllQueries:
         assert result.success == 0
         assert result.failed == 2
         assert result.total_embeddings == 0
-        assert len(result.errors) == 2
+        assert result.errors == [(1, "Network timeout"), (2, "Network timeout")]
+        assert all(q.vector_status == "vec_err" for q in queries)
+        mock_session.commit.assert_called_once()
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_verbose(self, mock_get_session, mock_vectorize_query, mock_session, capsys):
+    def test_vectorize_all_queries_verbose(self, mock_get_session, mock_create_embeddings, mock_session, capsys):
         """Test batch vectorization with verbose output."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        mock_create_embeddings.return_value = self._embeddings_model()
 
-        # Create pending queries
         queries = [
             Query(id=i+1, original_query=f"Query {i}", vector_status="to_vec")
             for i in range(2)
         ]
-        # Configure query chain to return these queries
-        mock_query = create_mock_query_chain(return_data=queries)
-        mock_session.query.return_value = mock_query
-
-        # Mock successful vectorizations
-        def mock_vectorize_side_effect(query_id, verbose=False):
-            return QueryVectorizationResult(
-                query_id=query_id,
-                total_embeddings=1,
-                original_count=1,
-                mqe_count=0,
-                hyde_count=0,
-                success=True
-            )
-
-        mock_vectorize_query.side_effect = mock_vectorize_side_effect
+        mock_session.query.return_value = create_mock_query_chain(return_data=queries)
 
         result = vectorize_all_queries(verbose=True)
 
         # Verify verbose output
         captured = capsys.readouterr()
         assert "Found 2 queries to vectorize" in captured.out
-        assert "Processing query" in captured.out
+        assert "Processing batch 1 (2 texts)" in captured.out
         assert "Completed:" in captured.out
         assert result.total_queries == 2
 
-    @patch('psychrag.retrieval.query_embeddings.vectorize_query')
+    @patch('psychrag.ai.llm_factory.create_embeddings')
     @patch('psychrag.retrieval.query_embeddings.get_session')
-    def test_vectorize_all_queries_mixed_embeddings(self, mock_get_session, mock_vectorize_query, mock_session):
-        """Test batch vectorization with queries having different embedding counts."""
+    def test_vectorize_all_queries_short_response(self, mock_get_session, mock_create_embeddings, mock_session):
+        """Test that a batch returning too few embeddings fails its queries."""
         mock_get_session.return_value.__enter__.return_value = mock_session
+        model = MagicMock()
+        model.embed_documents.return_value = [[0.1]]
+        mock_create_embeddings.return_value = model
 
-        # Create pending queries
-        queries = [
-            Query(id=i+1, original_query=f"Query {i}", vector_status="to_vec")
-            for i in range(3)
-        ]
-        # Configure query chain to return these queries
-        mock_query = create_mock_query_chain(return_data=queries)
-        mock_session.query.return_value = mock_query
-
-        # Mock different embedding counts
-        embedding_counts = [1, 3, 2]  # Original only, Original+MQE+HyDE, Original+MQE
-
-        def mock_vectorize_side_effect(query_id, verbose=False):
-            idx = next(i for i, q in enumerate(queries) if q.id == query_id)
-            return QueryVectorizationResult(
-                query_id=query_id,
-                total_embeddings=embedding_counts[idx],
-                original_count=1,
-                mqe_count=embedding_counts[idx] - 1,
-                hyde_count=0,
-                success=True
-            )
-
-        mock_vectorize_query.side_effect = mock_vectorize_side_effect
+        query = Query(id=1, original_query="q", expanded_queries=["m"], vector_status="to_vec")
+        mock_session.query.return_value = create_mock_query_chain(return_data=[query])
 
         result = vectorize_all_queries()
 
-        assert result.total_queries == 3
-        assert result.success == 3
-        assert result.total_embeddings == 6  # 1 + 3 + 2 = 6
-
+        assert result.failed == 1
+        assert "Expected 2 embeddings, got 1" in result.errors[0][1]
+        assert query.vector_status == "vec_err"
+        assert query.embedding_original is None
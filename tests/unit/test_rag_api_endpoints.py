@@ -0,0 +1,139 @@
+"""
+Unit tests for RAG API endpoints (augment prompt and streaming).
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.messages import AIMessageChunk
+
+from psychrag.augmentation import AugmentedPrompt
+from psychrag_api.routers.rag import get_augment_prompt, stream_augment
+
+
+def _chat(*chunks, error=None):
+    chat = MagicMock()
+
+    async def astream(prompt):
+        for chunk in chunks:
+            yield AIMessageChunk(content=chunk)
+        if error is not None:
+            raise error
+
+    chat.astream.side_effect = astream
+    return chat
+
+
+def _http_request(disconnect_after=None):
+    request = MagicMock()
+    calls = {"n": 0}
+
+    async def is_disconnected():
+        calls["n"] += 1
+        return disconnect_after is not None and calls["n"] > disconnect_after
+
+    request.is_disconnected.side_effect = is_disconnected
+    return request
+
+
+async def _events(response):
+    events = []
+    async for message in response.body_iterator:
+        event, data = message.strip().split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+class TestStreamAugment:
+    """Tests for stream_augment endpoint."""
+
+    @pytest.fixture
+    def mocks(self):
+        augmented = AugmentedPrompt(
+            prompt="prompt", contexts=[], prompt_tokens=1500, context_tokens=1200, token_budget=12000,
+        )
+        with patch("psychrag_api.routers.rag.build_augmented_prompt", return_value=augmented), \
+             patch("psychrag_api.routers.rag.create_langchain_chat") as mock_create, \
+             patch("psychrag_api.routers.rag._save_result", return_value=42) as mock_save:
+            yield mock_create, mock_save
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens_then_saves_result(self, mocks):
+        mock_create, mock_save = mocks
+        mock_create.return_value.chat = _chat("Predictive ", "", ["coding", {"type": "text", "text": "."}])
+
+        response = await stream_augment(7, _http_request())
+        events = await _events(response)
+
+        assert response.media_type == "text/event-stream"
+        assert events == [
+            ("token", {"text": "Predictive "}),
+            ("token", {"text": "coding."}),
+            ("done", {
+                "query_id": 7,
+                "result_id": 42,
+                "response_text": "Predictive coding.",
+                "prompt_tokens": 1500,
+            }),
+        ]
+        mock_save.assert_called_once_with(7, "Predictive coding.")
+
+    @pytest.mark.asyncio
+    async def test_client_disconnect_stops_without_saving(self, mocks):
+        mock_create, mock_save = mocks
+        mock_create.return_value.chat = _chat("a", "b", "c")
+
+        response = await stream_augment(7, _http_request(disconnect_after=1))
+        events = await _events(response)
+
+        assert events == [("token", {"text": "a"})]
+        mock_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_llm_error_sent_as_event(self, mocks):
+        mock_create, mock_save = mocks
+        mock_create.return_value.chat = _chat("a", error=RuntimeError("quota exceeded"))
+
+        response = await stream_augment(7, _http_request())
+        events = await _events(response)
+
+        assert events[-1] == ("error", {"detail": "LLM request failed: quota exceeded"})
+        mock_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("psychrag_api.routers.rag.build_augmented_prompt")
+    async def test_unknown_query(self, mock_build):
+        mock_build.side_effect = ValueError("Query with ID 99 not found")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await stream_augment(99, _http_request())
+
+        assert exc_info.value.status_code == 404
+
+
+class TestGetAugmentPrompt:
+    """Tests for get_augment_prompt endpoint."""
+
+    @pytest.mark.asyncio
+    @patch("psychrag_api.routers.rag.get_session")
+    @patch("psychrag_api.routers.rag.build_augmented_prompt")
+    async def test_reports_packed_contexts_and_tokens(self, mock_build, mock_get_session):
+        mock_build.return_value = AugmentedPrompt(
+            prompt="prompt",
+            contexts=[{"work_id": 1}, {"work_id": 2}],
+            prompt_tokens=5000,
+            context_tokens=4200,
+            token_budget=4500,
+            dropped_contexts=3,
+        )
+        session = mock_get_session.return_value.__enter__.return_value
+        session.query.return_value.filter.return_value.first.return_value.original_query = "Why?"
+
+        response = await get_augment_prompt(7, top_n=5)
+
+        assert response.context_count == 2
+        assert (response.prompt_tokens, response.context_tokens, response.token_budget) == (
+            5000, 4200, 4500,
+        )
@@ -0,0 +1,217 @@
+"""
+Unit tests for response_cache module.
+
+Tests cover:
+- Cache keys per provider, model, temperature, prompt and schema
+- Hits, misses, TTL expiry and per-function opt-in
+- Structured output and hit/saved-token statistics
+"""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from psychrag.ai import response_cache
+from psychrag.ai.response_cache import (
+    ResponseCache,
+    cache_stats_report,
+    chat_identity,
+    get_cache_stats,
+    invoke_cached,
+    make_cache_key,
+)
+from psychrag.config import AppConfig
+
+
+class ChatOpenAI:
+    """Stand-in with the attributes of langchain_openai.ChatOpenAI."""
+
+    def __init__(self, model_name="gpt-4o-mini", temperature=0.2):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.invoke = MagicMock(side_effect=lambda prompt: AIMessage(
+            content=f"answer to {prompt}",
+            usage_metadata={"input_tokens": 100, "output_tokens": 20, "total_tokens": 120},
+        ))
+
+
+class Answer(BaseModel):
+    title: str
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = AppConfig()
+    config.llm.cache.cache_dir = str(tmp_path / "llm_cache")
+    config.llm.cache.functions = ["query_expansion", "citation_parsing", "toc_extraction"]
+    response_cache.reset_cache_stats()
+    with patch.object(response_cache, "load_config", return_value=config):
+        yield config
+    response_cache.reset_cache_stats()
+
+
+class TestCacheKey:
+    """Tests for chat_identity and make_cache_key."""
+
+    def test_identity_of_factory_models(self):
+        assert chat_identity(ChatOpenAI("gpt-4o", 0.0)) == ("openai", "gpt-4o", 0.0)
+        assert chat_identity(MagicMock()) is None
+
+    def test_key_depends_on_every_part(self):
+        base = make_cache_key("openai", "gpt-4o", 0.2, "prompt")
+
+        assert make_cache_key("openai", "gpt-4o", 0.2, "prompt") == base
+        assert make_cache_key("gemini", "gpt-4o", 0.2, "prompt") != base
+        assert make_cache_key("openai", "gpt-4o-mini", 0.2, "prompt") != base
+        assert make_cache_key("openai", "gpt-4o", 0.7, "prompt") != base
+        assert make_cache_key("openai", "gpt-4o", 0.2, "prompt!") != base
+        assert make_cache_key("openai", "gpt-4o", 0.2, "prompt", Answer) != base
+
+
+class TestInvokeCached:
+    """Tests for invoke_cached."""
+
+    def test_repeated_prompt_answered_from_cache(self, config):
+        chat = ChatOpenAI()
+
+        first = invoke_cached(chat, "q", function="query_expansion")
+        second = invoke_cached(ChatOpenAI(), "q", function="query_expansion")
+
+        assert second.content == first.content == "answer to q"
+        assert second.response_metadata == {"cache_hit": True}
+        chat.invoke.assert_called_once_with("q")
+
+        stats = get_cache_stats()["query_expansion"]
+        assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+        assert stats.saved_tokens == 120
+
+    def test_stats_report_per_function_and_total(self, config):
+        chat = ChatOpenAI()
+        for prompt in ("q", "q", "q"):
+            invoke_cached(chat, prompt, function="query_expansion")
+        invoke_cached(chat, "t", function="toc_extraction")
+
+        report = cache_stats_report()
+
+        assert report["query_expansion"]["hit_rate"] == 0.6667
+        assert report["query_expansion"]["saved_tokens"] == 240
+        assert report["total"] == {
+            "hits": 2,
+            "misses": 2,
+            "saved_input_tokens": 200,
+            "saved_output_tokens": 40,
+            "hit_rate": 0.5,
+            "saved_tokens": 240,
+        }
+
+    def test_no_function_cached_by_default(self):
+        assert AppConfig().llm.cache.functions == []
+
+    def test_function_not_opted_in(self, config):
+        chat = ChatOpenAI()
+
+        invoke_cached(chat, "q", function="augmentation")
+        invoke_cached(chat, "q", function="augmentation")
+
+        assert chat.invoke.call_count == 2
+        assert get_cache_stats() == {}
+
+    def test_cache_disabled(self, config):
+        config.llm.cache.enabled = False
+        chat = ChatOpenAI()
+
+        invoke_cached(chat, "q", function="query_expansion")
+        invoke_cached(chat, "q", function="query_expansion")
+
+        assert chat.invoke.call_count == 2
+
+    def test_unknown_chat_model_not_cached(self, config):
+        chat = MagicMock()
+
+        invoke_cached(chat, "q", function="query_expansion")
+        invoke_cached(chat, "q", function="query_expansion")
+
+        assert chat.invoke.call_count == 2
+
+    def test_expired_entry_refetched(self, config):
+        config.llm.cache.ttl_seconds = 60
+        chat = ChatOpenAI()
+        invoke_cached(chat, "q", function="query_expansion")
+
+        with patch.object(response_cache.time, "time", return_value=time.time() + 61):
+            invoke_cached(chat, "q", function="query_expansion")
+
+        assert chat.invoke.call_count == 2
+
+    def test_empty_response_not_stored(self, config):
+        chat = ChatOpenAI()
+        chat.invoke.side_effect = lambda prompt: AIMessage(content="")
+
+        invoke_cached(chat, "q", function="query_expansion")
+        invoke_cached(chat, "q", function="query_expansion")
+
+        assert chat.invoke.call_count == 2
+
+    def test_structured_output(self, config):
+        chat = ChatOpenAI()
+        structured = chat.with_structured_output = MagicMock()
+        structured.return_value.invoke.return_value = {
+            "raw": AIMessage(content="", usage_metadata={
+                "input_tokens": 50, "output_tokens": 5, "total_tokens": 55,
+            }),
+            "parsed": Answer(title="Prediction"),
+            "parsing_error": None,
+        }
+
+        first = invoke_cached(chat, "q", function="citation_parsing", schema=Answer)
+        second = invoke_cached(chat, "q", function="citation_parsing", schema=Answer)
+
+        assert first == second == Answer(title="Prediction")
+        structured.assert_called_once_with(Answer, include_raw=True)
+        assert get_cache_stats()["citation_parsing"].saved_tokens == 55
+
+    def test_structured_parsing_error_raised(self, config):
+        chat = ChatOpenAI()
+        chat.with_structured_output = MagicMock()
+        chat.with_structured_output.return_value.invoke.return_value = {
+            "raw": AIMessage(content="nonsense"),
+            "parsed": None,
+            "parsing_error": ValueError("bad output"),
+        }
+
+        with pytest.raises(ValueError, match="bad output"):
+            invoke_cached(chat, "q", function="citation_parsing", schema=Answer)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage."""
+
+    def test_corrupt_entry_ignored(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        path = cache.entry_path("ab" * 32)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+
+        assert cache.load("ab" * 32) is None
+
+    def test_unwritable_cache_is_logged(self, tmp_path, caplog):
+        cache = ResponseCache(tmp_path)
+
+        with patch.object(response_cache, "write_text_atomic", side_effect=OSError("read-only")):
+            cache.store("ab" * 32, {"content": "x"})
+
+        assert cache.load("ab" * 32) is None
+        assert "Could not write LLM cache entry" in caplog.text
+
+    def test_entry_layout(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+
+        cache.store("cd" * 32, {"content": "x"})
+
+        entry = json.loads((tmp_path / "cd" / f"{'cd' * 32}.json").read_text(encoding="utf-8"))
+        assert entry["content"] == "x"
+        assert entry["format"] == response_cache.CACHE_FORMAT_VERSION
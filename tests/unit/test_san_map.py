@@ -0,0 +1,167 @@
+"""
+Unit tests for san_map module.
+
+Tests cover:
+- Single-pass mapping engine matching sequential str.replace
+- Per-mapping counts and conflict report
+- Preview and apply with the database mocked
+"""
+
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from psychrag.sanitization import san_map
+from psychrag.sanitization.san_map import (
+    MappingConflict,
+    apply_mappings,
+    apply_san_mapping,
+    preview_san_mapping,
+)
+from psychrag.utils import compute_file_hash
+
+
+def _sequential(content, mappings):
+    counts = []
+    for old, new in mappings:
+        counts.append(content.count(old))
+        content = content.replace(old, new)
+    return content, counts
+
+
+@pytest.fixture(params=[True, False], ids=["automaton", "find"])
+def occurrence_finder(request):
+    """Run with and without pyahocorasick."""
+    if request.param and not san_map.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    with patch.object(san_map, "AHOCORASICK_AVAILABLE", request.param):
+        yield
+
+
+class TestApplyMappings:
+    """Tests for apply_mappings."""
+
+    def test_independent_mappings(self, occurrence_finder):
+        content = "The teh cat sat on teh mat.\n" * 3
+        result = apply_mappings(content, [("teh", "the"), ("cat", "dog"), ("zebra", "x")])
+
+        assert result.content == "The the dog sat on the mat.\n" * 3
+        assert result.counts == [6, 3, 0]
+        assert result.matches == [6, 3, 0]
+        assert result.total_replacements == 9
+        assert result.conflicts == []
+
+    def test_overlap_earlier_mapping_wins(self, occurrence_finder):
+        result = apply_mappings("theat", [("eat", "EAT"), ("the", "THE")])
+
+        assert result.content == "thEAT"
+        assert result.counts == [1, 0]
+        assert result.matches == [1, 1]
+        assert result.conflicts == [MappingConflict(0, 1, "overlap")]
+
+    def test_chain_and_deletion_join(self, occurrence_finder):
+        # "b" -> "" joins "a" and "c"; "x" -> "ac" produces another "ac"
+        mappings = [("b", ""), ("x", "ac"), ("ac", "Z")]
+        result = apply_mappings("abc x", mappings)
+
+        assert (result.content, result.counts) == _sequential("abc x", mappings)
+        assert result.content == "Z Z"
+        assert MappingConflict(0, 2, "chain") in result.conflicts
+        assert MappingConflict(1, 2, "chain") in result.conflicts
+
+    def test_replacement_spreading_into_context(self, occurrence_finder):
+        # Each replacement creates the next match further along the text
+        content = "x" + "-" * 40 + "a" + "b" * 10
+        mappings = [("a", "ca"), ("cab", "A"), ("Ab", "aa")]
+
+        result = apply_mappings(content, mappings)
+
+        assert (result.content, result.counts) == _sequential(content, mappings)
+
+    def test_single_scan_without_chains(self, occurrence_finder):
+        # "the" could run into a following "ea", but the text never has one
+        mappings = [("teh", "the"), ("ea", "EA"), ("cat", "dog")]
+        with patch.object(
+            san_map, "_find_occurrences", wraps=san_map._find_occurrences
+        ) as find:
+            result = apply_mappings("teh cat, teh sea", mappings)
+
+        assert (result.content, result.counts) == _sequential("teh cat, teh sea", mappings)
+        assert find.call_count == 1
+
+    def test_rescan_from_chained_mapping(self, occurrence_finder):
+        mappings = [("teh", "the"), ("ea", "EA"), ("ca", "CA")]
+        with patch.object(
+            san_map, "_find_occurrences", wraps=san_map._find_occurrences
+        ) as find:
+            result = apply_mappings("tehat cat", mappings)
+
+        assert (result.content, result.counts) == _sequential("tehat cat", mappings)
+        assert result.content == "thEAt CAt"
+        assert find.call_count == 2
+        assert find.call_args.args[1] == {"ea", "ca"}
+
+    def test_matches_sequential_replace(self, occurrence_finder):
+        rng = random.Random(0)
+        for _ in range(500):
+            alphabet = rng.choice(["ab", "abc", "ab  xyz"])
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 120)))
+            mappings = [
+                (
+                    "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))),
+                    "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3))),
+                )
+                for _ in range(rng.randint(1, 5))
+            ]
+
+            result = apply_mappings(text, mappings)
+
+            assert (result.content, result.counts) == _sequential(text, mappings)
+            assert result.matches == [text.count(old) for old, _ in mappings]
+
+    def test_no_mappings(self):
+        result = apply_mappings("text", [])
+        assert result.content == "text"
+        assert result.counts == []
+
+    def test_empty_old_rejected(self):
+        with pytest.raises(ValueError, match="must not be empty"):
+            apply_mappings("text", [("", "x")])
+
+
+class TestSanMapFiles:
+    """Tests for preview_san_mapping and apply_san_mapping."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        markdown = tmp_path / "book.md"
+        markdown.write_text("teh cat and teh hat", encoding="utf-8")
+        csv_path = tmp_path / "book.san_mapping.csv"
+        csv_path.write_text("old,new\nteh,the\nthe cat,a cat\n,skipped\nzzz,y\n", encoding="utf-8")
+        return markdown, csv_path
+
+    def test_preview_counts_replacements_in_order(self, files):
+        markdown, csv_path = files
+
+        preview = preview_san_mapping(markdown, csv_path)
+
+        assert preview["mappings"] == [("teh", "the"), ("the cat", "a cat"), ("zzz", "y")]
+        assert preview["hits"] == [2, 1, 0]
+        assert preview["counts"] == {"teh": 2, "the cat": 1}
+        assert preview["total_replacements"] == 3
+        assert preview["conflicts"] == [MappingConflict(0, 1, "chain")]
+        assert markdown.read_text(encoding="utf-8") == "teh cat and teh hat"
+
+    @patch("psychrag.sanitization.san_map.SessionLocal")
+    def test_apply_updates_file_and_hash(self, mock_session_local, files):
+        markdown, csv_path = files
+        work = MagicMock()
+        session = mock_session_local.return_value.__enter__.return_value
+        session.query.return_value.filter.return_value.first.return_value = work
+
+        apply_san_mapping(markdown, csv_path, work_id=1)
+
+        assert markdown.read_text(encoding="utf-8") == "a cat and the hat"
+        assert work.content_hash == compute_file_hash(markdown)
+        session.commit.assert_called_once()
@@ -142,8 +142,8 @@ class TestSuggestionGeneration:
         work = create_mock_work(title="Test Work", content_hash="hash123")
         configure_mock_session_query(mock_session, Work, return_first=work)
         
-        # Mock Path.write_text to avoid file system writes
-        with patch('pathlib.Path.write_text') as mock_write:
+        # Mock the file write to avoid file system writes
+        with patch('psychrag.sanitization.suggest_heading_changes.write_text_atomic') as mock_write:
             output_path = suggest_heading_changes("test.titles.md")
             
             assert output_path.name.endswith(".title_changes.md")
@@ -255,7 +255,7 @@ class TestSaveTitleChanges:
         self,
         mock_get_session,
         mock_session,
-        mock_compute_hash, # for output hash
+        mock_compute_hash,
         mock_path_exists
     ):
         mock_get_session.return_value.__enter__.return_value = mock_session
@@ -267,11 +267,11 @@ class TestSaveTitleChanges:
         }
         configure_mock_session_query(mock_session, Work, return_first=work)
         
-        with patch('pathlib.Path.write_text') as mock_write, \
+        with patch('psychrag.sanitization.suggest_heading_changes.write_text_atomic') as mock_write, \
              patch('psychrag.sanitization.suggest_heading_changes.set_file_writable') as mock_set_writable, \
              patch('psychrag.sanitization.suggest_heading_changes.set_file_readonly') as mock_set_readonly:
              
-            mock_compute_hash.return_value = "full_output_hash"
+            mock_write.return_value = "full_output_hash"
             
             mock_path_exists.return_value = True # ensure markdown path exists
 
@@ -285,3 +285,40 @@ class TestSaveTitleChanges:
             mock_set_readonly.assert_called_once()
             assert "title_changes" in work.files
             assert work.files["title_changes"]["hash"] == "full_output_hash"
+
+
+@patch("psychrag.sanitization.suggest_heading_changes._log_llm_interaction")
+@patch("psychrag.sanitization.suggest_heading_changes.load_template")
+@patch("psychrag.sanitization.suggest_heading_changes.shard_titles")
+def test_request_changes_sharded(mock_shard, mock_load_template, mock_log):
+    """Shards are sent separately and merged in titles order with coverage checked."""
+    from psychrag.sanitization.suggest_heading_changes import _request_changes
+
+    mock_load_template.side_effect = lambda name, fallback: fallback()
+    titles = ["10: # Chapter 1", "15: ## Section A", "20: # Chapter 2", "25: ## Section B"]
+    mock_shard.return_value = [titles[:2], titles[2:]]
+    responses = {
+        "10: # Chapter 1": "10 : H1 : Chapter 1\n15 : H2 : Section A\n20 : H1 : Stray",
+        "20: # Chapter 2": "25 : H2 : Section B\n20 : H1 : Chapter 2",
+    }
+    chat = MagicMock()
+    chat.invoke.side_effect = lambda prompt: MagicMock(
+        content=next(
+            text for marker, text in responses.items()
+            if marker in prompt.split("## Document Part")[0]
+        )
+    )
+
+    changes = _request_changes(chat, "Book", "Author", [], "\n".join(titles), max_workers=2)
+
+    assert changes == [
+        "10 : H1 : Chapter 1",
+        "15 : H2 : Section A",
+        "20 : H1 : Chapter 2",
+        "25 : H2 : Section B",
+    ]
+    assert chat.invoke.call_count == 2
+    assert all("of 2 of this document's headings" in c.args[0] for c in chat.invoke.call_args_list)
+    logged = {c.kwargs["filename_prefix"]: c.args[0] for c in mock_log.call_args_list}
+    assert set(logged) == {"suggest_heading_part1of2", "suggest_heading_part2of2"}
+    assert "10: # Chapter 1" in logged["suggest_heading_part1of2"].split("## Document Part")[0]
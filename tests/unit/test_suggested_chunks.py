@@ -256,6 +256,32 @@ class TestApplyHierarchyRules:
         assert result == {10: "VECTORIZE"}
 
 
+class TestRequestDecisions:
+    """Tests for _request_decisions() with sharded titles."""
+
+    @patch('psychrag.chunking.suggested_chunks.load_template')
+    @patch('psychrag.chunking.suggested_chunks.shard_titles')
+    def test_shards_merged_with_coverage(self, mock_shard, mock_load_template, caplog):
+        from psychrag.chunking.suggested_chunks import _request_decisions
+
+        mock_load_template.side_effect = lambda name, fallback: fallback()
+        titles = ["10: # Contents", "20: # Chapter 1", "25: ## Section", "30: # Index"]
+        mock_shard.return_value = [titles[:2], titles[2:]]
+        chat = MagicMock()
+        chat.invoke.side_effect = lambda prompt: Mock(
+            content="10: SKIP\n20: VECTORIZE\n25: SKIP"
+            if "10: # Contents" in prompt.split("## Document Part")[0]
+            else "30: SKIP"
+        )
+
+        decisions = _request_decisions(chat, titles, None, max_workers=2)
+
+        # Line 25 belongs to the second shard, so the first shard's answer is ignored
+        assert decisions == {10: 'SKIP', 20: 'VECTORIZE', 30: 'SKIP'}
+        assert chat.invoke.call_count == 2
+        assert "no result for 1 of 4 headings" in caplog.text
+
+
 class TestSuggestChunks:
     """Tests for suggest_chunks() legacy function."""
 
@@ -8,10 +8,23 @@ and LangChain conversion.
 from unittest.mock import MagicMock, patch, Mock
 import pytest
 
-from psychrag.data.template_loader import load_template
+from psychrag.data.template_loader import (
+    get_template_cache_info,
+    invalidate_template_cache,
+    load_template,
+    warm_template_cache,
+)
 from psychrag.data.models.prompt_template import PromptTemplate
 
 
+@pytest.fixture(autouse=True)
+def clear_template_cache():
+    """Start every test with an empty template cache."""
+    invalidate_template_cache()
+    yield
+    invalidate_template_cache()
+
+
 class TestLoadTemplate:
     """Tests for load_template function."""
 
@@ -288,3 +301,94 @@ class TestLoadTemplate:
         assert "5" in result
         assert "Context 1" in result
 
+
+
+class TestTemplateCache:
+    """Tests for the compiled template cache."""
+
+    @staticmethod
+    def _mock_db(mock_get_session, template_content="Cached {x}", version=1):
+        mock_session = MagicMock()
+        mock_template = MagicMock()
+        mock_template.function_tag = "test_function"
+        mock_template.version = version
+        mock_template.template_content = template_content
+        mock_template.is_active = True
+        mock_session.query.return_value.filter.return_value.first.return_value = mock_template
+        mock_get_session.return_value.__enter__.return_value = mock_session
+        return mock_session, mock_template
+
+    @patch("psychrag.data.template_loader.get_session")
+    def test_second_load_is_served_from_cache(self, mock_get_session):
+        """Test that a cached template skips the database."""
+        mock_session, _ = self._mock_db(mock_get_session)
+
+        first = load_template("test_function", lambda: "Fallback")
+        second = load_template("test_function", lambda: "Fallback")
+
+        assert first is second
+        assert mock_session.query.call_count == 1
+
+    @patch("psychrag.data.template_loader.get_session")
+    def test_use_cache_false_always_queries(self, mock_get_session):
+        """Test that use_cache=False bypasses the active-template cache."""
+        mock_session, _ = self._mock_db(mock_get_session)
+
+        load_template("test_function", lambda: "Fallback", use_cache=False)
+        load_template("test_function", lambda: "Fallback", use_cache=False)
+
+        assert mock_session.query.call_count == 2
+
+    @patch("psychrag.data.template_loader.get_session")
+    def test_invalidate_reloads_changed_content(self, mock_get_session):
+        """Test that invalidation picks up edited template content."""
+        _, mock_template = self._mock_db(mock_get_session, "Old {x}")
+        load_template("test_function", lambda: "Fallback")
+
+        mock_template.template_content = "New {x}"
+        invalidate_template_cache("test_function")
+        template = load_template("test_function", lambda: "Fallback")
+
+        assert template.format(x="1") == "New 1"
+
+    @patch("psychrag.data.template_loader.get_session")
+    def test_fallback_is_cached_but_errors_are_not(self, mock_get_session):
+        """Test that fallbacks are cached only when the database answered."""
+        mock_session = MagicMock()
+        mock_session.query.side_effect = Exception("Database error")
+        mock_get_session.return_value.__enter__.return_value = mock_session
+
+        load_template("test_function", lambda: "Fallback")
+        load_template("test_function", lambda: "Fallback")
+        assert mock_session.query.call_count == 2
+
+        mock_session.query.side_effect = None
+        mock_session.query.return_value.filter.return_value.first.return_value = None
+        load_template("test_function", lambda: "Fallback")
+        load_template("test_function", lambda: "Fallback")
+        assert mock_session.query.call_count == 3
+        assert get_template_cache_info()["active"] == {"test_function": None}
+
+    @patch("psychrag.data.template_loader.get_session")
+    def test_warm_template_cache(self, mock_get_session):
+        """Test that warm-up compiles all active templates in one query."""
+        mock_session = MagicMock()
+        rows = []
+        for tag in ("query_expansion", "rag_augmentation"):
+            row = MagicMock()
+            row.function_tag = tag
+            row.version = 2
+            row.template_content = f"{tag} {{query}}"
+            rows.append(row)
+        mock_session.query.return_value.filter.return_value.all.return_value = rows
+        mock_get_session.return_value.__enter__.return_value = mock_session
+
+        assert warm_template_cache() == 2
+        assert get_template_cache_info()["active"] == {
+            "query_expansion": 2,
+            "rag_augmentation": 2,
+        }
+
+        template = load_template("query_expansion", lambda: "Fallback")
+        assert template.format(query="q") == "query_expansion q"
+        assert mock_session.query.call_count == 1
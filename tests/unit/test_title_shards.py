@@ -0,0 +1,123 @@
+"""
+Unit tests for title_shards module.
+
+Tests cover:
+- Sharding by top-level section and splitting oversized sections
+- Concurrent calls keeping shard order
+- Coverage of result lines against the titles list
+"""
+
+import threading
+import time
+
+from psychrag.sanitization.title_shards import (
+    merge_shard_results,
+    outline,
+    run_shards,
+    shard_note,
+    shard_titles,
+)
+
+
+def _book(chapters, sections):
+    titles = []
+    line = 1
+    for c in range(chapters):
+        titles.append(f"{line}: # Chapter {c}")
+        line += 1
+        for s in range(sections):
+            titles.append(f"{line}: ## Section {c}.{s}")
+            line += 1
+    return titles
+
+
+class TestShardTitles:
+    """Tests for shard_titles."""
+
+    def test_small_list_single_shard(self):
+        titles = _book(2, 3)
+
+        assert shard_titles(titles, max_titles=10) == [titles]
+
+    def test_shards_start_at_chapters(self):
+        titles = _book(6, 3)
+
+        shards = shard_titles(titles, max_titles=10)
+
+        assert [len(shard) for shard in shards] == [8, 8, 8]
+        assert all(": # Chapter" in shard[0] for shard in shards)
+        assert sum(shards, []) == titles
+
+    def test_oversized_chapter_split_at_sections(self):
+        titles = _book(1, 25) + _book(1, 2)
+
+        shards = shard_titles(titles, max_titles=10)
+
+        assert all(len(shard) <= 10 for shard in shards)
+        assert sum(shards, []) == titles
+        assert shards[0][0] == "1: # Chapter 0"
+
+    def test_titles_before_first_chapter(self):
+        titles = ["1: ### Preface note"] + [f"{i}: ## Front {i}" for i in range(2, 5)] + _book(3, 3)
+
+        shards = shard_titles(titles, max_titles=5)
+
+        assert all(len(shard) <= 5 for shard in shards)
+        assert sum(shards, []) == titles
+
+
+class TestRunShards:
+    """Tests for run_shards."""
+
+    def test_results_in_prompt_order_and_concurrent(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def invoke(part, prompt):
+            assert part == int(prompt) + 1
+            with lock:
+                running.append(prompt)
+                peak.append(len(running))
+            time.sleep(0.02 * (5 - int(prompt)))
+            with lock:
+                running.remove(prompt)
+            return f"answer {prompt}"
+
+        responses = run_shards([str(i) for i in range(5)], invoke, max_workers=3)
+
+        assert responses == [f"answer {i}" for i in range(5)]
+        assert 1 < max(peak) <= 3
+
+
+class TestMergeShardResults:
+    """Tests for merge_shard_results, outline and shard_note."""
+
+    def test_results_owned_by_shard_in_titles_order(self, caplog):
+        shards = [["10: # A", "15: ## B"], ["20: # C", "25: ## D"]]
+        results = [
+            {15: "b", 10: "a", 25: "wrong shard"},
+            {25: "d", 99: "not a heading"},
+        ]
+
+        merged, coverage = merge_shard_results(shards, results, label="Test step")
+
+        assert list(merged.items()) == [(10, "a"), (15, "b"), (25, "d")]
+        assert coverage.missing == [20]
+        assert coverage.unexpected == [25, 99]
+        assert not coverage.complete
+        assert "Test step returned no result for 1 of 4 headings" in caplog.text
+
+    def test_complete(self):
+        _, coverage = merge_shard_results([["10: # A"]], [{10: "a"}])
+
+        assert coverage.complete
+
+    def test_outline_in_note(self):
+        titles = _book(2, 2)
+
+        note = shard_note(2, 3, outline(titles))
+
+        assert "part 2 of 3" in note
+        assert "1: # Chapter 0\n4: # Chapter 1" in note
+        assert "Section" not in note
@@ -0,0 +1,73 @@
+"""
+Unit tests for token_count module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from psychrag.utils import token_count
+from psychrag.utils.token_count import count_tokens
+
+
+@pytest.fixture(autouse=True)
+def fresh_encoding():
+    token_count._encoding.cache_clear()
+    yield
+    token_count._encoding.cache_clear()
+
+
+class TestCountTokens:
+    """Tests for count_tokens."""
+
+    def test_estimate_without_tiktoken(self):
+        with patch.object(token_count, "TIKTOKEN_AVAILABLE", False):
+            assert count_tokens("") == 0
+            assert count_tokens("abcde") == 2
+
+    @pytest.mark.skipif(not token_count.TIKTOKEN_AVAILABLE, reason="tiktoken not installed")
+    def test_uncached_encoding_not_downloaded(self, tmp_path, monkeypatch, caplog):
+        # Real tiktoken loading: fails if its cache miss no longer goes
+        # through tiktoken.load.read_file, which the download guard replaces
+        monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(token_count.tiktoken.registry, "ENCODINGS", {})
+        original_read_file = token_count.tiktoken.load.read_file
+
+        with caplog.at_level("INFO", logger=token_count.__name__), patch.object(
+            token_count, "_read_file_offline", wraps=token_count._read_file_offline
+        ) as guard:
+            assert count_tokens("abcdefgh") == 2
+
+        assert guard.call_args.args[0].startswith("https://")
+        assert "not cached locally" in caplog.text
+        assert token_count.tiktoken.load.read_file is original_read_file
+
+    @pytest.mark.skipif(not token_count.TIKTOKEN_AVAILABLE, reason="tiktoken not installed")
+    def test_cached_encoding_used(self):
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+
+        def get_encoding(name):
+            assert token_count.tiktoken.load.read_file is token_count._read_file_offline
+            return encoding
+
+        with patch.object(token_count.tiktoken, "get_encoding", side_effect=get_encoding) as mock_get:
+            assert count_tokens("abcdefgh") == 3
+
+        mock_get.assert_called_once_with(token_count.ENCODING_NAME)
+        assert token_count.tiktoken.load.read_file is not token_count._read_file_offline
+
+    def test_local_files_still_read(self, tmp_path):
+        path = tmp_path / "o200k_base.tiktoken"
+        path.write_bytes(b"data")
+
+        assert token_count._read_file_offline(str(path)) == b"data"
+        with pytest.raises(OSError, match="not downloading"):
+            token_count._read_file_offline("https://example.com/o200k_base.tiktoken")
+
+    @pytest.mark.skipif(not token_count.TIKTOKEN_AVAILABLE, reason="tiktoken not installed")
+    def test_unloadable_encoding_falls_back(self, caplog):
+        with patch.object(token_count.tiktoken, "get_encoding", side_effect=ValueError("corrupt")):
+            assert count_tokens("abcdefgh") == 2
+
+        assert "estimating tokens" in caplog.text
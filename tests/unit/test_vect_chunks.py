@@ -0,0 +1,152 @@
+"""
+Unit tests for vect_chunks module.
+
+Tests cover:
+- Planner-based estimate of eligible chunks
+- Streaming eligible chunks in batches
+- Batch embedding, bulk updates and progress reporting
+
+Usage:
+    pytest tests/unit/test_vect_chunks.py -v
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from psychrag.vectorization import vect_chunks
+from psychrag.vectorization.vect_chunks import (
+    _stream_eligible_chunks,
+    estimate_eligible_chunks,
+    vectorize_chunks,
+)
+
+
+class TestEstimateEligibleChunks:
+    """Tests for estimate_eligible_chunks()."""
+
+    def test_reads_planner_rows(self):
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = [{"Plan": {"Plan Rows": 1234}}]
+
+        assert estimate_eligible_chunks(session, work_id=7) == 1234
+
+        sql = str(session.execute.call_args[0][0])
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT chunks.id")
+        assert "chunks.work_id = 7" in sql
+        assert "'to_vec'" in sql
+
+
+class TestStreamEligibleChunks:
+    """Tests for _stream_eligible_chunks()."""
+
+    @patch("psychrag.vectorization.vect_chunks.engine")
+    def test_streams_partitions_from_server_side_cursor(self, mock_engine):
+        connection = mock_engine.connect.return_value.__enter__.return_value
+        streaming = connection.execution_options.return_value
+        streaming.execute.return_value.partitions.return_value = iter([
+            [(1, "a"), (2, "b")],
+            [(3, "c")],
+        ])
+
+        batches = list(_stream_eligible_chunks(work_id=None, limit=None, batch_size=2))
+
+        assert batches == [[(1, "a"), (2, "b")], [(3, "c")]]
+        connection.execution_options.assert_called_once_with(
+            yield_per=vect_chunks.STREAM_PAGE_SIZE
+        )
+        streaming.execute.return_value.partitions.assert_called_once_with(2)
+
+    @patch("psychrag.vectorization.vect_chunks.engine")
+    def test_limit_applied_to_query(self, mock_engine):
+        connection = mock_engine.connect.return_value.__enter__.return_value
+        streaming = connection.execution_options.return_value
+        streaming.execute.return_value.partitions.return_value = iter([])
+
+        list(_stream_eligible_chunks(work_id=3, limit=10, batch_size=20))
+
+        stmt = streaming.execute.call_args[0][0]
+        assert stmt._limit == 10
+
+
+class TestVectorizeChunks:
+    """Tests for vectorize_chunks()."""
+
+    @pytest.fixture
+    def session(self):
+        with patch("psychrag.vectorization.vect_chunks.get_session") as mock_get_session:
+            session = MagicMock()
+            mock_get_session.return_value.__enter__.return_value = session
+            yield session
+
+    @pytest.fixture
+    def embeddings_model(self):
+        model = MagicMock()
+        model.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        with patch("psychrag.ai.llm_factory.create_embeddings", return_value=model):
+            yield model
+
+    def _run(self, batches, estimate=3, **kwargs):
+        with patch.object(vect_chunks, "estimate_eligible_chunks", return_value=estimate), \
+             patch.object(vect_chunks, "_stream_eligible_chunks", return_value=iter(batches)):
+            return vectorize_chunks(**kwargs)
+
+    def test_embeds_batches_and_updates_by_id(self, session, embeddings_model):
+        progress = []
+
+        result = self._run(
+            [[(1, "a"), (2, "bb")], [(3, "ccc")]],
+            batch_size=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert (result.processed, result.success, result.failed) == (3, 3, 0)
+        assert result.total_eligible == 3
+        assert progress == [(2, 3), (3, 3)]
+        updates = [call.args[1] for call in session.execute.call_args_list]
+        assert updates[0] == [
+            {"id": 1, "embedding": [1.0], "vector_status": "vec"},
+            {"id": 2, "embedding": [2.0], "vector_status": "vec"},
+        ]
+        assert session.commit.call_count == 2
+
+    def test_failed_batch_marked_as_error(self, session, embeddings_model):
+        embeddings_model.embed_documents.side_effect = [RuntimeError("rate limited"), [[0.5]]]
+
+        result = self._run([[(1, "a"), (2, "b")], [(3, "c")]])
+
+        assert (result.success, result.failed) == (1, 2)
+        assert result.errors == [(1, "rate limited"), (2, "rate limited")]
+        first_update = session.execute.call_args_list[0].args[1]
+        assert first_update == [
+            {"id": 1, "vector_status": "vec_err"},
+            {"id": 2, "vector_status": "vec_err"},
+        ]
+
+    def test_limit_reports_estimate(self, session, embeddings_model):
+        progress = []
+
+        result = self._run(
+            [[(1, "a"), (2, "b")]],
+            estimate=500,
+            limit=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert result.processed == 2
+        assert progress == [(2, 2)]  # progress counts towards the limit
+        assert result.total_eligible == 500  # planner estimate, not capped by the limit
+
+    def test_nothing_to_do_skips_model(self, session):
+        with patch("psychrag.ai.llm_factory.create_embeddings") as mock_create:
+            result = self._run([], estimate=0)
+
+        mock_create.assert_not_called()
+        assert result.processed == 0
+        assert result.total_eligible == 0
+
+    def test_unknown_work(self, session):
+        session.query.return_value.filter.return_value.first.return_value = None
+
+        with pytest.raises(ValueError, match="not found"):
+            vectorize_chunks(work_id=99)